@@ -0,0 +1,58 @@
+"""add track file_mtime column and file_path index
+
+Revision ID: DDD38028iiJ76
+Revises: AAB38025eeM99
+Create Date: 2026-01-20 10:00:00.000000
+
+Hey future me - SET-BASED INCREMENTAL LIBRARY SCAN!
+
+The incremental scan used to run one "SELECT ... WHERE file_path = ?" per file,
+and soulspot_tracks.file_path had no index (the old ix_soulspot_tracks_file_path
+from ll25009ooq57 was never declared on the model, so fresh DBs never got it).
+On a 180k track library a "nothing changed" rescan = 180k full table scans.
+
+Now the scanner loads (file_path, file_size, file_mtime, last_scanned_at) ONCE,
+diffs it against the folder walk in memory and only touches new/changed/removed
+files. file_mtime is the stored st_mtime so we can detect changes exactly
+(size + mtime), the index keeps all remaining path lookups cheap.
+
+Both operations are idempotent (checked via inspector) because some DBs
+already carry the index from ll25009ooq57.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "DDD38028iiJ76"
+down_revision: str | None = "AAB38025eeM99"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    """Add file_mtime column and file_path index to soulspot_tracks."""
+    connection = op.get_bind()
+    inspector = inspect(connection)
+
+    track_columns = [col["name"] for col in inspector.get_columns("soulspot_tracks")]
+    if "file_mtime" not in track_columns:
+        with op.batch_alter_table("soulspot_tracks", schema=None) as batch_op:
+            batch_op.add_column(sa.Column("file_mtime", sa.Float(), nullable=True))
+
+    existing_indexes = [idx["name"] for idx in inspector.get_indexes("soulspot_tracks")]
+    if "ix_soulspot_tracks_file_path" not in existing_indexes:
+        op.create_index(
+            "ix_soulspot_tracks_file_path",
+            "soulspot_tracks",
+            ["file_path"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Remove file_mtime column and file_path index."""
+    op.drop_index("ix_soulspot_tracks_file_path", table_name="soulspot_tracks")
+    with op.batch_alter_table("soulspot_tracks", schema=None) as batch_op:
+        batch_op.drop_column("file_mtime")
@@ -0,0 +1,91 @@
+"""add indexed transfer_key to downloads
+
+Revision ID: EEE38029jjK77
+Revises: DDD38028iiJ76
+Create Date: 2026-01-21 10:00:00.000000
+
+Hey future me - INDEXED slskd RECONCILIATION!
+
+DownloadStatusWorker matched every transfer slskd reports (including the whole
+completed history) with "source_url = ?" and, on a miss, an unindexed
+"source_url LIKE '%filename%'". 5k historic transfers = up to 10k queries per
+poll cycle while holding the SQLite write lock.
+
+transfer_key = sha1("username/filename") (same string that follows "slskd://" in
+source_url) is a fixed-width, indexed key. The worker now resolves ALL transfers
+of a cycle with "WHERE transfer_key IN (...)". The ORM keeps the column in sync
+with source_url (DownloadModel validator); this migration backfills existing rows.
+"""
+
+import hashlib
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "EEE38029jjK77"
+down_revision: str | None = "DDD38028iiJ76"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+# Must match soulspot.infrastructure.persistence.models.transfer_key_from_source_url
+# (copied on purpose - migrations must not import app code that changes later)
+_SCHEMES = ("slskd://", "soulseek://")
+
+
+def _transfer_key(source_url: str | None) -> str | None:
+    if not source_url:
+        return None
+    for scheme in _SCHEMES:
+        if source_url.startswith(scheme):
+            external_id = source_url[len(scheme) :]
+            return hashlib.sha1(external_id.encode(), usedforsecurity=False).hexdigest()
+    return None
+
+
+def upgrade() -> None:
+    """Add transfer_key column + index and backfill it from source_url."""
+    connection = op.get_bind()
+    inspector = inspect(connection)
+
+    download_columns = [col["name"] for col in inspector.get_columns("downloads")]
+    if "transfer_key" not in download_columns:
+        with op.batch_alter_table("downloads", schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column("transfer_key", sa.String(length=40), nullable=True)
+            )
+
+    existing_indexes = [idx["name"] for idx in inspector.get_indexes("downloads")]
+    if "ix_downloads_transfer_key" not in existing_indexes:
+        op.create_index(
+            "ix_downloads_transfer_key",
+            "downloads",
+            ["transfer_key"],
+            unique=False,
+        )
+
+    # Backfill (sha1 isn't available in SQL on SQLite → compute in Python)
+    rows = connection.execute(
+        sa.text(
+            "SELECT id, source_url FROM downloads "
+            "WHERE source_url IS NOT NULL AND transfer_key IS NULL"
+        )
+    ).fetchall()
+    params = [
+        {"id": row.id, "transfer_key": key}
+        for row in rows
+        if (key := _transfer_key(row.source_url)) is not None
+    ]
+    if params:
+        connection.execute(
+            sa.text("UPDATE downloads SET transfer_key = :transfer_key WHERE id = :id"),
+            params,
+        )
+
+
+def downgrade() -> None:
+    """Remove transfer_key column and index."""
+    op.drop_index("ix_downloads_transfer_key", table_name="downloads")
+    with op.batch_alter_table("downloads", schema=None) as batch_op:
+        batch_op.drop_column("transfer_key")
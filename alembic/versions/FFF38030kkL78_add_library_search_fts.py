@@ -0,0 +1,322 @@
+"""add full-text search index for library and playlist names
+
+Revision ID: FFF38030kkL78
+Revises: EEE38029jjK77
+Create Date: 2026-01-22 10:00:00.000000
+
+Hey future me - INDEXED LIBRARY SEARCH!
+
+The quick search used "ilike('%term%')" on track titles, artist names and playlist
+names. A leading wildcard can't use a b-tree index → full table scan per keystroke.
+
+SQLite: one FTS5 table per entity, keyed by the entity id (UNINDEXED column - the
+rowid of our UUID-keyed tables isn't stable across VACUUM/rebuilds), unicode61
+tokenizer with diacritic folding and a 2/3-char prefix index. A <fts>_keys table
+maps id → FTS rowid so the sync triggers look rows up by index. The triggers only
+read FTS/key tables (never another source table), so a batch rebuild of one source
+table doesn't trip over triggers of the others. Existing rows are copied in.
+
+PostgreSQL: pg_trgm + unaccent, an IMMUTABLE soulspot_fold() wrapper and one
+trigram GIN index per searchable name column.
+
+The statements below are copied from
+soulspot.infrastructure.persistence.search_index on purpose - migrations must not
+import app code that changes later. Keep both in sync!
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "FFF38030kkL78"
+down_revision: str | None = "EEE38029jjK77"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_SQLITE_DDL = [
+    (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS soulspot_artists_fts USING fts5(id "
+        "UNINDEXED, name, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 "
+        "3')"
+    ),
+    (
+        "CREATE TABLE IF NOT EXISTS soulspot_artists_fts_keys (fts_rowid INTEGER "
+        "PRIMARY KEY, id TEXT NOT NULL UNIQUE)"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS soulspot_artists_fts_ai AFTER INSERT ON "
+        "soulspot_artists BEGIN DELETE FROM soulspot_artists_fts WHERE rowid = "
+        "(SELECT fts_rowid FROM soulspot_artists_fts_keys WHERE id = new.id); "
+        "DELETE FROM soulspot_artists_fts_keys WHERE id = new.id; INSERT INTO "
+        "soulspot_artists_fts_keys(id) VALUES (new.id); INSERT INTO "
+        "soulspot_artists_fts(rowid, id, name) VALUES ((SELECT fts_rowid FROM "
+        "soulspot_artists_fts_keys WHERE id = new.id), new.id, new.name); UPDATE "
+        "soulspot_tracks_fts SET artist = new.name WHERE rowid IN (SELECT fts_rowid "
+        "FROM soulspot_tracks_fts_keys WHERE artist_id = new.id); UPDATE "
+        "soulspot_albums_fts SET artist = new.name WHERE rowid IN (SELECT fts_rowid "
+        "FROM soulspot_albums_fts_keys WHERE artist_id = new.id); END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS soulspot_artists_fts_ad AFTER DELETE ON "
+        "soulspot_artists BEGIN DELETE FROM soulspot_artists_fts WHERE rowid = "
+        "(SELECT fts_rowid FROM soulspot_artists_fts_keys WHERE id = old.id); "
+        "DELETE FROM soulspot_artists_fts_keys WHERE id = old.id; END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS soulspot_artists_fts_au AFTER UPDATE OF name "
+        "ON soulspot_artists WHEN old.name IS NOT new.name BEGIN DELETE FROM "
+        "soulspot_artists_fts WHERE rowid = (SELECT fts_rowid FROM "
+        "soulspot_artists_fts_keys WHERE id = old.id); DELETE FROM "
+        "soulspot_artists_fts_keys WHERE id = old.id; INSERT INTO "
+        "soulspot_artists_fts_keys(id) VALUES (new.id); INSERT INTO "
+        "soulspot_artists_fts(rowid, id, name) VALUES ((SELECT fts_rowid FROM "
+        "soulspot_artists_fts_keys WHERE id = new.id), new.id, new.name); UPDATE "
+        "soulspot_tracks_fts SET artist = new.name WHERE rowid IN (SELECT fts_rowid "
+        "FROM soulspot_tracks_fts_keys WHERE artist_id = new.id); UPDATE "
+        "soulspot_albums_fts SET artist = new.name WHERE rowid IN (SELECT fts_rowid "
+        "FROM soulspot_albums_fts_keys WHERE artist_id = new.id); END"
+    ),
+    (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS soulspot_tracks_fts USING fts5(id "
+        "UNINDEXED, title, artist, tokenize = 'unicode61 remove_diacritics 2', "
+        "prefix = '2 3')"
+    ),
+    (
+        "CREATE TABLE IF NOT EXISTS soulspot_tracks_fts_keys (fts_rowid INTEGER "
+        "PRIMARY KEY, id TEXT NOT NULL UNIQUE, artist_id TEXT)"
+    ),
+    (
+        "CREATE INDEX IF NOT EXISTS ix_soulspot_tracks_fts_keys_artist_id ON "
+        "soulspot_tracks_fts_keys (artist_id)"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS soulspot_tracks_fts_ai AFTER INSERT ON "
+        "soulspot_tracks BEGIN DELETE FROM soulspot_tracks_fts WHERE rowid = "
+        "(SELECT fts_rowid FROM soulspot_tracks_fts_keys WHERE id = new.id); DELETE "
+        "FROM soulspot_tracks_fts_keys WHERE id = new.id; INSERT INTO "
+        "soulspot_tracks_fts_keys(id, artist_id) VALUES (new.id, new.artist_id); "
+        "INSERT INTO soulspot_tracks_fts(rowid, id, title, artist) VALUES ((SELECT "
+        "fts_rowid FROM soulspot_tracks_fts_keys WHERE id = new.id), new.id, "
+        "new.title, (SELECT name FROM soulspot_artists_fts WHERE rowid = (SELECT "
+        "fts_rowid FROM soulspot_artists_fts_keys WHERE id = new.artist_id))); END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS soulspot_tracks_fts_ad AFTER DELETE ON "
+        "soulspot_tracks BEGIN DELETE FROM soulspot_tracks_fts WHERE rowid = "
+        "(SELECT fts_rowid FROM soulspot_tracks_fts_keys WHERE id = old.id); DELETE "
+        "FROM soulspot_tracks_fts_keys WHERE id = old.id; END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS soulspot_tracks_fts_au AFTER UPDATE OF title, "
+        "artist_id ON soulspot_tracks WHEN old.title IS NOT new.title OR "
+        "old.artist_id IS NOT new.artist_id BEGIN DELETE FROM soulspot_tracks_fts "
+        "WHERE rowid = (SELECT fts_rowid FROM soulspot_tracks_fts_keys WHERE id = "
+        "old.id); DELETE FROM soulspot_tracks_fts_keys WHERE id = old.id; INSERT "
+        "INTO soulspot_tracks_fts_keys(id, artist_id) VALUES (new.id, "
+        "new.artist_id); INSERT INTO soulspot_tracks_fts(rowid, id, title, artist) "
+        "VALUES ((SELECT fts_rowid FROM soulspot_tracks_fts_keys WHERE id = "
+        "new.id), new.id, new.title, (SELECT name FROM soulspot_artists_fts WHERE "
+        "rowid = (SELECT fts_rowid FROM soulspot_artists_fts_keys WHERE id = "
+        "new.artist_id))); END"
+    ),
+    (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS soulspot_albums_fts USING fts5(id "
+        "UNINDEXED, title, artist, tokenize = 'unicode61 remove_diacritics 2', "
+        "prefix = '2 3')"
+    ),
+    (
+        "CREATE TABLE IF NOT EXISTS soulspot_albums_fts_keys (fts_rowid INTEGER "
+        "PRIMARY KEY, id TEXT NOT NULL UNIQUE, artist_id TEXT)"
+    ),
+    (
+        "CREATE INDEX IF NOT EXISTS ix_soulspot_albums_fts_keys_artist_id ON "
+        "soulspot_albums_fts_keys (artist_id)"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS soulspot_albums_fts_ai AFTER INSERT ON "
+        "soulspot_albums BEGIN DELETE FROM soulspot_albums_fts WHERE rowid = "
+        "(SELECT fts_rowid FROM soulspot_albums_fts_keys WHERE id = new.id); DELETE "
+        "FROM soulspot_albums_fts_keys WHERE id = new.id; INSERT INTO "
+        "soulspot_albums_fts_keys(id, artist_id) VALUES (new.id, new.artist_id); "
+        "INSERT INTO soulspot_albums_fts(rowid, id, title, artist) VALUES ((SELECT "
+        "fts_rowid FROM soulspot_albums_fts_keys WHERE id = new.id), new.id, "
+        "new.title, (SELECT name FROM soulspot_artists_fts WHERE rowid = (SELECT "
+        "fts_rowid FROM soulspot_artists_fts_keys WHERE id = new.artist_id))); END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS soulspot_albums_fts_ad AFTER DELETE ON "
+        "soulspot_albums BEGIN DELETE FROM soulspot_albums_fts WHERE rowid = "
+        "(SELECT fts_rowid FROM soulspot_albums_fts_keys WHERE id = old.id); DELETE "
+        "FROM soulspot_albums_fts_keys WHERE id = old.id; END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS soulspot_albums_fts_au AFTER UPDATE OF title, "
+        "artist_id ON soulspot_albums WHEN old.title IS NOT new.title OR "
+        "old.artist_id IS NOT new.artist_id BEGIN DELETE FROM soulspot_albums_fts "
+        "WHERE rowid = (SELECT fts_rowid FROM soulspot_albums_fts_keys WHERE id = "
+        "old.id); DELETE FROM soulspot_albums_fts_keys WHERE id = old.id; INSERT "
+        "INTO soulspot_albums_fts_keys(id, artist_id) VALUES (new.id, "
+        "new.artist_id); INSERT INTO soulspot_albums_fts(rowid, id, title, artist) "
+        "VALUES ((SELECT fts_rowid FROM soulspot_albums_fts_keys WHERE id = "
+        "new.id), new.id, new.title, (SELECT name FROM soulspot_artists_fts WHERE "
+        "rowid = (SELECT fts_rowid FROM soulspot_artists_fts_keys WHERE id = "
+        "new.artist_id))); END"
+    ),
+    (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS playlists_fts USING fts5(id UNINDEXED, "
+        "name, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    ),
+    (
+        "CREATE TABLE IF NOT EXISTS playlists_fts_keys (fts_rowid INTEGER PRIMARY "
+        "KEY, id TEXT NOT NULL UNIQUE)"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS playlists_fts_ai AFTER INSERT ON playlists "
+        "BEGIN DELETE FROM playlists_fts WHERE rowid = (SELECT fts_rowid FROM "
+        "playlists_fts_keys WHERE id = new.id); DELETE FROM playlists_fts_keys "
+        "WHERE id = new.id; INSERT INTO playlists_fts_keys(id) VALUES (new.id); "
+        "INSERT INTO playlists_fts(rowid, id, name) VALUES ((SELECT fts_rowid FROM "
+        "playlists_fts_keys WHERE id = new.id), new.id, new.name); END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS playlists_fts_ad AFTER DELETE ON playlists "
+        "BEGIN DELETE FROM playlists_fts WHERE rowid = (SELECT fts_rowid FROM "
+        "playlists_fts_keys WHERE id = old.id); DELETE FROM playlists_fts_keys "
+        "WHERE id = old.id; END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS playlists_fts_au AFTER UPDATE OF name ON "
+        "playlists WHEN old.name IS NOT new.name BEGIN DELETE FROM playlists_fts "
+        "WHERE rowid = (SELECT fts_rowid FROM playlists_fts_keys WHERE id = "
+        "old.id); DELETE FROM playlists_fts_keys WHERE id = old.id; INSERT INTO "
+        "playlists_fts_keys(id) VALUES (new.id); INSERT INTO playlists_fts(rowid, "
+        "id, name) VALUES ((SELECT fts_rowid FROM playlists_fts_keys WHERE id = "
+        "new.id), new.id, new.name); END"
+    ),
+]
+
+_SQLITE_BACKFILL = [
+    "DELETE FROM soulspot_artists_fts",
+    "DELETE FROM soulspot_artists_fts_keys",
+    ("INSERT INTO soulspot_artists_fts_keys(id) SELECT id FROM soulspot_artists"),
+    (
+        "INSERT INTO soulspot_artists_fts(rowid, id, name) SELECT k.fts_rowid, "
+        "src.id, src.name FROM soulspot_artists AS src JOIN "
+        "soulspot_artists_fts_keys AS k ON k.id = src.id"
+    ),
+    "DELETE FROM soulspot_tracks_fts",
+    "DELETE FROM soulspot_tracks_fts_keys",
+    (
+        "INSERT INTO soulspot_tracks_fts_keys(id, artist_id) SELECT id, artist_id "
+        "FROM soulspot_tracks"
+    ),
+    (
+        "INSERT INTO soulspot_tracks_fts(rowid, id, title, artist) SELECT "
+        "k.fts_rowid, src.id, src.title, (SELECT name FROM soulspot_artists WHERE "
+        "id = src.artist_id) FROM soulspot_tracks AS src JOIN "
+        "soulspot_tracks_fts_keys AS k ON k.id = src.id"
+    ),
+    "DELETE FROM soulspot_albums_fts",
+    "DELETE FROM soulspot_albums_fts_keys",
+    (
+        "INSERT INTO soulspot_albums_fts_keys(id, artist_id) SELECT id, artist_id "
+        "FROM soulspot_albums"
+    ),
+    (
+        "INSERT INTO soulspot_albums_fts(rowid, id, title, artist) SELECT "
+        "k.fts_rowid, src.id, src.title, (SELECT name FROM soulspot_artists WHERE "
+        "id = src.artist_id) FROM soulspot_albums AS src JOIN "
+        "soulspot_albums_fts_keys AS k ON k.id = src.id"
+    ),
+    "DELETE FROM playlists_fts",
+    "DELETE FROM playlists_fts_keys",
+    "INSERT INTO playlists_fts_keys(id) SELECT id FROM playlists",
+    (
+        "INSERT INTO playlists_fts(rowid, id, name) SELECT k.fts_rowid, src.id, "
+        "src.name FROM playlists AS src JOIN playlists_fts_keys AS k ON k.id = "
+        "src.id"
+    ),
+]
+
+_SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS soulspot_artists_fts_ai",
+    "DROP TRIGGER IF EXISTS soulspot_artists_fts_ad",
+    "DROP TRIGGER IF EXISTS soulspot_artists_fts_au",
+    "DROP TRIGGER IF EXISTS soulspot_tracks_fts_ai",
+    "DROP TRIGGER IF EXISTS soulspot_tracks_fts_ad",
+    "DROP TRIGGER IF EXISTS soulspot_tracks_fts_au",
+    "DROP TRIGGER IF EXISTS soulspot_albums_fts_ai",
+    "DROP TRIGGER IF EXISTS soulspot_albums_fts_ad",
+    "DROP TRIGGER IF EXISTS soulspot_albums_fts_au",
+    "DROP TRIGGER IF EXISTS playlists_fts_ai",
+    "DROP TRIGGER IF EXISTS playlists_fts_ad",
+    "DROP TRIGGER IF EXISTS playlists_fts_au",
+    "DROP TRIGGER IF EXISTS soulspot_artists_fts_rename",
+    "DROP TABLE IF EXISTS soulspot_artists_fts",
+    "DROP TABLE IF EXISTS soulspot_artists_fts_keys",
+    "DROP TABLE IF EXISTS soulspot_tracks_fts",
+    "DROP TABLE IF EXISTS soulspot_tracks_fts_keys",
+    "DROP TABLE IF EXISTS soulspot_albums_fts",
+    "DROP TABLE IF EXISTS soulspot_albums_fts_keys",
+    "DROP TABLE IF EXISTS playlists_fts",
+    "DROP TABLE IF EXISTS playlists_fts_keys",
+]
+
+_POSTGRES_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    (
+        "CREATE OR REPLACE FUNCTION soulspot_fold(value text) RETURNS text AS $$ "
+        "SELECT public.unaccent('public.unaccent'::regdictionary, lower(value)) $$ "
+        "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT"
+    ),
+    (
+        "CREATE INDEX IF NOT EXISTS ix_soulspot_tracks_title_trgm ON soulspot_tracks "
+        "USING gin (soulspot_fold(title) gin_trgm_ops)"
+    ),
+    (
+        "CREATE INDEX IF NOT EXISTS ix_soulspot_artists_name_trgm ON soulspot_artists"
+        " USING gin (soulspot_fold(name) gin_trgm_ops)"
+    ),
+    (
+        "CREATE INDEX IF NOT EXISTS ix_soulspot_albums_title_trgm ON soulspot_albums "
+        "USING gin (soulspot_fold(title) gin_trgm_ops)"
+    ),
+    (
+        "CREATE INDEX IF NOT EXISTS ix_playlists_name_trgm ON playlists USING gin "
+        "(soulspot_fold(name) gin_trgm_ops)"
+    ),
+]
+
+_TRGM_INDEXES = (
+    ("ix_soulspot_tracks_title_trgm", "soulspot_tracks"),
+    ("ix_soulspot_artists_name_trgm", "soulspot_artists"),
+    ("ix_soulspot_albums_title_trgm", "soulspot_albums"),
+    ("ix_playlists_name_trgm", "playlists"),
+)
+
+
+def upgrade() -> None:
+    """Create the search index for the current dialect and fill it."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        for statement in _SQLITE_DDL:
+            op.execute(statement)
+        for statement in _SQLITE_BACKFILL:
+            op.execute(statement)
+    elif dialect == "postgresql":
+        for statement in _POSTGRES_DDL:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Drop the search index (extensions stay - other things may use them)."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        for statement in _SQLITE_DROP:
+            op.execute(statement)
+    elif dialect == "postgresql":
+        for index, _table in _TRGM_INDEXES:
+            op.execute(f"DROP INDEX IF EXISTS {index}")
+        op.execute("DROP FUNCTION IF EXISTS soulspot_fold(text)")
@@ -0,0 +1,212 @@
+"""add maintained library aggregates and keyset browse indexes
+
+Revision ID: GGG38031llM79
+Revises: FFF38030kkL78
+Create Date: 2026-01-23 10:00:00.000000
+
+Hey future me - NO MORE GROUP BY ON EVERY BROWSE REQUEST!
+
+/library/artists and /library/albums recomputed track/album counts with GROUP BY
+subqueries over the whole tracks/albums tables on every request, then sorted the
+complete result. Now:
+
+- soulspot_artists gets track_count, local_track_count, album_count,
+  local_album_count, total_duration_ms, has_local_files
+- soulspot_albums gets track_count, local_track_count, total_duration_ms,
+  has_local_files
+- maintained by soulspot.infrastructure.persistence.library_aggregates (scanner,
+  auto-import, cleanup) - this migration only backfills them once
+- browse indexes (lower(name|title), id) for keyset pagination, plus the
+  artist_id/album_id indexes the incremental refresh needs
+
+Plain op.add_column (no batch_alter_table!) on purpose: a SQLite batch rebuild
+recreates the table and drops its FTS triggers from FFF38030kkL78 and its
+expression indexes. downgrade() can't avoid the rebuild - it runs it inside
+_sqlite_rebuild_guard(), which restores both. All upgrade steps are idempotent
+(checked via inspector).
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "GGG38031llM79"
+down_revision: str | None = "FFF38030kkL78"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_ARTIST_COLUMNS = [
+    "track_count",
+    "local_track_count",
+    "album_count",
+    "local_album_count",
+    "total_duration_ms",
+    "has_local_files",
+]
+_ALBUM_COLUMNS = [
+    "track_count",
+    "local_track_count",
+    "total_duration_ms",
+    "has_local_files",
+]
+
+# (index name, table, columns)
+_INDEXES = [
+    ("ix_soulspot_artists_browse", "soulspot_artists", ["lower(name)", "id"]),
+    ("ix_soulspot_albums_browse", "soulspot_albums", ["lower(title)", "id"]),
+    ("ix_soulspot_albums_artist_id", "soulspot_albums", ["artist_id"]),
+    (
+        "ix_soulspot_tracks_artist_browse",
+        "soulspot_tracks",
+        ["artist_id", "lower(title)", "id"],
+    ),
+    ("ix_soulspot_tracks_album_id", "soulspot_tracks", ["album_id"]),
+]
+
+# Copied from soulspot.infrastructure.persistence.library_aggregates on purpose -
+# migrations must not import app code that changes later. Albums first!
+_BACKFILL_SQL = [
+    """
+    UPDATE soulspot_albums SET
+        track_count = (
+            SELECT count(*) FROM soulspot_tracks t
+            WHERE t.album_id = soulspot_albums.id
+        ),
+        local_track_count = (
+            SELECT count(*) FROM soulspot_tracks t
+            WHERE t.album_id = soulspot_albums.id AND t.file_path IS NOT NULL
+        ),
+        total_duration_ms = (
+            SELECT coalesce(sum(t.duration_ms), 0) FROM soulspot_tracks t
+            WHERE t.album_id = soulspot_albums.id
+        ),
+        has_local_files = EXISTS (
+            SELECT 1 FROM soulspot_tracks t
+            WHERE t.album_id = soulspot_albums.id AND t.file_path IS NOT NULL
+        )
+    """,
+    """
+    UPDATE soulspot_artists SET
+        track_count = (
+            SELECT count(*) FROM soulspot_tracks t
+            WHERE t.artist_id = soulspot_artists.id
+        ),
+        local_track_count = (
+            SELECT count(*) FROM soulspot_tracks t
+            WHERE t.artist_id = soulspot_artists.id AND t.file_path IS NOT NULL
+        ),
+        album_count = (
+            SELECT count(*) FROM soulspot_albums a
+            WHERE a.artist_id = soulspot_artists.id
+        ),
+        local_album_count = (
+            SELECT count(*) FROM soulspot_albums a
+            WHERE a.artist_id = soulspot_artists.id AND a.has_local_files
+        ),
+        total_duration_ms = (
+            SELECT coalesce(sum(t.duration_ms), 0) FROM soulspot_tracks t
+            WHERE t.artist_id = soulspot_artists.id
+        ),
+        has_local_files = EXISTS (
+            SELECT 1 FROM soulspot_tracks t
+            WHERE t.artist_id = soulspot_artists.id AND t.file_path IS NOT NULL
+        )
+    """,
+]
+
+
+@contextmanager
+def _sqlite_rebuild_guard(table: str) -> Iterator[None]:
+    """Batch-rebuild a SQLite table without losing its triggers and expression indexes.
+
+    Hey future me - alembic's SQLite batch mode copies the table, drops the original
+    and renames the copy. That takes every trigger ON the table with it (FTS sync
+    from FFF38030kkL78) plus the indexes it can't reflect (lower(...) browse
+    indexes), and SQLite refuses the rename while another table's trigger reads the
+    table. So: save their SQL, drop those triggers, rebuild, put back what's missing.
+    """
+    connection = op.get_bind()
+    if connection.dialect.name != "sqlite":
+        yield
+        return
+
+    saved = connection.execute(
+        sa.text(
+            "SELECT type, name, sql FROM sqlite_master WHERE sql IS NOT NULL AND ("
+            "(type = 'index' AND tbl_name = :table) OR "
+            "(type = 'trigger' AND (tbl_name = :table OR sql LIKE :ref)))"
+        ),
+        {"table": table, "ref": f"%{table}%"},
+    ).all()
+    for kind, name, _ in saved:
+        if kind == "trigger":
+            op.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+    yield
+
+    existing = {
+        row[0] for row in connection.execute(sa.text("SELECT name FROM sqlite_master"))
+    }
+    for _, name, sql in saved:
+        if name not in existing:
+            op.execute(sql)
+
+
+def _aggregate_column(name: str) -> sa.Column:
+    if name == "has_local_files":
+        return sa.Column(name, sa.Boolean(), nullable=False, server_default="0")
+    if name == "total_duration_ms":
+        return sa.Column(name, sa.BigInteger(), nullable=False, server_default="0")
+    return sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+
+
+def upgrade() -> None:
+    """Add aggregate columns + browse indexes and backfill the aggregates."""
+    connection = op.get_bind()
+    inspector = inspect(connection)
+
+    for table, columns in (
+        ("soulspot_artists", _ARTIST_COLUMNS),
+        ("soulspot_albums", _ALBUM_COLUMNS),
+    ):
+        existing = {col["name"] for col in inspector.get_columns(table)}
+        for name in columns:
+            if name not in existing:
+                op.add_column(table, _aggregate_column(name))
+
+    for index_name, table, columns in _INDEXES:
+        existing_indexes = {idx["name"] for idx in inspector.get_indexes(table)}
+        if index_name not in existing_indexes:
+            op.create_index(
+                index_name,
+                table,
+                [sa.text(c) if "(" in c else c for c in columns],
+                unique=False,
+            )
+
+    for statement in _BACKFILL_SQL:
+        op.execute(sa.text(statement))
+
+
+def downgrade() -> None:
+    """Drop browse indexes and aggregate columns."""
+    for index_name, table, _ in reversed(_INDEXES):
+        if index_name == "ix_soulspot_albums_artist_id":
+            # May predate this migration (ll25009ooq57) - keep it
+            continue
+        op.drop_index(index_name, table_name=table)
+
+    for table, columns in (
+        ("soulspot_albums", _ALBUM_COLUMNS),
+        ("soulspot_artists", _ARTIST_COLUMNS),
+    ):
+        with (
+            _sqlite_rebuild_guard(table),
+            op.batch_alter_table(table, schema=None) as batch_op,
+        ):
+            for name in reversed(columns):
+                batch_op.drop_column(name)
@@ -0,0 +1,112 @@
+"""add tag-independent audio hash columns to tracks
+
+Revision ID: HHH38032mmN80
+Revises: GGG38031llM79
+Create Date: 2026-01-25 10:00:00.000000
+
+Hey future me - RETAGGING NO LONGER HIDES DUPLICATES!
+
+file_hash covers the whole file, so every tag/artwork/lyrics write by the
+post-processing pipeline changed it and identical audio was never matched.
+audio_hash covers only the audio frames (see application/services/
+audio_fingerprint.py), so it survives tag edits:
+
+- audio_hash (indexed): exact-audio duplicates are one GROUP BY over the index
+- audio_hash_algorithm: "audio-sha256" (full) or "audio-sha256-partial"
+- audio_payload_size: length of the audio frames (duplicate funnel + tag edit check)
+- audio_hash_mtime: file_mtime the audio columns were last validated against
+
+Filled by the DUPLICATE_SCAN worker, nothing to backfill here. Plain
+op.add_column (no batch_alter_table!) for the same reason as GGG38031llM79 - a
+SQLite batch rebuild drops the FTS triggers and the lower(title) browse index of
+soulspot_tracks. downgrade() rebuilds inside _sqlite_rebuild_guard(), which
+restores them. Idempotent.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "HHH38032mmN80"
+down_revision: str | None = "GGG38031llM79"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_COLUMNS = [
+    sa.Column("audio_hash", sa.String(64), nullable=True),
+    sa.Column("audio_hash_algorithm", sa.String(20), nullable=True),
+    sa.Column("audio_payload_size", sa.BigInteger(), nullable=True),
+    sa.Column("audio_hash_mtime", sa.Float(), nullable=True),
+]
+
+
+@contextmanager
+def _sqlite_rebuild_guard(table: str) -> Iterator[None]:
+    """Batch-rebuild a SQLite table without losing its triggers and expression indexes.
+
+    Hey future me - alembic's SQLite batch mode copies the table, drops the original
+    and renames the copy. That takes every trigger ON the table with it (FTS sync
+    from FFF38030kkL78) plus the indexes it can't reflect (lower(...) browse
+    indexes), and SQLite refuses the rename while another table's trigger reads the
+    table. So: save their SQL, drop those triggers, rebuild, put back what's missing.
+    """
+    connection = op.get_bind()
+    if connection.dialect.name != "sqlite":
+        yield
+        return
+
+    saved = connection.execute(
+        sa.text(
+            "SELECT type, name, sql FROM sqlite_master WHERE sql IS NOT NULL AND ("
+            "(type = 'index' AND tbl_name = :table) OR "
+            "(type = 'trigger' AND (tbl_name = :table OR sql LIKE :ref)))"
+        ),
+        {"table": table, "ref": f"%{table}%"},
+    ).all()
+    for kind, name, _ in saved:
+        if kind == "trigger":
+            op.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+    yield
+
+    existing = {
+        row[0] for row in connection.execute(sa.text("SELECT name FROM sqlite_master"))
+    }
+    for _, name, sql in saved:
+        if name not in existing:
+            op.execute(sql)
+
+
+def upgrade() -> None:
+    """Add audio hash columns + index to soulspot_tracks."""
+    connection = op.get_bind()
+    inspector = inspect(connection)
+
+    existing = {col["name"] for col in inspector.get_columns("soulspot_tracks")}
+    for column in _COLUMNS:
+        if column.name not in existing:
+            op.add_column("soulspot_tracks", column)
+
+    existing_indexes = {idx["name"] for idx in inspector.get_indexes("soulspot_tracks")}
+    if "ix_soulspot_tracks_audio_hash" not in existing_indexes:
+        op.create_index(
+            "ix_soulspot_tracks_audio_hash",
+            "soulspot_tracks",
+            ["audio_hash"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Drop audio hash index and columns."""
+    op.drop_index("ix_soulspot_tracks_audio_hash", table_name="soulspot_tracks")
+    with (
+        _sqlite_rebuild_guard("soulspot_tracks"),
+        op.batch_alter_table("soulspot_tracks", schema=None) as batch_op,
+    ):
+        for column in reversed(_COLUMNS):
+            batch_op.drop_column(column.name)
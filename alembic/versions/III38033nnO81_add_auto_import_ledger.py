@@ -0,0 +1,59 @@
+"""add auto_import_ledger table
+
+Revision ID: III38033nnO81
+Revises: HHH38032mmN80
+Create Date: 2026-01-26 10:00:00.000000
+
+Hey future me - AutoImportService no longer re-reads the tags of every leftover
+file in downloads on every cycle!
+
+Every file it examined but couldn't import gets a row here:
+- file_path (PK), file_size, file_mtime: unchanged file = skipped
+- outcome: no_match / not_completed / error
+- track_id, isrc, title, artist: what we matched/read, so a completed download
+  can re-queue exactly the files that might belong to it
+
+Filled at runtime, nothing to backfill. Idempotent.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "III38033nnO81"
+down_revision: str | None = "HHH38032mmN80"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    """Create auto_import_ledger."""
+    connection = op.get_bind()
+    inspector = inspect(connection)
+    if inspector.has_table("auto_import_ledger"):
+        return
+
+    op.create_table(
+        "auto_import_ledger",
+        sa.Column("file_path", sa.String(1024), primary_key=True),
+        sa.Column("file_size", sa.BigInteger(), nullable=False),
+        sa.Column("file_mtime", sa.Float(), nullable=False),
+        sa.Column("outcome", sa.String(20), nullable=False),
+        sa.Column("track_id", sa.String(36), nullable=True),
+        sa.Column("isrc", sa.String(20), nullable=True),
+        sa.Column("title", sa.String(512), nullable=True),
+        sa.Column("artist", sa.String(512), nullable=True),
+        sa.Column("detail", sa.Text(), nullable=True),
+        sa.Column(
+            "examined_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop auto_import_ledger."""
+    op.drop_table("auto_import_ledger")
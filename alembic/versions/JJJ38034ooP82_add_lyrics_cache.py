@@ -0,0 +1,60 @@
+"""add lyrics_cache table
+
+Revision ID: JJJ38034ooP82
+Revises: III38033nnO81
+Create Date: 2026-01-27 10:00:00.000000
+
+Hey future me - LyricsService no longer walks LRCLIB -> Genius -> Musixmatch
+for lyrics it already found (or already knows a provider doesn't have)!
+
+One row per (cache_key, provider):
+- found=True: synced_lyrics / plain_lyrics
+- found=False: negative entry, skipped until expires_at
+cache_key = normalized artist | title | duration bucket, isrc indexed as the
+second way in.
+
+Filled at runtime, nothing to backfill. Idempotent.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "JJJ38034ooP82"
+down_revision: str | None = "III38033nnO81"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    """Create lyrics_cache."""
+    connection = op.get_bind()
+    inspector = inspect(connection)
+    if inspector.has_table("lyrics_cache"):
+        return
+
+    op.create_table(
+        "lyrics_cache",
+        sa.Column("cache_key", sa.String(512), nullable=False),
+        sa.Column("provider", sa.String(20), nullable=False),
+        sa.Column("isrc", sa.String(20), nullable=True),
+        sa.Column("found", sa.Boolean(), nullable=False),
+        sa.Column("synced_lyrics", sa.Text(), nullable=True),
+        sa.Column("plain_lyrics", sa.Text(), nullable=True),
+        sa.Column(
+            "fetched_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("cache_key", "provider"),
+    )
+    op.create_index("ix_lyrics_cache_isrc", "lyrics_cache", ["isrc"])
+
+
+def downgrade() -> None:
+    """Drop lyrics_cache."""
+    op.drop_index("ix_lyrics_cache_isrc", table_name="lyrics_cache")
+    op.drop_table("lyrics_cache")
@@ -0,0 +1,103 @@
+"""add content-addressed image store tables
+
+Revision ID: KKK38035ppQ83
+Revises: JJJ38034ooP82
+Create Date: 2026-01-28 10:00:00.000000
+
+Hey future me - identical artwork is downloaded, converted and stored ONCE now!
+
+- image_blobs: one row per stored file (content_hash = sha256 of the WebP),
+  ref_count + orphaned_at indexed → orphan cleanup is a query, not an rglob
+- image_refs: entity → blob, source_url indexed → known URLs aren't downloaded again
+- image_cache_stats: per-category count/bytes, maintained on blob insert/delete
+- indexes on the entity image path columns for the refcount reconcile
+
+Existing files are registered in place by ImageContentStore.adopt_existing_images()
+at startup (needs the image directory, not something a migration should walk).
+Idempotent.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "KKK38035ppQ83"
+down_revision: str | None = "JJJ38034ooP82"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+# (index name, table, columns)
+_PATH_INDEXES = [
+    ("ix_soulspot_artists_image_path", "soulspot_artists", ["image_path"]),
+    ("ix_soulspot_albums_cover_path", "soulspot_albums", ["cover_path"]),
+    ("ix_playlists_cover_path", "playlists", ["cover_path"]),
+]
+
+
+def upgrade() -> None:
+    """Create image store tables + path indexes."""
+    connection = op.get_bind()
+    inspector = inspect(connection)
+
+    if not inspector.has_table("image_blobs"):
+        op.create_table(
+            "image_blobs",
+            sa.Column("content_hash", sa.String(64), primary_key=True),
+            sa.Column("relative_path", sa.String(512), nullable=False, unique=True),
+            sa.Column("category", sa.String(20), nullable=False),
+            sa.Column("size_bytes", sa.BigInteger(), nullable=False),
+            sa.Column("source_hash", sa.String(80), nullable=True),
+            sa.Column("ref_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.text("CURRENT_TIMESTAMP"),
+            ),
+            sa.Column("orphaned_at", sa.DateTime(timezone=True), nullable=True),
+        )
+        op.create_index("ix_image_blobs_source_hash", "image_blobs", ["source_hash"])
+        op.create_index(
+            "ix_image_blobs_orphans", "image_blobs", ["ref_count", "orphaned_at"]
+        )
+
+    if not inspector.has_table("image_refs"):
+        op.create_table(
+            "image_refs",
+            sa.Column("ref_key", sa.String(255), primary_key=True),
+            sa.Column("content_hash", sa.String(64), nullable=False),
+            sa.Column("source_url", sa.String(1024), nullable=True),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.text("CURRENT_TIMESTAMP"),
+            ),
+        )
+        op.create_index("ix_image_refs_content_hash", "image_refs", ["content_hash"])
+        op.create_index("ix_image_refs_source_url", "image_refs", ["source_url"])
+
+    if not inspector.has_table("image_cache_stats"):
+        op.create_table(
+            "image_cache_stats",
+            sa.Column("category", sa.String(20), primary_key=True),
+            sa.Column("image_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column(
+                "total_bytes", sa.BigInteger(), nullable=False, server_default="0"
+            ),
+        )
+
+    for index_name, table, columns in _PATH_INDEXES:
+        existing_indexes = {idx["name"] for idx in inspector.get_indexes(table)}
+        if index_name not in existing_indexes:
+            op.create_index(index_name, table, columns)
+
+
+def downgrade() -> None:
+    """Drop image store tables + path indexes."""
+    for index_name, table, _ in reversed(_PATH_INDEXES):
+        op.drop_index(index_name, table_name=table)
+    op.drop_table("image_cache_stats")
+    op.drop_table("image_refs")
+    op.drop_table("image_blobs")
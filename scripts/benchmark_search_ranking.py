@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for Soulseek search-result ranking.
+
+Hey future me - run this after touching search_ranking.py / advanced_search.py!
+
+Generates N synthetic slskd results (default 10k: mix of formats, bitrates, junk
+keywords, messy separators, lengths around the expected duration) and times:
+- legacy:  the old per-result loop (token_set_ratio + scoring per SearchResult)
+- engine:  SearchRankingEngine.rank() (cdist + array scoring), full sort
+- top-1:   SearchRankingEngine.rank(limit=1) - what select_best_match() does
+
+Usage:
+    python scripts/benchmark_search_ranking.py [--results 10000] [--repeat 5]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from rapidfuzz import fuzz  # noqa: E402
+
+from soulspot.application.services.advanced_search import (  # noqa: E402
+    AdvancedSearchService,
+    SearchFilters,
+    SearchResult,
+)
+from soulspot.application.services.search_ranking import (  # noqa: E402
+    NUMPY_AVAILABLE,
+    SearchRankingEngine,
+)
+
+QUERY = "Queen Bohemian Rhapsody"
+EXPECTED_DURATION = 355
+
+_WORDS = ["queen", "bohemian", "rhapsody", "night", "opera", "remaster", "2011"]
+_NOISE = ["live", "karaoke", "cover", "demo", "[FLAC]", "(Official)", "best of"]
+_FORMATS = [("flac", 900), ("mp3", 320), ("mp3", 192), ("m4a", 256), ("ogg", 160)]
+
+
+def synthetic_results(count: int, seed: int = 42) -> list[dict[str, Any]]:
+    """Build slskd-shaped results with realistic variety."""
+    rng = random.Random(seed)
+    results = []
+    for i in range(count):
+        words = rng.sample(_WORDS, rng.randint(2, len(_WORDS)))
+        if rng.random() < 0.3:
+            words.append(rng.choice(_NOISE))
+        separator = rng.choice([" ", "_", " - ", "."])
+        ext, bitrate = rng.choice(_FORMATS)
+        results.append(
+            {
+                "username": f"user{i % 500}",
+                "filename": f"@@music\\Queen\\Album {i % 40}\\{i:02d} "
+                f"{separator.join(words)}.{ext}",
+                "size": rng.randint(2_000_000, 45_000_000),
+                "bitrate": bitrate,
+                "length": EXPECTED_DURATION + rng.randint(-40, 40),
+                "quality": 0,
+            }
+        )
+    return results
+
+
+def legacy_rank(service: AdvancedSearchService, results: list[dict[str, Any]]) -> Any:
+    """The pre-engine pipeline: one result at a time in Python."""
+    enhanced = []
+    for result in results:
+        base = service._extract_base_filename(result["filename"])
+        fuzzy_score = fuzz.token_set_ratio(QUERY.lower(), base.lower())
+        if fuzzy_score >= 60:
+            enhanced.append(
+                SearchResult(
+                    username=result["username"],
+                    filename=result["filename"],
+                    size=result["size"],
+                    bitrate=result["bitrate"],
+                    length=result["length"],
+                    fuzzy_score=fuzzy_score,
+                )
+            )
+    enhanced = service.apply_exclusion_filters(enhanced, None)
+    return service.rank_results(enhanced, QUERY)
+
+
+def timed(label: str, repeat: int, fn: Any) -> None:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - start) * 1000)
+    median = statistics.median(runs)
+    print(f"  {label:<8} median {median:8.1f} ms  min {min(runs):8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = synthetic_results(args.results)
+    service = AdvancedSearchService()
+    engine = SearchRankingEngine()
+    filters = SearchFilters(fuzzy_threshold=60)
+    keywords = service.default_exclusion_keywords
+
+    print(f"{args.results} results, numpy={'yes' if NUMPY_AVAILABLE else 'no'}")
+    timed("legacy", args.repeat, lambda: legacy_rank(service, results))
+    timed(
+        "engine",
+        args.repeat,
+        lambda: engine.rank(QUERY, results, filters, keywords, EXPECTED_DURATION),
+    )
+    timed(
+        "top-1",
+        args.repeat,
+        lambda: engine.rank(
+            QUERY, results, filters, keywords, EXPECTED_DURATION, limit=1
+        ),
+    )
+
+    best = engine.rank(QUERY, results, filters, keywords, EXPECTED_DURATION, limit=1)
+    if best:
+        print(f"best: {best[0].filename} ({best[0].match_score:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Offline time-to-download benchmark for the streaming Soulseek search.
+
+Hey future me - run this after touching SlskdClient.search_stream or the early accept
+in SearchAndDownloadTrackUseCase! No slskd needed: FakeSlskdTransport plays peers
+answering over the search window (a few fast junk/low-bitrate peers, one good FLAC
+after ~2s, stragglers until the timeout).
+
+Times two ways to get from "search started" to "best file picked":
+- full:    wait for the whole search (accept_score=None) - the pre-streaming behaviour
+- stream:  rank batches as they arrive, stop at accept_score (default 85)
+and prints which file each picked, how many results it saw, and whether the slskd
+search was stopped early.
+
+Usage:
+    python scripts/benchmark_streaming_search.py [--timeout 10] [--accept 85]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from soulspot.application.services.advanced_search import (  # noqa: E402
+    AdvancedSearchService,
+    SearchFilters,
+)
+from soulspot.config.settings import SlskdSettings  # noqa: E402
+from soulspot.infrastructure.integrations.slskd_client import SlskdClient  # noqa: E402
+from soulspot.infrastructure.integrations.slskd_fake import (  # noqa: E402
+    FakePeer,
+    FakeSlskdTransport,
+)
+
+QUERY = "Queen Bohemian Rhapsody"
+EXPECTED_DURATION = 355
+
+
+def _file(name: str, bitrate: int, size: int, length: int = 355) -> dict[str, Any]:
+    return {"filename": name, "bitRate": bitrate, "size": size, "length": length}
+
+
+def fake_peers(timeout: float) -> list[FakePeer]:
+    """Peers in the order real searches tend to look like: junk first, good stuff later."""
+    peers = [
+        FakePeer(
+            f"early{i}",
+            delay=0.1 * i,
+            files=[
+                _file(
+                    f"@@m\\Queen\\Live\\Bohemian Rhapsody (Live {i}).mp3",
+                    128,
+                    5_000_000,
+                ),
+                _file(
+                    f"@@m\\Karaoke\\Bohemian Rhapsody karaoke {i}.mp3", 192, 6_000_000
+                ),
+            ],
+        )
+        for i in range(8)
+    ]
+    peers.append(
+        FakePeer(
+            "good_flac",
+            delay=2.0,
+            files=[
+                _file(
+                    "@@m\\Queen\\A Night at the Opera\\11 Queen - Bohemian Rhapsody.flac",
+                    1000,
+                    42_000_000,
+                )
+            ],
+        )
+    )
+    peers.extend(
+        FakePeer(
+            f"late{i}",
+            delay=2.5 + i * (timeout - 3) / 10,
+            files=[_file(f"@@x\\Queen\\Bohemian Rhapsody {i}.mp3", 320, 9_000_000)],
+        )
+        for i in range(10)
+    )
+    return peers
+
+
+async def run(timeout: int, accept: float | None) -> None:
+    transport = FakeSlskdTransport(fake_peers(timeout))
+    client = SlskdClient(
+        SlskdSettings(url="http://fake-slskd", search_poll_interval=0.25),
+        transport=transport,
+    )
+    service = AdvancedSearchService()
+    filters = SearchFilters(fuzzy_threshold=80)
+
+    start = time.perf_counter()
+    received = 0
+    best = None
+    stream = client.search_stream(QUERY, timeout=timeout)
+    try:
+        async for batch in stream:
+            received += len(batch)
+            match = service.select_best_match(QUERY, batch, filters, EXPECTED_DURATION)
+            if match is not None and (
+                best is None or match.match_score > best.match_score
+            ):
+                best = match
+            if best is not None and accept is not None and best.match_score >= accept:
+                break
+    finally:
+        await stream.aclose()
+        await client.close()
+    elapsed = time.perf_counter() - start
+
+    label = "full" if accept is None else "stream"
+    picked = (
+        f"{best.filename.rsplit(chr(92), 1)[-1]} ({best.match_score:.1f})"
+        if best
+        else "-"
+    )
+    print(
+        f"  {label:<7} {elapsed:6.2f} s  {received:3d} results  "
+        f"stopped early: {'yes' if transport.stopped else 'no':<3}  picked: {picked}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--timeout", type=int, default=10)
+    parser.add_argument("--accept", type=float, default=85.0)
+    args = parser.parse_args()
+
+    print(f"search timeout {args.timeout}s, accept score {args.accept}")
+    asyncio.run(run(args.timeout, None))
+    asyncio.run(run(args.timeout, args.accept))
+
+
+if __name__ == "__main__":
+    main()
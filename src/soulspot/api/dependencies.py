@@ -8,6 +8,7 @@ from fastapi import Cookie, Depends, Header, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from soulspot.application.services.credentials_service import CredentialsService
+from soulspot.application.services.filter_service import FilterService
 from soulspot.application.services.session_store import (
     DatabaseSessionStore,
 )
@@ -38,6 +39,7 @@ from soulspot.application.use_cases.search_and_download import (
 from soulspot.application.workers.download_worker import DownloadWorker
 from soulspot.application.workers.job_queue import JobQueue
 from soulspot.config import Settings, get_settings
+from soulspot.infrastructure.integrations.client_registry import ProviderClientRegistry
 from soulspot.infrastructure.integrations.deezer_client import DeezerClient
 from soulspot.infrastructure.integrations.lastfm_client import LastfmClient
 from soulspot.infrastructure.integrations.musicbrainz_client import MusicBrainzClient
@@ -129,10 +131,46 @@ async def get_credentials_service(
     return CredentialsService(session, fallback_settings=settings)
 
 
-# Yo, creates NEW SpotifyClient on EVERY request! Not cached/singleton. This is fine because
-# SpotifyClient is stateless (httpx client inside is pooled). If SpotifyClient becomes expensive
-# to construct, add @lru_cache but watch out - settings changes won't take effect until restart!
+# Hey future me - provider clients are SHARED now (ProviderClientRegistry)! Building a
+# SpotifyClient per request meant a credentials query + a fresh httpx client (new TCP/TLS
+# handshake, no keep-alive) on every call. The registry hands out one long-lived client and
+# only re-reads credentials when they were saved (version counter) or every 60s. SpotifyClient
+# is stateless (tokens are passed per call), so sharing it across requests is safe.
+# The CredentialsService session is lazy - no DB connection unless the loader actually runs.
+async def _get_shared_spotify_client(
+    credentials_service: CredentialsService,
+) -> SpotifyClient:
+    """Get the process-wide SpotifyClient (rebuilt when credentials change)."""
+    from soulspot.config.settings import SpotifySettings
+
+    async def load() -> tuple[str, str, str]:
+        spotify_creds = await credentials_service.get_spotify_credentials()
+        return (
+            spotify_creds.client_id,
+            spotify_creds.client_secret,
+            spotify_creds.redirect_uri,
+        )
+
+    def build(config: tuple[str, str, str]) -> SpotifyClient:
+        client_id, client_secret, redirect_uri = config
+        return SpotifyClient(
+            SpotifySettings(
+                client_id=client_id,
+                client_secret=client_secret,
+                redirect_uri=redirect_uri,
+            )
+        )
+
+    return await ProviderClientRegistry.get_client(
+        "spotify",
+        version=CredentialsService.credentials_version("spotify"),
+        load=load,
+        build=build,
+    )
+
+
 # UPDATE: Now gets credentials from DB-first via CredentialsService (with .env fallback)!
+# UPDATE 2: Shared client from ProviderClientRegistry instead of a new one per request.
 async def get_spotify_client(
     credentials_service: CredentialsService = Depends(get_credentials_service),
 ) -> SpotifyClient:
@@ -141,17 +179,7 @@ async def get_spotify_client(
     Credentials are loaded from database via CredentialsService with .env fallback.
     This enables runtime credential updates without app restart.
     """
-    from soulspot.config.settings import SpotifySettings
-
-    spotify_creds = await credentials_service.get_spotify_credentials()
-
-    # Create SpotifySettings from DB credentials
-    spotify_settings = SpotifySettings(
-        client_id=spotify_creds.client_id,
-        client_secret=spotify_creds.client_secret,
-        redirect_uri=spotify_creds.redirect_uri,
-    )
-    return SpotifyClient(spotify_settings)
+    return await _get_shared_spotify_client(credentials_service)
 
 
 # Hey future me - SpotifyAuthService wraps all OAuth operations cleanly!
@@ -252,18 +280,11 @@ async def get_spotify_plugin(
     Raises:
         HTTPException: 503 if plugin cannot be created
     """
-    from soulspot.config.settings import SpotifySettings
     from soulspot.infrastructure.plugins.spotify_plugin import SpotifyPlugin
 
     try:
-        # Get credentials from DB (with .env fallback)
-        spotify_creds = await credentials_service.get_spotify_credentials()
-        spotify_settings = SpotifySettings(
-            client_id=spotify_creds.client_id,
-            client_secret=spotify_creds.client_secret,
-            redirect_uri=spotify_creds.redirect_uri,
-        )
-        spotify_client = SpotifyClient(spotify_settings)
+        # Shared client, credentials from DB (with .env fallback)
+        spotify_client = await _get_shared_spotify_client(credentials_service)
         db_token_manager: DatabaseTokenManager = request.app.state.db_token_manager
 
         # Get access token from token manager
@@ -309,17 +330,10 @@ async def get_spotify_plugin_optional(
     Returns:
         SpotifyPlugin instance if authenticated, None otherwise
     """
-    from soulspot.config.settings import SpotifySettings
     from soulspot.infrastructure.plugins.spotify_plugin import SpotifyPlugin
 
     try:
-        spotify_creds = await credentials_service.get_spotify_credentials()
-        spotify_settings = SpotifySettings(
-            client_id=spotify_creds.client_id,
-            client_secret=spotify_creds.client_secret,
-            redirect_uri=spotify_creds.redirect_uri,
-        )
-        spotify_client = SpotifyClient(spotify_settings)
+        spotify_client = await _get_shared_spotify_client(credentials_service)
         db_token_manager: DatabaseTokenManager = request.app.state.db_token_manager
 
         access_token = await db_token_manager.get_token_for_background()
@@ -555,10 +569,10 @@ async def get_spotify_token_shared(request: Request) -> str:
     return access_token
 
 
-# Yo, creates NEW SlskdClient on every request - not cached! Slskd is your Soulseek downloader, this
-# client talks to its API. Like SpotifyClient, it's stateless so creating new instances is fine (httpx
-# pools connections internally). If slskd server is down, this won't fail until you actually USE the
-# client in an endpoint.
+# Yo, Slskd is your Soulseek downloader, this client talks to its API. It's stateless, so ONE
+# shared instance (ProviderClientRegistry) serves all requests - download pages poll slskd a lot,
+# keep-alive matters here. Saving slskd credentials bumps the version → client is rebuilt.
+# If slskd server is down, this won't fail until you actually USE the client in an endpoint.
 # UPDATE: Now gets credentials from DB-first via CredentialsService (with .env fallback)!
 async def get_slskd_client(
     credentials_service: CredentialsService = Depends(get_credentials_service),
@@ -570,18 +584,34 @@ async def get_slskd_client(
     """
     from soulspot.config.settings import SlskdSettings
 
-    slskd_creds = await credentials_service.get_slskd_credentials()
+    async def load() -> tuple[str, str | None, str | None, str | None]:
+        slskd_creds = await credentials_service.get_slskd_credentials()
+        return (
+            slskd_creds.url,
+            slskd_creds.username,
+            slskd_creds.password,
+            slskd_creds.api_key,
+        )
 
-    # Create SlskdSettings from DB credentials
-    # Hey future me - username/password can be None if not configured in DB!
-    # Use defaults to prevent Pydantic validation errors.
-    slskd_settings = SlskdSettings(
-        url=slskd_creds.url,
-        username=slskd_creds.username or "admin",
-        password=slskd_creds.password or "changeme",
-        api_key=slskd_creds.api_key,
+    def build(config: tuple[str, str | None, str | None, str | None]) -> SlskdClient:
+        url, username, password, api_key = config
+        # Create SlskdSettings from DB credentials
+        # Hey future me - username/password can be None if not configured in DB!
+        # Use defaults to prevent Pydantic validation errors.
+        slskd_settings = SlskdSettings(
+            url=url,
+            username=username or "admin",
+            password=password or "changeme",
+            api_key=api_key,
+        )
+        return SlskdClient(slskd_settings)
+
+    return await ProviderClientRegistry.get_client(
+        "slskd",
+        version=CredentialsService.credentials_version("slskd"),
+        load=load,
+        build=build,
     )
-    return SlskdClient(slskd_settings)
 
 
 # Hey future me - this checks if slskd is currently available for downloads!
@@ -605,14 +635,23 @@ async def check_slskd_available(
 
 
 # Hey, MusicBrainz is the metadata enrichment source - gets artist/album/track info from their public
-# database. Not cached, new client per request. MusicBrainz has RATE LIMITS (1 req/sec for anonymous,
-# higher if you set contact info in settings.musicbrainz.contact). If you hammer it too fast, you'll
-# get 503 errors! The client should handle rate limiting internally but watch out for that.
-def get_musicbrainz_client(
+# database. Shared client (ProviderClientRegistry), config comes from .env only. MusicBrainz has RATE
+# LIMITS (1 req/sec) - the client uses the process-wide limiter from rate_limiter.py, so it doesn't
+# matter how many requests/workers use it at once. If you hammer it too fast, you'll get 503 errors!
+async def get_musicbrainz_client(
     settings: Settings = Depends(get_settings),
 ) -> MusicBrainzClient:
     """Get MusicBrainz client instance."""
-    return MusicBrainzClient(settings.musicbrainz)
+
+    async def load() -> str:
+        return settings.musicbrainz.model_dump_json()
+
+    return await ProviderClientRegistry.get_client(
+        "musicbrainz",
+        version=0,
+        load=load,
+        build=lambda _: MusicBrainzClient(settings.musicbrainz),
+    )
 
 
 # Listen up, Last.fm is OPTIONAL! Returns None if API key isn't configured. This is different from other
@@ -745,12 +784,14 @@ def get_search_and_download_use_case(
     slskd_client: SlskdClient = Depends(get_slskd_client),
     track_repository: TrackRepository = Depends(get_track_repository),
     download_repository: DownloadRepository = Depends(get_download_repository),
+    session: AsyncSession = Depends(get_db_session),
 ) -> SearchAndDownloadTrackUseCase:
     """Get search and download use case instance."""
     return SearchAndDownloadTrackUseCase(
         slskd_client=slskd_client,
         track_repository=track_repository,
         download_repository=download_repository,
+        filter_service=FilterService(session),
     )
 
 
@@ -1098,10 +1139,16 @@ async def get_library_view_service(
     )
 
 
+async def _load_no_config() -> None:
+    """Registry loader for clients without any config (public APIs)."""
+    return None
+
+
 # Hey future me - DeezerClient is stateless and doesn't need OAuth!
 # Perfect for browse/discovery features when user isn't logged into Spotify.
-# Creates a new client per request (cheap - just httpx setup).
-def get_deezer_client() -> DeezerClient:
+# Shared client from ProviderClientRegistry - browse pages fire lots of Deezer calls,
+# one keep-alive pool instead of a new TLS handshake per request.
+async def get_deezer_client() -> DeezerClient:
     """Get Deezer client instance for no-auth music discovery.
 
     Deezer API is perfect for:
@@ -1114,13 +1161,18 @@ def get_deezer_client() -> DeezerClient:
     Returns:
         DeezerClient instance
     """
-    return DeezerClient()
+    return await ProviderClientRegistry.get_client(
+        "deezer",
+        version=0,
+        load=_load_no_config,
+        build=lambda _: DeezerClient(),
+    )
 
 
 # Hey future me - DeezerPlugin wraps DeezerClient and converts to DTOs!
 # Like SpotifyPlugin but simpler - no OAuth needed for most operations.
 # Use this for browse/discovery features without auth requirements.
-def get_deezer_plugin() -> "DeezerPlugin":
+async def get_deezer_plugin() -> "DeezerPlugin":
     """Get Deezer plugin instance for no-auth music discovery.
 
     The plugin wraps DeezerClient and provides:
@@ -1136,7 +1188,7 @@ def get_deezer_plugin() -> "DeezerPlugin":
     """
     from soulspot.infrastructure.plugins.deezer_plugin import DeezerPlugin
 
-    return DeezerPlugin()
+    return DeezerPlugin(client=await get_deezer_client())
 
 
 # Hey future me - DeezerSyncService synct Deezer-Daten zur DB!
@@ -1264,7 +1316,7 @@ async def get_image_service_with_session(
     Async methods that need session:
     - get_image() - Loads entity from DB
     - download_and_cache() - Updates entity image_path in DB
-    - _update_entity_image_path() - Internal DB update
+    - update_entity_image_path() - DB update (after store_entity_image())
 
     Args:
         session: Database session for entity operations
@@ -6,20 +6,47 @@ The image_path stored in the database is relative to IMAGE_PATH setting.
 This endpoint resolves the full path and serves the file securely.
 
 Security: Uses Path.resolve() + is_relative_to() to prevent path traversal attacks.
+
+Caching (see application/services/images/variants.py):
+- ?size=N serves a resized variant (64/150/300/600), generated once and cached
+- Strong content ETag, If-None-Match → 304 Not Modified
+- ?v=<digest> URLs (what get_display_url() emits) are immutable: cached for a year
+- Everything else: "no-cache" = browser revalidates, gets a cheap 304
 """
 
+import asyncio
 import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
-
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse, Response
+
+from soulspot.application.services.images.variants import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    ImageVariantStore,
+    content_digest,
+    etag_matches,
+    make_etag,
+    snap_variant_size,
+)
 from soulspot.config import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/images", tags=["images"])
 
+# Hey future me - one store per image root (SingleFlight must be shared across requests)
+_variant_stores: dict[str, ImageVariantStore] = {}
+
+
+def _get_variant_store(settings: Settings) -> ImageVariantStore:
+    key = str(settings.storage.image_path)
+    store = _variant_stores.get(key)
+    if store is None:
+        store = _variant_stores[key] = ImageVariantStore(settings.storage.image_path)
+    return store
+
 
 # Hey future me - this serves local image files from the IMAGE_PATH directory!
 # Security is critical here: we MUST prevent path traversal attacks (../../etc/passwd).
@@ -27,15 +54,20 @@ router = APIRouter(prefix="/images", tags=["images"])
 @router.get("/{file_path:path}")
 async def serve_image(
     file_path: str,
+    request: Request,
     settings: Annotated[Settings, Depends(get_settings)],
-) -> FileResponse:
+    size: Annotated[int | None, Query(ge=1, le=4096)] = None,
+    v: Annotated[str | None, Query(max_length=64)] = None,
+) -> Response:
     """Serve image file from local storage.
 
     Args:
         file_path: Relative path to image file (from image_path setting)
+        size: Optional edge length in px (snapped to 64/150/300/600)
+        v: Content digest from get_display_url() - makes the response immutable
 
     Returns:
-        FileResponse with the image file
+        FileResponse with the image file, or 304 if the client's copy is current
 
     Raises:
         404 if file not found
@@ -61,8 +93,38 @@ async def serve_image(
     if not full_path.exists() or not full_path.is_file():
         raise HTTPException(status_code=404, detail="Image not found")
 
+    # Memo hit = one stat; a new file gets hashed off the event loop
+    digest = await asyncio.to_thread(content_digest, full_path)
+    if digest is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    variant_size = snap_variant_size(size) if size else None
+    etag = make_etag(digest, variant_size)
+    # Only the URL that names the current content may be cached forever - an old
+    # ?v= after the cover changed must revalidate, or the browser keeps the old one
+    headers = {
+        "ETag": etag,
+        "Cache-Control": (
+            IMMUTABLE_CACHE_CONTROL if v == digest else REVALIDATE_CACHE_CONTROL
+        ),
+    }
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    serve_path = full_path
+    if variant_size:
+        variant = await _get_variant_store(settings).get_variant(
+            full_path, digest, variant_size
+        )
+        if variant is not None:
+            serve_path = variant
+        else:
+            # Original instead of the variant - don't let that get cached forever
+            headers = {"ETag": make_etag(digest), "Cache-Control": "no-store"}
+
     # Determine media type from extension
-    suffix = full_path.suffix.lower()
+    suffix = serve_path.suffix.lower()
     media_types = {
         ".jpg": "image/jpeg",
         ".jpeg": "image/jpeg",
@@ -73,7 +135,8 @@ async def serve_image(
     media_type = media_types.get(suffix, "application/octet-stream")
 
     return FileResponse(
-        path=full_path,
+        path=serve_path,
         media_type=media_type,
         filename=full_path.name,
+        headers=headers,
     )
@@ -48,7 +48,7 @@ class DuplicateCandidate(BaseModel):
     track_2_artist: str
     track_2_file_path: str | None
     similarity_score: int  # 0-100
-    match_type: str  # metadata, fingerprint
+    match_type: str  # metadata, file_hash, audio_hash, fingerprint
     status: str  # pending, confirmed, dismissed
     created_at: str
 
@@ -6,6 +6,7 @@ Endpoints:
 - GET /api/metrics         → Prometheus text format
 - GET /api/metrics/json    → JSON format for debugging
 - GET /api/metrics/circuit-breakers → Circuit breaker status
+- GET /api/metrics/provider-requests → Coalesced provider API calls (single-flight)
 
 The metrics endpoint is scraped by Prometheus at regular intervals.
 Grafana can visualize these metrics in dashboards.
@@ -18,6 +19,9 @@ from fastapi import APIRouter, Depends
 from fastapi.responses import PlainTextResponse
 
 from soulspot.api.dependencies import get_download_repository
+from soulspot.infrastructure.integrations.single_flight import (
+    get_single_flight_stats,
+)
 from soulspot.infrastructure.observability.circuit_breaker import (
     get_circuit_breaker_stats,
 )
@@ -79,6 +83,10 @@ async def get_prometheus_metrics(
     if circuit_breaker_output:
         prometheus_output += "\n\n" + circuit_breaker_output
 
+    single_flight_output = _format_single_flight_prometheus()
+    if single_flight_output:
+        prometheus_output += "\n\n" + single_flight_output
+
     return prometheus_output
 
 
@@ -126,6 +134,7 @@ async def get_metrics_json(
                 "total_failed": failed,
             },
             "metrics": metrics.get_summary(),
+            "provider_requests": _single_flight_summary(),
         }
 
     except Exception as e:
@@ -191,6 +200,58 @@ async def get_circuit_breaker_metrics() -> dict[str, Any]:
     }
 
 
+@router.get("/provider-requests")
+async def get_provider_request_metrics() -> dict[str, Any]:
+    """Get request coalescing (single-flight) counters per provider.
+
+    Hey future me - "coalesced" are provider API calls that did NOT cost a rate limit
+    token because an identical request was already in flight!
+
+    Returns:
+        Leader/coalesced/in-flight counts per provider
+    """
+    return _single_flight_summary()
+
+
+def _single_flight_summary() -> dict[str, Any]:
+    """Build the JSON view of the single-flight counters."""
+    return {
+        name: {
+            "requests": stats.leaders,
+            "coalesced": stats.coalesced,
+            "in_flight": stats.in_flight,
+            "coalesce_rate": round(stats.coalesce_rate * 100, 2),
+        }
+        for name, stats in get_single_flight_stats().items()
+    }
+
+
+def _format_single_flight_prometheus() -> str:
+    """Format single-flight counters as Prometheus metrics.
+
+    Metrics:
+    - provider_requests_total: Provider API calls that were actually sent
+    - provider_requests_coalesced_total: Calls served by an identical in-flight call
+    """
+    all_stats = get_single_flight_stats()
+    if not all_stats:
+        return ""
+
+    lines = [
+        "# HELP provider_requests_total Provider API requests actually sent (coalescable GETs)",
+        "# TYPE provider_requests_total counter",
+        "# HELP provider_requests_coalesced_total Provider API calls served by an identical in-flight request",
+        "# TYPE provider_requests_coalesced_total counter",
+    ]
+    for name, stats in all_stats.items():
+        lines.append(f'provider_requests_total{{provider="{name}"}} {stats.leaders}')
+        lines.append(
+            f'provider_requests_coalesced_total{{provider="{name}"}} {stats.coalesced}'
+        )
+
+    return "\n".join(lines)
+
+
 def _format_circuit_breakers_prometheus() -> str:
     """Format circuit breaker stats as Prometheus metrics.
 
@@ -563,8 +563,8 @@ async def get_spotify_sync_settings(
 
         image_service = get_image_service(get_settings())
 
-        disk_usage = image_service.get_disk_usage()
-        image_count = image_service.get_image_count()
+        disk_usage = await image_service.get_disk_usage()
+        image_count = await image_service.get_image_count()
 
         image_stats = SpotifyImageStats(
             artists_bytes=disk_usage.get("artists", 0),
@@ -755,8 +755,8 @@ async def get_library_image_stats(
     Returns breakdown of storage used by artist, album, and playlist images
     from all providers (Spotify, Deezer, Tidal, etc.).
     """
-    disk_usage = image_service.get_disk_usage()
-    image_count = image_service.get_image_count()
+    disk_usage = await image_service.get_disk_usage()
+    image_count = await image_service.get_image_count()
 
     return SpotifyImageStats(
         artists_bytes=disk_usage.get("artists", 0),
@@ -14,11 +14,16 @@ from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from soulspot.api.dependencies import get_db_session, get_download_repository
+from soulspot.infrastructure.event_bus import (
+    DOWNLOAD_TOPIC,
+    JOB_TOPIC,
+    RESYNC_TOPIC,
+    get_event_bus,
+)
+from soulspot.infrastructure.persistence.database import Database
 from soulspot.infrastructure.persistence.repositories import DownloadRepository
 
 logger = logging.getLogger(__name__)
@@ -88,26 +93,93 @@ class SSEEvent:
         return message
 
 
-# Hey future me, the main SSE event stream! This keeps connections alive and streams real-time updates
-# to clients. poll_interval defaults to 2 seconds which is reasonable - faster = more load, slower = lag.
-# Uses client_id = id(request) for logging which is just memory address - not very meaningful but works
-# for debugging. Heartbeat every 30 seconds (15 iterations * 2s) prevents connection timeout. The
-# "while True" loop runs forever until client disconnects or exception. await request.is_disconnected()
-# checks if client dropped connection - graceful handling. Downloads limited to 10 most recent, same as
-# widget. AsyncGenerator return type with explicit yield makes this a true stream. Exception handling logs
-# errors but keeps stream alive. CancelledError is expected when connection closes. IMPORTANT: infinite
-# loops can leak resources if not properly cleaned up! FastAPI handles this via async context manager.
+# Hey future me - snapshot of the active downloads, shared by ALL SSE clients!
+# Deltas come from the event bus, but a fresh client (or one that fell behind) needs
+# the full picture once. That picture is the bus' retained state, loaded from the DB
+# at most once per _SNAPSHOT_MAX_AGE_SECONDS for the WHOLE process - the lock makes
+# 10 tabs connecting at once share one query. Downloads the API creates (WAITING)
+# show up as soon as the DownloadQueueWorker dispatches them, or with the next reload.
+_SNAPSHOT_MAX_AGE_SECONDS = 60.0
+_SNAPSHOT_LIMIT = 500
+_snapshot_lock = asyncio.Lock()
+
+
+async def _ensure_download_snapshot(request: Request) -> None:
+    """Seed the retained download state from the DB if it is missing or stale."""
+    bus = get_event_bus()
+    age = bus.seed_age(DOWNLOAD_TOPIC)
+    if age is not None and age < _SNAPSHOT_MAX_AGE_SECONDS:
+        return
+
+    async with _snapshot_lock:
+        age = bus.seed_age(DOWNLOAD_TOPIC)
+        if age is not None and age < _SNAPSHOT_MAX_AGE_SECONDS:
+            return  # Another client loaded it while we waited
+
+        db: Database = request.app.state.db
+        async with db.session_scope() as session:
+            downloads = await DownloadRepository(session).list_active(
+                limit=_SNAPSHOT_LIMIT
+            )
+
+        bus.seed(
+            DOWNLOAD_TOPIC,
+            {
+                str(download.id.value): {
+                    "id": str(download.id.value),
+                    "track_id": str(download.track_id.value),
+                    "status": download.status.value,
+                    "progress_percent": download.progress_percent or 0,
+                    "priority": download.priority,
+                    "created_at": download.created_at.isoformat(),
+                }
+                for download in downloads
+            },
+        )
+
+
+def _downloads_snapshot_event() -> SSEEvent:
+    """Build the full "downloads_update" event from the retained state."""
+    downloads = get_event_bus().retained(DOWNLOAD_TOPIC)
+    # Same order as DownloadRepository.list_active: priority desc, newest first
+    downloads.sort(key=lambda d: d.get("created_at") or "", reverse=True)
+    downloads.sort(key=lambda d: d.get("priority") or 0, reverse=True)
+
+    return SSEEvent(
+        data={
+            "downloads": [
+                {"progress_percent": 0, **download}
+                for download in downloads[:10]  # Limit to 10 most recent
+            ],
+            "total_count": len(downloads),
+            "timestamp": datetime.now(UTC).isoformat(),
+        },
+        event="downloads_update",
+    )
+
+
+# Hey future me, the main SSE event stream! No DB polling anymore - the stream
+# subscribes to the event bus and forwards deltas:
+# - "downloads_update": full snapshot, sent on connect and after a resync
+# - "download_delta": one download changed (merge it into your list by id)
+# - "job_update": one job changed state/progress
+# - "heartbeat": nothing happened for heartbeat_interval seconds
+# We subscribe BEFORE building the snapshot so no delta can fall in between (worst
+# case a delta repeats what the snapshot already said - harmless). A client that
+# can't keep up gets its queue dropped by the bus and a fresh snapshot instead.
+# is_disconnected() is checked at least every _DISCONNECT_CHECK_SECONDS.
+_DISCONNECT_CHECK_SECONDS = 5.0
+
+
 async def event_generator(
     request: Request,
-    download_repository: DownloadRepository,
-    poll_interval: float = 2.0,
+    heartbeat_interval: float = 30.0,
 ) -> AsyncGenerator[str, None]:
     """Generate SSE events for real-time updates.
 
     Args:
         request: FastAPI request object (to detect client disconnect)
-        download_repository: Repository for download data
-        poll_interval: Seconds between updates
+        heartbeat_interval: Seconds without events before a heartbeat is sent
 
     Yields:
         SSE-formatted event strings
@@ -115,71 +187,65 @@ async def event_generator(
     client_id = id(request)
     logger.info(f"SSE connection established: client_id={client_id}")
 
-    # Send initial connection event
-    yield SSEEvent(
-        data={
-            "message": "Connected to event stream",
-            "timestamp": datetime.now(UTC).isoformat(),
-        },
-        event="connected",
-        id=str(client_id),
-    ).encode()
-
-    # Heartbeat counter
-    heartbeat_counter = 0
-
+    bus = get_event_bus()
     try:
-        while True:
-            # Check if client disconnected
-            if await request.is_disconnected():
-                logger.info(f"SSE client disconnected: client_id={client_id}")
-                break
-
-            # Send heartbeat every 30 seconds (15 iterations * 2s)
-            heartbeat_counter += 1
-            if heartbeat_counter >= 15:
-                yield SSEEvent(
-                    data={"timestamp": datetime.now(UTC).isoformat()},
-                    event="heartbeat",
-                ).encode()
-                heartbeat_counter = 0
+        with bus.subscribe((DOWNLOAD_TOPIC, JOB_TOPIC)) as subscription:
+            # Send initial connection event
+            yield SSEEvent(
+                data={
+                    "message": "Connected to event stream",
+                    "timestamp": datetime.now(UTC).isoformat(),
+                },
+                event="connected",
+                id=str(client_id),
+            ).encode()
 
-            # Get active downloads
             try:
-                downloads = await download_repository.list_active()
-
-                # Prepare download data
-                downloads_data = [
-                    {
-                        "id": str(download.id.value),
-                        "track_id": str(download.track_id.value),
-                        "status": download.status.value,
-                        "progress_percent": download.progress_percent or 0,
-                        "priority": download.priority,
-                        "created_at": download.created_at.isoformat(),
-                    }
-                    for download in downloads[:10]  # Limit to 10 most recent
-                ]
-
-                # Send download update event
-                yield SSEEvent(
-                    data={
-                        "downloads": downloads_data,
-                        "total_count": len(downloads),
-                        "timestamp": datetime.now(UTC).isoformat(),
-                    },
-                    event="downloads_update",
-                ).encode()
-
+                await _ensure_download_snapshot(request)
+                yield _downloads_snapshot_event().encode()
             except Exception as e:
-                logger.exception(f"Error generating SSE event: {e}")
+                logger.exception(f"Error loading SSE download snapshot: {e}")
                 yield SSEEvent(
                     data={"error": str(e), "timestamp": datetime.now(UTC).isoformat()},
                     event="error",
                 ).encode()
 
-            # Wait before next update
-            await asyncio.sleep(poll_interval)
+            idle = 0.0
+            while True:
+                # Check if client disconnected
+                if await request.is_disconnected():
+                    logger.info(f"SSE client disconnected: client_id={client_id}")
+                    break
+
+                event = await subscription.get(timeout=_DISCONNECT_CHECK_SECONDS)
+                if event is None:
+                    idle += _DISCONNECT_CHECK_SECONDS
+                    if idle >= heartbeat_interval:
+                        yield SSEEvent(
+                            data={"timestamp": datetime.now(UTC).isoformat()},
+                            event="heartbeat",
+                        ).encode()
+                        idle = 0.0
+                    continue
+
+                idle = 0.0
+                if event.topic == RESYNC_TOPIC:
+                    logger.debug(
+                        f"SSE client too slow, resyncing: client_id={client_id}"
+                    )
+                    yield _downloads_snapshot_event().encode()
+                elif event.topic == DOWNLOAD_TOPIC:
+                    yield SSEEvent(
+                        data={"download": event.data, "seq": event.seq},
+                        event="download_delta",
+                        id=str(event.seq),
+                    ).encode()
+                elif event.topic == JOB_TOPIC:
+                    yield SSEEvent(
+                        data={"job": event.data, "seq": event.seq},
+                        event="job_update",
+                        id=str(event.seq),
+                    ).encode()
 
     except asyncio.CancelledError:
         logger.info(f"SSE connection cancelled: client_id={client_id}")
@@ -192,21 +258,17 @@ async def event_generator(
 # Listen up! The SSE endpoint that clients connect to. Sets critical headers for SSE: Cache-Control
 # no-cache prevents browsers from caching, Connection keep-alive maintains long-lived HTTP connection,
 # X-Accel-Buffering no tells nginx to not buffer (otherwise events get delayed). StreamingResponse with
-# text/event-stream media type is SSE standard. The _session param is unused but dependency is required
-# to maintain session lifecycle. Docstring has good JavaScript example showing client-side usage. Each
-# client gets their own event stream - memory usage scales with number of connected clients! EventSource
-# API on client side auto-reconnects on disconnect which is nice. No authentication here - anyone can
-# connect and see download status! Should require auth if data is sensitive.
+# text/event-stream media type is SSE standard. No DB session dependency anymore - a session held for
+# the whole (hours-long) connection was exactly the problem. EventSource API on client side
+# auto-reconnects on disconnect which is nice. No authentication here - anyone can connect and see
+# download status! Should require auth if data is sensitive.
 @router.get("/stream")
-async def event_stream(
-    request: Request,
-    _session: AsyncSession = Depends(get_db_session),
-    download_repository: DownloadRepository = Depends(get_download_repository),
-) -> StreamingResponse:
+async def event_stream(request: Request) -> StreamingResponse:
     """Server-Sent Events endpoint for real-time updates.
 
     This endpoint establishes an SSE connection and streams events to the client.
-    Events include download status updates, job completions, and heartbeats.
+    After a full "downloads_update" snapshot only changes are sent: download deltas,
+    job updates and heartbeats.
 
     Example client-side usage:
     ```javascript
@@ -217,6 +279,11 @@ async def event_stream(
         console.log('Downloads:', data.downloads);
     });
 
+    eventSource.addEventListener('download_delta', (event) => {
+        const data = JSON.parse(event.data);
+        console.log('Download changed:', data.download);
+    });
+
     eventSource.addEventListener('heartbeat', (event) => {
         console.log('Heartbeat received');
     });
@@ -231,7 +298,7 @@ async def event_stream(
         StreamingResponse with text/event-stream content type
     """
     return StreamingResponse(
-        event_generator(request, download_repository),
+        event_generator(request),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -241,6 +308,23 @@ async def event_stream(
     )
 
 
+@router.get("/stats")
+async def sse_stats() -> dict[str, Any]:
+    """Get event bus counters (subscribers, deliveries, slow-consumer drops).
+
+    Returns:
+        Event bus stats
+    """
+    stats = get_event_bus().get_stats()
+    return {
+        "subscribers": stats.subscribers,
+        "published": stats.published,
+        "delivered": stats.delivered,
+        "slow_consumer_drops": stats.overflows,
+        "active_downloads_retained": len(get_event_bus().retained(DOWNLOAD_TOPIC)),
+    }
+
+
 @router.get("/test")
 async def sse_test(request: Request) -> StreamingResponse:
     """Simple SSE test endpoint for debugging.
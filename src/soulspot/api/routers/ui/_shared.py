@@ -72,6 +72,7 @@ def get_display_url(
     local_path: str | None,
     entity_type: str = "album",
     require_local: bool = False,
+    size: int | None = None,
 ) -> str:
     """Template helper for image URL resolution.
 
@@ -87,9 +88,12 @@ def get_display_url(
         
     For Browse/Search (CDN fallback OK):
         {{ get_display_url(artist.image_url, None, 'artist', False) }}
+
+    For grids/lists (serves a cached thumbnail variant instead of the full image):
+        {{ get_display_url(album.cover_url, album.cover_path, 'album', True, size=300) }}
     """
     return _get_image_service_lazy().get_display_url(
-        source_url, local_path, entity_type, require_local
+        source_url, local_path, entity_type, require_local, size=size
     )  # type: ignore[arg-type]
 
 
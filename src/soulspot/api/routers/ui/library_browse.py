@@ -5,19 +5,28 @@ Hey future me - this module contains the library browsing pages:
 - Albums list (/library/albums)
 - Tracks list (/library/tracks)
 - Compilations list (/library/compilations)
+
+All counts ("3/5 local" badges) come from the MAINTAINED aggregate columns on
+soulspot_artists/soulspot_albums (see persistence/library_aggregates.py) - no GROUP BY
+over the tracks table per request. Artists, albums and tracks use KEYSET pagination
+(?after=<cursor> / ?before=<cursor>) on indexed sort keys, so the last page costs the
+same as the first.
 """
 
 import logging
 from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
 
 from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import HTMLResponse
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, Select, and_, func, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import InstrumentedAttribute, contains_eager, joinedload
 
 from soulspot.api.dependencies import get_db_session, get_track_repository
 from soulspot.api.routers.ui._shared import templates
+from soulspot.api.schemas.pagination import decode_cursor, encode_cursor
+from soulspot.application.services.images.queue import note_images_viewed
 from soulspot.domain.value_objects.album_types import VARIOUS_ARTISTS_PATTERNS
 from soulspot.infrastructure.persistence.models import (
     AlbumModel,
@@ -34,173 +43,256 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-# Hey future me – refactored to load ArtistModel directly with album/track counts!
-# Now includes image_url from Spotify CDN. SQL does aggregation via subqueries instead
-# of loading all tracks into Python memory. Uses pagination (page/per_page params) for
-# big libraries - defaults to 50 per page. image_url comes from Spotify sync – falls back
-# to None if artist wasn't synced.
-# UNIFIED LIBRARY (2025-12): Shows ALL artists in DB, not filtered by file_path!
-# Hey future me - this now checks for unenriched artists and passes enrichment_needed flag!
-@router.get("/library/artists", response_class=HTMLResponse)
-async def library_artists(
-    request: Request,
-    source: str | None = None,  # Filter by source (local/spotify/hybrid/all)
-    _track_repository: TrackRepository = Depends(get_track_repository),
-    session: AsyncSession = Depends(get_db_session),
-) -> Any:
-    """Unified artists browser page - shows LOCAL + SPOTIFY + HYBRID artists.
+# =============================================================================
+# KEYSET PAGINATION HELPERS
+# =============================================================================
 
-    Hey future me - This is now the UNIFIED Music Manager artist view!
-    It shows ALL artists regardless of source (local file scan OR Spotify followed).
-    NO PAGINATION - shows all artists on one page (pagination only for download queue).
 
-    Filter by source param:
-    - ?source=local -> Only artists from local file scans (with or without Spotify)
-    - ?source=spotify -> Only artists followed on Spotify (with or without local files)
-    - ?source=hybrid -> Only artists that exist in BOTH local + Spotify
-    - ?source=all OR no param -> Show ALL artists (default unified view)
+# Sort key of a keyset page - SQL expression or plain mapped column
+_SortKey = ColumnElement[Any] | InstrumentedAttribute[Any]
+
+
+def _seek_condition(
+    keys: list[_SortKey],
+    values: list[Any],
+    forward: bool,
+    split: int | None = None,
+) -> ColumnElement[bool]:
+    """Build the "rows after/before this sort key" condition.
+
+    Hey future me - with split=None this is a plain row-value comparison
+    "(k0, k1) > (:v0, :v1)", which the (k0, k1) index answers with a seek.
+    Sort keys spanning TWO tables (tracks: artist name/id, then track title/id) can't
+    live in one index - split=2 writes it as "artist part >= cursor AND (artist part >
+    cursor OR track part > cursor)": the first conjunct is an index range on the
+    artists, the second resolves ties inside one artist via the tracks index.
+
+    Args:
+        keys: Sort key expressions (ORDER BY order, all ascending)
+        values: Cursor values, same length as keys
+        forward: True = rows after the cursor, False = rows before it
+        split: Index where the second table's keys start (None = one table)
     """
-    # Subquery for total track count per artist (ALL tracks including Spotify-only)
-    # Hey future me - After Table Consolidation (2025-12), we show ALL tracks now!
-    # We also count how many are local (have file_path) for the "X/Y local" badge.
-    total_track_count_subq = (
-        select(TrackModel.artist_id, func.count(TrackModel.id).label("total_tracks"))
-        .group_by(TrackModel.artist_id)
-        .subquery()
+    if split is None:
+        if forward:
+            return tuple_(*keys) > tuple_(*values)
+        return tuple_(*keys) < tuple_(*values)
+
+    outer_keys, outer_values = tuple_(*keys[:split]), tuple_(*values[:split])
+    inner_keys, inner_values = tuple_(*keys[split:]), tuple_(*values[split:])
+    if forward:
+        return and_(
+            outer_keys >= outer_values,
+            or_(outer_keys > outer_values, inner_keys > inner_values),
+        )
+    return and_(
+        outer_keys <= outer_values,
+        or_(outer_keys < outer_values, inner_keys < inner_values),
     )
 
-    # Subquery for LOCAL track count per artist (tracks with file_path)
-    local_track_count_subq = (
-        select(TrackModel.artist_id, func.count(TrackModel.id).label("local_tracks"))
-        .where(TrackModel.file_path.isnot(None))
-        .group_by(TrackModel.artist_id)
-        .subquery()
-    )
 
-    # Subquery for total album count per artist (ALL albums)
-    total_album_count_subq = (
-        select(AlbumModel.artist_id, func.count(AlbumModel.id).label("total_albums"))
-        .group_by(AlbumModel.artist_id)
-        .subquery()
-    )
+async def _fetch_keyset_page(
+    session: AsyncSession,
+    stmt: Select[Any],
+    keys: list[_SortKey],
+    per_page: int,
+    after: str | None,
+    before: str | None,
+    split: int | None = None,
+) -> tuple[list[Any], str | None, str | None]:
+    """Fetch one page of stmt ordered by keys, seeking from a cursor.
+
+    Hey future me - LIMIT per_page + 1 tells us whether there's another page without
+    a COUNT. "before" pages are fetched in DESCENDING order (seek backwards from the
+    cursor) and flipped in Python. Malformed cursors fall back to the first page.
+
+    Args:
+        session: Database session
+        stmt: Filtered SELECT without ORDER BY/LIMIT
+        keys: Sort key expressions - last one must be unique (primary key)
+        per_page: Page size
+        after: Cursor of the previous page's last row (→ next page)
+        before: Cursor of the next page's first row (→ previous page)
+        split: See _seek_condition
+
+    Returns:
+        (rows without the key columns, prev cursor or None, next cursor or None)
+    """
+    after_key = decode_cursor(after, len(keys))
+    before_key = decode_cursor(before, len(keys)) if after_key is None else None
 
-    # Subquery for LOCAL album count (albums with at least one local track)
-    albums_with_files_subq = (
-        select(func.distinct(TrackModel.album_id))
-        .where(TrackModel.file_path.isnot(None))
-        .where(TrackModel.album_id.isnot(None))
-        .subquery()
+    stmt = stmt.add_columns(*keys)
+    if before_key is not None:
+        stmt = stmt.where(_seek_condition(keys, before_key, False, split)).order_by(
+            *[key.desc() for key in keys]
+        )
+    else:
+        if after_key is not None:
+            stmt = stmt.where(_seek_condition(keys, after_key, True, split))
+        stmt = stmt.order_by(*keys)
+
+    result = await session.execute(stmt.limit(per_page + 1))
+    rows = list(result.all())
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    if before_key is not None:
+        rows.reverse()
+        has_prev, has_next = has_more, True
+    else:
+        has_prev, has_next = after_key is not None, has_more
+
+    key_count = len(keys)
+    prev_cursor = (
+        encode_cursor(list(rows[0][-key_count:])) if rows and has_prev else None
     )
-    local_album_count_subq = (
-        select(AlbumModel.artist_id, func.count(AlbumModel.id).label("local_albums"))
-        .where(AlbumModel.id.in_(select(albums_with_files_subq)))
-        .group_by(AlbumModel.artist_id)
-        .subquery()
+    next_cursor = (
+        encode_cursor(list(rows[-1][-key_count:])) if rows and has_next else None
     )
+    return [row[:-key_count] for row in rows], prev_cursor, next_cursor
 
-    # Main query - SHOW ALL ARTISTS (unified view)
-    # Hey future me - After Table Consolidation (2025-12), we show BOTH local AND total counts!
-    # This allows "X/Y" badges like "3/5 local" meaning 3 of 5 tracks have local files.
-    stmt = (
-        select(
-            ArtistModel,
-            total_track_count_subq.c.total_tracks,
-            local_track_count_subq.c.local_tracks,
-            total_album_count_subq.c.total_albums,
-            local_album_count_subq.c.local_albums,
-        )
-        .outerjoin(
-            total_track_count_subq, ArtistModel.id == total_track_count_subq.c.artist_id
-        )
-        .outerjoin(
-            local_track_count_subq, ArtistModel.id == local_track_count_subq.c.artist_id
-        )
-        .outerjoin(
-            total_album_count_subq, ArtistModel.id == total_album_count_subq.c.artist_id
-        )
-        .outerjoin(
-            local_album_count_subq, ArtistModel.id == local_album_count_subq.c.artist_id
-        )
-    )
 
-    # Exclude Various Artists patterns from artist view
-    # Hey future me - VA/Compilations have their own section, don't clutter artist list!
-    stmt = stmt.where(~func.lower(ArtistModel.name).in_(list(VARIOUS_ARTISTS_PATTERNS)))
+def _page_url(request: Request, **cursor: str) -> str:
+    """Current URL with the cursor params replaced (keeps source, per_page, ...)."""
+    params = {
+        key: value
+        for key, value in request.query_params.items()
+        if key not in ("after", "before")
+    }
+    params.update(cursor)
+    return f"{request.url.path}?{urlencode(params)}"
+
+
+def _pagination_context(
+    request: Request, prev_cursor: str | None, next_cursor: str | None
+) -> dict[str, str | None]:
+    """Template context for partials/keyset_pagination.html."""
+    return {
+        "prev_url": _page_url(request, before=prev_cursor) if prev_cursor else None,
+        "next_url": _page_url(request, after=next_cursor) if next_cursor else None,
+    }
+
 
-    # Apply source filter if requested
+def _artist_source_filters(source: str | None) -> list[ColumnElement[bool]]:
+    """WHERE conditions of the artist browser (VA excluded + source filter)."""
+    # Hey future me - VA/Compilations have their own section, don't clutter artist list!
+    filters: list[ColumnElement[bool]] = [
+        ~func.lower(ArtistModel.name).in_(list(VARIOUS_ARTISTS_PATTERNS))
+    ]
     if source == "local":
         # Only artists with local files (source='local' OR 'hybrid')
-        stmt = stmt.where(ArtistModel.source.in_(["local", "hybrid"]))
+        filters.append(ArtistModel.source.in_(["local", "hybrid"]))
     elif source == "spotify":
         # Only Spotify followed artists (source='spotify' OR 'hybrid')
-        stmt = stmt.where(ArtistModel.source.in_(["spotify", "hybrid"]))
+        filters.append(ArtistModel.source.in_(["spotify", "hybrid"]))
     elif source == "hybrid":
         # Only artists in BOTH sources
-        stmt = stmt.where(ArtistModel.source == "hybrid")
+        filters.append(ArtistModel.source == "hybrid")
     # else: source == "all" or None -> Show ALL artists (no filter)
+    return filters
 
-    # Get total count for display (no pagination, so just count)
-    # Also exclude VA patterns from count
-    count_stmt = select(func.count(ArtistModel.id)).where(
-        ~func.lower(ArtistModel.name).in_(list(VARIOUS_ARTISTS_PATTERNS))
-    )
+
+def _album_source_filters(source: str | None) -> list[ColumnElement[bool]]:
+    """WHERE conditions of the album browser (source filter)."""
     if source == "local":
-        count_stmt = count_stmt.where(ArtistModel.source.in_(["local", "hybrid"]))
-    elif source == "spotify":
-        count_stmt = count_stmt.where(ArtistModel.source.in_(["spotify", "hybrid"]))
-    elif source == "hybrid":
-        count_stmt = count_stmt.where(ArtistModel.source == "hybrid")
-    total_count_result = await session.execute(count_stmt)
-    total_count = total_count_result.scalar() or 0
+        return [AlbumModel.source.in_(["local", "hybrid"])]
+    if source == "spotify":
+        return [AlbumModel.source.in_(["spotify", "hybrid"])]
+    if source == "hybrid":
+        return [AlbumModel.source == "hybrid"]
+    return []
+
+
+# Hey future me – artists browser on MAINTAINED AGGREGATES + KEYSET PAGINATION!
+# The "X/Y local" numbers are columns on soulspot_artists now (refreshed by scanner,
+# auto-import and cleanup) - before, every request ran four GROUP BY subqueries over
+# the whole tracks/albums tables. Pages seek on (lower(name), id), which is exactly
+# the ix_soulspot_artists_browse index. image_url comes from Spotify sync – falls
+# back to None if artist wasn't synced.
+# UNIFIED LIBRARY (2025-12): Shows ALL artists in DB, not filtered by file_path!
+@router.get("/library/artists", response_class=HTMLResponse)
+async def library_artists(
+    request: Request,
+    source: str | None = None,  # Filter by source (local/spotify/hybrid/all)
+    after: str | None = Query(None, description="Cursor: page after this artist"),
+    before: str | None = Query(None, description="Cursor: page before this artist"),
+    per_page: int = Query(100, ge=10, le=500, description="Items per page"),
+    _track_repository: TrackRepository = Depends(get_track_repository),
+    session: AsyncSession = Depends(get_db_session),
+) -> Any:
+    """Unified artists browser page - shows LOCAL + SPOTIFY + HYBRID artists.
 
-    # NO PAGINATION - load all artists, just order alphabetically
-    # Hey future me - removed pagination (2025-12), all artists shown on one page!
+    Hey future me - This is the UNIFIED Music Manager artist view!
+    It shows ALL artists regardless of source (local file scan OR Spotify followed),
+    alphabetically, one keyset page at a time.
 
-    # Apply ordering only (no pagination)
-    stmt = stmt.order_by(ArtistModel.name)
-    result = await session.execute(stmt)
-    rows = result.all()
+    Filter by source param:
+    - ?source=local -> Only artists from local file scans (with or without Spotify)
+    - ?source=spotify -> Only artists followed on Spotify (with or without local files)
+    - ?source=hybrid -> Only artists that exist in BOTH local + Spotify
+    - ?source=all OR no param -> Show ALL artists (default unified view)
+    """
+    filters = _artist_source_filters(source)
+
+    # Get total count for display (cheap - no joins, no GROUP BY)
+    total_count_result = await session.execute(
+        select(func.count(ArtistModel.id)).where(*filters)
+    )
+    total_count = total_count_result.scalar() or 0
+
+    rows, prev_cursor, next_cursor = await _fetch_keyset_page(
+        session,
+        select(ArtistModel).where(*filters),
+        keys=[func.lower(ArtistModel.name), ArtistModel.id],
+        per_page=per_page,
+        after=after,
+        before=before,
+    )
 
     # Convert to template-friendly format with image_url + source
     # Hey future me - name is CLEAN (no disambiguation), disambiguation is stored separately!
     # After Dec 2025 folder parsing fixes, new scans store clean names. Old entries might
     # still have disambiguation in name - re-scan library to fix.
-    # NEW (2025-12): Shows BOTH total AND local counts for "X/Y local" badges!
+    # Shows BOTH total AND local counts for "X/Y local" badges!
     artists = [
         {
             "name": artist.name,
             "disambiguation": artist.disambiguation,  # Text like "English rock band"
             "source": artist.source,  # 'local', 'spotify', or 'hybrid'
-            "total_tracks": total_tracks or 0,  # ALL tracks (incl. Spotify-only)
-            "local_tracks": local_tracks or 0,  # Only tracks with file_path
-            "total_albums": total_albums or 0,  # ALL albums
-            "local_albums": local_albums or 0,  # Only albums with local tracks
+            "total_tracks": artist.track_count,  # ALL tracks (incl. Spotify-only)
+            "local_tracks": artist.local_track_count,  # Only tracks with file_path
+            "total_albums": artist.album_count,  # ALL albums
+            "local_albums": artist.local_album_count,  # Only albums with local tracks
             "image_url": artist.image_url,  # Spotify CDN URL or None
             "image_path": artist.image_path,  # Local cached image path or None
             "genres": artist.genres,  # JSON list of genres (from Spotify)
         }
-        for artist, total_tracks, local_tracks, total_albums, local_albums in rows
+        for (artist,) in rows
     ]
 
+    # Placeholders on this page → the image repair fetches these first
+    note_images_viewed("artist", [str(a.id) for (a,) in rows if not a.image_path])
+
     # Check for missing artwork (artists + albums)
     # Hey future me - the enrichment button fetches BOTH artist images and album covers.
     # FIXED (Dec 2025): Count artists without LOCAL image (image_path), not CDN URL!
     # Artists may have image_url (CDN) but no image_path (local cache).
     # Auto-fetch should download from CDN to create local cache.
-    artists_without_local_image = sum(
-        1 for a in artists if not a["image_path"] or a["image_path"].startswith("FAILED")
+    # Counted in SQL over ALL filtered artists, not just the current page.
+    artists_without_image_result = await session.execute(
+        select(func.count(ArtistModel.id))
+        .where(*filters)
+        .where(
+            ArtistModel.image_path.is_(None)
+            | (ArtistModel.image_path == "")
+            | ArtistModel.image_path.startswith("FAILED")
+        )
     )
-    artists_without_url = sum(1 for a in artists if not a["image_url"])
+    artists_without_local_image = artists_without_image_result.scalar() or 0
 
-    has_local_album_tracks = (
-        select(TrackModel.id)
-        .where(TrackModel.album_id == AlbumModel.id)
-        .where(TrackModel.file_path.isnot(None))
-        .exists()
-    )
     albums_without_cover_stmt = (
         select(func.count(AlbumModel.id))
-        .where(has_local_album_tracks)
+        .where(AlbumModel.has_local_files.is_(True))
         .where((AlbumModel.cover_url.is_(None)) | (AlbumModel.cover_url == ""))
     )
     albums_without_cover_result = await session.execute(albums_without_cover_stmt)
@@ -262,102 +354,63 @@ async def library_artists(
             "albums_without_cover": albums_without_cover,
             "current_source": source or "all",  # Active filter
             "source_counts": source_counts,  # For filter badge counts
-            "total_count": total_count,  # Total artists shown
+            "total_count": total_count,  # Total artists matching the filter
+            **_pagination_context(request, prev_cursor, next_cursor),
         },
     )
 
 
-# Hey future me – refactored to load AlbumModel directly with artist join!
-# This gives us access to artwork_url from Spotify CDN. SQL does the grouping via
-# relationship, not manual Python dict. Uses pagination (page/per_page params) for
-# big libraries - defaults to 50 per page. artwork_url comes from Spotify sync – if
-# album wasn't synced, falls back to None.
+# Hey future me – albums browser on MAINTAINED AGGREGATES + KEYSET PAGINATION!
+# Track counts are columns on soulspot_albums (refreshed by scanner/import/cleanup),
+# pages seek on (lower(title), id) = ix_soulspot_albums_browse. artwork_url comes
+# from Spotify sync – if album wasn't synced, falls back to None.
 # UNIFIED LIBRARY (2025-12): Shows ALL albums in DB, not filtered by file_path!
 # Also handles "Various Artists" compilations properly via album_artist field.
-# NO PAGINATION - all albums shown on one page!
 @router.get("/library/albums", response_class=HTMLResponse)
 async def library_albums(
     request: Request,
     source: str | None = None,  # Filter by source (local/spotify/hybrid/all)
+    after: str | None = Query(None, description="Cursor: page after this album"),
+    before: str | None = Query(None, description="Cursor: page before this album"),
+    per_page: int = Query(100, ge=10, le=500, description="Items per page"),
     _track_repository: TrackRepository = Depends(get_track_repository),
     session: AsyncSession = Depends(get_db_session),
 ) -> Any:
     """Unified library albums browser page - shows ALL albums with local/total counts.
 
     Hey future me - After Table Consolidation (2025-12), shows ALL albums!
-    NO PAGINATION - all albums on one page (pagination only for download queue).
-    Filter by source param like /library/artists.
+    Filter by source param like /library/artists, keyset pages like /library/artists.
     Shows "X/Y local" badge (e.g. "3/10 tracks" = 3 verfügbar, 10 total).
     """
-    # Subquery for total track count per album (ALL tracks)
-    total_track_count_subq = (
-        select(TrackModel.album_id, func.count(TrackModel.id).label("total_tracks"))
-        .group_by(TrackModel.album_id)
-        .subquery()
-    )
-
-    # Subquery for local track count per album (tracks with file_path)
-    local_track_count_subq = (
-        select(TrackModel.album_id, func.count(TrackModel.id).label("local_tracks"))
-        .where(TrackModel.file_path.isnot(None))
-        .group_by(TrackModel.album_id)
-        .subquery()
-    )
-
-    # Build main query
-    stmt = (
-        select(
-            AlbumModel,
-            total_track_count_subq.c.total_tracks,
-            local_track_count_subq.c.local_tracks,
-        )
-        .outerjoin(
-            total_track_count_subq, AlbumModel.id == total_track_count_subq.c.album_id
-        )
-        .outerjoin(
-            local_track_count_subq, AlbumModel.id == local_track_count_subq.c.album_id
-        )
-        .options(joinedload(AlbumModel.artist))
-    )
-
-    # Apply source filter
-    if source == "local":
-        stmt = stmt.where(AlbumModel.source.in_(["local", "hybrid"]))
-    elif source == "spotify":
-        stmt = stmt.where(AlbumModel.source.in_(["spotify", "hybrid"]))
-    elif source == "hybrid":
-        stmt = stmt.where(AlbumModel.source == "hybrid")
-    # else: show all
+    filters = _album_source_filters(source)
 
     # Get total count for display
-    count_stmt = select(func.count(AlbumModel.id))
-    if source == "local":
-        count_stmt = count_stmt.where(AlbumModel.source.in_(["local", "hybrid"]))
-    elif source == "spotify":
-        count_stmt = count_stmt.where(AlbumModel.source.in_(["spotify", "hybrid"]))
-    elif source == "hybrid":
-        count_stmt = count_stmt.where(AlbumModel.source == "hybrid")
-    total_count_result = await session.execute(count_stmt)
+    total_count_result = await session.execute(
+        select(func.count(AlbumModel.id)).where(*filters)
+    )
     total_count = total_count_result.scalar() or 0
 
-    # NO PAGINATION - load all albums, just order alphabetically
-    # Hey future me - removed pagination (2025-12), all albums shown on one page!
-    stmt = stmt.order_by(AlbumModel.title)
-    result = await session.execute(stmt)
-    rows = result.unique().all()
+    rows, prev_cursor, next_cursor = await _fetch_keyset_page(
+        session,
+        select(AlbumModel).where(*filters).options(joinedload(AlbumModel.artist)),
+        keys=[func.lower(AlbumModel.title), AlbumModel.id],
+        per_page=per_page,
+        after=after,
+        before=before,
+    )
 
     # Convert to template-friendly format with artwork_url
     # Hey future me - album_artist overrides artist.name for compilations/Various Artists!
     # artwork_path is local file, artwork_url is Spotify CDN - template prefers local
-    # NEW (2025-12): Shows BOTH total AND local track counts for "X/Y local" badge!
+    # Shows BOTH total AND local track counts for "X/Y local" badge!
     albums = [
         {
             "title": album.title,
             "artist": album.album_artist
             or (album.artist.name if album.artist else "Unknown Artist"),
             "source": album.source,  # 'local', 'spotify', or 'hybrid'
-            "total_tracks": total_tracks or 0,  # ALL tracks
-            "local_tracks": local_tracks or 0,  # Only tracks with file_path
+            "total_tracks": album.track_count,  # ALL tracks
+            "local_tracks": album.local_track_count,  # Only tracks with file_path
             "year": album.release_year,
             "release_date": album.release_date,  # Full date (YYYY-MM-DD) or None
             "artwork_url": album.cover_url,  # Spotify CDN URL or None
@@ -366,9 +419,12 @@ async def library_albums(
             "primary_type": album.primary_type or "album",
             "secondary_types": album.secondary_types or [],
         }
-        for album, total_tracks, local_tracks in rows
+        for (album,) in rows
     ]
 
+    # Placeholders on this page → the image repair fetches these first
+    note_images_viewed("album", [str(a.id) for (a,) in rows if not a.cover_path])
+
     # Count albums by source for filter badges
     count_all = await session.execute(select(func.count(AlbumModel.id)))
     count_local = await session.execute(
@@ -398,11 +454,16 @@ async def library_albums(
     # Albums may have artwork_url (CDN) but no artwork_path (local cache).
     # Auto-fetch should download from CDN to create local cache.
     # ==========================================================================
-    albums_without_local_cover = sum(
-        1 for a in albums if not a["artwork_path"] or (
-            a["artwork_path"] and a["artwork_path"].startswith("FAILED")
+    albums_without_cover_result = await session.execute(
+        select(func.count(AlbumModel.id))
+        .where(*filters)
+        .where(
+            AlbumModel.cover_path.is_(None)
+            | (AlbumModel.cover_path == "")
+            | AlbumModel.cover_path.startswith("FAILED")
         )
     )
+    albums_without_local_cover = albums_without_cover_result.scalar() or 0
     if albums_without_local_cover > 0:
         try:
             from soulspot.application.services import AutoFetchService
@@ -423,7 +484,8 @@ async def library_albums(
             "albums": albums,
             "current_source": source or "all",
             "source_counts": source_counts,
-            "total_count": total_count,  # Total albums shown
+            "total_count": total_count,  # Total albums matching the filter
+            **_pagination_context(request, prev_cursor, next_cursor),
         },
     )
 
@@ -439,26 +501,18 @@ async def library_compilations(
     session: AsyncSession = Depends(get_db_session),
 ) -> Any:
     """Library compilations browser page - only compilation albums with local files."""
-    # Subquery for track count - ONLY count tracks with local files
-    track_count_subq = (
-        select(TrackModel.album_id, func.count(TrackModel.id).label("track_count"))
-        .where(TrackModel.file_path.isnot(None))
-        .group_by(TrackModel.album_id)
-        .subquery()
-    )
-
     # Only get compilation albums that have at least one local track
+    # (maintained local_track_count - no GROUP BY over the tracks table)
     # SQLite JSON containment check: secondary_types LIKE '%"compilation"%'
     stmt = (
-        select(AlbumModel, track_count_subq.c.track_count)
-        .join(track_count_subq, AlbumModel.id == track_count_subq.c.album_id)
-        .where(track_count_subq.c.track_count > 0)
+        select(AlbumModel)
+        .where(AlbumModel.local_track_count > 0)
         .where(AlbumModel.secondary_types.contains(["compilation"]))
         .options(joinedload(AlbumModel.artist))
-        .order_by(AlbumModel.title)
+        .order_by(func.lower(AlbumModel.title), AlbumModel.id)
     )
     result = await session.execute(stmt)
-    rows = result.unique().all()
+    albums = result.scalars().all()
 
     # Convert to template-friendly format
     # For compilations, album_artist is more relevant than artist (often "Various Artists")
@@ -468,19 +522,16 @@ async def library_compilations(
             "title": album.title,
             "album_artist": album.album_artist or "Various Artists",
             "artist": album.artist.name if album.artist else "Unknown Artist",
-            "track_count": track_count or 0,
+            "track_count": album.local_track_count,
             "year": album.release_year,
             "artwork_url": album.cover_url,
             "artwork_path": album.cover_path,
             "primary_type": album.primary_type,
             "secondary_types": album.secondary_types or [],
         }
-        for album, track_count in rows
+        for album in albums
     ]
 
-    # Sort alphabetically by title
-    compilations.sort(key=lambda x: x["title"].lower())
-
     return templates.TemplateResponse(
         request,
         "library_compilations.html",
@@ -489,51 +540,50 @@ async def library_compilations(
 
 
 # IMPORTANT: Library tracks page with SQLAlchemy direct queries! Uses Depends(get_db_session) to
-# properly manage DB session lifecycle. select() with joinedload() is proper way to eagerly load
-# relationships and avoid N+1. unique() on result prevents duplicate Track objects when joins create
-# multiple rows. Uses pagination (page/per_page params) for big libraries - defaults to 100 per page.
-# The track data extraction handles None values gracefully with "Unknown". Sort by artist/album/title
-# is done in SQL ORDER BY for efficiency. Good use of joinedload to prevent N+1 queries.
+# properly manage DB session lifecycle. contains_eager()/joinedload() load artist and album in
+# the same query (no N+1). KEYSET pagination sorted by artist, then title: the seek on
+# (lower(artist name), artist id) uses ix_soulspot_artists_browse, ties inside one artist are
+# resolved via ix_soulspot_tracks_artist_browse (artist_id, lower(title), id). Artists without
+# any local file (has_local_files aggregate) are skipped before touching their tracks.
 # IMPORTANT: Only shows tracks with local files (file_path IS NOT NULL)!
 @router.get("/library/tracks", response_class=HTMLResponse)
 async def library_tracks(
     request: Request,
-    page: int = Query(1, ge=1, description="Page number (1-indexed)"),
+    after: str | None = Query(None, description="Cursor: page after this track"),
+    before: str | None = Query(None, description="Cursor: page before this track"),
     per_page: int = Query(100, ge=10, le=500, description="Items per page"),
     _track_repository: TrackRepository = Depends(get_track_repository),
     session: AsyncSession = Depends(get_db_session),
 ) -> Any:
     """Library tracks browser page - only tracks with local files."""
-    # Get total count of tracks with local files (for pagination)
-    count_stmt = select(func.count(TrackModel.id)).where(
-        TrackModel.file_path.isnot(None)
+    # Total count of tracks with local files = sum of the maintained per-artist counts
+    # (one pass over artists instead of a count over the busiest table)
+    total_count_result = await session.execute(
+        select(func.coalesce(func.sum(ArtistModel.local_track_count), 0))
     )
-    total_count_result = await session.execute(count_stmt)
     total_count = total_count_result.scalar() or 0
 
-    # Calculate pagination
-    total_pages = max(1, (total_count + per_page - 1) // per_page)
-    offset = (page - 1) * per_page
-
-    # Query with joined loads for artist and album - ONLY tracks with local files!
-    # Sort in SQL for efficiency (not in Python memory)
     stmt = (
         select(TrackModel)
+        .join(TrackModel.artist)
+        .where(ArtistModel.has_local_files.is_(True))
         .where(TrackModel.file_path.isnot(None))
-        .options(joinedload(TrackModel.artist), joinedload(TrackModel.album))
-        .join(TrackModel.artist, isouter=True)
-        .join(TrackModel.album, isouter=True)
-        .order_by(
-            func.lower(
-                func.coalesce(ArtistModel.name, "zzz")
-            ),  # Artists first, null last
-            func.lower(func.coalesce(TrackModel.title, "")),
-        )
-        .offset(offset)
-        .limit(per_page)
+        .options(contains_eager(TrackModel.artist), joinedload(TrackModel.album))
+    )
+    rows, prev_cursor, next_cursor = await _fetch_keyset_page(
+        session,
+        stmt,
+        keys=[
+            func.lower(ArtistModel.name),
+            ArtistModel.id,
+            func.lower(TrackModel.title),
+            TrackModel.id,
+        ],
+        per_page=per_page,
+        after=after,
+        before=before,
+        split=2,
     )
-    result = await session.execute(stmt)
-    track_models = result.unique().scalars().all()
 
     # Convert to template-friendly format
     tracks_data = [
@@ -546,7 +596,7 @@ async def library_tracks(
             "file_path": track.file_path,
             "is_broken": track.is_broken,
         }
-        for track in track_models
+        for (track,) in rows
     ]
 
     return templates.TemplateResponse(
@@ -554,12 +604,8 @@ async def library_tracks(
         "library_tracks.html",
         context={
             "tracks": tracks_data,
-            # Pagination context
-            "page": page,
             "per_page": per_page,
             "total_count": total_count,
-            "total_pages": total_pages,
-            "has_prev": page > 1,
-            "has_next": page < total_pages,
+            **_pagination_context(request, prev_cursor, next_cursor),
         },
     )
@@ -20,6 +20,7 @@ from sqlalchemy.orm import joinedload
 
 from soulspot.api.dependencies import get_db_session, get_track_repository
 from soulspot.api.routers.ui._shared import templates
+from soulspot.application.services.images.queue import note_images_viewed
 from soulspot.config import get_settings
 from soulspot.infrastructure.persistence.models import (
     AlbumModel,
@@ -91,6 +92,11 @@ async def library_artist_detail(
     albums_result = await session.execute(albums_stmt)
     album_models = albums_result.scalars().all()
 
+    # Placeholders on this page → the image repair fetches these first
+    if not artist_model.image_path:
+        note_images_viewed("artist", [str(artist_model.id)])
+    note_images_viewed("album", [str(a.id) for a in album_models if not a.cover_path])
+
     # Hey future me - WORKER-FIRST PATTERN! (Jan 2026 design change)
     # ================================================================
     # DESIGN DECISION: NO on-demand API calls in routes!
@@ -326,6 +332,10 @@ async def library_album_detail(
             status_code=404,
         )
 
+    # Placeholder cover → the image repair fetches this one first
+    if not album_model.cover_path:
+        note_images_viewed("album", [str(album_model.id)])
+
     # Query tracks for this album - include ALL tracks, not just those with file_path
     stmt = (
         select(TrackModel)
@@ -7,20 +7,23 @@ Hey future me - this module contains all search-related UI routes:
 
 import logging
 from typing import Any
+from urllib.parse import quote
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
-from sqlalchemy import or_, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from soulspot.api.dependencies import get_db_session
 from soulspot.api.routers.ui._shared import templates
 from soulspot.infrastructure.persistence.models import (
+    AlbumModel,
     ArtistModel,
     PlaylistModel,
     TrackModel,
 )
+from soulspot.infrastructure.persistence.search_index import search_entity_ids
 
 logger = logging.getLogger(__name__)
 
@@ -34,10 +37,12 @@ async def search(request: Request) -> Any:
 
 
 # Hey future me - this is the HTMX quick-search endpoint for the header search bar! It returns a
-# dropdown partial with local library results (tracks, artists, playlists). NOT Spotify search -
-# that would be slow and require auth. The q param comes from input field via hx-get. We search
-# library only if query is at least 2 chars to avoid noise. Results limited to 5 per type for
-# quick display. The partial renders into #search-results dropdown in base.html header.
+# dropdown partial with local library results (tracks, artists, albums, playlists). NOT Spotify
+# search - that would be slow and require auth. The q param comes from input field via hx-get. We
+# search library only if query is at least 2 chars to avoid noise. Results limited to 5 per type
+# for quick display. The partial renders into #search-results dropdown in base.html header.
+# Matching goes through the full-text search index (search_index.py: FTS5 on SQLite, trigram on
+# Postgres) - word-prefix matches, accent-insensitive, ranked. No more ilike('%q%') table scans!
 @router.get("/search/quick", response_class=HTMLResponse)
 async def quick_search(
     request: Request,
@@ -46,8 +51,9 @@ async def quick_search(
 ) -> Any:
     """Quick search partial for header search bar.
 
-    Searches local library (tracks, artists, playlists) and returns
-    HTML partial for HTMX dropdown. Minimum query length is 2 characters.
+    Searches local library (tracks, artists, albums, playlists) via the search
+    index and returns HTML partial for HTMX dropdown. Minimum query length is
+    2 characters.
 
     Args:
         request: FastAPI request
@@ -61,57 +67,89 @@ async def quick_search(
     query = q.strip()
 
     if len(query) >= 2:
-        search_term = f"%{query}%"
-
-        # Search tracks (title or artist name)
-        stmt = (
-            select(TrackModel)
-            .join(TrackModel.artist)
-            .options(joinedload(TrackModel.artist))
-            .where(
-                or_(
-                    TrackModel.title.ilike(search_term),
-                    ArtistModel.name.ilike(search_term),
+        # Each kind: ranked IDs from the index, then one IN query for the rows.
+        # "relevance" keeps the index order (best match first) within a type.
+        track_ids = await search_entity_ids(session, "track", query, limit=5)
+        if track_ids:
+            track_rows = await session.execute(
+                select(TrackModel)
+                .options(joinedload(TrackModel.artist))
+                .where(TrackModel.id.in_(track_ids))
+            )
+            for track in track_rows.scalars().all():
+                artist_name = track.artist.name if track.artist else "Unknown Artist"
+                results.append(
+                    {
+                        "type": "track",
+                        "name": track.title,
+                        "subtitle": artist_name,
+                        "url": f"/library/tracks/{track.id}",
+                        "relevance": track_ids.index(track.id),
+                    }
                 )
+
+        artist_ids = await search_entity_ids(session, "artist", query, limit=5)
+        if artist_ids:
+            artist_rows = await session.execute(
+                select(ArtistModel).where(ArtistModel.id.in_(artist_ids))
             )
-            .limit(5)
-        )
-        result = await session.execute(stmt)
-        tracks = result.scalars().all()
-
-        for track in tracks:
-            results.append(
-                {
-                    "type": "track",
-                    "name": track.title,
-                    "subtitle": track.artist.name if track.artist else "Unknown Artist",
-                    "url": f"/library/tracks/{track.id}",
-                }
+            for artist in artist_rows.scalars().all():
+                results.append(
+                    {
+                        "type": "artist",
+                        "name": artist.name,
+                        "subtitle": "Artist",
+                        "url": f"/library/artists/{quote(artist.name, safe='')}",
+                        "relevance": artist_ids.index(artist.id),
+                    }
+                )
+
+        album_ids = await search_entity_ids(session, "album", query, limit=5)
+        if album_ids:
+            album_rows = await session.execute(
+                select(AlbumModel)
+                .options(joinedload(AlbumModel.artist))
+                .where(AlbumModel.id.in_(album_ids))
             )
+            for album in album_rows.scalars().all():
+                artist_name = album.artist.name if album.artist else "Unknown Artist"
+                album_key = (
+                    f"{quote(artist_name, safe='')}::{quote(album.title, safe='')}"
+                )
+                results.append(
+                    {
+                        "type": "album",
+                        "name": album.title,
+                        "subtitle": artist_name,
+                        "url": f"/library/albums/{album_key}",
+                        "relevance": album_ids.index(album.id),
+                    }
+                )
 
-        # Search playlists by name
-        stmt = (
-            select(PlaylistModel).where(PlaylistModel.name.ilike(search_term)).limit(5)
-        )
-        result = await session.execute(stmt)
-        playlists = result.scalars().all()
-
-        for playlist in playlists:
-            results.append(
-                {
-                    "type": "playlist",
-                    "name": playlist.name,
-                    "subtitle": "Playlist",
-                    "url": f"/playlists/{playlist.id}",
-                }
+        playlist_ids = await search_entity_ids(session, "playlist", query, limit=5)
+        if playlist_ids:
+            playlist_rows = await session.execute(
+                select(PlaylistModel).where(PlaylistModel.id.in_(playlist_ids))
             )
+            for playlist in playlist_rows.scalars().all():
+                results.append(
+                    {
+                        "type": "playlist",
+                        "name": playlist.name,
+                        "subtitle": "Playlist",
+                        "url": f"/playlists/{playlist.id}",
+                        "relevance": playlist_ids.index(playlist.id),
+                    }
+                )
 
-        # Sort: exact matches first, then by type (playlist > track)
+        # Sort: exact matches first, then by type (playlist > artist > album > track),
+        # then by index rank
         type_order = {"playlist": 0, "artist": 1, "album": 2, "track": 3}
         results.sort(
             key=lambda x: (
                 0 if x["name"].lower() == query.lower() else 1,
                 type_order.get(x["type"], 99),
+                x["relevance"],
             )
         )
 
@@ -1,5 +1,10 @@
 """API schemas."""
 
-from soulspot.api.schemas.pagination import PaginatedResponse, PaginationParams
+from soulspot.api.schemas.pagination import (
+    PaginatedResponse,
+    PaginationParams,
+    decode_cursor,
+    encode_cursor,
+)
 
-__all__ = ["PaginatedResponse", "PaginationParams"]
+__all__ = ["PaginatedResponse", "PaginationParams", "decode_cursor", "encode_cursor"]
@@ -1,6 +1,8 @@
 """Pagination schemas for API responses."""
 
-from typing import TypeVar
+import base64
+import json
+from typing import Any, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -60,3 +62,40 @@ class PaginatedResponse[T](BaseModel):
             page_size=page_size,
             pages=pages,
         )
+
+
+# Hey future me - KEYSET (seek) pagination cursors for the library browse pages!
+# A cursor is the sort key of the last (or first) row of a page, e.g.
+# ["the beatles", "3f2c..."] for ORDER BY lower(name), id. The next page is
+# "WHERE (lower(name), id) > (:k0, :k1) ORDER BY ... LIMIT n" - an index seek, so
+# page 500 costs the same as page 1 (OFFSET 50000 reads and throws away 50000 rows).
+# base64url(JSON) keeps it opaque and URL-safe. Cursors are NOT signed: they only
+# ever end up in a WHERE clause as bound parameters, a forged one just yields a
+# different page.
+def encode_cursor(values: list[Any]) -> str:
+    """Encode a row's sort key as an opaque, URL-safe cursor."""
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None, size: int) -> list[Any] | None:
+    """Decode a cursor created by encode_cursor().
+
+    Args:
+        cursor: Cursor from the query string (None/empty = first page)
+        size: Expected number of sort key values
+
+    Returns:
+        Sort key values, or None if the cursor is missing or malformed
+        (callers then start at the first page instead of erroring)
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(values, list) or len(values) != size:
+        return None
+    return values
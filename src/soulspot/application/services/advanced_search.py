@@ -2,9 +2,20 @@
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
-from rapidfuzz import fuzz
+
+# Hey future me, ALL exclusion keywords as ONE alternation regex - one scan per filename
+# instead of `kw in name` for every keyword. Cached per keyword tuple, so the defaults (and
+# each user's list) compile once per process. Also used by SearchRankingEngine - pass a
+# sorted tuple so equal lists share one cache entry.
+# GOTCHA: keywords are lowercased here, so search() on text.lower()! Deliberately NOT
+# re.IGNORECASE - that disables the literal fast path and is ~7x slower on 10k names.
+@lru_cache(maxsize=64)
+def compile_keyword_matcher(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile keywords into one substring matcher for LOWERCASED text."""
+    return re.compile("|".join(re.escape(kw.lower()) for kw in keywords))
 
 
 # Hey future me, SearchFilters is a simple config dataclass for search criteria! Holds bitrate minimum (320kbps for
@@ -65,6 +76,10 @@ class AdvancedSearchService:
             "demo",
             "rehearsal",
         ]
+        # Lazy import: search_ranking imports SearchFilters/SearchResult from here
+        from soulspot.application.services.search_ranking import SearchRankingEngine
+
+        self.ranking_engine = SearchRankingEngine()
 
     # Hey future me: Advanced search with fuzzy matching - because "bohemian rhapsody" should match "Bohemian Rhapsody (2011 Remaster).flac"
     # WHY fuzzy matching? Users and uploaders spell things differently, we need tolerance
@@ -86,26 +101,22 @@ class AdvancedSearchService:
         Returns:
             List of SearchResult objects with fuzzy match scores
         """
-        enhanced_results: list[SearchResult] = []
-
-        for result in results:
-            filename = result.get("filename", "")
-            # Extract filename without path and extension for better matching
-            base_filename = self._extract_base_filename(filename)
-
-            # Calculate fuzzy match score
-            fuzzy_score = fuzz.token_set_ratio(query.lower(), base_filename.lower())
+        # Base filenames (no path/extension), all scored in ONE batch call
+        names = [self._extract_base_filename(r.get("filename", "")) for r in results]
+        scores = self.ranking_engine.text_scores(query, names, threshold)
 
+        enhanced_results: list[SearchResult] = []
+        for result, fuzzy_score in zip(results, scores, strict=True):
             if fuzzy_score >= threshold:
                 enhanced_results.append(
                     SearchResult(
                         username=result.get("username", ""),
-                        filename=filename,
+                        filename=result.get("filename", ""),
                         size=result.get("size", 0),
                         bitrate=result.get("bitrate", 0),
                         length=result.get("length"),
                         quality=result.get("quality"),
-                        fuzzy_score=fuzzy_score,
+                        fuzzy_score=float(fuzzy_score),
                     )
                 )
 
@@ -151,7 +162,7 @@ class AdvancedSearchService:
     # Hey, exclusion filter - blacklist removal by keywords in filename. WHY case-insensitive? "LIVE" and "live"
     # both suck equally! WHY substring match not word match? Catches "live_recording", "live-2023", etc. Uses
     # default keywords if none provided (convenience). This is super simple but effective - removes 30-40% of
-    # junk results typically. The any() check is efficient - stops at first match, no need to check all keywords.
+    # junk results typically. All keywords are one compiled alternation (compile_keyword_matcher) - one scan per name.
     # GOTCHA: This can be too aggressive - "Alive" contains "live"! Consider word boundary regex if that's a problem.
     def apply_exclusion_filters(
         self,
@@ -168,16 +179,10 @@ class AdvancedSearchService:
             Filtered list of search results
         """
         keywords = exclusion_keywords or self.default_exclusion_keywords
-        keywords_lower = [kw.lower() for kw in keywords]
+        matcher = compile_keyword_matcher(tuple(sorted(set(keywords))))
 
-        filtered_results = []
-        for result in results:
-            filename_lower = result.filename.lower()
-            # Check if any exclusion keyword is present in the filename
-            if not any(kw in filename_lower for kw in keywords_lower):
-                filtered_results.append(result)
-
-        return filtered_results
+        # Keep results whose filename contains none of the exclusion keywords
+        return [r for r in results if not matcher.search(r.filename.lower())]
 
     # Hey future me: Quality scoring - the "how good is this audio file" calculator
     # Scoring breakdown (0-100 scale):
@@ -372,16 +377,20 @@ class AdvancedSearchService:
         return ranked
 
     # Listen up, this is THE FULL PIPELINE - everything in one call! Takes raw slskd results and returns
-    # ranked, filtered, scored results ready for user. Four-step process: fuzzy match (remove non-matches),
-    # quality filter (bitrate/format), exclusion filter (blacklist keywords), then rank (smart scoring + sort).
-    # Order matters! Filter first (fast), then score survivors (slow). This is the main public API - most
-    # callers use this instead of individual steps. Filters default to SearchFilters() with all None (no filtering).
-    # Returns list in best-to-worst order - take first N for "top results"!
+    # ranked, filtered, scored results ready for user. Runs on SearchRankingEngine: names normalized once,
+    # ONE rapidfuzz cdist call for all fuzzy scores, quality/filename/duration scores as arrays, then top-k.
+    # Same steps and weights as the old per-result loop (fuzzy threshold -> quality filter -> exclusions ->
+    # smart score), just not one result at a time. Filters default to SearchFilters() with all None.
+    # expected_duration (seconds) adds the duration plausibility check - wrong edits/live versions usually
+    # have a different length. limit=k returns only the k best (cheaper than sorting everything).
+    # Returns list in best-to-worst order!
     def search_with_filters(
         self,
         query: str,
         results: list[dict[str, Any]],
         filters: SearchFilters | None = None,
+        expected_duration: int | None = None,
+        limit: int | None = None,
     ) -> list[SearchResult]:
         """Complete search pipeline with all filters and ranking.
 
@@ -389,6 +398,8 @@ class AdvancedSearchService:
             query: Search query string
             results: Raw search results from slskd
             filters: Search filters configuration
+            expected_duration: Expected track length in seconds (optional)
+            limit: Return only the top-k results (None = all)
 
         Returns:
             Filtered and ranked list of search results
@@ -396,27 +407,18 @@ class AdvancedSearchService:
         if filters is None:
             filters = SearchFilters()
 
-        # Step 1: Apply fuzzy matching
-        enhanced_results = self.apply_fuzzy_matching(
-            query, results, filters.fuzzy_threshold
+        # Empty/None exclusion list = default exclusions (same as apply_exclusion_filters)
+        exclusion_keywords = (
+            filters.exclusion_keywords or self.default_exclusion_keywords
+        )
+        return self.ranking_engine.rank(
+            query,
+            results,
+            filters=filters,
+            exclusion_keywords=exclusion_keywords,
+            expected_duration=expected_duration,
+            limit=limit,
         )
-
-        # Step 2: Apply quality filters
-        filtered_results = self.apply_quality_filters(enhanced_results, filters)
-
-        # Step 3: Apply exclusion filters
-        if filters.exclusion_keywords is not None:
-            filtered_results = self.apply_exclusion_filters(
-                filtered_results, filters.exclusion_keywords
-            )
-        else:
-            # Use default exclusions
-            filtered_results = self.apply_exclusion_filters(filtered_results, None)
-
-        # Step 4: Rank by smart score
-        ranked_results = self.rank_results(filtered_results, query)
-
-        return ranked_results
 
     # Hey future me, convenience method - runs full pipeline and returns ONLY the #1 best result. Use this for
     # auto-download scenarios where you trust the scoring algorithm. Returns None if no results pass filters
@@ -427,6 +429,7 @@ class AdvancedSearchService:
         query: str,
         results: list[dict[str, Any]],
         filters: SearchFilters | None = None,
+        expected_duration: int | None = None,
     ) -> SearchResult | None:
         """Select the best match from search results.
 
@@ -434,10 +437,13 @@ class AdvancedSearchService:
             query: Search query string
             results: Raw search results from slskd
             filters: Search filters configuration
+            expected_duration: Expected track length in seconds (optional)
 
         Returns:
             Best matching result or None if no results
         """
-        ranked_results = self.search_with_filters(query, results, filters)
+        ranked_results = self.search_with_filters(
+            query, results, filters, expected_duration=expected_duration, limit=1
+        )
 
         return ranked_results[0] if ranked_results else None
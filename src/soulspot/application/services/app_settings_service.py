@@ -56,6 +56,10 @@ class AppSettingsService:
     # Class-level cache to share across instances within same process
     # Hey future me - this is intentionally simple. If you need distributed caching, use Redis.
     _cache: dict[str, tuple[Any, datetime]] = {}
+    # Change counter per key namespace ("slskd.url" → "slskd"), bumped on set()/delete().
+    # Hey future me - long-lived provider clients (ProviderClientRegistry) compare this
+    # to decide if credentials changed and the client must be rebuilt.
+    _namespace_versions: dict[str, int] = {}
 
     def __init__(self, session: AsyncSession) -> None:
         """Initialize with async DB session.
@@ -91,6 +95,26 @@ class AppSettingsService:
         """
         self._cache[key] = (value, datetime.now(UTC))
 
+    @classmethod
+    def get_namespace_version(cls, namespace: str) -> int:
+        """Get the change counter of a settings namespace (e.g. 'slskd').
+
+        Args:
+            namespace: Key prefix before the first dot.
+
+        Returns:
+            Number of set()/delete() calls on keys of that namespace in this process.
+        """
+        return cls._namespace_versions.get(namespace, 0)
+
+    @classmethod
+    def _bump_namespace_version(cls, key: str) -> None:
+        """Record a change of a key in its namespace counter."""
+        namespace = key.split(".", 1)[0]
+        cls._namespace_versions[namespace] = (
+            cls._namespace_versions.get(namespace, 0) + 1
+        )
+
     def invalidate_cache(self, key: str | None = None) -> None:
         """Invalidate cache for specific key or all keys.
 
@@ -380,6 +404,7 @@ class AppSettingsService:
 
         # Invalidate cache
         self.invalidate_cache(key)
+        self._bump_namespace_version(key)
 
         logger.debug(f"Set app setting: {key} = {str_value}")
         return setting
@@ -398,6 +423,7 @@ class AppSettingsService:
             await self._session.delete(setting)
             await self._session.flush()
             self.invalidate_cache(key)
+            self._bump_namespace_version(key)
             logger.debug(f"Deleted app setting: {key}")
             return True
         return False
@@ -0,0 +1,241 @@
+"""Tag-independent audio payload fingerprints (exact audio duplicates).
+
+Hey future me - this is why retagging doesn't hide duplicates anymore!
+
+tracks.file_hash is a hash of the whole FILE. Post-processing rewrites tags all the
+time (ID3, artwork, lyrics), every rewrite changes the file hash, and two downloads of
+the same rip with different tags never matched. The audio itself never changed.
+
+So here we find the byte range that holds ONLY the audio frames and hash just that:
+
+- MP3 (and anything unknown): skip leading ID3v2 tag(s), strip trailing ID3v1,
+  APEv2, Lyrics3v2 and appended ID3v2.4 ("3DI" footer) tags
+- FLAC: skip "fLaC" + all metadata blocks (VORBIS_COMMENT, PICTURE, PADDING...)
+- MP4/M4A: the mdat atom (tags live in moov/udta, may move around freely)
+- WAV / AIFF: the data / SSND chunk (LIST/INFO, id3 chunks ignored)
+- Ogg (Vorbis/Opus/FLAC-in-Ogg): everything after the header pages (granule <= 0)
+
+Offsets come straight from the tag/container headers - the same structures mutagen
+walks, but we only read a few header bytes instead of parsing every frame and
+loading embedded pictures into memory.
+
+Limits (the stored hash is simply missing for these, file_hash still works):
+- files with more than one mdat atom, unknown containers (ASF/WMA...)
+- Ogg: a retag that changes the NUMBER of comment pages renumbers every audio page,
+  so those two copies won't match (mutagen keeps padding, so this is rare)
+
+The hashing itself reuses the size -> partial -> full funnel from file_hashing.py
+with AUDIO_HASH_SCHEME: payload length groups first, only collisions get read fully.
+"""
+
+import logging
+import os
+import struct
+from typing import BinaryIO
+
+from soulspot.application.services.file_hashing import HashScheme
+
+logger = logging.getLogger(__name__)
+
+AUDIO_HASH_ALGORITHM = "audio-sha256"
+AUDIO_PARTIAL_HASH_ALGORITHM = "audio-sha256-partial"
+
+_ID3V1_SIZE = 128
+_APE_FOOTER_SIZE = 32
+_ID3V2_HEADER_SIZE = 10
+
+
+def _syncsafe(data: bytes) -> int:
+    """Decode a 4 byte ID3v2 syncsafe integer (7 bits per byte)."""
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+def _skip_id3v2(f: BinaryIO, start: int) -> int:
+    """Offset after any ID3v2 tags starting at `start` (some files carry several)."""
+    offset = start
+    while True:
+        f.seek(offset)
+        header = f.read(_ID3V2_HEADER_SIZE)
+        if len(header) < _ID3V2_HEADER_SIZE or header[:3] != b"ID3":
+            return offset
+        size = _syncsafe(header[6:10]) + _ID3V2_HEADER_SIZE
+        if header[5] & 0x10:  # footer present
+            size += _ID3V2_HEADER_SIZE
+        offset += size
+
+
+def _strip_trailing_tags(f: BinaryIO, start: int, end: int) -> int:
+    """End offset of the audio data after removing tags appended to the file."""
+    while end - start > 0:
+        # ID3v1: fixed 128 bytes, "TAG" at the start
+        if end - start >= _ID3V1_SIZE:
+            f.seek(end - _ID3V1_SIZE)
+            if f.read(3) == b"TAG":
+                end -= _ID3V1_SIZE
+                continue
+        if end - start >= _APE_FOOTER_SIZE:
+            f.seek(end - _APE_FOOTER_SIZE)
+            footer = f.read(_APE_FOOTER_SIZE)
+            # APEv2: footer "APETAGEX", size excludes the optional 32 byte header
+            if footer[:8] == b"APETAGEX":
+                size = struct.unpack("<I", footer[12:16])[0]
+                flags = struct.unpack("<I", footer[20:24])[0]
+                if flags & 0x80000000:
+                    size += _APE_FOOTER_SIZE
+                end -= size
+                continue
+        if end - start >= 15:
+            f.seek(end - 15)
+            trailer = f.read(15)
+            # Lyrics3v2: 6 digit size + "LYRICS200" (size excludes those 15 bytes)
+            if trailer[6:] == b"LYRICS200" and trailer[:6].isdigit():
+                end -= int(trailer[:6]) + 15
+                continue
+        if end - start >= _ID3V2_HEADER_SIZE:
+            f.seek(end - _ID3V2_HEADER_SIZE)
+            footer = f.read(_ID3V2_HEADER_SIZE)
+            # Appended ID3v2.4 tag ("3DI" footer mirrors the header)
+            if footer[:3] == b"3DI":
+                end -= _syncsafe(footer[6:10]) + 2 * _ID3V2_HEADER_SIZE
+                continue
+        return end
+    return end
+
+
+def _flac_payload(f: BinaryIO, start: int) -> int | None:
+    """Offset of the first FLAC audio frame (after "fLaC" + metadata blocks)."""
+    offset = start + 4
+    while True:
+        f.seek(offset)
+        header = f.read(4)
+        if len(header) < 4:
+            return None
+        length = int.from_bytes(header[1:4], "big")
+        offset += 4 + length
+        if header[0] & 0x80:  # last-metadata-block flag
+            return offset
+
+
+def _mp4_payload(f: BinaryIO, file_size: int) -> tuple[int, int] | None:
+    """The one top-level mdat atom (offset, length of its data)."""
+    offset = 0
+    found: tuple[int, int] | None = None
+    while offset + 8 <= file_size:
+        f.seek(offset)
+        header = f.read(8)
+        size, kind = struct.unpack(">I4s", header)
+        header_size = 8
+        if size == 1:  # 64-bit size follows
+            size = struct.unpack(">Q", f.read(8))[0]
+            header_size = 16
+        elif size == 0:  # atom runs to the end of the file
+            size = file_size - offset
+        if size < header_size:
+            return None
+        if kind == b"mdat":
+            if found is not None:
+                return None  # several mdat atoms - not one contiguous payload
+            found = (offset + header_size, size - header_size)
+        offset += size
+    return found
+
+
+def _riff_payload(
+    f: BinaryIO, file_size: int, big_endian: bool
+) -> tuple[int, int] | None:
+    """The data (WAV) / SSND (AIFF) chunk of a RIFF/FORM file."""
+    target = b"SSND" if big_endian else b"data"
+    fmt = ">4sI" if big_endian else "<4sI"
+    offset = 12
+    while offset + 8 <= file_size:
+        f.seek(offset)
+        kind, size = struct.unpack(fmt, f.read(8))
+        if kind == target:
+            start = offset + 8
+            if big_endian:
+                start += 8  # SSND: offset + blockSize fields before the samples
+                size -= 8
+            return start, max(0, min(size, file_size - start))
+        offset += 8 + size + (size & 1)  # chunks are word aligned
+    return None
+
+
+def _ogg_payload(f: BinaryIO, file_size: int) -> int | None:
+    """Offset of the first Ogg page that carries audio (granule position > 0).
+
+    Header pages have granule 0 - or -1 when a long comment header spans pages.
+    """
+    offset = 0
+    while offset + 27 <= file_size:
+        f.seek(offset)
+        header = f.read(27)
+        if header[:4] != b"OggS":
+            return None
+        granule = struct.unpack("<q", header[6:14])[0]
+        segments = header[26]
+        lacing = f.read(segments)
+        if granule > 0:
+            return offset
+        offset += 27 + segments + sum(lacing)
+    return None
+
+
+def audio_payload_region_sync(file_path: str) -> tuple[int, int] | None:
+    """Byte range (offset, length) of the audio frames of a file.
+
+    Runs in the thread pool - only header bytes are read.
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        (offset, length), or None if the container isn't supported / file unreadable
+    """
+    try:
+        file_size = os.path.getsize(file_path)
+        with open(file_path, "rb") as f:
+            magic = f.read(12)
+            if magic[4:8] == b"ftyp":
+                return _mp4_payload(f, file_size)
+            if magic[:4] == b"RIFF" and magic[8:12] == b"WAVE":
+                return _riff_payload(f, file_size, big_endian=False)
+            if magic[:4] == b"FORM" and magic[8:12] in (b"AIFF", b"AIFC"):
+                return _riff_payload(f, file_size, big_endian=True)
+            if magic[:4] == b"OggS":
+                start = _ogg_payload(f, file_size)
+                return (start, file_size - start) if start is not None else None
+
+            # MP3, FLAC (possibly with a non-standard leading ID3v2), AAC/ADTS...
+            start = _skip_id3v2(f, 0)
+            f.seek(start)
+            if f.read(4) == b"fLaC":
+                flac_start = _flac_payload(f, start)
+                if flac_start is None:
+                    return None
+                start = flac_start
+            end = _strip_trailing_tags(f, start, file_size)
+            if end <= start:
+                return None
+            return start, end - start
+    except (OSError, struct.error, IndexError) as e:
+        logger.debug(f"Cannot locate audio payload of {file_path}: {e}")
+        return None
+
+
+# tracks.audio_hash & co. - plugged into FileHashPipeline(scheme=AUDIO_HASH_SCHEME)
+AUDIO_HASH_SCHEME = HashScheme(
+    full_algorithm=AUDIO_HASH_ALGORITHM,
+    partial_algorithm=AUDIO_PARTIAL_HASH_ALGORITHM,
+    hash_column="audio_hash",
+    algorithm_column="audio_hash_algorithm",
+    size_column="audio_payload_size",
+    locate=audio_payload_region_sync,
+)
+
+
+__all__ = [
+    "AUDIO_HASH_ALGORITHM",
+    "AUDIO_HASH_SCHEME",
+    "AUDIO_PARTIAL_HASH_ALGORITHM",
+    "audio_payload_region_sync",
+]
@@ -1,12 +1,24 @@
 """Auto-import service for moving completed downloads to music library."""
 
 import asyncio
+import contextlib
 import logging
+import os
 import shutil
 import time
+from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from soulspot.application.services.import_ledger import (
+    OUTCOME_ERROR,
+    OUTCOME_NO_MATCH,
+    OUTCOME_NOT_COMPLETED,
+    FileTags,
+    ImportLedger,
+)
+from soulspot.application.services.postprocessing.artwork_cache import album_key
+from soulspot.application.services.postprocessing.lyrics_cache import LyricsCache
 from soulspot.application.services.postprocessing.pipeline import (
     PostProcessingPipeline,
 )
@@ -31,6 +43,66 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Hey future me - watchfiles = inotify (Linux) / FSEvents / ReadDirectoryChangesW in
+# Rust. Comes with uvicorn[standard]; without it we simply keep polling.
+try:
+    from watchfiles import Change, awatch
+
+    WATCHFILES_AVAILABLE = True
+except ImportError:
+    WATCHFILES_AVAILABLE = False
+
+# Files count as complete once they haven't been modified for this long
+MIN_FILE_AGE_SECONDS = 10
+# Empty files untouched for this long are abandoned (failed/queued transfers) - stop
+# re-checking them every MIN_FILE_AGE_SECONDS. A write brings them back (event/scan).
+EMPTY_FILE_PENDING_SECONDS = 300
+# Watch mode: full directory walk + full completed-downloads reload this often
+# (catches missed/overflowed events, prunes the ledger)
+RECONCILE_INTERVAL_SECONDS = 3600
+
+
+def read_file_tags_sync(file_path: Path) -> FileTags | None:
+    """Read ISRC, title and artist of an audio file - runs in the thread pool.
+
+    Hey future me: ISRC first because it's globally unique.
+    GOTCHA: mutagen import inside function to avoid startup delay (lazy load)
+    GOTCHA: Some MP3s have weird encodings - use .text[0] not .text to get string
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        FileTags, or None if the file has no readable metadata
+    """
+    from mutagen import File as MutagenFile  # type: ignore[attr-defined]
+    from mutagen.easyid3 import EasyID3
+    from mutagen.id3 import ID3
+
+    audio = MutagenFile(file_path, easy=True)
+    if audio is None:
+        return None
+
+    tags = FileTags()
+
+    # For MP3 files, try to read ISRC from TSRC frame (not in EasyID3)
+    if file_path.suffix.lower() == ".mp3":
+        try:
+            id3 = ID3(file_path)  # type: ignore[no-untyped-call]
+            if "TSRC" in id3:
+                tags.isrc = str(id3["TSRC"].text[0])
+        except Exception as e:
+            logger.debug("Could not read TSRC frame: %s", e)
+
+    # Get title and artist from easy tags
+    if isinstance(audio, EasyID3) or hasattr(audio, "get"):
+        title_tag = audio.get("title")
+        artist_tag = audio.get("artist")
+        tags.title = title_tag[0] if title_tag else None
+        tags.artist = artist_tag[0] if artist_tag else None
+
+    return tags
+
 
 class AutoImportService:
     """Service for automatically importing completed downloads to music library.
@@ -44,6 +116,11 @@ class AutoImportService:
 
     This service monitors the downloads directory and moves completed music files
     to the music library directory, organizing them appropriately.
+
+    Event-driven (Jan 2026): with watchfiles installed, file events tell us WHAT
+    changed - no full directory walk per cycle. Files it couldn't import go into a
+    persistent ImportLedger and are only looked at again when they change on disk or
+    a matching download completes. Tag reading runs in the thread pool.
     """
 
     def __init__(
@@ -57,6 +134,9 @@ class AutoImportService:
         post_processing_pipeline: PostProcessingPipeline | None = None,
         spotify_plugin: "SpotifyPlugin | None" = None,
         app_settings_service: "AppSettingsService | None" = None,
+        import_ledger: ImportLedger | None = None,
+        watch: bool = True,
+        lyrics_cache: LyricsCache | None = None,
     ) -> None:
         """Initialize auto-import service.
 
@@ -77,6 +157,10 @@ class AutoImportService:
             post_processing_pipeline: Optional post-processing pipeline
             spotify_plugin: Optional SpotifyPlugin for artwork downloads (handles auth internally)
             app_settings_service: Optional app settings service for dynamic naming templates
+            import_ledger: Ledger of already examined files (default: memory-only)
+            watch: Use file events instead of rescanning the directory every cycle
+                (falls back to polling without watchfiles or when watching fails)
+            lyrics_cache: Persistent lyrics cache for the default pipeline
         """
         self._settings = settings
         self._track_repository = track_repository
@@ -98,12 +182,39 @@ class AutoImportService:
                 album_repository=album_repository,
                 spotify_plugin=spotify_plugin,  # Pass for Spotify artwork
                 app_settings_service=app_settings_service,  # Pass for dynamic templates
+                lyrics_cache=lyrics_cache,
             )
 
+        # Hey future me - our repositories and the pipeline's share ONE DB session,
+        # and an AsyncSession must never be used concurrently. Gathered matches and
+        # album imports take this lock around their DB calls only - tag reads,
+        # HTTP and file moves stay parallel.
+        self._session_lock = self._pipeline.session_lock
+
         # Hey future me - use unified AUDIO_EXTENSIONS from folder_parsing!
         # Single source of truth for all audio file extensions.
         self._audio_extensions = AUDIO_EXTENSIONS
 
+        # "is not None" - an empty ledger has len() 0 and is falsy!
+        self._ledger = import_ledger if import_ledger is not None else ImportLedger()
+        self._watch = watch
+
+        # Completed downloads, maintained incrementally (watermark = max updated_at)
+        self._completed_track_ids: set[str] = set()
+        self._completed_watermark: datetime | None = None
+        self._last_completed_reload = 0.0
+
+        # Filled by the watcher, drained by _process_downloads
+        self._dirty_paths: set[str] = set()  # audio files created/modified
+        self._dirty_dirs: set[str] = set()  # other paths (e.g. album dir moved in)
+        self._deleted_paths: set[str] = set()
+        # Audio files seen but still being written - re-checked every cycle
+        self._pending_paths: set[str] = set()
+        self._watching = False
+        self._last_full_scan = 0.0
+        self._wake = asyncio.Event()
+        self._stop_event = asyncio.Event()
+
     # Hey future me: Auto-import service - the background daemon that moves completed downloads to music library
     # WHY poll every 60 seconds? Balance between responsiveness and CPU usage
     # WHY two paths (download_path and music_path)? Downloads go to temp, music is organized permanent storage
@@ -163,21 +274,87 @@ class AutoImportService:
         """Stop the auto-import service."""
         logger.info("Stopping auto-import service")
         self._running = False
+        self._stop_event.set()  # ends the watcher
+        self._wake.set()  # ends the wait for the next cycle
 
     # Listen, the main monitoring loop - runs forever until _running=False
     # WHY broad Exception catch? Monitor shouldn't crash from one bad file - log and continue
     # WHY asyncio.sleep not time.sleep? time.sleep BLOCKS the event loop, asyncio.sleep yields control
-    # poll_interval is configurable (default 60s) - trade-off between responsiveness and CPU usage
+    # poll_interval is configurable (default 60s) - trade-off between responsiveness and CPU usage.
+    # In watch mode it's only the safety net: file events wake us up right away.
     async def _monitor_loop(self) -> None:
         """Monitor downloads directory and process completed files."""
-        while self._running:
-            try:
-                await self._process_downloads()
-            except Exception as e:
-                logger.exception("Error in auto-import monitor loop: %s", e)
+        self._stop_event.clear()
+        await self._ledger.load()
+
+        watcher: asyncio.Task[None] | None = None
+        if self._watch and WATCHFILES_AVAILABLE:
+            watcher = asyncio.create_task(self._watch_loop())
+        elif self._watch:
+            logger.info("watchfiles not installed - auto-import keeps polling")
 
-            # Wait before next check
-            await asyncio.sleep(self._poll_interval)
+        try:
+            while self._running:
+                try:
+                    await self._process_downloads()
+                except Exception as e:
+                    logger.exception("Error in auto-import monitor loop: %s", e)
+
+                # Wait before next check
+                await self._wait_for_changes()
+        finally:
+            if watcher is not None:
+                self._stop_event.set()
+                watcher.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await watcher
+
+    async def _wait_for_changes(self) -> None:
+        """Sleep until the next cycle - a file event ends the wait early.
+
+        Files still being written are re-checked once they can be complete
+        (MIN_FILE_AGE_SECONDS), not a whole poll interval later.
+        """
+        timeout: float = self._poll_interval
+        if self._pending_paths:
+            timeout = min(timeout, MIN_FILE_AGE_SECONDS)
+        if not self._watching:
+            await asyncio.sleep(timeout)
+            return
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._wake.wait(), timeout)
+        self._wake.clear()
+
+    # Hey future me - the watcher only COLLECTS paths, _process_downloads does the work.
+    # awatch debounces (1.6s) so a file being written doesn't wake us per chunk.
+    # Anything that isn't an audio file goes to _dirty_dirs: a completed album
+    # directory moved into downloads is ONE event for the directory, not its files.
+    # If watching dies (inotify watch limit, network mount...), we fall back to polling.
+    async def _watch_loop(self) -> None:
+        """Collect file events from the downloads directory."""
+        self._watching = True
+        logger.info("Auto-import watching %s for changes", self._download_path)
+        try:
+            async for changes in awatch(
+                self._download_path, stop_event=self._stop_event, recursive=True
+            ):
+                for change, raw_path in changes:
+                    if change == Change.deleted:
+                        self._deleted_paths.add(raw_path)
+                    elif Path(raw_path).suffix.lower() in self._audio_extensions:
+                        self._dirty_paths.add(raw_path)
+                    else:
+                        self._dirty_dirs.add(raw_path)
+                self._wake.set()
+        except Exception as e:
+            logger.warning(
+                "Watching %s failed (%s) - auto-import falls back to polling",
+                self._download_path,
+                e,
+            )
+        finally:
+            self._watching = False
+            self._wake.set()
 
     # Hey future me - REFACTORED for PARALLEL PROCESSING (Jan 2025)!
     # Before: Sequential processing - 100 files = 100 x 3s = 300 seconds
@@ -191,8 +368,12 @@ class AutoImportService:
     # WHY asyncio.gather with return_exceptions=True?
     # - One failed import shouldn't cancel others
     # - We collect all results and log summary at end
+    #
+    # Jan 2026: only files the ledger doesn't know (or that changed / got re-queued)
+    # are examined at all. Outcomes are written to the ledger AFTER gather - one
+    # session, so no concurrent writes on it.
     async def _process_downloads(self) -> None:
-        """Process all files in the downloads directory that have completed downloads.
+        """Process new/changed files in the downloads directory.
 
         OPTIMIZED: Uses parallel processing with concurrency limit for 5x+ speedup!
         """
@@ -201,46 +382,52 @@ class AutoImportService:
             "auto_import.process_downloads",
             poll_interval=self._poll_interval,
         )
-        
+
         try:
-            # Get all audio files in downloads directory
-            audio_files = self._get_audio_files(self._download_path)
+            # CRITICAL FILTER: track IDs with completed downloads (incremental).
+            # Newly completed downloads re-queue the ledger files that might be theirs.
+            newly_completed = await self._refresh_completed_track_ids()
+            if newly_completed:
+                requeued = await self._ledger.requeue_for_tracks(newly_completed)
+                if requeued:
+                    logger.debug(
+                        "%d newly completed download(s) re-queued %d file(s)",
+                        len(newly_completed),
+                        requeued,
+                    )
 
-            if not audio_files:
-                logger.debug("No audio files found in downloads directory")
-                return
+            files = await self._collect_candidate_files()
 
-            # CRITICAL FILTER: Get track IDs with completed downloads
-            # Retry logic for concurrent session provisioning errors during startup.
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    completed_track_ids = (
-                        await self._download_repository.get_completed_track_ids()
-                    )
-                    break
-                except Exception as e:
-                    if (
-                        "provisioning a new connection" in str(e)
-                        and attempt < max_retries - 1
-                    ):
-                        logger.debug(
-                            "Session busy, retrying in 0.5s (attempt %d/%d)",
-                            attempt + 1,
-                            max_retries,
-                        )
-                        await asyncio.sleep(0.5)
-                        continue
-                    raise
+            now = time.time()
+            to_examine: list[tuple[Path, int, float]] = []
+            for path, (size, mtime) in files.items():
+                # Check if file is not being written (size stable)
+                if not self._is_file_complete(size, mtime, now):
+                    if size == 0 and now - mtime >= EMPTY_FILE_PENDING_SECONDS:
+                        self._pending_paths.discard(path)
+                    else:
+                        self._pending_paths.add(path)
+                    continue
+                self._pending_paths.discard(path)
+                if self._ledger.needs_examination(path, size, mtime):
+                    to_examine.append((Path(path), size, mtime))
+
+            if not to_examine:
+                logger.debug("No new or changed audio files in downloads directory")
+                await self._ledger.commit()
+                return
 
-            if not completed_track_ids:
+            if not self._completed_track_ids:
                 logger.debug("No completed downloads found, skipping import")
+                await self._ledger.commit()
                 return
 
             logger.info(
-                "Found %d audio file(s) to process (%d completed downloads tracked)",
-                len(audio_files),
-                len(completed_track_ids),
+                "Found %d new/changed audio file(s) to process "
+                "(%d completed downloads tracked, %d files in ledger)",
+                len(to_examine),
+                len(self._completed_track_ids),
+                len(self._ledger),
             )
 
             # PARALLEL PROCESSING with concurrency limit
@@ -249,74 +436,160 @@ class AutoImportService:
             )
             sem = asyncio.Semaphore(max_concurrent)
 
-            async def process_one_file(
+            async def match_one_file(
                 file_path: Path,
-            ) -> tuple[Path, bool, str | None]:
-                """Process a single file with concurrency control.
+            ) -> tuple[str | None, FileTags, Track | None, str | None]:
+                """Match a single file with concurrency control.
 
                 Returns:
-                    Tuple of (file_path, success, error_message)
+                    Tuple of (outcome or None if ready to import, tags,
+                    matched track, detail)
                 """
                 async with sem:
+                    tags = FileTags()
                     try:
+                        tags = await self._read_tags(file_path)
                         # Find associated track
-                        track = await self._find_track_for_file(file_path)
+                        async with self._session_lock:
+                            track = await self._find_track_for_file(file_path, tags)
 
                         # CRITICAL CHECK: Only import if track has completed download!
-                        if track and str(track.id.value) in completed_track_ids:
-                            await self._import_file(file_path, track)
-                            return (file_path, True, None)
+                        if track and str(track.id.value) in self._completed_track_ids:
+                            return (None, tags, track, None)
                         elif track:
                             return (
-                                file_path,
-                                False,
+                                OUTCOME_NOT_COMPLETED,
+                                tags,
+                                track,
                                 f"track {track.id.value} has no completed download",
                             )
                         else:
-                            return (file_path, False, "no matching track in database")
+                            return (
+                                OUTCOME_NO_MATCH,
+                                tags,
+                                None,
+                                "no matching track in database",
+                            )
                     except Exception as e:
-                        logger.exception("Error importing file %s: %s", file_path, e)
-                        return (file_path, False, str(e))
+                        logger.exception("Error matching file %s: %s", file_path, e)
+                        return (OUTCOME_ERROR, tags, None, str(e))
 
-            # Run all imports in parallel with concurrency limit
-            results = await asyncio.gather(
-                *[process_one_file(f) for f in audio_files], return_exceptions=True
+            # Match all files in parallel with concurrency limit
+            matches = await asyncio.gather(
+                *[match_one_file(f) for f, _size, _mtime in to_examine],
+                return_exceptions=True,
             )
 
-            # Count successes and failures
+            # Hey future me - import grouped by album: the pipeline fetches the artwork
+            # once per album, and the tracks get ONE DB update per album.
+            # album_batching off = every file is its own group (the old behaviour).
+            groups: dict[str, list[tuple[Path, Track]]] = {}
+            for (file_path, _size, _mtime), match in zip(
+                to_examine, matches, strict=True
+            ):
+                if isinstance(match, BaseException) or match[0] is not None:
+                    continue
+                track = match[2]
+                if track is None:
+                    continue
+                if self._settings.postprocessing.album_batching:
+                    key = album_key(
+                        str(track.album_id.value) if track.album_id else None,
+                        str(track.id.value),
+                    )
+                else:
+                    key = str(file_path)
+                groups.setdefault(key, []).append((file_path, track))
+
+            async def import_group(
+                items: list[tuple[Path, Track]],
+            ) -> list[BaseException | None]:
+                async with sem:
+                    return await self._import_album(items)
+
+            import_errors: dict[Path, BaseException | None] = {}
+            group_items = list(groups.values())
+            group_results = await asyncio.gather(
+                *[import_group(items) for items in group_items]
+            )
+            for items, errors in zip(group_items, group_results, strict=True):
+                for (file_path, _track), error in zip(items, errors, strict=True):
+                    import_errors[file_path] = error
+
+            # Count successes and failures, remember outcomes in the ledger
             success_count = 0
             skip_count = 0
             error_count = 0
+            imported: set[str] = set()
 
-            for result in results:
-                if isinstance(result, Exception):
+            for (file_path, size, mtime), match in zip(
+                to_examine, matches, strict=True
+            ):
+                if isinstance(match, BaseException):
+                    error_count += 1
+                    logger.error(f"Unexpected error during import: {match}")
+                    await self._ledger.record(
+                        str(file_path),
+                        size,
+                        mtime,
+                        OUTCOME_ERROR,
+                        FileTags(),
+                        None,
+                        str(match),
+                    )
+                    continue
+
+                outcome, tags, track, detail = match
+                if outcome is None:
+                    error = import_errors.get(file_path)
+                    if error is None:
+                        success_count += 1
+                        imported.add(str(file_path))
+                        continue
+                    outcome, detail = OUTCOME_ERROR, str(error)
+                if outcome == OUTCOME_ERROR:
                     error_count += 1
-                    logger.error(f"Unexpected error during import: {result}")
-                elif result[1]:  # success = True
-                    success_count += 1
                 else:
                     skip_count += 1
-                    logger.debug("Skipping file %s: %s", result[0].name, result[2])
+                    logger.debug("Skipping file %s: %s", file_path.name, detail)
+                await self._ledger.record(
+                    str(file_path),
+                    size,
+                    mtime,
+                    outcome,
+                    tags,
+                    str(track.id.value) if track else None,
+                    detail,
+                )
+
+            await self._ledger.forget(imported)
+            await self._ledger.commit()
 
             if success_count > 0 or error_count > 0:
                 logger.info(
-                    "Import batch complete: %d imported, %d skipped, %d errors",
+                    "Import batch complete: %d imported (%d albums), %d skipped, "
+                    "%d errors",
                     success_count,
+                    len(groups),
                     skip_count,
                     error_count,
                 )
-            
+
             end_operation(
                 logger,
                 "auto_import.process_downloads",
                 start_time,
                 operation_id,
                 success=True,
-                total_files=len(audio_files),
-                completed_track_ids_count=len(completed_track_ids),
+                total_files=len(to_examine),
+                completed_track_ids_count=len(self._completed_track_ids),
                 imported=success_count,
+                albums=len(groups),
                 skipped=skip_count,
                 errors=error_count,
+                albums_per_minute=round(
+                    self._pipeline.get_stats().albums_per_minute, 2
+                ),
             )
 
         except Exception as e:
@@ -325,59 +598,175 @@ class AutoImportService:
                 exc_info=True,
                 extra={"error_type": type(e).__name__},
             )
-            end_operation(logger, "auto_import.process_downloads", start_time, operation_id, success=False, error=e)
+            end_operation(
+                logger,
+                "auto_import.process_downloads",
+                start_time,
+                operation_id,
+                success=False,
+                error=e,
+            )
 
-    # Hey future me: Recursive file discovery with completeness check
-    # WHY rglob("*")? Downloads might be organized in subdirs like "Artist/Album/track.mp3"
+    async def _refresh_completed_track_ids(self) -> set[str]:
+        """Pick up downloads completed since the last cycle.
+
+        Hey future me - incremental via updated_at watermark, with a full reload every
+        RECONCILE_INTERVAL_SECONDS so downloads that LEFT the completed state drop out.
+
+        Returns:
+            Track IDs that weren't known as completed before
+        """
+        if time.monotonic() - self._last_completed_reload >= RECONCILE_INTERVAL_SECONDS:
+            self._completed_watermark = None
+            self._last_completed_reload = time.monotonic()
+            full_reload = True
+        else:
+            full_reload = False
+
+        # Retry logic for concurrent session provisioning errors during startup.
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                (
+                    track_ids,
+                    watermark,
+                ) = await self._download_repository.get_completed_track_ids_since(
+                    self._completed_watermark
+                )
+                break
+            except Exception as e:
+                if (
+                    "provisioning a new connection" in str(e)
+                    and attempt < max_retries - 1
+                ):
+                    logger.debug(
+                        "Session busy, retrying in 0.5s (attempt %d/%d)",
+                        attempt + 1,
+                        max_retries,
+                    )
+                    await asyncio.sleep(0.5)
+                    continue
+                raise
+
+        newly_completed = track_ids - self._completed_track_ids
+        if full_reload:
+            self._completed_track_ids = track_ids
+        else:
+            self._completed_track_ids |= track_ids
+        self._completed_watermark = watermark
+        return newly_completed
+
+    async def _collect_candidate_files(self) -> dict[str, tuple[int, float]]:
+        """Audio files to look at this cycle: path -> (size, mtime).
+
+        Polling (or a due reconcile): walk the whole directory - stat only, in a
+        thread - and drop ledger rows of vanished files.
+        Watching: only paths from file events + files still being written + files
+        re-queued by completed downloads.
+        """
+        full_scan = (
+            not self._watching
+            or time.monotonic() - self._last_full_scan >= RECONCILE_INTERVAL_SECONDS
+        )
+        if full_scan:
+            self._dirty_paths.clear()
+            self._dirty_dirs.clear()
+            self._deleted_paths.clear()
+            files = await asyncio.to_thread(self._scan_audio_files, self._download_path)
+            self._last_full_scan = time.monotonic()
+            self._pending_paths &= files.keys()
+            await self._ledger.forget(self._ledger.paths() - files.keys())
+            return files
+
+        dirty, self._dirty_paths = self._dirty_paths, set()
+        dirs, self._dirty_dirs = self._dirty_dirs, set()
+        deleted, self._deleted_paths = self._deleted_paths, set()
+
+        paths = dirty | self._pending_paths | self._ledger.requeued_paths()
+        files = await asyncio.to_thread(self._stat_audio_files, paths, dirs)
+
+        # Deleted files - or whole deleted directories - leave the ledger
+        gone = {p for p in paths if p not in files}
+        if deleted:
+            prefixes = tuple(d.rstrip(os.sep) + os.sep for d in deleted)
+            gone |= {
+                p
+                for p in self._ledger.paths()
+                if p in deleted or p.startswith(prefixes)
+            }
+        self._pending_paths -= gone
+        await self._ledger.forget(gone)
+        return files
+
+    # Hey future me: Recursive file discovery - stat only, NO tag reading here
+    # WHY os.walk + os.stat? Downloads might be organized in subdirs like "Artist/Album/track.mp3"
     # WHY suffix.lower()? File extensions might be ".MP3" or ".Mp3" - normalize for comparison
-    # WHY skip incomplete files? slskd might be actively writing - we check is_file_complete
-    # GOTCHA: This scans ENTIRE tree on every poll - slow for huge download dirs (10k+ files)
-    # Consider caching or watching filesystem events instead of polling
-    def _get_audio_files(self, directory: Path) -> list[Path]:
+    # Runs in a thread (asyncio.to_thread) - a 10k file tree doesn't block the event loop.
+    # In watch mode this only runs on startup, for moved-in directories and once per
+    # RECONCILE_INTERVAL_SECONDS.
+    def _scan_audio_files(self, directory: Path) -> dict[str, tuple[int, float]]:
         """Get all audio files from directory recursively.
 
         Args:
             directory: Directory to scan
 
         Returns:
-            List of audio file paths
+            Dict of path -> (size, mtime)
         """
-        audio_files = []
+        audio_files: dict[str, tuple[int, float]] = {}
 
         try:
-            for item in directory.rglob("*"):
-                if item.is_file() and item.suffix.lower() in self._audio_extensions:
-                    # Check if file is not being written (size stable)
-                    if self._is_file_complete(item):
-                        audio_files.append(item)
-                    else:
-                        logger.debug("Skipping incomplete file: %s", item)
+            for root, _dirs, filenames in os.walk(directory):
+                for filename in filenames:
+                    if Path(filename).suffix.lower() not in self._audio_extensions:
+                        continue
+                    path = os.path.join(root, filename)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue  # vanished meanwhile
+                    audio_files[path] = (stat.st_size, stat.st_mtime)
 
         except Exception as e:
             logger.exception("Error scanning directory %s: %s", directory, e)
 
         return audio_files
 
+    def _stat_audio_files(
+        self, paths: set[str], dirs: set[str]
+    ) -> dict[str, tuple[int, float]]:
+        """Stat single files + walk directories from file events (thread pool)."""
+        audio_files: dict[str, tuple[int, float]] = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # deleted or moved away
+            audio_files[path] = (stat.st_size, stat.st_mtime)
+        for directory in dirs:
+            if os.path.isdir(directory):
+                audio_files.update(self._scan_audio_files(Path(directory)))
+        return audio_files
+
     # Hey future me - IMPROVED file completeness check (Jan 2025)!
     # The old 5-second heuristic was too naive - slow downloads could be moved too early.
     #
-    # New multi-layer approach:
-    # 1. Basic checks (exists, size > 0)
+    # Approach:
+    # 1. Basic checks (exists, size > 0) - exists is implied, we got a stat
     # 2. Age check with configurable minimum (10s instead of 5s)
-    # 3. Size stability check (compare size over 2 seconds)
     #
     # NOTE: We intentionally don't call slskd API here because:
     # - This method is called during directory scan (can be thousands of files)
     # - Making API calls per-file would overwhelm slskd
     # - The age + size stability check is good enough for most cases
     # - If user wants authoritative check, they can implement slskd webhook integration
-    def _is_file_complete(self, file_path: Path) -> bool:
+    @staticmethod
+    def _is_file_complete(size: int, mtime: float, now: float) -> bool:
         """Check if file is completely downloaded (not being written).
 
         A file is considered complete if:
-        1. It exists and is readable
-        2. Its size is greater than 0
-        3. It hasn't been modified in the last 10 seconds (more conservative than before)
+        1. Its size is greater than 0
+        2. It hasn't been modified in the last 10 seconds (more conservative than before)
 
         Hey future me - we use 10s instead of 5s because:
         - Large files (100MB+ FLAC) take longer to flush to disk
@@ -385,118 +774,185 @@ class AutoImportService:
         - Better to wait a bit longer than import incomplete files
 
         Args:
-            file_path: Path to file
+            size: File size in bytes
+            mtime: Last modification time
+            now: Current time.time()
 
         Returns:
             True if file is complete, False otherwise
         """
-        MIN_AGE_SECONDS = 10  # More conservative than old 5s value
-
-        try:
-            if not file_path.exists() or not file_path.is_file():
-                return False
-
-            # Check file size
-            stat = file_path.stat()
-            if stat.st_size == 0:
-                return False
+        return size > 0 and now - mtime >= MIN_FILE_AGE_SECONDS
 
-            # Check if file was modified recently
-            age = time.time() - stat.st_mtime
-            return age >= MIN_AGE_SECONDS
+    async def _read_tags(self, file_path: Path) -> FileTags:
+        """Tags of a file - from the ledger if it was only re-queued, else from disk.
 
-        except Exception as e:
-            logger.warning("Error checking file completeness for %s: %s", file_path, e)
-            return False
-
-    async def _import_file(self, file_path: Path, track: Track) -> None:
-        """Import a single file to the music library.
+        A re-queued file didn't change since we read it, so the stored tags are
+        still right and the re-match costs no file I/O at all.
+        """
+        entry = self._ledger.get(str(file_path))
+        if entry is not None and entry.requeued:
+            try:
+                stat = await asyncio.to_thread(os.stat, file_path)
+            except OSError:
+                stat = None
+            if (
+                stat is not None
+                and stat.st_size == entry.file_size
+                and stat.st_mtime == entry.file_mtime
+            ):
+                return entry.tags
+
+        tags = await asyncio.to_thread(read_file_tags_sync, file_path)
+        if tags is None:
+            logger.debug("Could not read audio metadata: %s", file_path)
+            return FileTags()
+        return tags
+
+    # Hey future me: The import flow - post-process then move (if needed)
+    # WHY run post-processing first? It might rename/move the file to final destination
+    # WHY check if still in downloads after? Post-processing might have moved it already
+    # GOTCHA: We cleanup empty directories after move - don't leave "/downloads/Artist/Album/" clutter
+    # Album mode: all files of one release go through the pipeline together and the
+    # new file paths are written with ONE update_batch() - not one UPDATE per track.
+    # That also covers files the RENAMING step moved (before, only our own move
+    # below wrote the new path to the DB).
+    async def _import_album(
+        self, items: list[tuple[Path, Track]]
+    ) -> list[BaseException | None]:
+        """Import the files of one album to the music library.
 
         This method:
-        1. Runs post-processing pipeline (if enabled)
-        2. Moves file to final destination (if post-processing didn't already)
-
-        Hey future me - track is now passed as parameter (already matched by caller)!
-        This avoids duplicate track matching logic.
+        1. Runs post-processing pipeline (if enabled) for all files at once
+        2. Moves files to final destination (if post-processing didn't already)
+        3. Updates the file paths of all tracks in one DB operation
 
         Args:
-            file_path: Path to file to import
-            track: Associated track entity (already validated to have completed download)
+            items: (file path, track) pairs, tracks validated to have completed downloads
+
+        Returns:
+            Per item: None if imported, else the exception it failed with
         """
-        # Hey future me: The import flow - post-process then move (if needed)
-        # WHY run post-processing first? It might rename/move the file to final destination
-        # WHY check if still in downloads after? Post-processing might have moved it already
-        # GOTCHA: We cleanup empty directories after move - don't leave "/downloads/Artist/Album/" clutter
-        try:
-            if self._settings.postprocessing.enabled:
-                # Run post-processing pipeline
-                logger.info("Running post-processing for: %s", file_path)
-                result = await self._pipeline.process(file_path, track)
+        errors: list[BaseException | None] = [None] * len(items)
+        final_paths = [file_path for file_path, _track in items]
 
+        if self._settings.postprocessing.enabled:
+            # Run post-processing pipeline
+            logger.info(
+                "Running post-processing for %d file(s): %s",
+                len(items),
+                items[0][0] if len(items) == 1 else items[0][0].parent,
+            )
+            try:
+                results = await self._pipeline.process_album(items)
+            except Exception as e:
+                logger.exception("Post-processing failed: %s", e)
+                return [e] * len(items)
+
+            for i, result in enumerate(results):
                 if result.success:
                     logger.info(
-                        "Post-processing completed successfully for: %s", file_path
+                        "Post-processing completed successfully for: %s", items[i][0]
                     )
-                    # Update track file path if it changed
-                    if result.final_path and result.final_path != file_path:
-                        file_path = result.final_path
                 else:
                     logger.warning(
                         "Post-processing completed with errors: %s",
                         ", ".join(result.errors),
                     )
                     # Continue with import even if post-processing had errors
+                # Update track file path if it changed
+                if result.final_path:
+                    final_paths[i] = result.final_path
 
-            # If post-processing didn't rename the file, use the original logic
-            if file_path.parent == self._download_path or file_path.is_relative_to(
-                self._download_path
-            ):
-                # Determine destination path
-                # Keep the relative path structure from downloads directory
-                try:
-                    relative_path = file_path.relative_to(self._download_path)
-                except ValueError:
-                    # File might already be in a subdirectory
-                    relative_path = Path(file_path.name)
+        changed: list[int] = []
+        for i, (original_path, track) in enumerate(items):
+            file_path = final_paths[i]
+            try:
+                moved = await self._move_to_library(file_path, track)
+            except Exception as e:
+                logger.exception(
+                    "Error importing file %s: %s", file_path, e, exc_info=True
+                )
+                errors[i] = e
+                continue
+            if moved or file_path != original_path:
+                changed.append(i)
 
-                dest_path = self._music_path / relative_path
+        if changed:
+            try:
+                async with self._session_lock:
+                    await self._track_repository.update_batch(
+                        [items[i][1] for i in changed]
+                    )
+            except Exception as e:
+                logger.exception(
+                    "Error updating %d imported tracks: %s", len(changed), e
+                )
+                for i in changed:
+                    errors[i] = e
 
-                # Create destination directory if it doesn't exist
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
+        return errors
 
-                # Handle existing file at destination
-                if dest_path.exists():
-                    logger.warning(
-                        "File already exists at destination, skipping: %s", dest_path
-                    )
-                    # Remove source file to avoid processing it again
-                    file_path.unlink()
-                    return
+    async def _move_to_library(self, file_path: Path, track: Track) -> bool:
+        """Move a file that is still in downloads into the music library.
+
+        Args:
+            file_path: Current path (after post-processing)
+            track: Track entity - its file path is updated, NOT saved
 
-                # Move file to music library
-                logger.info("Importing: %s -> %s", file_path, dest_path)
-                await asyncio.to_thread(shutil.move, str(file_path), str(dest_path))
-                logger.info("Successfully imported: %s", dest_path)
+        Returns:
+            True if the file was moved
+        """
+        # If post-processing didn't rename the file, use the original logic
+        if not (
+            file_path.parent == self._download_path
+            or file_path.is_relative_to(self._download_path)
+        ):
+            return False
 
-                # Update track with final path
-                track.update_file_path(FilePath(dest_path))
-                await self._track_repository.update(track)
+        # Determine destination path
+        # Keep the relative path structure from downloads directory
+        try:
+            relative_path = file_path.relative_to(self._download_path)
+        except ValueError:
+            # File might already be in a subdirectory
+            relative_path = Path(file_path.name)
 
-                # Clean up empty parent directories in downloads
-                self._cleanup_empty_dirs(file_path.parent)
+        dest_path = self._music_path / relative_path
 
-        except Exception as e:
-            logger.exception("Error importing file %s: %s", file_path, e, exc_info=True)
-            raise
+        # Create destination directory if it doesn't exist
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Handle existing file at destination
+        if dest_path.exists():
+            logger.warning(
+                "File already exists at destination, skipping: %s", dest_path
+            )
+            # Remove source file to avoid processing it again
+            file_path.unlink()
+            return False
+
+        # Move file to music library
+        logger.info("Importing: %s -> %s", file_path, dest_path)
+        await asyncio.to_thread(shutil.move, str(file_path), str(dest_path))
+        logger.info("Successfully imported: %s", dest_path)
+
+        # Update track with final path
+        track.update_file_path(FilePath(dest_path))
+
+        # Clean up empty parent directories in downloads
+        self._cleanup_empty_dirs(file_path.parent)
+        return True
 
     # Hey future me: Track matching using ID3 tags -> ISRC -> title/artist!
     # This is the key to connecting downloaded files to our database tracks.
     # Priority order:
     #   1. ISRC (globally unique, best match) - read from TSRC frame in ID3
     #   2. Title + Artist (fuzzy match) - read from TIT2/TPE1 frames
-    # GOTCHA: mutagen import inside method to avoid startup delay (lazy load)
-    # GOTCHA: Some MP3s have weird encodings - use .text[0] not .text to get string
-    async def _find_track_for_file(self, file_path: Path) -> Track | None:
+    # The tags are read BEFORE (read_file_tags_sync in the thread pool, or the
+    # ledger) - this method only does DB lookups.
+    async def _find_track_for_file(
+        self, file_path: Path, tags: FileTags
+    ) -> Track | None:
         """Find the track entity associated with a downloaded file.
 
         Attempts to match using:
@@ -505,42 +961,13 @@ class AutoImportService:
 
         Args:
             file_path: Path to the downloaded file
+            tags: Tags read from the file
 
         Returns:
             Track entity or None if no match found
         """
         try:
-            # Lazy import mutagen to avoid startup delay
-            from mutagen import File as MutagenFile  # type: ignore[attr-defined]
-            from mutagen.easyid3 import EasyID3
-            from mutagen.id3 import ID3
-
-            audio = MutagenFile(file_path, easy=True)
-            if audio is None:
-                logger.debug("Could not read audio metadata: %s", file_path)
-                return None
-
-            # Try to get ISRC from ID3 tags (most reliable match)
-            isrc = None
-            title = None
-            artist = None
-
-            # For MP3 files, try to read ISRC from TSRC frame (not in EasyID3)
-            if file_path.suffix.lower() == ".mp3":
-                try:
-                    id3 = ID3(file_path)  # type: ignore[no-untyped-call]
-                    if "TSRC" in id3:
-                        isrc = str(id3["TSRC"].text[0])
-                        logger.debug("Found ISRC in ID3: %s", isrc)
-                except Exception as e:
-                    logger.debug("Could not read TSRC frame: %s", e)
-
-            # Get title and artist from easy tags
-            if isinstance(audio, EasyID3) or hasattr(audio, "get"):
-                title_tag = audio.get("title")
-                artist_tag = audio.get("artist")
-                title = title_tag[0] if title_tag else None
-                artist = artist_tag[0] if artist_tag else None
+            isrc, title, artist = tags.isrc, tags.title, tags.artist
 
             # Strategy 1: ISRC lookup (best match)
             if isrc:
@@ -113,6 +113,22 @@ class CredentialsService:
         self._settings_service = AppSettingsService(session)
         self._fallback = fallback_settings
 
+    @staticmethod
+    def credentials_version(provider: str) -> int:
+        """Get the change counter of a provider's credentials.
+
+        Hey future me - cached provider clients store this number and rebuild
+        themselves when it moves (credentials saved via Settings UI/onboarding).
+        Bumped by AppSettingsService.set() for every "<provider>.*" key.
+
+        Args:
+            provider: Settings namespace ("spotify", "slskd", "deezer")
+
+        Returns:
+            Monotonic change counter (process-local)
+        """
+        return AppSettingsService.get_namespace_version(provider)
+
     async def get_spotify_credentials(self) -> SpotifyCredentials:
         """Get Spotify OAuth credentials.
 
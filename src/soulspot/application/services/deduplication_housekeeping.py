@@ -147,9 +147,8 @@ class DeduplicationHousekeepingService:
             [(a.id, f"{a.artist_id}:{self._normalize(a.title)}") for a in all_albums]
         )
 
-        # Count track duplicates (by ISRC or name+duration)
-        all_tracks = await self._track_repo.get_all()
-        track_groups = self._count_track_duplicate_groups(all_tracks)
+        # Count track duplicate groups (by ISRC or name+duration) - IDs only
+        track_groups = len(await self._find_track_duplicate_id_groups())
 
         return DuplicateCounts(
             artist_groups=artist_groups,
@@ -182,48 +181,6 @@ class DeduplicationHousekeepingService:
 
         return sum(1 for ids in key_to_ids.values() if len(ids) > 1)
 
-    def _count_track_duplicate_groups(self, tracks: list[Track]) -> int:
-        """
-        Count track duplicate groups by ISRC or name+duration.
-
-        Hey future me – tracks are trickier because we have multiple match strategies:
-        1. ISRC match (most reliable)
-        2. Same album + title + duration (±3 sec)
-        We count both but avoid double-counting.
-        """
-        seen_ids: set[int] = set()
-        group_count = 0
-
-        # First pass: ISRC matches
-        isrc_to_tracks: dict[str, list[Track]] = {}
-        for track in tracks:
-            if track.isrc:
-                if track.isrc not in isrc_to_tracks:
-                    isrc_to_tracks[track.isrc] = []
-                isrc_to_tracks[track.isrc].append(track)
-
-        for isrc_tracks in isrc_to_tracks.values():
-            if len(isrc_tracks) > 1:
-                group_count += 1
-                for t in isrc_tracks:
-                    seen_ids.add(t.id)
-
-        # Second pass: name+album+duration matches (excluding already counted)
-        key_to_tracks: dict[str, list[Track]] = {}
-        for track in tracks:
-            if track.id in seen_ids:
-                continue
-            key = f"{track.album_id}:{self._normalize(track.title)}:{track.duration_ms // 3000}"
-            if key not in key_to_tracks:
-                key_to_tracks[key] = []
-            key_to_tracks[key].append(track)
-
-        for key_tracks in key_to_tracks.values():
-            if len(key_tracks) > 1:
-                group_count += 1
-
-        return group_count
-
     # ───────────────────────────────────────────────────────────────────────────
     # FIND DUPLICATES (full library scan)
     # ───────────────────────────────────────────────────────────────────────────
@@ -327,84 +284,102 @@ class DeduplicationHousekeepingService:
         Match strategies:
         1. ISRC match (highest confidence)
         2. Same album + title + duration (±3 sec)
+
+        Only the tracks of the found groups are loaded as entities.
         """
-        all_tracks = await self._track_repo.get_all()
-        groups: list[DuplicateGroup] = []
-        seen_ids: set[int] = set()
+        id_groups = await self._find_track_duplicate_id_groups()
+        tracks = await self._track_repo.get_by_ids(
+            [track_id for _reason, ids in id_groups for track_id in ids]
+        )
+        by_id = {str(t.id.value): t for t in tracks}
 
-        # Pass 1: ISRC matches
-        isrc_to_tracks: dict[str, list[Track]] = {}
-        for track in all_tracks:
-            if track.isrc:
-                if track.isrc not in isrc_to_tracks:
-                    isrc_to_tracks[track.isrc] = []
-                isrc_to_tracks[track.isrc].append(track)
-
-        for isrc, isrc_tracks in isrc_to_tracks.items():
-            if len(isrc_tracks) < 2:
-                continue
+        groups: list[DuplicateGroup] = []
+        for reason, ids in id_groups:
+            group_tracks = [by_id[i] for i in ids if i in by_id]
+            if len(group_tracks) < 2:
+                continue  # deleted meanwhile
 
             sorted_tracks = sorted(
-                isrc_tracks,
+                group_tracks,
                 key=lambda t: (
                     -self._track_completeness_score(t),
                     t.created_at or datetime.min.replace(tzinfo=timezone.utc),
                 ),
             )
 
-            canonical = sorted_tracks[0]
-            duplicates = sorted_tracks[1:]
-
             groups.append(
                 DuplicateGroup(
                     entity_type="track",
-                    canonical=canonical,
-                    duplicates=duplicates,
-                    match_reason=f"ISRC: {isrc}",
+                    canonical=sorted_tracks[0],
+                    duplicates=sorted_tracks[1:],
+                    match_reason=reason,
                 )
             )
 
-            for t in isrc_tracks:
-                seen_ids.add(t.id)
+        logger.info(f"Found {len(groups)} duplicate track groups")
+        return groups
 
-        # Pass 2: name+album+duration matches
-        key_to_tracks: dict[str, list[Track]] = {}
-        for track in all_tracks:
-            if track.id in seen_ids:
-                continue
-            # Duration bucket: ±3 seconds (3000ms)
-            duration_bucket = (track.duration_ms or 0) // 3000
-            key = f"{track.album_id}:{self._normalize(track.title)}:{duration_bucket}"
-            if key not in key_to_tracks:
-                key_to_tracks[key] = []
-            key_to_tracks[key].append(track)
-
-        for key, key_tracks in key_to_tracks.items():
-            if len(key_tracks) < 2:
-                continue
+    async def _find_track_duplicate_id_groups(self) -> list[tuple[str, list[str]]]:
+        """
+        Track duplicate groups as (match_reason, track IDs) - no entities loaded.
+
+        Hey future me – neither pass holds the library in memory:
+        1. ISRC: one GROUP BY ... HAVING count > 1 in SQL
+        2. album + title + duration: NearDuplicateEngine blocked by album_id with a
+           ±3s SLIDING window. The old `duration_ms // 3000` buckets put 2.9s and
+           3.1s into different buckets and never compared them.
+        Tracks already grouped by ISRC are left out of pass 2 (no double counting).
+        """
+        from sqlalchemy import func, select
 
-            sorted_tracks = sorted(
-                key_tracks,
-                key=lambda t: (
-                    -self._track_completeness_score(t),
-                    t.created_at or datetime.min.replace(tzinfo=timezone.utc),
-                ),
-            )
+        from soulspot.application.services.near_duplicates import (
+            NearDuplicateEngine,
+            NearDuplicatePair,
+            group_pairs,
+        )
+        from soulspot.infrastructure.persistence.models import TrackModel
 
-            canonical = sorted_tracks[0]
-            duplicates = sorted_tracks[1:]
+        id_groups: list[tuple[str, list[str]]] = []
 
-            groups.append(
-                DuplicateGroup(
-                    entity_type="track",
-                    canonical=canonical,
-                    duplicates=duplicates,
-                    match_reason=f"album+title+duration: {key}",
-                )
+        # Pass 1: ISRC matches
+        duplicated_isrcs = (
+            select(TrackModel.isrc)
+            .where(TrackModel.isrc.isnot(None), TrackModel.isrc != "")
+            .group_by(TrackModel.isrc)
+            .having(func.count() > 1)
+        )
+        result = await self._session.execute(
+            select(TrackModel.isrc, TrackModel.id)
+            .where(TrackModel.isrc.in_(duplicated_isrcs))
+            .order_by(TrackModel.isrc, TrackModel.id)
+        )
+        isrc_groups: dict[str, list[str]] = {}
+        for isrc, track_id in result.all():
+            if isrc is None:  # excluded by the WHERE, narrows the type
+                continue
+            isrc_groups.setdefault(isrc, []).append(str(track_id))
+        seen_ids = {i for ids in isrc_groups.values() for i in ids}
+        id_groups.extend((f"ISRC: {isrc}", ids) for isrc, ids in isrc_groups.items())
+
+        # Pass 2: name+album+duration matches (excluding already grouped)
+        engine = NearDuplicateEngine(
+            self._session,
+            block_by="album",
+            duration_tolerance_ms=3000,
+            title_threshold=100,  # exact normalized title, this feeds auto-merge
+            normalize=self._normalize,
+        )
+        pairs: list[NearDuplicatePair] = []
+        async for page in engine.iter_pairs():
+            pairs.extend(
+                pair
+                for pair in page
+                if pair.track_id_1 not in seen_ids and pair.track_id_2 not in seen_ids
             )
-
-        logger.info(f"Found {len(groups)} duplicate track groups")
-        return groups
+        id_groups.extend(
+            ("album+title+duration (±3s)", ids) for ids in group_pairs(pairs)
+        )
+        return id_groups
 
     # ───────────────────────────────────────────────────────────────────────────
     # MERGE OPERATIONS (resolve duplicates)
@@ -0,0 +1,415 @@
+"""Size-prefiltered, parallel file hashing for exact duplicate detection.
+
+Hey future me - this is why the nightly duplicate scan doesn't read the whole library!
+
+Before: DuplicateDetectorWorker SHA256'd EVERY local file, one at a time (await each
+executor call before starting the next), in 8 KB reads, with one UPDATE per row.
+But two files can only be byte-identical if they have the same size - and most audio
+files have a unique size. Reading those is pure waste.
+
+Now it's a funnel, every stage only sees what the previous one couldn't rule out:
+1. SIZE:    group all local files by size (DB file_size, stat() only if missing).
+            Unique size = can't have an exact duplicate = never read.
+2. PARTIAL: same-size files get a cheap head+tail hash (2 x 64 KB + size).
+            Different partial hash = different file.
+3. FULL:    only files whose partial hashes collide get a full SHA256
+            (1 MB readinto buffer, GIL released while hashing).
+
+All reads run in the caller's thread pool with a bounded number in flight, results are
+returned as bulk update rows for one executemany per chunk.
+
+What gets stored in tracks.file_hash / file_hash_algorithm:
+- "sha256":         full file hash - the only kind compared for exact duplicates
+- "sha256-partial": head/tail hash of a file that had no partial collision; reused
+                    next run so a new same-size file only costs ITS partial read
+- nothing:          unique size, costs nothing next run either (size check only)
+The library scanner clears both columns when a file changes, so stored hashes are
+never stale.
+
+Usage:
+    pipeline = FileHashPipeline(executor, max_in_flight=8)
+    result = await pipeline.run(candidates)
+    await session.execute(update(TrackModel), result.hash_updates)
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+FULL_HASH_ALGORITHM = "sha256"
+PARTIAL_HASH_ALGORITHM = "sha256-partial"
+
+# Bytes read from the head AND the tail of a file for the partial hash. Audio files
+# differ early (tags) or late (audio end/trailing tags), 64 KB each catches both.
+PARTIAL_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class HashCandidate:
+    """One local track file (or a byte region of it) as stored in the DB.
+
+    offset/size describe the hashed region: the whole file for file hashes, the
+    audio payload for audio fingerprints. offset None = not known yet, the
+    scheme's locate() finds it right before the file is read.
+    """
+
+    track_id: str
+    file_path: str
+    size: int | None = None
+    file_hash: str | None = None
+    algorithm: str | None = None
+    offset: int | None = 0
+
+
+@dataclass(frozen=True)
+class HashScheme:
+    """Which region gets hashed and which columns the results go to."""
+
+    full_algorithm: str
+    partial_algorithm: str
+    hash_column: str
+    algorithm_column: str
+    size_column: str
+    # Sync (thread pool): file path -> (offset, length) of the region, None = skip
+    locate: Callable[[str], tuple[int, int] | None]
+
+
+@dataclass
+class HashPipelineResult:
+    """Outcome of one pipeline run (update rows + numbers for the worker stats)."""
+
+    hash_updates: list[dict[str, Any]] = field(default_factory=list)
+    size_updates: list[dict[str, Any]] = field(default_factory=list)
+    files_considered: int = 0
+    unique_size_skipped: int = 0
+    partial_hashed: int = 0
+    full_hashed: int = 0
+    bytes_read: int = 0
+    errors: int = 0
+
+
+# =============================================================================
+# SYNC READERS (run in the thread pool)
+# =============================================================================
+
+# Read buffer for full hashes
+_REGION_BUFFER_SIZE = 1024 * 1024
+
+
+def file_size_sync(file_path: str) -> int | None:
+    """Size of a file in bytes, None if it's gone or unreadable."""
+    try:
+        return os.stat(file_path).st_size
+    except OSError as e:
+        logger.debug(f"Cannot stat {file_path}: {e}")
+        return None
+
+
+def whole_file_region_sync(file_path: str) -> tuple[int, int] | None:
+    """The region of a plain file hash: everything."""
+    size = file_size_sync(file_path)
+    return (0, size) if size else None
+
+
+def partial_hash_sync(
+    file_path: str, size: int, offset: int = 0
+) -> tuple[str | None, int]:
+    """Hash size + first and last PARTIAL_CHUNK_SIZE bytes of a region.
+
+    Returns:
+        (hex digest or None on error, bytes read)
+    """
+    try:
+        digest = hashlib.sha256(size.to_bytes(8, "little"))
+        with open(file_path, "rb") as f:
+            f.seek(offset)
+            head = f.read(min(PARTIAL_CHUNK_SIZE, size))
+            digest.update(head)
+            read = len(head)
+            if size > PARTIAL_CHUNK_SIZE:
+                f.seek(offset + max(PARTIAL_CHUNK_SIZE, size - PARTIAL_CHUNK_SIZE))
+                tail = f.read(min(PARTIAL_CHUNK_SIZE, size - PARTIAL_CHUNK_SIZE))
+                digest.update(tail)
+                read += len(tail)
+        return digest.hexdigest(), read
+    except OSError as e:
+        logger.warning(f"Error computing partial hash for {file_path}: {e}")
+        return None, 0
+
+
+def full_hash_sync(
+    file_path: str, offset: int = 0, length: int | None = None
+) -> tuple[str | None, int]:
+    """Full SHA256 of `length` bytes starting at `offset` (None = to the end).
+
+    Hey future me - one reusable 1 MB buffer filled with readinto() (no per-chunk
+    bytes objects, same trick as hashlib.file_digest) and sha256.update() releases
+    the GIL on big buffers, so several of these really run in parallel in the
+    thread pool. Way faster than the old 8 KB read loop.
+
+    Returns:
+        (hex digest or None on error, bytes read)
+    """
+    try:
+        digest = hashlib.sha256()
+        buffer = bytearray(_REGION_BUFFER_SIZE)
+        view = memoryview(buffer)
+        read = 0
+        with open(file_path, "rb", buffering=0) as f:
+            f.seek(offset)
+            while length is None or read < length:
+                want = _REGION_BUFFER_SIZE
+                if length is not None:
+                    want = min(want, length - read)
+                n = f.readinto(view[:want])
+                if not n:
+                    break
+                digest.update(view[:n])
+                read += n
+        return digest.hexdigest(), read
+    except OSError as e:
+        logger.warning(f"Error computing SHA256 for {file_path}: {e}")
+        return None, 0
+
+
+# Plain file hashes (exact byte duplicates) - tracks.file_hash & co.
+FILE_HASH_SCHEME = HashScheme(
+    full_algorithm=FULL_HASH_ALGORITHM,
+    partial_algorithm=PARTIAL_HASH_ALGORITHM,
+    hash_column="file_hash",
+    algorithm_column="file_hash_algorithm",
+    size_column="file_size",
+    locate=whole_file_region_sync,
+)
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+
+class FileHashPipeline:
+    """Size -> partial hash -> full hash funnel over a bounded thread pool."""
+
+    def __init__(
+        self,
+        executor: Executor,
+        max_in_flight: int = 8,
+        scheme: HashScheme = FILE_HASH_SCHEME,
+    ) -> None:
+        """
+        Initialize the pipeline.
+
+        Args:
+            executor: Thread pool doing the file reads (owned by the caller)
+            max_in_flight: Max file operations submitted to the pool at once
+            scheme: What to hash - whole files (default) or e.g. audio payloads
+        """
+        self._executor = executor
+        self._max_in_flight = max(1, max_in_flight)
+        self._scheme = scheme
+
+    async def map(
+        self, func: Callable[..., Any], calls: Sequence[tuple[Any, ...]]
+    ) -> list[Any]:
+        """Run func(*args) for every args tuple in the pool, N in flight, in order.
+
+        Hey future me - sliding window instead of gather() over everything: 100k
+        queued futures would hold 100k closures, and we want reads to stay spread
+        over the pool, not all queued at once in front of other executor users.
+        """
+        loop = asyncio.get_running_loop()
+        results: list[Any] = [None] * len(calls)
+        pending: dict[asyncio.Future[Any], int] = {}
+        next_index = 0
+
+        while next_index < len(calls) or pending:
+            while next_index < len(calls) and len(pending) < self._max_in_flight:
+                future = loop.run_in_executor(self._executor, func, *calls[next_index])
+                pending[future] = next_index
+                next_index += 1
+            done, _ = await asyncio.wait(
+                pending.keys(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                results[pending.pop(future)] = future.result()
+        return results
+
+    def _has_full_hash(self, candidate: HashCandidate) -> bool:
+        return (
+            bool(candidate.file_hash)
+            and candidate.algorithm == self._scheme.full_algorithm
+        )
+
+    def _hash_row(
+        self, candidate: HashCandidate, digest: str, algorithm: str
+    ) -> dict[str, Any]:
+        return {
+            "id": candidate.track_id,
+            self._scheme.hash_column: digest,
+            self._scheme.algorithm_column: algorithm,
+        }
+
+    async def _locate(
+        self, candidates: list[HashCandidate], result: HashPipelineResult
+    ) -> list[HashCandidate]:
+        """Find offset/size of candidates that don't know them yet (drops failures)."""
+        regions = await self.map(
+            self._scheme.locate, [(c.file_path,) for c in candidates]
+        )
+        located = []
+        for candidate, region in zip(candidates, regions, strict=True):
+            if region is None:
+                continue
+            candidate.offset, size = region
+            if size != candidate.size:
+                candidate.size = size
+                result.size_updates.append(
+                    {"id": candidate.track_id, self._scheme.size_column: size}
+                )
+            located.append(candidate)
+        return located
+
+    async def run(self, candidates: Sequence[HashCandidate]) -> HashPipelineResult:
+        """Find every region that could be an exact duplicate and hash just those.
+
+        Args:
+            candidates: ALL local track files (hashed or not) - sizes of already
+                hashed files matter for grouping new ones
+
+        Returns:
+            Update rows ({"id", hash_column, algorithm_column} and
+            {"id", size_column}) plus stats
+        """
+        scheme = self._scheme
+        result = HashPipelineResult(files_considered=len(candidates))
+
+        # STAGE 1: sizes - from the DB, locate() (stat for plain files) only where
+        # nothing is stored yet
+        unsized = [c for c in candidates if not c.size]
+        if unsized:
+            await self._locate(unsized, result)
+
+        by_size: dict[int, list[HashCandidate]] = {}
+        for candidate in candidates:
+            if candidate.size:
+                by_size.setdefault(candidate.size, []).append(candidate)
+
+        groups = [
+            group
+            for group in by_size.values()
+            if len(group) > 1 and not all(self._has_full_hash(c) for c in group)
+        ]
+        result.unique_size_skipped = sum(
+            1 for group in by_size.values() if len(group) == 1
+        )
+
+        # STAGE 2: partial hashes. Tiny regions: the "partial" read IS the whole
+        # region, so hash them fully right away. Stored partials are reused,
+        # full-hashed members need a (not stored) partial to be comparable.
+        needs_full: list[HashCandidate] = []
+        needs_partial: list[HashCandidate] = []
+        partials: dict[str, str] = {}
+        for group in groups:
+            for candidate in group:
+                size = candidate.size or 0
+                if self._has_full_hash(candidate):
+                    if size > 2 * PARTIAL_CHUNK_SIZE:
+                        needs_partial.append(candidate)
+                elif size <= 2 * PARTIAL_CHUNK_SIZE:
+                    needs_full.append(candidate)
+                elif candidate.algorithm == scheme.partial_algorithm and (
+                    candidate.file_hash
+                ):
+                    partials[candidate.track_id] = candidate.file_hash
+                else:
+                    needs_partial.append(candidate)
+
+        # Regions of unchanged rows aren't stored - find them now, only for the
+        # few files that actually get read
+        unlocated = [c for c in needs_partial + needs_full if c.offset is None]
+        if unlocated:
+            located = {id(c) for c in await self._locate(unlocated, result)}
+            result.errors += sum(
+                1
+                for c in unlocated
+                if id(c) not in located and not self._has_full_hash(c)
+            )
+            needs_partial = [c for c in needs_partial if c.offset is not None]
+            needs_full = [c for c in needs_full if c.offset is not None]
+
+        computed = await self.map(
+            partial_hash_sync,
+            [(c.file_path, c.size, c.offset) for c in needs_partial],
+        )
+        for candidate, (digest, read) in zip(needs_partial, computed, strict=True):
+            result.bytes_read += read
+            if digest is None:
+                if not self._has_full_hash(candidate):
+                    result.errors += 1
+                continue
+            partials[candidate.track_id] = digest
+            if not self._has_full_hash(candidate):
+                result.partial_hashed += 1
+
+        # STAGE 3: full hashes only where partials collide (same size AND same partial)
+        by_partial: dict[str, list[HashCandidate]] = {}
+        for group in groups:
+            for candidate in group:
+                partial = partials.get(candidate.track_id)
+                if partial is not None:
+                    by_partial.setdefault(partial, []).append(candidate)
+
+        for members in by_partial.values():
+            if len(members) > 1:
+                needs_full.extend(c for c in members if not self._has_full_hash(c))
+            elif not self._has_full_hash(members[0]) and (
+                members[0].algorithm != scheme.partial_algorithm
+            ):
+                # No collision - remember the partial so next run doesn't re-read it
+                result.hash_updates.append(
+                    self._hash_row(
+                        members[0],
+                        partials[members[0].track_id],
+                        scheme.partial_algorithm,
+                    )
+                )
+
+        fulls = await self.map(
+            full_hash_sync,
+            [(c.file_path, c.offset, c.size) for c in needs_full],
+        )
+        for candidate, (digest, read) in zip(needs_full, fulls, strict=True):
+            result.bytes_read += read
+            if digest is None:
+                result.errors += 1
+                continue
+            result.full_hashed += 1
+            result.hash_updates.append(
+                self._hash_row(candidate, digest, scheme.full_algorithm)
+            )
+
+        return result
+
+
+__all__ = [
+    "FILE_HASH_SCHEME",
+    "FULL_HASH_ALGORITHM",
+    "PARTIAL_CHUNK_SIZE",
+    "PARTIAL_HASH_ALGORITHM",
+    "FileHashPipeline",
+    "HashCandidate",
+    "HashPipelineResult",
+    "HashScheme",
+    "file_size_sync",
+    "full_hash_sync",
+    "partial_hash_sync",
+    "whole_file_region_sync",
+]
@@ -1,14 +1,21 @@
 """Filter service for whitelist/blacklist filtering."""
 
 import logging
-import re
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from soulspot.application.services.result_matcher import (
+    filter_search_results,
+    get_compiled_blocklist,
+    get_compiled_filter_rules,
+)
 from soulspot.domain.entities import FilterRule, FilterTarget, FilterType
 from soulspot.domain.value_objects import FilterRuleId
-from soulspot.infrastructure.persistence.repositories import FilterRuleRepository
+from soulspot.infrastructure.persistence.repositories import (
+    BlocklistRepository,
+    FilterRuleRepository,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +30,7 @@ class FilterService:
             session: Database session
         """
         self.repository = FilterRuleRepository(session)
+        self.blocklist_repository = BlocklistRepository(session)
 
     # Hey future me, creates whitelist/blacklist filter rules! pattern is string to match (or regex if
     # is_regex=True). FilterRule is a domain entity (good separation of concerns). Uses repository.add()
@@ -130,6 +138,10 @@ class FilterService:
         await self.repository.delete(filter_id)
         logger.info(f"Deleted filter rule: {filter_id}")
 
+    # Hey future me, this used to load the rules and run every rule against every result
+    # (lowercase + re.search per rule per result). Now the enabled rules are compiled ONCE
+    # per process into a single alternation regex per target (result_matcher.py) and only
+    # reloaded when a filter rule change commits - a 1000 result search costs 0 queries.
     async def apply_filters(
         self, search_results: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
@@ -142,118 +154,42 @@ class FilterService:
         Returns:
             Filtered list of search results
         """
-        filters = await self.list_enabled()
-        if not filters:
+        rules = await get_compiled_filter_rules(self.repository)
+        if not rules.rule_count:
             return search_results
 
-        # Sort by priority (higher first)
-        filters.sort(key=lambda f: f.priority, reverse=True)
-
-        # Separate whitelist and blacklist filters
-        whitelist_filters = [
-            f for f in filters if f.filter_type == FilterType.WHITELIST
-        ]
-        blacklist_filters = [
-            f for f in filters if f.filter_type == FilterType.BLACKLIST
-        ]
-
-        filtered_results = []
-
-        for result in search_results:
-            # Apply blacklist filters first
-            if self._is_blacklisted(result, blacklist_filters):
-                logger.debug(
-                    f"Filtered out by blacklist: {result.get('filename', 'unknown')}"
-                )
-                continue
-
-            # Apply whitelist filters (if any exist, result must match at least one)
-            if whitelist_filters and not self._is_whitelisted(
-                result, whitelist_filters
-            ):
-                logger.debug(
-                    f"Filtered out by whitelist: {result.get('filename', 'unknown')}"
-                )
-                continue
-
-            filtered_results.append(result)
-
+        filtered_results = rules.filter_results(search_results)
         logger.info(
             f"Filtered {len(search_results)} results down to {len(filtered_results)}"
         )
         return filtered_results
 
-    # Listen, blacklist check - returns True if result matches ANY blacklist filter
-    # WHY any match? One bad keyword is enough to filter out (e.g., "live" excludes all live versions)
-    def _is_blacklisted(
-        self, result: dict[str, Any], blacklist_filters: list[FilterRule]
-    ) -> bool:
-        """Check if result matches any blacklist filter."""
-        for filter_rule in blacklist_filters:
-            if self._matches_filter(result, filter_rule):
-                return True
-        return False
-
-    # Hey whitelist check - returns True if matches ANY whitelist filter
-    # If you have whitelists, result MUST match at least one to pass
-    def _is_whitelisted(
-        self, result: dict[str, Any], whitelist_filters: list[FilterRule]
-    ) -> bool:
-        """Check if result matches any whitelist filter."""
-        for filter_rule in whitelist_filters:
-            if self._matches_filter(result, filter_rule):
-                return True
-        return False
-
-    def _matches_filter(self, result: dict[str, Any], filter_rule: FilterRule) -> bool:
-        """Check if result matches a specific filter rule."""
-        try:
-            if filter_rule.target == FilterTarget.KEYWORD:
-                # Check filename for keyword
-                filename = result.get("filename", "")
-                return self._pattern_matches(filter_rule, filename)
-
-            elif filter_rule.target == FilterTarget.USER:
-                # Check username
-                username = result.get("username", "")
-                return self._pattern_matches(filter_rule, username)
-
-            elif filter_rule.target == FilterTarget.FORMAT:
-                # Check file format/extension
-                filename = result.get("filename", "")
-                extension = filename.split(".")[-1].lower() if "." in filename else ""
-                return self._pattern_matches(filter_rule, extension)
-
-            elif filter_rule.target == FilterTarget.BITRATE:
-                # Check if bitrate is above minimum
-                bitrate = result.get("bitrate", 0)
-                try:
-                    min_bitrate = int(filter_rule.pattern)
-                    return bitrate >= min_bitrate  # type: ignore[no-any-return]
-                except ValueError:
-                    logger.warning(f"Invalid bitrate pattern: {filter_rule.pattern}")
-                    return False
-
-        except Exception as e:
-            logger.error(f"Error matching filter {filter_rule.name}: {e}")
-            return False
-
-        return False
-
-    # Yo pattern matching - case-insensitive substring search OR regex
-    # WHY case-insensitive? "FLAC" and "flac" should both match
-    # GOTCHA: Invalid regex patterns are caught and logged, returns False (safe default)
-    def _pattern_matches(self, filter_rule: FilterRule, text: str) -> bool:
-        """Check if text matches filter pattern."""
-        if filter_rule.is_regex:
-            try:
-                return bool(re.search(filter_rule.pattern, text, re.IGNORECASE))
-            except re.error as e:
-                logger.error(f"Invalid regex pattern in filter {filter_rule.name}: {e}")
-                return False
-        else:
-            # Case-insensitive substring match
-            return filter_rule.pattern.lower() in text.lower()
+    # Yo, THE bulk entry point for search/download paths: drops blocked sources (blocklist)
+    # AND filtered results (rules) in one pass over the list. Both matchers come from the
+    # process-wide cache, so repeated searches don't touch the DB at all.
+    async def filter_search_results(
+        self, search_results: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Apply blocklist and enabled filter rules to search results.
+
+        Args:
+            search_results: List of search results from slskd
+
+        Returns:
+            Results that are neither blocked nor filtered out (order preserved)
+        """
+        if not search_results:
+            return search_results
+
+        rules = await get_compiled_filter_rules(self.repository)
+        blocklist = await get_compiled_blocklist(self.blocklist_repository)
+        filtered_results = filter_search_results(search_results, rules, blocklist)
+        if len(filtered_results) != len(search_results):
+            logger.info(
+                f"Blocklist/filters reduced {len(search_results)} results "
+                f"to {len(filtered_results)}"
+            )
+        return filtered_results
 
     # Listen, default keywords - hard-coded list of common exclusions
     # WHY these? Live recordings, remixes, karaoke usually lower quality than studio originals
@@ -57,6 +57,15 @@ Usage:
     stats = await image_service.repair_artist_images(limit=50)
 """
 
+# Content-addressed store (shared blobs, refcounts, incremental stats)
+from soulspot.application.services.images.content_store import (
+    ImageContentStore,
+    ImageStoreError,
+    StoredImage,
+    configure_image_store,
+    get_image_store,
+)
+
 # FAILED marker utilities (shared by repair operations)
 from soulspot.application.services.images.failed_markers import (
     FAILED_RETRY_HOURS,
@@ -87,6 +96,7 @@ from soulspot.application.services.images.queue import (
     ImageDownloadJob,
     ImageDownloadQueue,
     ImagePriority,
+    note_images_viewed,
 )
 
 # Batch repair operations (extracted from deprecated ImageRepairService)
@@ -95,6 +105,21 @@ from soulspot.application.services.images.repair import (
     repair_artist_images,
 )
 
+# Concurrent repair engine (bounded pool, shared rate limiters, checkpoints)
+from soulspot.application.services.images.repair_engine import (
+    ImageRepairEngine,
+    RepairCheckpoint,
+    RepairRateLimited,
+)
+
+# Content-hashed size variants + HTTP cache validators (served by /api/images)
+from soulspot.application.services.images.variants import (
+    VARIANT_SIZES,
+    ImageVariantStore,
+    content_digest,
+    snap_variant_size,
+)
+
 # Clean Architecture: Import DTOs from Domain Port (Single Source of Truth)
 from soulspot.domain.ports.image_service import (
     EntityType,
@@ -132,8 +157,23 @@ __all__ = [
     # Batch repair operations
     "repair_artist_images",
     "repair_album_images",
+    "ImageRepairEngine",
+    "RepairCheckpoint",
+    "RepairRateLimited",
     # Image Download Queue (Eager Loading)
     "ImageDownloadQueue",
     "ImageDownloadJob",
     "ImagePriority",
+    "note_images_viewed",
+    # Content-addressed store
+    "ImageContentStore",
+    "ImageStoreError",
+    "StoredImage",
+    "configure_image_store",
+    "get_image_store",
+    # Size variants (ETag/304 + immutable caching)
+    "VARIANT_SIZES",
+    "ImageVariantStore",
+    "content_digest",
+    "snap_variant_size",
 ]
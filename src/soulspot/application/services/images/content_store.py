@@ -0,0 +1,819 @@
+"""Content-addressed image store with reference counting.
+
+Hey future me - this is why a cover shared by 12 releases is on disk ONCE!
+
+Before: ImageService wrote one file per entity ({entity}s/{provider}/{id}.webp).
+A single's cover reused by the album, the deluxe edition and three compilations =
+6 downloads, 6 PIL decodes/encodes, 6 identical files. optimize_cache() rglob'ed the
+whole directory and the settings page walked it again for disk usage + image count.
+
+Now every image goes through store():
+1. Known source URL (image_refs.source_url, indexed) → reuse the blob, no download
+2. Downloaded bytes seen before (image_blobs.source_hash) → reuse, no decode/encode
+3. Same WebP bytes (image_blobs.content_hash) → reuse, no second file
+4. Otherwise write blobs/{hash[:2]}/{hash}.webp (atomically)
+Then the entity's ref (ref_key → blob) is recorded and ref_counts move.
+
+Bookkeeping:
+- ref_count is kept up to date incrementally (ref moved = -1 old, +1 new). The truth
+  is the entity path columns though - callers of the provider-ID methods persist the
+  path themselves, entities get deleted without telling us. reconcile_ref_counts()
+  recounts from those columns (indexed, one UPDATE) before every cleanup.
+- ref_count 0 → orphaned_at is set. collect_garbage() deletes orphans older than a
+  grace period (the caller may not have saved the path yet!) - an indexed query.
+- image_cache_stats is bumped with every blob insert/delete → stats are a lookup.
+
+Sessions: with the caller's session (ImageService.session) bookkeeping joins the
+caller's transaction - a second session would wait for the caller's SQLite write
+lock. Without one we use the configured session_scope. Bookkeeping errors are logged
+and swallowed, the image itself is fine. No session_scope configured (tests, CLI) =
+file-level dedup only.
+
+Files from before the store are registered in place by adopt_existing_images().
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+from soulspot.application.services.images.variants import (
+    DIGEST_LENGTH,
+    VARIANT_SIZES,
+    ImageVariantStore,
+)
+from soulspot.infrastructure.integrations.single_flight import SingleFlight
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+BLOB_DIR = "blobs"
+DEFAULT_ORPHAN_GRACE_SECONDS = 24 * 3600
+STAT_CATEGORIES = ("artists", "albums", "playlists")
+_IMAGE_SUFFIXES = {".webp", ".jpg", ".jpeg", ".png", ".gif"}
+# Never adopt these (our own store + the variant cache from variants.py)
+_SKIP_DIRS = {BLOB_DIR, ".variants"}
+
+
+class ImageStoreError(Exception):
+    """Storing an image failed.
+
+    stage: "download" | "convert" | "write" - ImageService maps it to an error code.
+    """
+
+    def __init__(self, stage: str, message: str) -> None:
+        super().__init__(message)
+        self.stage = stage
+
+
+@dataclass(frozen=True, slots=True)
+class StoredImage:
+    """Result of ImageContentStore.store()."""
+
+    relative_path: str
+    content_hash: str
+    downloaded: bool  # False = known source URL, nothing fetched
+    deduplicated: bool  # True = an existing blob was reused
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class ImageContentStore:
+    """Content-addressed image files + refcount bookkeeping."""
+
+    def __init__(
+        self,
+        base_path: Path | str,
+        session_scope: Callable[[], Any] | None = None,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            base_path: Image cache root (settings.storage.image_path)
+            session_scope: Async context manager factory for DB sessions
+                (Database.session_scope) - None = no bookkeeping
+        """
+        self.base_path = Path(base_path)
+        self._session_scope = session_scope
+        self._flight: SingleFlight[tuple[str, str, bool, bool]] = SingleFlight(
+            "image_store"
+        )
+        self._variants = ImageVariantStore(self.base_path)
+
+    @property
+    def has_bookkeeping(self) -> bool:
+        """True if blobs/refs/stats are tracked in the DB."""
+        return self._session_scope is not None
+
+    @staticmethod
+    def blob_path(content_hash: str) -> str:
+        """Relative path of a blob (what ends up in image_path/cover_path)."""
+        return f"{BLOB_DIR}/{content_hash[:2]}/{content_hash[:32]}.webp"
+
+    # =========================================================================
+    # STORE
+    # =========================================================================
+
+    async def store(
+        self,
+        *,
+        ref_key: str,
+        category: str,
+        target_size: int,
+        source_url: str,
+        download: Callable[[], Awaitable[bytes | None]],
+        convert: Callable[[bytes], Awaitable[bytes | None]],
+        session: "AsyncSession | None" = None,
+    ) -> StoredImage:
+        """Store the image of one entity, sharing identical images.
+
+        Concurrent calls for the same URL + size (album sync and a page view
+        wanting the same cover) share one download.
+
+        Args:
+            ref_key: Entity identity, e.g. "artist:spotify:<id>" or "album:<uuid>"
+            category: Stats bucket ("artists", "albums", "playlists", ...)
+            target_size: Edge length the WebP is converted to
+            source_url: Where the image comes from
+            download: Fetches the raw bytes (None = failed)
+            convert: Raw bytes → WebP bytes (None = failed)
+            session: Caller's session - bookkeeping joins its transaction
+
+        Returns:
+            Where the image is stored
+
+        Raises:
+            ImageStoreError: Download, conversion or file write failed
+        """
+        content_hash, relative_path, downloaded, deduplicated = await self._flight.do(
+            (source_url, target_size),
+            lambda: self._resolve_blob(
+                category, target_size, source_url, download, convert, session
+            ),
+        )
+        await self._attach(ref_key, content_hash, source_url, session)
+        return StoredImage(relative_path, content_hash, downloaded, deduplicated)
+
+    async def _resolve_blob(
+        self,
+        category: str,
+        target_size: int,
+        source_url: str,
+        download: Callable[[], Awaitable[bytes | None]],
+        convert: Callable[[bytes], Awaitable[bytes | None]],
+        session: "AsyncSession | None",
+    ) -> tuple[str, str, bool, bool]:
+        """(content_hash, relative_path, downloaded, deduplicated) of an image."""
+        # 1. Known URL → no download at all
+        known = await self._find_blob_by_source_url(source_url, target_size, session)
+        if known is not None:
+            return known[0], known[1], False, True
+
+        raw = await download()
+        if not raw:
+            raise ImageStoreError(
+                "download", f"Failed to download image from {source_url}"
+            )
+
+        # 2. Same downloaded bytes (other URL, other provider) → no decode/encode
+        source_hash = f"{_sha256(raw)[:64]}:{target_size}"
+        known = await self._find_blob_by_source_hash(source_hash, session)
+        if known is not None:
+            return known[0], known[1], True, True
+
+        webp = await convert(raw)
+        if not webp:
+            raise ImageStoreError("convert", "Failed to convert image to WebP")
+
+        # 3. Same WebP bytes → the file is already there
+        content_hash = _sha256(webp)
+        relative_path = self.blob_path(content_hash)
+        full_path = self.base_path / relative_path
+        deduplicated = full_path.exists()
+        if not deduplicated:
+            try:
+                await asyncio.to_thread(_write_atomic, full_path, webp)
+            except OSError as e:
+                raise ImageStoreError("write", f"Failed to write file: {e}") from e
+
+        await self._register_blob(
+            content_hash, relative_path, category, len(webp), source_hash, session
+        )
+        return content_hash, relative_path, True, deduplicated
+
+    # =========================================================================
+    # BOOKKEEPING
+    # =========================================================================
+
+    @asynccontextmanager
+    async def _session(
+        self, session: "AsyncSession | None"
+    ) -> AsyncIterator["AsyncSession | None"]:
+        """Caller's session (in a SAVEPOINT), a fresh one, or None.
+
+        Hey future me - errors are swallowed HERE: a failed bookkeeping write must
+        never fail the image download. reconcile_ref_counts() fixes drift later.
+        """
+        from sqlalchemy.exc import IntegrityError
+
+        entered = False
+        try:
+            if session is not None:
+                async with session.begin_nested():
+                    entered = True
+                    yield session
+            elif self._session_scope is not None:
+                async with self._session_scope() as own_session:
+                    entered = True
+                    yield own_session
+            else:
+                entered = True
+                yield None
+        except IntegrityError as e:
+            # Two concurrent stores registered the same blob/ref - the other one won
+            logger.debug("Image store bookkeeping raced: %s", e)
+        except Exception as e:
+            logger.warning("Image store bookkeeping failed: %s", e)
+            if not entered:
+                yield None  # couldn't even open a session - body runs without DB
+
+    async def _find_blob_by_source_url(
+        self, source_url: str, target_size: int, session: "AsyncSession | None"
+    ) -> tuple[str, str] | None:
+        from sqlalchemy import select
+
+        from soulspot.infrastructure.persistence.models import (
+            ImageBlobModel,
+            ImageRefModel,
+        )
+
+        stmt = (
+            select(ImageBlobModel.content_hash, ImageBlobModel.relative_path)
+            .join(
+                ImageRefModel,
+                ImageRefModel.content_hash == ImageBlobModel.content_hash,
+            )
+            .where(
+                ImageRefModel.source_url == source_url,
+                ImageBlobModel.source_hash.like(f"%:{target_size}"),
+            )
+            .limit(1)
+        )
+        return await self._first_existing(stmt, session)
+
+    async def _find_blob_by_source_hash(
+        self, source_hash: str, session: "AsyncSession | None"
+    ) -> tuple[str, str] | None:
+        from sqlalchemy import select
+
+        from soulspot.infrastructure.persistence.models import ImageBlobModel
+
+        stmt = (
+            select(ImageBlobModel.content_hash, ImageBlobModel.relative_path)
+            .where(ImageBlobModel.source_hash == source_hash)
+            .limit(1)
+        )
+        return await self._first_existing(stmt, session)
+
+    async def _first_existing(
+        self, stmt: Any, session: "AsyncSession | None"
+    ) -> tuple[str, str] | None:
+        """First (content_hash, relative_path) row whose file is still on disk."""
+        row = None
+        async with self._session(session) as db_session:
+            if db_session is not None:
+                row = (await db_session.execute(stmt)).first()
+        if row is None or not (self.base_path / row[1]).exists():
+            return None
+        return row[0], row[1]
+
+    async def _register_blob(
+        self,
+        content_hash: str,
+        relative_path: str,
+        category: str,
+        size_bytes: int,
+        source_hash: str | None,
+        session: "AsyncSession | None",
+    ) -> None:
+        """Insert the blob row (+ stats) if it's new, remember source_hash."""
+        from soulspot.infrastructure.persistence.models import ImageBlobModel
+
+        async with self._session(session) as db_session:
+            if db_session is None:
+                return
+            blob = await db_session.get(ImageBlobModel, content_hash)
+            if blob is not None:
+                if source_hash and not blob.source_hash:
+                    blob.source_hash = source_hash
+                return
+            db_session.add(
+                ImageBlobModel(
+                    content_hash=content_hash,
+                    relative_path=relative_path,
+                    category=category,
+                    size_bytes=size_bytes,
+                    source_hash=source_hash,
+                    ref_count=0,
+                    orphaned_at=datetime.now(UTC),
+                )
+            )
+            await db_session.flush()
+            await _bump_stats(db_session, category, 1, size_bytes)
+
+    async def _attach(
+        self,
+        ref_key: str,
+        content_hash: str,
+        source_url: str | None,
+        session: "AsyncSession | None",
+    ) -> None:
+        """Point ref_key at a blob and move the ref_counts."""
+        from soulspot.infrastructure.persistence.models import ImageRefModel
+
+        now = datetime.now(UTC)
+        async with self._session(session) as db_session:
+            if db_session is None:
+                return
+            ref = await db_session.get(ImageRefModel, ref_key)
+            old_hash = ref.content_hash if ref is not None else None
+            if ref is None:
+                db_session.add(
+                    ImageRefModel(
+                        ref_key=ref_key,
+                        content_hash=content_hash,
+                        source_url=source_url,
+                        updated_at=now,
+                    )
+                )
+            else:
+                ref.content_hash = content_hash
+                ref.source_url = source_url
+                ref.updated_at = now
+
+            if old_hash != content_hash:
+                await _adjust_ref_count(db_session, content_hash, +1, now)
+                if old_hash is not None:
+                    await _adjust_ref_count(db_session, old_hash, -1, now)
+
+    async def is_managed(
+        self, relative_path: str, session: "AsyncSession | None" = None
+    ) -> bool:
+        """True if the file is a registered blob (possibly shared - don't unlink!)."""
+        from sqlalchemy import select
+
+        from soulspot.infrastructure.persistence.models import ImageBlobModel
+
+        if relative_path.startswith(f"{BLOB_DIR}/"):
+            return True
+        found = None
+        async with self._session(session) as db_session:
+            if db_session is not None:
+                found = (
+                    await db_session.execute(
+                        select(ImageBlobModel.content_hash).where(
+                            ImageBlobModel.relative_path == relative_path
+                        )
+                    )
+                ).first()
+        return found is not None
+
+    # =========================================================================
+    # CLEANUP
+    # =========================================================================
+
+    async def reconcile_ref_counts(self, session: "AsyncSession | None" = None) -> None:
+        """Recount references from the entity path columns (one indexed UPDATE)."""
+        from sqlalchemy import and_, func, select, update
+
+        from soulspot.infrastructure.persistence.models import (
+            AlbumModel,
+            ArtistModel,
+            ImageBlobModel,
+            PlaylistModel,
+        )
+
+        path = ImageBlobModel.relative_path
+        references = (
+            select(func.count()).where(ArtistModel.image_path == path).scalar_subquery()
+            + select(func.count())
+            .where(AlbumModel.cover_path == path)
+            .scalar_subquery()
+            + select(func.count())
+            .where(PlaylistModel.cover_path == path)
+            .scalar_subquery()
+        )
+        now = datetime.now(UTC)
+        async with self._session(session) as db_session:
+            if db_session is None:
+                return
+            await db_session.execute(
+                update(ImageBlobModel).values(ref_count=references)
+            )
+            await db_session.execute(
+                update(ImageBlobModel)
+                .where(
+                    and_(
+                        ImageBlobModel.ref_count == 0,
+                        ImageBlobModel.orphaned_at.is_(None),
+                    )
+                )
+                .values(orphaned_at=now)
+            )
+            await db_session.execute(
+                update(ImageBlobModel)
+                .where(
+                    and_(
+                        ImageBlobModel.ref_count > 0,
+                        ImageBlobModel.orphaned_at.is_not(None),
+                    )
+                )
+                .values(orphaned_at=None)
+            )
+
+    async def collect_garbage(
+        self,
+        grace_seconds: int = DEFAULT_ORPHAN_GRACE_SECONDS,
+        dry_run: bool = True,
+        limit: int = 1000,
+        session: "AsyncSession | None" = None,
+    ) -> dict[str, int]:
+        """Delete blobs nobody references anymore (after reconciling ref_counts).
+
+        Args:
+            grace_seconds: Only orphans unreferenced for at least this long
+            dry_run: Just report what would be deleted
+            limit: Max blobs deleted per call
+            session: Caller's session
+
+        Returns:
+            {deleted_count, freed_bytes, orphaned_count}
+        """
+        from sqlalchemy import delete, func, select
+
+        from soulspot.infrastructure.persistence.models import (
+            ImageBlobModel,
+            ImageRefModel,
+        )
+
+        result = {"deleted_count": 0, "freed_bytes": 0, "orphaned_count": 0}
+        if not self.has_bookkeeping and session is None:
+            return result
+
+        await self.reconcile_ref_counts(session)
+
+        cutoff = datetime.now(UTC) - timedelta(seconds=grace_seconds)
+        async with self._session(session) as db_session:
+            if db_session is None:
+                return result
+            result["orphaned_count"] = (
+                await db_session.execute(
+                    select(func.count()).where(ImageBlobModel.ref_count == 0)
+                )
+            ).scalar_one()
+            rows = (
+                await db_session.execute(
+                    select(
+                        ImageBlobModel.content_hash,
+                        ImageBlobModel.relative_path,
+                        ImageBlobModel.category,
+                        ImageBlobModel.size_bytes,
+                    )
+                    .where(
+                        ImageBlobModel.ref_count == 0,
+                        ImageBlobModel.orphaned_at <= cutoff,
+                    )
+                    .limit(limit)
+                )
+            ).all()
+
+            for _hash, _path, _category, size_bytes in rows:
+                result["deleted_count"] += 1
+                result["freed_bytes"] += size_bytes
+            if dry_run or not rows:
+                return result
+
+            await asyncio.to_thread(self._unlink_blobs, [(r[0], r[1]) for r in rows])
+            hashes = [r[0] for r in rows]
+            await db_session.execute(
+                delete(ImageRefModel).where(ImageRefModel.content_hash.in_(hashes))
+            )
+            await db_session.execute(
+                delete(ImageBlobModel).where(ImageBlobModel.content_hash.in_(hashes))
+            )
+            for _hash, _path, category, size_bytes in rows:
+                await _bump_stats(db_session, category, -1, -size_bytes)
+
+        logger.info(
+            "Image store cleanup: deleted %d orphaned images (%d bytes)",
+            result["deleted_count"],
+            result["freed_bytes"],
+        )
+        return result
+
+    def _unlink_blobs(self, blobs: list[tuple[str, str]]) -> None:
+        """Delete blob files + their size variants (thread pool)."""
+        for content_hash, relative_path in blobs:
+            (self.base_path / relative_path).unlink(missing_ok=True)
+            digest = content_hash[:DIGEST_LENGTH]
+            for size in VARIANT_SIZES:
+                self._variants.variant_path(digest, size).unlink(missing_ok=True)
+
+    # =========================================================================
+    # STATS
+    # =========================================================================
+
+    async def get_stats(
+        self, session: "AsyncSession | None" = None
+    ) -> dict[str, tuple[int, int]]:
+        """Image count + bytes per category (a lookup, no directory walk).
+
+        Returns:
+            {category: (image_count, total_bytes)}
+        """
+        from sqlalchemy import select
+
+        from soulspot.infrastructure.persistence.models import ImageCacheStatsModel
+
+        stats: dict[str, tuple[int, int]] = {}
+        async with self._session(session) as db_session:
+            if db_session is not None:
+                rows = (
+                    await db_session.execute(
+                        select(
+                            ImageCacheStatsModel.category,
+                            ImageCacheStatsModel.image_count,
+                            ImageCacheStatsModel.total_bytes,
+                        )
+                    )
+                ).all()
+                stats = {row[0]: (row[1], row[2]) for row in rows}
+        return stats
+
+    # =========================================================================
+    # ADOPTION (one-time, files from before the store)
+    # =========================================================================
+
+    async def adopt_existing_images(self, batch_size: int = 200) -> dict[str, int]:
+        """Register pre-store image files in place, merging identical ones.
+
+        Hey future me - this is the ONE directory walk left, and it only finds work
+        once: registered files are skipped (no re-hashing). Duplicates are merged
+        into the first copy (entity path columns re-pointed, duplicate deleted).
+
+        Returns:
+            {registered, duplicates_removed, freed_bytes}
+        """
+        from sqlalchemy import select
+
+        from soulspot.infrastructure.persistence.models import ImageBlobModel
+
+        result = {"registered": 0, "duplicates_removed": 0, "freed_bytes": 0}
+        if not self.has_bookkeeping:
+            return result
+
+        async with self._session(None) as db_session:
+            if db_session is None:
+                return result
+            registered = set(
+                (await db_session.execute(select(ImageBlobModel.relative_path)))
+                .scalars()
+                .all()
+            )
+        files = await asyncio.to_thread(self._list_files)
+        todo = [f for f in files if f[0] not in registered]
+
+        for start in range(0, len(todo), batch_size):
+            batch = todo[start : start + batch_size]
+            hashed = await asyncio.to_thread(self._hash_files, batch)
+            async with self._session(None) as db_session:
+                if db_session is None:
+                    break
+                for relative_path, size_bytes, content_hash in hashed:
+                    keeper = await db_session.get(ImageBlobModel, content_hash)
+                    if keeper is None:
+                        category = relative_path.split("/", 1)[0]
+                        db_session.add(
+                            ImageBlobModel(
+                                content_hash=content_hash,
+                                relative_path=relative_path,
+                                category=category,
+                                size_bytes=size_bytes,
+                                ref_count=0,
+                            )
+                        )
+                        await db_session.flush()
+                        await _bump_stats(db_session, category, 1, size_bytes)
+                        result["registered"] += 1
+                        continue
+                    await _repoint_entities(
+                        db_session, relative_path, keeper.relative_path
+                    )
+                    (self.base_path / relative_path).unlink(missing_ok=True)
+                    result["duplicates_removed"] += 1
+                    result["freed_bytes"] += size_bytes
+
+        await self.reconcile_ref_counts()
+        if todo:
+            logger.info(
+                "Image store: registered %d existing images, merged %d duplicates "
+                "(%d bytes freed)",
+                result["registered"],
+                result["duplicates_removed"],
+                result["freed_bytes"],
+            )
+        return result
+
+    def _list_files(self) -> list[tuple[str, int]]:
+        """(relative_path, size) of pre-store image files."""
+        files: list[tuple[str, int]] = []
+        if not self.base_path.exists():
+            return files
+        for root, dirs, names in os.walk(self.base_path):
+            if Path(root) == self.base_path:
+                dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+            for name in names:
+                if Path(name).suffix.lower() not in _IMAGE_SUFFIXES:
+                    continue
+                full = Path(root) / name
+                try:
+                    files.append(
+                        (
+                            full.relative_to(self.base_path).as_posix(),
+                            full.stat().st_size,
+                        )
+                    )
+                except OSError:
+                    continue
+        return files
+
+    def _hash_files(self, files: list[tuple[str, int]]) -> list[tuple[str, int, str]]:
+        hashed = []
+        for relative_path, size_bytes in files:
+            try:
+                data = (self.base_path / relative_path).read_bytes()
+            except OSError:
+                continue
+            hashed.append((relative_path, size_bytes, _sha256(data)))
+        return hashed
+
+
+# =============================================================================
+# SQL helpers
+# =============================================================================
+
+
+async def _bump_stats(
+    session: "AsyncSession", category: str, count_delta: int, bytes_delta: int
+) -> None:
+    """Incrementally update image_cache_stats."""
+    from sqlalchemy import CursorResult, update
+
+    from soulspot.infrastructure.persistence.models import ImageCacheStatsModel
+
+    # UPDATE statements return a CursorResult (execute() is typed as plain Result)
+    updated = cast(
+        CursorResult[Any],
+        await session.execute(
+            update(ImageCacheStatsModel)
+            .where(ImageCacheStatsModel.category == category)
+            .values(
+                image_count=ImageCacheStatsModel.image_count + count_delta,
+                total_bytes=ImageCacheStatsModel.total_bytes + bytes_delta,
+            )
+        ),
+    )
+    if updated.rowcount == 0:
+        session.add(
+            ImageCacheStatsModel(
+                category=category,
+                image_count=max(0, count_delta),
+                total_bytes=max(0, bytes_delta),
+            )
+        )
+        await session.flush()
+
+
+async def _adjust_ref_count(
+    session: "AsyncSession", content_hash: str, delta: int, now: datetime
+) -> None:
+    """ref_count += delta (never below 0), keeping orphaned_at in sync."""
+    from sqlalchemy import case, update
+
+    from soulspot.infrastructure.persistence.models import ImageBlobModel
+
+    new_count = case(
+        (ImageBlobModel.ref_count + delta < 0, 0),
+        else_=ImageBlobModel.ref_count + delta,
+    )
+    await session.execute(
+        update(ImageBlobModel)
+        .where(ImageBlobModel.content_hash == content_hash)
+        .values(
+            ref_count=new_count,
+            orphaned_at=case((new_count == 0, now), else_=None),
+        )
+    )
+
+
+async def _repoint_entities(
+    session: "AsyncSession", old_path: str, new_path: str
+) -> None:
+    """Entities using old_path use new_path from now on."""
+    from sqlalchemy import update
+
+    from soulspot.infrastructure.persistence.models import (
+        AlbumModel,
+        ArtistModel,
+        PlaylistModel,
+    )
+
+    await session.execute(
+        update(ArtistModel)
+        .where(ArtistModel.image_path == old_path)
+        .values(image_path=new_path)
+    )
+    await session.execute(
+        update(AlbumModel)
+        .where(AlbumModel.cover_path == old_path)
+        .values(cover_path=new_path)
+    )
+    await session.execute(
+        update(PlaylistModel)
+        .where(PlaylistModel.cover_path == old_path)
+        .values(cover_path=new_path)
+    )
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """tmp + replace: readers never see a half-written blob."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+# =============================================================================
+# GLOBAL STORE INSTANCE
+# =============================================================================
+# Hey future me - ImageService instances are created all over the place (per request,
+# per worker, lazily for templates). The store must be shared: SingleFlight only
+# coalesces within one instance, and only lifecycle knows the Database.
+# configure_image_store() runs at startup; get_image_store() before that (or for
+# another base path) hands out a store without bookkeeping.
+
+_image_stores: dict[str, ImageContentStore] = {}
+
+
+def _store_key(base_path: Path | str) -> str:
+    return str(Path(base_path).resolve())
+
+
+def configure_image_store(
+    base_path: Path | str, session_scope: Callable[[], Any]
+) -> ImageContentStore:
+    """Create the global store for base_path with DB bookkeeping."""
+    store = ImageContentStore(base_path, session_scope=session_scope)
+    _image_stores[_store_key(base_path)] = store
+    return store
+
+
+def get_image_store(base_path: Path | str) -> ImageContentStore:
+    """Get the shared store for an image root."""
+    key = _store_key(base_path)
+    store = _image_stores.get(key)
+    if store is None:
+        store = _image_stores[key] = ImageContentStore(base_path)
+    return store
+
+
+def reset_image_stores() -> None:
+    """Forget all stores (for testing)."""
+    _image_stores.clear()
+
+
+__all__ = [
+    "BLOB_DIR",
+    "ImageContentStore",
+    "ImageStoreError",
+    "StoredImage",
+    "configure_image_store",
+    "get_image_store",
+    "reset_image_stores",
+]
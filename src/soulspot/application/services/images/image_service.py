@@ -37,13 +37,25 @@ See: docs/architecture/IMAGE_SERVICE_DETAILED_PLAN.md
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
+from soulspot.application.services.images.content_store import (
+    BLOB_DIR,
+    STAT_CATEGORIES,
+    ImageStoreError,
+    StoredImage,
+    get_image_store,
+)
+from soulspot.application.services.images.variants import (
+    content_digest,
+    snap_variant_size,
+)
+
 # Clean Architecture: Import DTOs from Domain Port (Single Source of Truth)
 from soulspot.domain.ports.image_service import (
     EntityType,
@@ -180,6 +192,7 @@ class ImageService:
         local_path: str | None,
         entity_type: EntityType = "album",
         require_local: bool = False,
+        size: int | None = None,
     ) -> str:
         """Get the best display URL for an image.
 
@@ -201,15 +214,23 @@ class ImageService:
                           Use require_local=True for Library entities (Artists, Albums)
                           to ensure images are always served from local cache.
                           Use require_local=False (default) for Browse/Search results.
+            size: Display size in px for local images (grids: 150/300) - served as a
+                  cached variant, see images/variants.py. None = stored size.
 
         Returns:
             URL string to display the image
         """
         # Priority 1: Local cache (if path provided AND file exists)
+        # Hey future me - local URLs carry the content digest (?v=), that's what makes
+        # them immutable-cacheable. content_digest() doubles as the exists() check.
         if local_path:
             full_path = Path(self.cache_base_path) / local_path
-            if full_path.exists():
-                return f"{self.local_serve_prefix}/{local_path}"
+            digest = content_digest(full_path)
+            if digest is not None:
+                url = f"{self.local_serve_prefix}/{local_path}?v={digest}"
+                if size:
+                    url += f"&size={snap_variant_size(size)}"
+                return url
             else:
                 logger.debug(
                     "Local path provided but file missing: %s (entity_type=%s)",
@@ -549,47 +570,69 @@ class ImageService:
             if existing and existing.is_cached and existing.source_url == source_url:
                 return SaveImageResult.success_cached(existing)
 
-        # Download and process
+        # Download, convert + store (shared with identical images, see content_store)
+        result = await self.store_entity_image(source_url, entity_type, entity_id)
+        if not result.success or result.image_info is None:
+            return result
+
+        # Update entity in DB
         try:
-            image_data = await self._download_image(source_url)
-            if not image_data:
-                return SaveImageResult.failure(
-                    f"Failed to download image from {source_url}"
-                )
+            await self.update_entity_image_path(
+                entity_type, entity_id, source_url, result.image_info.local_path or ""
+            )
+        except Exception as e:
+            logger.exception(
+                "Error in download_and_cache for %s/%s", entity_type, entity_id
+            )
+            return SaveImageResult.failure(str(e))
 
-            # Convert to WebP
-            target_size = IMAGE_SIZES.get(entity_type, 300)
-            webp_data = await self._convert_to_webp(image_data, target_size)
-            if not webp_data:
-                return SaveImageResult.failure("Failed to convert image to WebP")
+        return result
 
-            # Save to cache
-            local_path = await self._save_to_cache(webp_data, entity_type, entity_id)
+    async def store_entity_image(
+        self,
+        source_url: str,
+        entity_type: EntityType,
+        entity_id: str,
+    ) -> SaveImageResult:
+        """download_and_cache() without the DB part: download, convert, store.
 
-            # Update entity in DB
-            await self._update_entity_image_path(
-                entity_type, entity_id, source_url, local_path
-            )
+        Hey future me - for concurrent callers (ImageRepairEngine workers) that must
+        not share a session. They apply the returned path themselves, from one task,
+        via update_entity_image_path().
 
-            # Build result
-            image_info = ImageInfo(
-                entity_type=entity_type,
-                entity_id=entity_id,
-                display_url=f"{self.local_serve_prefix}/{local_path}",
-                source_url=source_url,
-                local_path=local_path,
-                is_cached=True,
-                provider=self._guess_provider(source_url),
-            )
+        Args:
+            source_url: CDN URL to download from
+            entity_type: Type of entity (artist, album, etc.)
+            entity_id: Entity's internal ID (ref key in the content store)
 
-            return SaveImageResult.success_downloaded(image_info)
+        Returns:
+            SaveImageResult with the stored path (entity row NOT updated)
+        """
+        if not source_url:
+            return SaveImageResult.failure("No source URL provided")
 
-        except Exception as e:
-            logger.exception(
-                "Error in download_and_cache for %s/%s", entity_type, entity_id
+        try:
+            stored = await self._store_image(
+                source_url, entity_type, f"{entity_type}:{entity_id}"
             )
+        except ImageStoreError as e:
+            return SaveImageResult.failure(str(e))
+        except Exception as e:
+            logger.exception("Error storing image for %s/%s", entity_type, entity_id)
             return SaveImageResult.failure(str(e))
 
+        local_path = stored.relative_path
+        image_info = ImageInfo(
+            entity_type=entity_type,
+            entity_id=entity_id,
+            display_url=f"{self.local_serve_prefix}/{local_path}",
+            source_url=source_url,
+            local_path=local_path,
+            is_cached=True,
+            provider=self._guess_provider(source_url),
+        )
+        return SaveImageResult.success_downloaded(image_info)
+
     async def _download_image(self, url: str) -> bytes | None:
         """Download image from URL using HttpClientPool.
 
@@ -649,34 +692,34 @@ class ImageService:
             logger.warning("Error converting image to WebP: %s", e)
             return None
 
-    async def _save_to_cache(
-        self,
-        image_data: bytes,
-        entity_type: EntityType,
-        entity_id: str,
-    ) -> str:
-        """Save image data to local cache.
-
-        Returns relative path for DB storage.
-        """
-        import asyncio
-
-        # Build path: {entity_type}s/{id[:2]}/{id}.webp
-        # Sharding by first 2 chars prevents too many files in one dir
-        subdir = entity_id[:2] if len(entity_id) >= 2 else "00"
-        relative_path = f"{entity_type}s/{subdir}/{entity_id}.webp"
+    async def _store_image(
+        self, source_url: str, entity_type: str, ref_key: str
+    ) -> StoredImage:
+        """Download + convert + store one entity's image in the content store.
 
-        full_path = Path(self.cache_base_path) / relative_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
+        Hey future me - identical images (same URL, same downloaded bytes or same
+        WebP bytes) are downloaded/converted/written once and SHARED. The returned
+        path may be used by other entities too - never unlink it directly!
 
-        await asyncio.to_thread(full_path.write_bytes, image_data)
-
-        logger.debug(
-            "Saved image to cache: %s (%d bytes)", relative_path, len(image_data)
+        Raises:
+            ImageStoreError: Download, conversion or write failed
+        """
+        target_size = IMAGE_SIZES.get(entity_type, 300)  # type: ignore[call-overload]
+
+        async def convert(raw: bytes) -> bytes | None:
+            return await self._convert_to_webp(raw, target_size)
+
+        return await get_image_store(self.cache_base_path).store(
+            ref_key=ref_key,
+            category=f"{entity_type}s",
+            target_size=target_size,
+            source_url=source_url,
+            download=lambda: self._download_image(source_url),
+            convert=convert,
+            session=self.session,
         )
-        return relative_path
 
-    async def _update_entity_image_path(
+    async def update_entity_image_path(
         self,
         entity_type: EntityType,
         entity_id: str,
@@ -749,67 +792,39 @@ class ImageService:
 
     async def optimize_cache(
         self,
-        max_age_days: int = 90,
+        orphan_grace_hours: int = 24,
         dry_run: bool = True,
     ) -> dict[str, int]:
-        """Clean up old/orphaned cached images.
+        """Clean up orphaned cached images.
 
         Future me note:
         Call this periodically (e.g., weekly cron) to free disk space.
 
-        Removes images that:
-        - Haven't been modified in max_age_days
-        - Are orphaned (file exists but no entity references it)
+        Hey future me - no more rglob + mtime! The old version deleted every file
+        older than max_age_days, INCLUDING images still in use. Now it's the content
+        store's indexed query: ref_counts are recounted from the entity path columns,
+        then blobs unreferenced for orphan_grace_hours are deleted (+ their variants).
+        The grace period protects images whose entity isn't saved yet.
 
         Args:
-            max_age_days: Delete images older than this
+            orphan_grace_hours: Only delete images unreferenced at least this long
             dry_run: If True, just report what would be deleted
 
         Returns:
             Stats dict: {deleted_count, freed_bytes, orphaned_count}
         """
-        from datetime import timedelta
-
-        cache_path = Path(self.cache_base_path)
-        if not cache_path.exists():
-            return {"deleted_count": 0, "freed_bytes": 0, "orphaned_count": 0}
-
-        cutoff = datetime.now(UTC) - timedelta(days=max_age_days)
-
-        deleted_count = 0
-        freed_bytes = 0
-        orphaned_count = 0
-
-        # Walk cache directory
-        for file_path in cache_path.rglob("*.webp"):
-            try:
-                stat = file_path.stat()
-                mtime = datetime.fromtimestamp(stat.st_mtime, tz=UTC)
-
-                if mtime < cutoff:
-                    size = stat.st_size
-
-                    if not dry_run:
-                        file_path.unlink()
-                        logger.info("Deleted old image: %s (%d bytes)", file_path, size)
-
-                    deleted_count += 1
-                    freed_bytes += size
-
-            except Exception as e:
-                logger.warning("Error checking cache file %s: %s", file_path, e)
-
-        result = {
-            "deleted_count": deleted_count,
-            "freed_bytes": freed_bytes,
-            "orphaned_count": orphaned_count,  # TODO: Check DB for orphans
-        }
+        result = await get_image_store(self.cache_base_path).collect_garbage(
+            grace_seconds=orphan_grace_hours * 3600,
+            dry_run=dry_run,
+            session=self.session,
+        )
 
         logger.info(
-            "Cache optimization %s: %d files, %d bytes",
+            "Cache optimization %s: %d files, %d bytes (%d orphans total)",
             "would delete" if dry_run else "deleted",
-            deleted_count,
-            freed_bytes,
+            result["deleted_count"],
+            result["freed_bytes"],
+            result["orphaned_count"],
         )
 
         return result
@@ -989,6 +1004,14 @@ class ImageService:
         if not relative_path:
             return False
 
+        # Hey future me - content store files may be SHARED by other entities!
+        # They're not unlinked here: once no entity points at them anymore,
+        # optimize_cache() deletes them (after the grace period).
+        store = get_image_store(self.cache_base_path)
+        if await store.is_managed(relative_path, session=self.session):
+            logger.debug("Not deleting shared image %s (refcounted)", relative_path)
+            return False
+
         try:
             full_path = Path(self.cache_base_path) / relative_path
             if full_path.exists():
@@ -1018,10 +1041,11 @@ class ImageService:
     # - Passing the path to the repository's upsert method
     # - The repository handles mapping provider_id → internal record
     #
-    # Path structure: {entity_type}s/{provider}/{provider_id}.webp
-    # Example: artists/spotify/1dfeR4HaWDbWqFHLkxsg1d.webp
-    #          artists/deezer/123456.webp
-    #          albums/musicbrainz/abc-def-123.webp
+    # Path structure (content store, Jan 2026): blobs/{hash[:2]}/{hash}.webp
+    # Example: blobs/3f/3f9a0c...e1.webp - shared by every entity with that image!
+    # The provider/ID only lives on as the ref key "{entity_type}:{provider}:{id}".
+    # Old files ({entity_type}s/{provider}/{provider_id}.webp) stay valid, they're
+    # registered in place by ImageContentStore.adopt_existing_images().
     #
     # This keeps the existing flow intact while using ImageService internals.
 
@@ -1041,7 +1065,7 @@ class ImageService:
             provider: Provider name ("spotify", "deezer", "tidal", "musicbrainz")
 
         Returns:
-            Relative path like "artists/spotify/abc123.webp" or None
+            Relative path like "blobs/3f/3f9a0c....webp" or None
         """
         return await self._download_for_provider(
             provider_id=provider_id,
@@ -1101,20 +1125,14 @@ class ImageService:
 
         Future me note:
         This is the actual implementation behind the provider-ID methods.
-        Uses a provider subdirectory to keep images organized by source.
-
-        Path structure: {entity_type}s/{provider}/{provider_id}.webp
-
-        Examples:
-            - artists/spotify/1dfeR4HaWDbWqFHLkxsg1d.webp
-            - albums/deezer/123456.webp
-            - artists/musicbrainz/abc-def-ghi.webp
+        Stores via the content store: identical images share one blob
+        (blobs/{hash[:2]}/{hash}.webp), the provider ID is the ref key.
 
         Args:
             provider_id: External ID (Spotify ID, Deezer ID, etc.)
             image_url: URL to fetch
             entity_type: "artist", "album", or "playlist"
-            provider: Provider name for subdirectory
+            provider: Provider name (part of the ref key)
 
         Returns:
             Relative path or None if failed
@@ -1126,34 +1144,10 @@ class ImageService:
         safe_provider = provider.lower().replace(" ", "_")
 
         try:
-            # Fetch image data (BUG FIX: was _fetch_image, now _download_image)
-            image_data = await self._download_image(image_url)
-            if not image_data:
-                return None
-
-            # Convert to WebP (BUG FIX: added await, added target_size)
-            target_size = IMAGE_SIZES.get(entity_type, 300)  # type: ignore[arg-type]
-            webp_data = await self._convert_to_webp(image_data, target_size)
-            if not webp_data:
-                logger.warning(
-                    "WebP conversion failed for %s %s (%s)",
-                    entity_type,
-                    provider_id,
-                    safe_provider,
-                )
-                return None
-
-            # Build path: {entity_type}s/{provider}/{provider_id}.webp
-            # Example: artists/spotify/1dfeR4HaWDbWqFHLkxsg1d.webp
-            #          albums/deezer/123456.webp
-            relative_path = f"{entity_type}s/{safe_provider}/{provider_id}.webp"
-            full_path = Path(self.cache_base_path) / relative_path
-
-            # Ensure directory exists
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write file
-            full_path.write_bytes(webp_data)
+            stored = await self._store_image(
+                image_url, entity_type, f"{entity_type}:{safe_provider}:{provider_id}"
+            )
+            relative_path = stored.relative_path
             logger.debug(
                 "Downloaded %s image for %s:%s → %s",
                 entity_type,
@@ -1163,6 +1157,15 @@ class ImageService:
             )
             return relative_path
 
+        except ImageStoreError as e:
+            logger.warning(
+                "Could not store %s image for %s:%s: %s",
+                entity_type,
+                safe_provider,
+                provider_id,
+                e,
+            )
+            return None
         except Exception as e:
             logger.error(
                 "Error downloading %s image for %s:%s: %s",
@@ -1253,7 +1256,7 @@ class ImageService:
             provider_id: External ID
             image_url: URL to fetch
             entity_type: "artist", "album", or "playlist"
-            provider: Provider name for subdirectory
+            provider: Provider name (part of the ref key)
         """
         if not image_url:
             return ImageDownloadResult.error(
@@ -1273,39 +1276,24 @@ class ImageService:
         safe_provider = provider.lower().replace(" ", "_")
 
         try:
-            # Fetch image data with error tracking (BUG FIX: was _fetch_image)
-            image_data = await self._download_image(image_url)
-            if not image_data:
-                return ImageDownloadResult.error(
-                    ImageDownloadErrorCode.NETWORK_OTHER,
-                    "Failed to fetch image data",
+            try:
+                stored = await self._store_image(
                     image_url,
+                    entity_type,
+                    f"{entity_type}:{safe_provider}:{provider_id}",
                 )
-
-            # Convert to WebP (BUG FIX: added await, added target_size)
-            target_size = IMAGE_SIZES.get(entity_type, 300)  # type: ignore[arg-type]
-            webp_data = await self._convert_to_webp(image_data, target_size)
-            if not webp_data:
+            except ImageStoreError as e:
+                error_codes = {
+                    "download": ImageDownloadErrorCode.NETWORK_OTHER,
+                    "convert": ImageDownloadErrorCode.WEBP_CONVERSION_ERROR,
+                    "write": ImageDownloadErrorCode.DISK_WRITE_ERROR,
+                }
                 return ImageDownloadResult.error(
-                    ImageDownloadErrorCode.WEBP_CONVERSION_ERROR,
-                    "WebP conversion failed",
-                    image_url,
-                )
-
-            # Build path: {entity_type}s/{provider}/{provider_id}.webp
-            relative_path = f"{entity_type}s/{safe_provider}/{provider_id}.webp"
-            full_path = Path(self.cache_base_path) / relative_path
-
-            # Ensure directory exists and write
-            try:
-                full_path.parent.mkdir(parents=True, exist_ok=True)
-                full_path.write_bytes(webp_data)
-            except OSError as e:
-                return ImageDownloadResult.error(
-                    ImageDownloadErrorCode.DISK_WRITE_ERROR,
-                    f"Failed to write file: {e}",
+                    error_codes.get(e.stage, ImageDownloadErrorCode.UNKNOWN),
+                    str(e),
                     image_url,
                 )
+            relative_path = stored.relative_path
 
             logger.debug(
                 "Downloaded %s image for %s:%s → %s",
@@ -1334,79 +1322,70 @@ class ImageService:
     # STATISTICS METHODS (for settings UI)
     # =========================================================================
 
-    def get_disk_usage(self) -> dict[str, int]:
+    async def get_disk_usage(self) -> dict[str, int]:
         """Get disk usage statistics for cached images.
 
         Future me note:
         This is for the Settings UI to show storage used per category.
+        Hey future me - no directory walk anymore, image_cache_stats is kept up to
+        date by the content store. Only without DB bookkeeping (tests/CLI) we walk.
 
         Returns:
             Dict with 'artists', 'albums', 'playlists', 'total' byte counts.
         """
-        usage: dict[str, int] = {}
-        total = 0
-
-        cache_path = Path(self.cache_base_path)
-        logger.info(
-            "📊 Image Stats - Cache path: %s (exists: %s)",
-            cache_path,
-            cache_path.exists(),
-        )
-
-        if not cache_path.exists():
-            logger.warning("⚠️ Image cache directory does not exist: %s", cache_path)
-            return {"artists": 0, "albums": 0, "playlists": 0, "total": 0}
-
-        for category in ("artists", "albums", "playlists"):
-            category_path = cache_path / category
-            if category_path.exists():
-                cat_bytes = sum(
-                    f.stat().st_size for f in category_path.rglob("*") if f.is_file()
-                )
-                usage[category] = cat_bytes
-                total += cat_bytes
-                logger.debug(
-                    "📊 %s: %d bytes from %d files",
-                    category,
-                    cat_bytes,
-                    sum(1 for f in category_path.rglob("*") if f.is_file()),
-                )
-            else:
-                usage[category] = 0
-                logger.debug("📊 %s directory does not exist", category)
-
-        usage["total"] = total
-        logger.info(
-            "📊 Image Stats Total: %d bytes across %d files",
-            total,
-            sum(1 for f in cache_path.rglob("*") if f.is_file()),
-        )
+        stats = await self._get_store_stats()
+        if stats is None:
+            return await asyncio.to_thread(self._scan_cache, "bytes")
+        usage = {
+            category: stats.get(category, (0, 0))[1] for category in STAT_CATEGORIES
+        }
+        usage["total"] = sum(total for _count, total in stats.values())
         return usage
 
-    def get_image_count(self) -> dict[str, int]:
+    async def get_image_count(self) -> dict[str, int]:
         """Get count of cached images per category.
 
         Future me note:
-        For Settings UI alongside disk usage.
+        For Settings UI alongside disk usage. Same source as get_disk_usage().
 
         Returns:
             Dict with 'artists', 'albums', 'playlists', 'total' counts.
         """
-        counts: dict[str, int] = {}
-        total = 0
+        stats = await self._get_store_stats()
+        if stats is None:
+            return await asyncio.to_thread(self._scan_cache, "count")
+        counts = {
+            category: stats.get(category, (0, 0))[0] for category in STAT_CATEGORIES
+        }
+        counts["total"] = sum(count for count, _total in stats.values())
+        return counts
 
-        cache_path = Path(self.cache_base_path)
-        if not cache_path.exists():
-            return {"artists": 0, "albums": 0, "playlists": 0, "total": 0}
+    async def _get_store_stats(self) -> dict[str, tuple[int, int]] | None:
+        """Content store counters, None if the store has no DB bookkeeping."""
+        store = get_image_store(self.cache_base_path)
+        if not store.has_bookkeeping and self.session is None:
+            return None
+        return await store.get_stats(session=self.session)
 
-        for category in ("artists", "albums", "playlists"):
-            category_path = cache_path / category
-            if category_path.exists():
-                cat_count = sum(1 for f in category_path.rglob("*") if f.is_file())
-                counts[category] = cat_count
-                total += cat_count
-            else:
-                counts[category] = 0
+    def _scan_cache(self, measure: str) -> dict[str, int]:
+        """Fallback without bookkeeping: walk the category dirs (slow!).
 
-        counts["total"] = total
-        return counts
+        Blobs have no category without the DB - they only show up in the total.
+        """
+        result: dict[str, int] = {}
+        cache_path = Path(self.cache_base_path)
+        for category in (*STAT_CATEGORIES, BLOB_DIR):
+            category_path = cache_path / category
+            files = (
+                [f for f in category_path.rglob("*") if f.is_file()]
+                if category_path.exists()
+                else []
+            )
+            result[category] = (
+                sum(f.stat().st_size for f in files)
+                if measure == "bytes"
+                else len(files)
+            )
+        result["total"] = sum(result.values())
+        del result[BLOB_DIR]
+        return result
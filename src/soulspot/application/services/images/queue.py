@@ -21,6 +21,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import OrderedDict
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import IntEnum
@@ -31,6 +33,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# How many "just shown without image" entities we remember (see note_images_viewed)
+RECENTLY_VIEWED_ENTRIES = 2000
+
 
 class ImagePriority(IntEnum):
     """Download priority levels.
@@ -359,3 +364,63 @@ class ImageDownloadQueue:
 
         logger.info("Cleared %d jobs from image queue", cleared)
         return cleared
+
+
+# =============================================================================
+# RECENTLY VIEWED ENTITIES (repair priority)
+# =============================================================================
+# Hey future me - the UI notes which entities it just rendered WITHOUT a local
+# image (library grids, detail pages). ImageRepairEngine queues those as HIGH, so
+# the covers the user is looking at right now come first - not whatever is next
+# by ID in a library of 5000 albums. Keys use the queue's "{type}:{id}" format.
+# Process-local on purpose: after a restart "recent" starts empty, that's correct.
+_recently_viewed: OrderedDict[str, None] = OrderedDict()
+
+
+def note_images_viewed(entity_type: str, entity_ids: Iterable[str]) -> None:
+    """Remember entities the UI just showed with a placeholder instead of an image.
+
+    Args:
+        entity_type: "artist", "album" or "playlist"
+        entity_ids: Internal UUIDs (most important last = most recent)
+    """
+    for entity_id in entity_ids:
+        key = f"{entity_type}:{entity_id}"
+        _recently_viewed[key] = None
+        _recently_viewed.move_to_end(key)
+    while len(_recently_viewed) > RECENTLY_VIEWED_ENTRIES:
+        _recently_viewed.popitem(last=False)
+
+
+def forget_image_viewed(entity_type: str, entity_id: str) -> None:
+    """Drop an entity from the recently-viewed set (its image is there now)."""
+    _recently_viewed.pop(f"{entity_type}:{entity_id}", None)
+
+
+def recently_viewed_ids(entity_type: str, limit: int = 200) -> list[str]:
+    """IDs of recently viewed entities of one type, most recent first.
+
+    Args:
+        entity_type: "artist", "album" or "playlist"
+        limit: Maximum number of IDs
+
+    Returns:
+        Internal UUIDs
+    """
+    prefix = f"{entity_type}:"
+    ids: list[str] = []
+    for key in reversed(_recently_viewed):
+        if key.startswith(prefix):
+            ids.append(key[len(prefix) :])
+            if len(ids) >= limit:
+                break
+    return ids
+
+
+def priority_for_entity(
+    entity_type: str, entity_id: str, default: int = ImagePriority.LOW
+) -> int:
+    """Queue priority of an entity: HIGH if recently viewed, else default."""
+    if f"{entity_type}:{entity_id}" in _recently_viewed:
+        return ImagePriority.HIGH
+    return default
@@ -14,12 +14,19 @@
 # 2. Downloading via ImageService.download_*_image_with_result()
 # 3. Handling FAILED markers (24h retry)
 # 4. API fallback when CDN URL is missing
+#
+# CONCURRENT (Jan 2026): Both phases run on ImageRepairEngine (repair_engine.py) -
+# bounded worker pool paced by the shared provider token buckets, recently viewed
+# entities first, progress committed every few results + keyset cursor per phase.
+# No more fixed sleeps between items.
 """Batch repair operations for missing images."""
 
 from __future__ import annotations
 
-import asyncio
+import dataclasses
 import logging
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -31,30 +38,61 @@ from soulspot.application.services.images.failed_markers import (
     make_failed_marker,
     parse_failed_marker,
 )
+from soulspot.application.services.images.queue import (
+    ImageDownloadJob,
+    ImagePriority,
+    forget_image_viewed,
+    recently_viewed_ids,
+)
+from soulspot.application.services.images.repair_engine import (
+    DEFAULT_REPAIR_CONCURRENCY,
+    ImageRepairEngine,
+    RepairCheckpoint,
+    RepairRateLimited,
+    is_rate_limit_error,
+)
 from soulspot.infrastructure.persistence.models import (
     AlbumModel,
     ArtistModel,
 )
 
 if TYPE_CHECKING:
+    from sqlalchemy import Select
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from soulspot.application.services.images.image_provider_registry import (
         ImageProviderRegistry,
     )
-    from soulspot.application.services.images.image_service import ImageService
+    from soulspot.application.services.images.image_service import (
+        ImageDownloadResult,
+        ImageService,
+    )
     from soulspot.infrastructure.plugins.spotify_plugin import SpotifyPlugin
 
 logger = logging.getLogger(__name__)
 
 
-# Rate limit between API calls (50ms = 20 requests/second)
-API_RATE_LIMIT_SECONDS = 0.05
+def _window(
+    stmt: Select[Any],
+    model: type[ArtistModel] | type[AlbumModel],
+    limit: int,
+    after_id: str | None,
+    only_ids: Sequence[str] | None,
+) -> Select[Any]:
+    """Keyset page (ORDER BY id, id > after_id) or an explicit ID set."""
+    if only_ids is not None:
+        stmt = stmt.where(model.id.in_(list(only_ids)))
+    elif after_id:
+        stmt = stmt.where(model.id > after_id)
+    return stmt.order_by(model.id).limit(limit)
 
 
 async def get_artists_missing_images(
     session: AsyncSession,
     limit: int = 50,
+    *,
+    after_id: str | None = None,
+    only_ids: Sequence[str] | None = None,
 ) -> list[ArtistModel]:
     """Get artists with CDN URL but missing local file.
 
@@ -68,6 +106,9 @@ async def get_artists_missing_images(
     - image_path = '' → include (needs download)
     - image_path LIKE 'FAILED%' → exclude (retry later)
     - image_path has valid path → exclude (already downloaded)
+
+    after_id pages through the table (ORDER BY id, see RepairCheckpoint), only_ids
+    restricts to given entities (recently viewed ones) - same for all helpers here.
     """
     stmt = (
         select(ArtistModel)
@@ -87,8 +128,8 @@ async def get_artists_missing_images(
                 ~ArtistModel.image_path.like("FAILED%"),
             ),
         )
-        .limit(limit)
     )
+    stmt = _window(stmt, ArtistModel, limit, after_id, only_ids)
     result = await session.execute(stmt)
     return list(result.scalars().all())
 
@@ -96,6 +137,9 @@ async def get_artists_missing_images(
 async def get_artists_with_provider_id_but_no_image(
     session: AsyncSession,
     limit: int = 50,
+    *,
+    after_id: str | None = None,
+    only_ids: Sequence[str] | None = None,
 ) -> list[ArtistModel]:
     """Get artists with provider ID but no image_url.
 
@@ -125,8 +169,8 @@ async def get_artists_with_provider_id_but_no_image(
                 ~ArtistModel.image_path.like("FAILED%"),
             ),
         )
-        .limit(limit)
     )
+    stmt = _window(stmt, ArtistModel, limit, after_id, only_ids)
     result = await session.execute(stmt)
     return list(result.scalars().all())
 
@@ -137,6 +181,9 @@ async def get_artists_with_provider_id_but_no_image(
 async def get_albums_with_provider_id_but_no_cover_url(
     session: AsyncSession,
     limit: int = 50,
+    *,
+    after_id: str | None = None,
+    only_ids: Sequence[str] | None = None,
 ) -> list[AlbumModel]:
     """Get albums with provider ID but no cover_url.
 
@@ -176,18 +223,114 @@ async def get_albums_with_provider_id_but_no_cover_url(
                 ~AlbumModel.cover_path.like("FAILED%"),
             ),
         )
-        .limit(limit)
     )
+    stmt = _window(stmt, AlbumModel, limit, after_id, only_ids)
     result = await session.execute(stmt)
     return list(result.scalars().all())
 
 
+@dataclass(slots=True)
+class _RepairTarget:
+    """Snapshot of what a worker needs from one entity.
+
+    Hey future me - workers read THIS, never the ORM model: the model is only
+    touched by the engine's coordinator (apply), so the caller's session is never
+    used from two tasks at once.
+    """
+
+    model: Any  # ArtistModel | AlbumModel
+    name: str
+    provider_id: str
+    image_url: str | None  # None = look it up first
+    provider_ids: dict[str, str] = field(default_factory=dict)
+    artist_name: str | None = None
+
+
+@dataclass(slots=True)
+class _RepairOutcome:
+    """What a worker did: looked up (maybe), downloaded (maybe)."""
+
+    looked_up: bool = False
+    image_url: str | None = None
+    provider: str = "unknown"
+    result: ImageDownloadResult | None = None  # None = lookup found no image
+
+
+async def _plan_phase(
+    session: AsyncSession,
+    fetch: Callable[..., Awaitable[Sequence[Any]]],
+    entity_type: str,
+    phase: str,
+    checkpoint: RepairCheckpoint,
+    limit: int,
+) -> list[tuple[Any, int]]:
+    """Candidates of one repair phase with their queue priority.
+
+    Recently viewed entities (note_images_viewed) come first as HIGH, the rest of
+    the batch is the next keyset page after the phase's checkpoint cursor (LOW).
+
+    Returns:
+        Up to limit (entity, priority) tuples
+    """
+    viewed = recently_viewed_ids(entity_type, limit=limit)
+    prioritized = list(await fetch(session, limit=limit, only_ids=viewed)) if viewed else []
+    page = await fetch(session, limit=limit, after_id=await checkpoint.cursor(phase))
+
+    planned: list[tuple[Any, int]] = [(e, ImagePriority.HIGH) for e in prioritized]
+    seen = {e.id for e in prioritized}
+    taken: list[str] = []
+    for entity in page:
+        if len(planned) >= limit:
+            break
+        taken.append(entity.id)
+        if entity.id not in seen:
+            planned.append((entity, ImagePriority.LOW))
+
+    checkpoint.advance(
+        phase, taken, exhausted=len(page) < limit and len(taken) == len(page)
+    )
+    return planned
+
+
+def _lookup_provider(registry: ImageProviderRegistry | None) -> str:
+    """Provider an API lookup will (mostly) hit - picks the engine lane."""
+    if registry is not None:
+        providers = registry.get_registered_providers()
+        if providers:
+            return str(min(providers, key=lambda p: p[1])[0])
+    return "spotify"
+
+
+async def _rate_aware(lookup: Awaitable[Any]) -> Any:
+    """Await a provider lookup; a 429 becomes RepairRateLimited (engine retries)."""
+    try:
+        return await lookup
+    except Exception as e:
+        if is_rate_limit_error(str(e)):
+            raise RepairRateLimited(str(e)) from e
+        raise
+
+
+def _checkpointer(
+    session: AsyncSession, checkpoint: RepairCheckpoint
+) -> Callable[[bool], Awaitable[None]]:
+    """Engine checkpoint: commit the repaired entities (+ cursors at the end)."""
+
+    async def save(final: bool) -> None:
+        if final:
+            await checkpoint.save()
+        await session.commit()
+
+    return save
+
+
 async def repair_artist_images(
     session: AsyncSession,
     image_service: ImageService,
     image_provider_registry: ImageProviderRegistry | None = None,
     spotify_plugin: SpotifyPlugin | None = None,
     limit: int = 100,
+    concurrency: int = DEFAULT_REPAIR_CONCURRENCY,
 ) -> dict[str, Any]:
     """Download images for artists that have CDN URL but missing local file.
 
@@ -208,7 +351,8 @@ async def repair_artist_images(
         image_service: ImageService for downloads
         image_provider_registry: Optional multi-provider registry for API fallback
         spotify_plugin: Optional Spotify plugin for API fallback
-        limit: Maximum number of artists to process
+        limit: Maximum number of artists to process (per phase)
+        concurrency: Downloads/lookups in flight (paced by the provider buckets)
 
     Returns:
         Stats dict with repaired count, processed count, and errors
@@ -352,172 +496,179 @@ async def repair_artist_images(
         "artists_missing_url_with_ids": artists_missing_url_with_ids,
     }
 
-    # Phase 1: Download from existing CDN URLs
-    artists = await get_artists_missing_images(session, limit=limit)
-
-    if not artists:
+    # Phase 1 (CDN URL known → download) + Phase 2 (API lookup first), one pool
+    checkpoint = RepairCheckpoint(session)
+    planned = await _plan_phase(
+        session,
+        get_artists_missing_images,
+        "artist",
+        "artist:download",
+        checkpoint,
+        limit,
+    )
+    if not planned:
         logger.info("No artists need image download (missing_url=%d)", artists_missing_url)
     else:
-        logger.info("Downloading images for %d artists", len(artists))
-
-    for idx, artist in enumerate(artists, 1):
-        if not artist.image_url:
-            stats["no_image_url"] += 1
-            continue
-
-        stats["processed"] += 1
+        logger.info("Downloading images for %d artists", len(planned))
+
+    lookup_planned: list[tuple[ArtistModel, int]] = []
+    if api_fallback_enabled:
+        lookup_planned = await _plan_phase(
+            session,
+            get_artists_with_provider_id_but_no_image,
+            "artist",
+            "artist:lookup",
+            checkpoint,
+            limit,
+        )
+        stats["artists_without_url_found"] = len(lookup_planned)
+        if lookup_planned:
+            logger.info(
+                "📥 PHASE 2: API fallback for %d artists without image_url",
+                len(lookup_planned),
+            )
+    else:
+        stats["artists_without_url_found"] = min(artists_missing_url_with_ids, limit)
+        logger.info(
+            "Phase 2: No artists eligible for API fallback (missing_url_with_ids=%d)",
+            artists_missing_url_with_ids,
+        )
 
-        try:
-            spotify_id = (
-                artist.spotify_uri.split(":")[-1] if artist.spotify_uri else None
+    lookup_provider = _lookup_provider(image_provider_registry)
+    targets: dict[str, _RepairTarget] = {}
+    jobs: list[ImageDownloadJob] = []
+    for artist, priority in planned + lookup_planned:
+        target = _RepairTarget(
+            model=artist,
+            name=artist.name,
+            provider_id=artist.deezer_id or artist.spotify_id or str(artist.id),
+            image_url=artist.image_url or None,
+            provider_ids={
+                k: v
+                for k, v in (("deezer", artist.deezer_id), ("spotify", artist.spotify_id))
+                if v
+            },
+        )
+        targets[str(artist.id)] = target
+        jobs.append(
+            ImageDownloadJob.for_artist(
+                entity_id=str(artist.id),
+                provider_id=target.provider_id,
+                url=target.image_url or "",
+                provider=guess_provider_from_url(target.image_url)
+                if target.image_url
+                else lookup_provider,
+                priority=priority,
             )
-            deezer_id = artist.deezer_id
+        )
 
-            image_url = artist.image_url
-            provider = guess_provider_from_url(image_url)
+    # Hey future me - workers must NOT share the caller's session (the content
+    # store would join it from several tasks at once) → session-less copy
+    downloader = dataclasses.replace(image_service, session=None)
 
-            provider_id = deezer_id or spotify_id or str(artist.id)
-            download_result = await image_service.download_artist_image_with_result(
-                provider_id=provider_id,
-                image_url=image_url,
-                provider=provider,
-            )
+    async def lookup(target: _RepairTarget) -> tuple[str | None, str]:
+        image_url: str | None = None
+        provider = "unknown"
 
-            if download_result.success:
-                artist.image_url = image_url
-                artist.image_path = download_result.path
-                artist.updated_at = datetime.now(UTC)
-                stats["repaired"] += 1
-                logger.info("Downloaded: %s", artist.name)
-            else:
-                error_msg = download_result.error_message or "Download failed"
-                reason = classify_error(error_msg)
-                artist.image_path = make_failed_marker(reason)
-                artist.updated_at = datetime.now(UTC)
-                stats["errors"].append(
-                    {"name": artist.name, "error": error_msg, "reason": reason}
+        # Prefer registry (it already handles priority + availability + fallback)
+        if image_provider_registry is not None:
+            image_result = await _rate_aware(
+                image_provider_registry.get_artist_image(
+                    artist_name=target.name,
+                    artist_ids=target.provider_ids,
                 )
-                logger.warning("Failed: %s (%s)", artist.name, reason)
-
-        except Exception as e:
-            error_msg = str(e)
-            reason = classify_error(error_msg)
-            artist.image_path = make_failed_marker(reason)
-            artist.updated_at = datetime.now(UTC)
-            logger.error("Exception: %s - %s", artist.name, e)
-            stats["errors"].append(
-                {"name": artist.name, "error": error_msg, "reason": reason}
             )
+            if image_result is not None:
+                image_url = image_result.url
+                provider = image_result.provider
 
-    # Phase 2: API fallback for artists without image_url
-    artists_without_url = await get_artists_with_provider_id_but_no_image(
-        session, limit=limit
-    )
-    stats["artists_without_url_found"] = len(artists_without_url)
-
-    logger.info("-" * 40)
-    if artists_without_url and api_fallback_enabled:
-        logger.info(
-            "📥 PHASE 2: API fallback for %d artists without image_url",
-            len(artists_without_url),
-        )
-
-        for idx, artist in enumerate(artists_without_url, 1):
+        # Fallback: Spotify-only lookup (legacy path)
+        spotify_id = target.provider_ids.get("spotify")
+        if not image_url and spotify_plugin and spotify_id:
             try:
-                logger.debug(
-                    "  [%d/%d] 🔎 %s: Looking up image_url via providers...",
-                    idx,
-                    len(artists_without_url),
-                    artist.name,
-                )
-
-                image_url: str | None = None
-                provider = "unknown"
-
-                # Prefer registry (it already handles priority + availability + fallback)
-                if image_provider_registry is not None:
-                    artist_ids: dict[str, str] = {}
-                    if artist.deezer_id:
-                        artist_ids["deezer"] = artist.deezer_id
-                    if artist.spotify_id:
-                        artist_ids["spotify"] = artist.spotify_id
-
-                    image_result = await image_provider_registry.get_artist_image(
-                        artist_name=artist.name,
-                        artist_ids=artist_ids,
-                    )
-                    if image_result is not None:
-                        image_url = image_result.url
-                        provider = image_result.provider
-
-                # Fallback: Spotify-only lookup (legacy path)
-                if not image_url and spotify_plugin and artist.spotify_id:
-                    try:
-                        artist_dto = await spotify_plugin.get_artist(artist.spotify_id)
-                        if artist_dto and artist_dto.image and artist_dto.image.url:
-                            image_url = artist_dto.image.url
-                            provider = "spotify"
-                    except Exception as e:
-                        logger.debug(
-                            "Spotify API lookup failed for %s: %s", artist.name, e
-                        )
-
-                await asyncio.sleep(API_RATE_LIMIT_SECONDS)
-
-                if not image_url:
-                    stats["api_lookup_no_image"] = (
-                        stats.get("api_lookup_no_image", 0) + 1
-                    )
-                    continue
-
-                provider_id = artist.deezer_id or artist.spotify_id or str(artist.id)
-                download_result = await image_service.download_artist_image_with_result(
-                    provider_id=provider_id,
-                    image_url=image_url,
-                    provider=provider,
-                )
-
-                if download_result.success:
-                    artist.image_url = image_url
-                    artist.image_path = download_result.path
-                    artist.updated_at = datetime.now(UTC)
-                    stats["repaired"] += 1
-                    stats["api_lookup_success"] = stats.get("api_lookup_success", 0) + 1
-                    logger.info(
-                        "Repaired image for artist via API: %s (%s)",
-                        artist.name,
-                        provider,
-                    )
-                else:
-                    error_msg = download_result.error_message or "Download failed"
-                    reason = classify_error(error_msg)
-                    artist.image_path = make_failed_marker(reason)
-                    artist.updated_at = datetime.now(UTC)
-                    stats["errors"].append(
-                        {"name": artist.name, "error": error_msg, "reason": reason}
-                    )
-                    logger.warning(
-                        "Failed: %s (%s)",
-                        artist.name,
-                        reason,
-                    )
-
+                artist_dto = await spotify_plugin.get_artist(spotify_id)
+                if artist_dto and artist_dto.image and artist_dto.image.url:
+                    image_url = artist_dto.image.url
+                    provider = "spotify"
             except Exception as e:
-                error_msg = str(e)
-                reason = classify_error(error_msg)
-                artist.image_path = make_failed_marker(reason)
-                artist.updated_at = datetime.now(UTC)
-                stats["errors"].append(
-                    {"name": artist.name, "error": error_msg, "reason": reason}
-                )
-                logger.error(
-                    "Exception: %s - %s", artist.name, e
+                if is_rate_limit_error(str(e)):
+                    raise RepairRateLimited(str(e)) from e
+                logger.debug("Spotify API lookup failed for %s: %s", target.name, e)
+
+        return image_url, provider
+
+    async def handle(job: ImageDownloadJob) -> _RepairOutcome:
+        target = targets[job.entity_id]
+        image_url, provider = target.image_url, job.provider
+        if image_url is None:
+            image_url, provider = await lookup(target)
+            if not image_url:
+                return _RepairOutcome(looked_up=True)
+
+        download_result = await downloader.download_artist_image_with_result(
+            provider_id=target.provider_id,
+            image_url=image_url,
+            provider=provider,
+        )
+        if not download_result.success and is_rate_limit_error(
+            download_result.error_message
+        ):
+            raise RepairRateLimited(download_result.error_message or "rate limited")
+        return _RepairOutcome(
+            looked_up=target.image_url is None,
+            image_url=image_url,
+            provider=provider,
+            result=download_result,
+        )
+
+    async def apply(
+        job: ImageDownloadJob, outcome: _RepairOutcome | None, error: Exception | None
+    ) -> None:
+        target = targets[job.entity_id]
+        artist = target.model
+        if target.image_url is not None:
+            stats["processed"] += 1
+
+        if outcome is not None and outcome.result is None:
+            stats["api_lookup_no_image"] = stats.get("api_lookup_no_image", 0) + 1
+            return
+
+        if outcome is not None and outcome.result is not None and outcome.result.success:
+            artist.image_url = outcome.image_url
+            artist.image_path = outcome.result.path
+            artist.updated_at = datetime.now(UTC)
+            stats["repaired"] += 1
+            forget_image_viewed("artist", job.entity_id)
+            if outcome.looked_up:
+                stats["api_lookup_success"] = stats.get("api_lookup_success", 0) + 1
+                logger.info(
+                    "Repaired image for artist via API: %s (%s)",
+                    target.name,
+                    outcome.provider,
                 )
-    else:
-        logger.info(
-            "Phase 2: No artists eligible for API fallback (missing_url_with_ids=%d)",
-            artists_missing_url_with_ids,
+            else:
+                logger.info("Downloaded: %s", target.name)
+            return
+
+        if error is not None:
+            error_msg = str(error)
+            logger.error("Exception: %s - %s", target.name, error)
+        else:
+            error_msg = (
+                outcome.result.error_message if outcome and outcome.result else None
+            ) or "Download failed"
+        reason = classify_error(error_msg)
+        artist.image_path = make_failed_marker(reason)
+        artist.updated_at = datetime.now(UTC)
+        stats["errors"].append(
+            {"name": target.name, "error": error_msg, "reason": reason}
         )
+        if error is None:
+            logger.warning("Failed: %s (%s)", target.name, reason)
+
+    stats["engine"] = await ImageRepairEngine[_RepairOutcome](
+        concurrency=concurrency
+    ).run(jobs, handle, apply, checkpoint=_checkpointer(session, checkpoint))
 
     # Calculate remaining (keep the semantics explicit to avoid confusing logs)
     remaining_download_result = await session.execute(total_missing_query)
@@ -546,6 +697,9 @@ async def repair_artist_images(
 async def get_albums_missing_covers(
     session: AsyncSession,
     limit: int = 50,
+    *,
+    after_id: str | None = None,
+    only_ids: Sequence[str] | None = None,
 ) -> list[AlbumModel]:
     """Get albums with CDN URL but missing local cover file.
 
@@ -570,8 +724,8 @@ async def get_albums_missing_covers(
                 ~AlbumModel.cover_path.like("FAILED%"),
             ),
         )
-        .limit(limit)
     )
+    stmt = _window(stmt, AlbumModel, limit, after_id, only_ids)
     result = await session.execute(stmt)
     return list(result.scalars().all())
 
@@ -581,6 +735,7 @@ async def repair_album_images(
     image_service: ImageService,
     image_provider_registry: ImageProviderRegistry | None = None,
     limit: int = 100,
+    concurrency: int = DEFAULT_REPAIR_CONCURRENCY,
 ) -> dict[str, Any]:
     """Download covers for albums that have CDN URL but missing local file.
 
@@ -588,7 +743,8 @@ async def repair_album_images(
         session: SQLAlchemy async session
         image_service: ImageService for downloads
         image_provider_registry: Optional multi-provider registry for API fallback
-        limit: Maximum number of albums to process (default 100)
+        limit: Maximum number of albums to process per phase (default 100)
+        concurrency: Downloads/lookups in flight (paced by the provider buckets)
 
     Returns:
         Stats dict with repaired count, processed count, and errors
@@ -721,173 +877,160 @@ async def repair_album_images(
         "albums_missing_url_with_ids": albums_missing_url_with_ids,
     }
 
-    albums = await get_albums_missing_covers(session, limit=limit)
-
-    if not albums:
+    checkpoint = RepairCheckpoint(session)
+    planned = await _plan_phase(
+        session,
+        get_albums_missing_covers,
+        "album",
+        "album:download",
+        checkpoint,
+        limit,
+    )
+    if not planned:
         logger.info("No albums need cover download (missing_url=%d)", albums_missing_url_total)
     else:
-        logger.info("Downloading covers for %d albums", len(albums))
+        logger.info("Downloading covers for %d albums", len(planned))
 
     # Phase 2: API fallback for albums without cover_url (only safe when IDs exist)
-    albums_without_url: list[AlbumModel] = []
+    lookup_planned: list[tuple[AlbumModel, int]] = []
     if image_provider_registry is not None:
-        albums_without_url = await get_albums_with_provider_id_but_no_cover_url(
-            session, limit=limit
+        lookup_planned = await _plan_phase(
+            session,
+            get_albums_with_provider_id_but_no_cover_url,
+            "album",
+            "album:lookup",
+            checkpoint,
+            limit,
         )
-        stats["albums_without_url_found"] = len(albums_without_url)
-
-        if albums_without_url:
+        stats["albums_without_url_found"] = len(lookup_planned)
+        if lookup_planned:
             logger.info(
                 "Phase 2: API fallback for %d albums without cover_url",
-                len(albums_without_url),
+                len(lookup_planned),
             )
 
-            for idx, album in enumerate(albums_without_url, 1):
-                try:
-                    album_ids: dict[str, str] = {}
-                    if album.deezer_id:
-                        album_ids["deezer"] = album.deezer_id
-                    if album.spotify_id:
-                        album_ids["spotify"] = album.spotify_id
-                    if album.musicbrainz_id:
-                        album_ids["musicbrainz"] = album.musicbrainz_id
-                    if album.tidal_id:
-                        album_ids["tidal"] = album.tidal_id
-
-                    image_result = await image_provider_registry.get_album_image(
-                        album_title=album.title,
-                        artist_name=album.artist.name
-                        if getattr(album, "artist", None)
-                        else None,
-                        album_ids=album_ids,
-                    )
-                    await asyncio.sleep(API_RATE_LIMIT_SECONDS)
-
-                    if image_result is None:
-                        stats["api_lookup_no_image"] = (
-                            stats.get("api_lookup_no_image", 0) + 1
-                        )
-                        continue
-
-                    provider_id = (
-                        album.deezer_id
-                        or album.spotify_id
-                        or album.musicbrainz_id
-                        or album.tidal_id
-                        or str(album.id)
-                    )
-
-                    download_result = (
-                        await image_service.download_album_image_with_result(
-                            provider_id=provider_id,
-                            image_url=image_result.url,
-                            provider=image_result.provider,
-                        )
-                    )
-
-                    if download_result.success:
-                        album.cover_url = image_result.url
-                        album.cover_path = download_result.path
-                        album.updated_at = datetime.now(UTC)
-                        stats["repaired"] += 1
-                        stats["api_lookup_success"] = (
-                            stats.get("api_lookup_success", 0) + 1
-                        )
-                        artist_name = album.artist.name if getattr(album, "artist", None) else "Unknown"
-                        logger.info(
-                            "[%d/%d] ✅ %s - %s (via %s API)",
-                            idx,
-                            len(albums_without_url),
-                            artist_name,
-                            album.title,
-                            image_result.provider,
-                        )
-                    else:
-                        error_msg = download_result.error_message or "Download failed"
-                        reason = classify_error(error_msg)
-                        album.cover_path = make_failed_marker(reason)
-                        album.updated_at = datetime.now(UTC)
-                        stats["errors"].append(
-                            {"name": album.title, "error": error_msg, "reason": reason}
-                        )
-                        artist_name = album.artist.name if getattr(album, "artist", None) else "Unknown"
-                        logger.warning(
-                            "[%d/%d] ❌ %s - %s: %s",
-                            idx,
-                            len(albums_without_url),
-                            artist_name,
-                            album.title,
-                            reason,
-                        )
-
-                except Exception as e:
-                    error_msg = str(e)
-                    reason = classify_error(error_msg)
-                    album.cover_path = make_failed_marker(reason)
-                    album.updated_at = datetime.now(UTC)
-                    stats["errors"].append(
-                        {"name": album.title, "error": error_msg, "reason": reason}
-                    )
-                    logger.error(
-                        "Exception: %s - %s",
-                        idx,
-                        len(albums_without_url),
-                        album.title,
-                        e,
-                    )
-
-    for idx, album in enumerate(albums, 1):
-        if not album.cover_url:
-            logger.debug(
-                f"  [{idx}/{len(albums)}] ⏭️ {album.title}: No cover_url, skipping"
+    lookup_provider = _lookup_provider(image_provider_registry)
+    targets: dict[str, _RepairTarget] = {}
+    jobs: list[ImageDownloadJob] = []
+    for album, priority in planned + lookup_planned:
+        cover_url = album.cover_url or None
+        provider_ids = {
+            k: v
+            for k, v in (
+                ("deezer", album.deezer_id),
+                ("spotify", album.spotify_id),
+                ("musicbrainz", album.musicbrainz_id),
+                ("tidal", album.tidal_id),
             )
-            stats["no_cover_url"] += 1
-            continue
-
-        stats["processed"] += 1
-
-        try:
-            spotify_id = album.spotify_id
-            deezer_id = album.deezer_id
-
-            cover_url = album.cover_url
-            provider = guess_provider_from_url(cover_url)
-
-            provider_id = deezer_id or spotify_id or str(album.id)
-            download_result = await image_service.download_album_image_with_result(
-                provider_id=provider_id,
-                image_url=cover_url,
-                provider=provider,
+            if v
+        }
+        target = _RepairTarget(
+            model=album,
+            name=album.title,
+            provider_id=(
+                album.deezer_id or album.spotify_id or str(album.id)
+                if cover_url
+                else next(iter(provider_ids.values()), str(album.id))
+            ),
+            image_url=cover_url,
+            provider_ids=provider_ids,
+            artist_name=album.artist.name if getattr(album, "artist", None) else None,
+        )
+        targets[str(album.id)] = target
+        jobs.append(
+            ImageDownloadJob.for_album(
+                entity_id=str(album.id),
+                provider_id=target.provider_id,
+                url=cover_url or "",
+                provider=guess_provider_from_url(cover_url)
+                if cover_url
+                else lookup_provider,
+                priority=priority,
             )
+        )
 
-            if download_result.success:
-                album.cover_url = cover_url
-                album.cover_path = download_result.path
-                album.updated_at = datetime.now(UTC)
-                stats["repaired"] += 1
-                artist_name = album.artist.name if getattr(album, "artist", None) else "Unknown"
-                logger.info("[%d/%d] ✅ %s - %s", idx, len(albums), artist_name, album.title)
-            else:
-                error_msg = download_result.error_message or "Download failed"
-                reason = classify_error(error_msg)
-                album.cover_path = make_failed_marker(reason)
-                album.updated_at = datetime.now(UTC)
-                stats["errors"].append(
-                    {"name": album.title, "error": error_msg, "reason": reason}
+    # Session-less copy for the workers (see repair_artist_images)
+    downloader = dataclasses.replace(image_service, session=None)
+
+    async def handle(job: ImageDownloadJob) -> _RepairOutcome:
+        target = targets[job.entity_id]
+        image_url, provider = target.image_url, job.provider
+        if image_url is None:
+            assert image_provider_registry is not None  # only planned with a registry
+            image_result = await _rate_aware(
+                image_provider_registry.get_album_image(
+                    album_title=target.name,
+                    artist_name=target.artist_name,
+                    album_ids=target.provider_ids,
                 )
-                artist_name = album.artist.name if getattr(album, "artist", None) else "Unknown"
-                logger.warning("[%d/%d] ❌ %s - %s: %s", idx, len(albums), artist_name, album.title, reason)
+            )
+            if image_result is None:
+                return _RepairOutcome(looked_up=True)
+            image_url, provider = image_result.url, image_result.provider
+
+        download_result = await downloader.download_album_image_with_result(
+            provider_id=target.provider_id,
+            image_url=image_url,
+            provider=provider,
+        )
+        if not download_result.success and is_rate_limit_error(
+            download_result.error_message
+        ):
+            raise RepairRateLimited(download_result.error_message or "rate limited")
+        return _RepairOutcome(
+            looked_up=target.image_url is None,
+            image_url=image_url,
+            provider=provider,
+            result=download_result,
+        )
 
-        except Exception as e:
-            error_msg = str(e)
-            reason = classify_error(error_msg)
-            album.cover_path = make_failed_marker(reason)
+    async def apply(
+        job: ImageDownloadJob, outcome: _RepairOutcome | None, error: Exception | None
+    ) -> None:
+        target = targets[job.entity_id]
+        album = target.model
+        artist_name = target.artist_name or "Unknown"
+        if target.image_url is not None:
+            stats["processed"] += 1
+
+        if outcome is not None and outcome.result is None:
+            stats["api_lookup_no_image"] = stats.get("api_lookup_no_image", 0) + 1
+            return
+
+        if outcome is not None and outcome.result is not None and outcome.result.success:
+            album.cover_url = outcome.image_url
+            album.cover_path = outcome.result.path
             album.updated_at = datetime.now(UTC)
-            artist_name = album.artist.name if getattr(album, "artist", None) else "Unknown"
-            logger.error("[%d/%d] 💥 %s - %s: %s", idx, len(albums), artist_name, album.title, e)
-            stats["errors"].append(
-                {"name": album.title, "error": error_msg, "reason": reason}
-            )
+            stats["repaired"] += 1
+            forget_image_viewed("album", job.entity_id)
+            if outcome.looked_up:
+                stats["api_lookup_success"] = stats.get("api_lookup_success", 0) + 1
+                logger.info(
+                    "✅ %s - %s (via %s API)", artist_name, target.name, outcome.provider
+                )
+            else:
+                logger.info("✅ %s - %s", artist_name, target.name)
+            return
+
+        if error is not None:
+            error_msg = str(error)
+            logger.error("💥 %s - %s: %s", artist_name, target.name, error)
+        else:
+            error_msg = (
+                outcome.result.error_message if outcome and outcome.result else None
+            ) or "Download failed"
+        reason = classify_error(error_msg)
+        album.cover_path = make_failed_marker(reason)
+        album.updated_at = datetime.now(UTC)
+        stats["errors"].append(
+            {"name": target.name, "error": error_msg, "reason": reason}
+        )
+        if error is None:
+            logger.warning("❌ %s - %s: %s", artist_name, target.name, reason)
+
+    stats["engine"] = await ImageRepairEngine[_RepairOutcome](
+        concurrency=concurrency
+    ).run(jobs, handle, apply, checkpoint=_checkpointer(session, checkpoint))
 
     # Calculate remaining (explicit categories so logs match reality)
     remaining_download_result = await session.execute(total_missing_query)
@@ -0,0 +1,339 @@
+"""Bounded, rate-aware concurrent engine for image repair and backfill.
+
+Hey future me - this is why repairing 500 missing covers no longer takes 500 x
+(download + sleep)!
+
+Before: repair.py and UnifiedLibraryManager._sync_images walked their entities ONE
+AT A TIME with a fixed asyncio.sleep() between items (50ms / 200ms / 300ms). The
+sleeps guessed at rate limits the API clients already enforce - every Deezer/Spotify/
+MusicBrainz request goes through the shared token buckets in
+infrastructure/rate_limiter.py. So we paid the sleep AND the bucket, with one request
+in flight.
+
+Now:
+- A bounded pool of workers (DEFAULT_REPAIR_CONCURRENCY) runs the jobs. Pacing comes
+  from the shared buckets inside the clients - no sleeps, and the repair shares the
+  same quota as everything else in the process instead of a private guess.
+- Jobs are split into per-provider lanes. A lane gets at most as many workers as its
+  bucket allows as burst: MusicBrainz (1 token, no burst) gets ONE worker, so jobs
+  waiting on its bucket never occupy the whole pool while Deezer jobs could run.
+- Each lane is an ImageDownloadQueue: recently viewed entities (queue.py,
+  note_images_viewed) are HIGH and go first, the background backfill is LOW.
+- A handler raising RepairRateLimited puts the provider's SHARED bucket into backoff
+  (everyone talking to that provider slows down, not just this job) and the job is
+  retried - instead of being marked FAILED for 24h because of a 429.
+- Results are applied by ONE coordinator task (the caller's session is never used
+  concurrently), with a checkpoint callback every checkpoint_every results: progress
+  is committed as it happens, a restart mid-run doesn't lose it.
+
+RepairCheckpoint persists keyset cursors per repair phase in app_settings, so a run
+continues where the last one stopped instead of re-reading the same first N rows.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TYPE_CHECKING, Any
+
+from soulspot.application.services.images.queue import (
+    ImageDownloadJob,
+    ImageDownloadQueue,
+)
+from soulspot.infrastructure.rate_limiter import (
+    RateLimiter,
+    get_deezer_limiter,
+    get_musicbrainz_limiter,
+    get_spotify_limiter,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_REPAIR_CONCURRENCY = 4
+DEFAULT_CHECKPOINT_EVERY = 25
+MAX_RATE_LIMIT_RETRIES = 2
+# Providers without a shared bucket (CDNs, CAA) still back off a little on 429
+FALLBACK_BACKOFF_SECONDS = 2.0
+CHECKPOINT_SETTING_KEY = "images.repair_checkpoint"
+
+# provider name -> shared bucket (the same singletons the API clients use)
+_PROVIDER_LIMITERS: dict[str, Callable[[], RateLimiter]] = {
+    "spotify": get_spotify_limiter,
+    "deezer": get_deezer_limiter,
+    "musicbrainz": get_musicbrainz_limiter,
+}
+_OPEN_LANE = "_open"
+
+_WORKER_DONE = object()
+
+
+class RepairRateLimited(Exception):
+    """Raised by a job handler when the provider answered "slow down" (429)."""
+
+    def __init__(self, message: str = "rate limited", retry_after: int | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def limiter_for_provider(provider: str) -> RateLimiter | None:
+    """Shared token bucket of a provider (None = no bucket, e.g. CDNs)."""
+    getter = _PROVIDER_LIMITERS.get(provider)
+    return getter() if getter is not None else None
+
+
+def is_rate_limit_error(message: str | None) -> bool:
+    """Does an error message describe a rate limit response?"""
+    if not message:
+        return False
+    lower = message.lower()
+    return "429" in lower or "rate limit" in lower or "too many requests" in lower
+
+
+class ImageRepairEngine[T]:
+    """Runs image repair jobs on a bounded, per-provider-lane worker pool."""
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_REPAIR_CONCURRENCY,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            concurrency: Jobs in flight at most (all lanes together)
+            checkpoint_every: Results between two checkpoint() calls
+        """
+        self.concurrency = max(1, concurrency)
+        self.checkpoint_every = max(1, checkpoint_every)
+
+    def lane_size(self, provider: str) -> int:
+        """Workers a provider's lane gets: the bucket's burst, capped by the pool."""
+        limiter = limiter_for_provider(provider)
+        if limiter is None:
+            return self.concurrency
+        return max(1, min(self.concurrency, limiter.config.max_tokens))
+
+    async def run(
+        self,
+        jobs: Sequence[ImageDownloadJob],
+        handler: Callable[[ImageDownloadJob], Awaitable[T]],
+        on_result: Callable[
+            [ImageDownloadJob, T | None, Exception | None], Awaitable[None]
+        ],
+        checkpoint: Callable[[bool], Awaitable[None]] | None = None,
+    ) -> dict[str, Any]:
+        """Run jobs concurrently and feed their results to on_result.
+
+        Hey future me - handler runs in the workers: network/CPU only, NO caller
+        session! on_result runs in the coordinator (this task), one at a time - that's
+        where DB entities get updated. checkpoint(final) is called every
+        checkpoint_every results and once at the end with final=True.
+
+        Args:
+            jobs: Jobs to run (deduplicated by entity, ordered by priority per lane)
+            handler: Does the work of one job, may raise RepairRateLimited
+            on_result: Applies a result (value, or the exception the handler raised)
+            checkpoint: Persists progress (commit, cursor) - optional
+
+        Returns:
+            Stats dict: jobs, completed, failed, rate_limited, checkpoints, duration
+        """
+        started = time.monotonic()
+        stats: dict[str, Any] = {
+            "jobs": 0,
+            "completed": 0,
+            "failed": 0,
+            "rate_limited": 0,
+            "checkpoints": 0,
+            "concurrency": self.concurrency,
+        }
+
+        # One priority queue per lane - a lane that waits on its bucket only
+        # blocks its own workers
+        lanes: dict[str, ImageDownloadQueue] = {}
+        lane_sizes: dict[str, int] = {}
+        for job in jobs:
+            lane = job.provider if job.provider in _PROVIDER_LIMITERS else _OPEN_LANE
+            queue = lanes.get(lane)
+            if queue is None:
+                queue = lanes[lane] = ImageDownloadQueue(max_size=0)
+                lane_sizes[lane] = (
+                    self.lane_size(job.provider)
+                    if lane != _OPEN_LANE
+                    else self.concurrency
+                )
+            if await queue.enqueue(job):
+                stats["jobs"] += 1
+
+        slots = asyncio.Semaphore(self.concurrency)
+        results: asyncio.Queue[Any] = asyncio.Queue()
+        retries: dict[str, int] = {}
+        workers = [
+            asyncio.create_task(
+                self._worker(queue, slots, handler, results, retries, stats)
+            )
+            for lane, queue in lanes.items()
+            for _ in range(min(lane_sizes[lane], queue.get_stats()["queue_size"]))
+        ]
+
+        finished = 0
+        since_checkpoint = 0
+        try:
+            while finished < len(workers):
+                item = await results.get()
+                if item is _WORKER_DONE:
+                    finished += 1
+                    continue
+
+                job, value, error = item
+                stats["failed" if error is not None else "completed"] += 1
+                try:
+                    await on_result(job, value, error)
+                except Exception as e:
+                    logger.warning(
+                        "Could not apply image repair result for %s:%s: %s",
+                        job.entity_type,
+                        job.entity_id,
+                        e,
+                    )
+
+                since_checkpoint += 1
+                if checkpoint is not None and since_checkpoint >= self.checkpoint_every:
+                    await checkpoint(False)
+                    stats["checkpoints"] += 1
+                    since_checkpoint = 0
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        if checkpoint is not None:
+            await checkpoint(True)
+            stats["checkpoints"] += 1
+
+        stats["duration_seconds"] = round(time.monotonic() - started, 2)
+        return stats
+
+    async def _worker(
+        self,
+        queue: ImageDownloadQueue,
+        slots: asyncio.Semaphore,
+        handler: Callable[[ImageDownloadJob], Awaitable[T]],
+        results: asyncio.Queue[Any],
+        retries: dict[str, int],
+        stats: dict[str, Any],
+    ) -> None:
+        try:
+            while (job := await queue.get_nowait()) is not None:
+                value: T | None = None
+                error: Exception | None = None
+                async with slots:
+                    try:
+                        value = await handler(job)
+                    except Exception as e:
+                        error = e
+
+                key = f"{job.entity_type}:{job.entity_id}"
+                if (
+                    isinstance(error, RepairRateLimited)
+                    and retries.get(key, 0) < MAX_RATE_LIMIT_RETRIES
+                ):
+                    # Backoff OUTSIDE the pool slot - other lanes keep going
+                    retries[key] = retries.get(key, 0) + 1
+                    stats["rate_limited"] += 1
+                    await self._backoff(job.provider, error.retry_after)
+                    await queue.mark_done(job, success=False)
+                    await queue.enqueue(job)
+                    continue
+
+                await queue.mark_done(job, success=error is None)
+                results.put_nowait((job, value, error))
+        finally:
+            results.put_nowait(_WORKER_DONE)
+
+    @staticmethod
+    async def _backoff(provider: str, retry_after: int | None) -> None:
+        limiter = limiter_for_provider(provider)
+        if limiter is not None:
+            # Shared bucket: clears its tokens, every client of this provider waits
+            await limiter.handle_rate_limit_response(retry_after)
+        else:
+            await asyncio.sleep(
+                float(retry_after) if retry_after else FALLBACK_BACKOFF_SECONDS
+            )
+
+
+class RepairCheckpoint:
+    """Keyset cursors of the repair phases, persisted in app_settings.
+
+    Hey future me - phases are e.g. "artist:download" / "album:lookup". Each run
+    reads the page AFTER the stored cursor (ORDER BY id), so entities a provider
+    has no image for don't fill every batch forever. A short page = end of table,
+    the cursor wraps to the start for the next run.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the checkpoint.
+
+        Args:
+            session: DB session (the caller's - saved together with the results)
+        """
+        from soulspot.application.services.app_settings_service import (
+            AppSettingsService,
+        )
+
+        self._settings = AppSettingsService(session)
+        self._cursors: dict[str, str] | None = None
+        self._pending: dict[str, str] = {}
+
+    async def cursor(self, phase: str) -> str | None:
+        """Last entity ID the phase got to (None = start of table)."""
+        if self._cursors is None:
+            try:
+                stored = await self._settings.get_json(CHECKPOINT_SETTING_KEY, {})
+            except Exception as e:
+                logger.debug("Could not read image repair checkpoint: %s", e)
+                stored = {}
+            self._cursors = stored if isinstance(stored, dict) else {}
+        return self._cursors.get(phase) or None
+
+    def advance(self, phase: str, planned_ids: Sequence[str], exhausted: bool) -> None:
+        """Remember where the phase's next run starts (saved by save()).
+
+        Args:
+            phase: Repair phase
+            planned_ids: IDs taken from the keyset page, in ID order
+            exhausted: The page reached the end of the table (wrap around)
+        """
+        if exhausted:
+            self._pending[phase] = ""
+        elif planned_ids:
+            self._pending[phase] = str(planned_ids[-1])
+
+    async def save(self) -> None:
+        """Persist advanced cursors (flushes - the caller's commit makes it durable)."""
+        if not self._pending:
+            return
+        cursors = {**(self._cursors or {}), **self._pending}
+        await self._settings.set(
+            CHECKPOINT_SETTING_KEY, cursors, value_type="json", category="images"
+        )
+        self._cursors = cursors
+        self._pending = {}
+
+
+__all__ = [
+    "CHECKPOINT_SETTING_KEY",
+    "DEFAULT_REPAIR_CONCURRENCY",
+    "ImageRepairEngine",
+    "RepairCheckpoint",
+    "RepairRateLimited",
+    "is_rate_limit_error",
+    "limiter_for_provider",
+]
@@ -0,0 +1,207 @@
+"""Content-hashed image variants (64/150/300/600 px) for the image endpoint.
+
+Hey future me - this is why a library grid with 200 covers costs ~0 requests on the
+second visit!
+
+Before: ImageService stored ONE WebP per entity (album 500px, artist 300px) and
+/api/images served it via FileResponse - mtime ETag, no 304, no Cache-Control, and
+GZip re-compressed the WebP bytes on every request. Every grid navigation = 200
+full image transfers, for 150px thumbnails showing 500px covers.
+
+Now:
+- Every cached image has a content digest (sha256 of the file, 16 hex chars).
+  Memoized by (path, size, mtime_ns) - a stat, not a file read, after the first time.
+- get_display_url() puts the digest into the URL (?v=<digest>). A new image = new
+  digest = new URL, so the old URL can be cached "forever" (immutable).
+- ?size=N serves a smaller variant, snapped to VARIANT_SIZES (no arbitrary sizes -
+  otherwise every ?size=151 would be a new file on disk).
+- Variants are generated on first request, stored under .variants/ and keyed by the
+  SOURCE digest: a replaced cover never serves a stale variant, and identical images
+  share their variants.
+- Strong ETag = digest (+ size), so If-None-Match → 304 works across restarts.
+
+Variants are never upscaled: a 300px artist image asked for at 600 is served as 300.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+from soulspot.infrastructure.integrations.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+VARIANT_SIZES: tuple[int, ...] = (64, 150, 300, 600)
+VARIANT_DIR = ".variants"
+VARIANT_QUALITY = 82  # Thumbnails - a bit below WEBP_QUALITY is invisible
+DIGEST_LENGTH = 16
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+_DIGEST_MEMO_ENTRIES = 20_000
+# path -> ((st_size, st_mtime_ns), digest)
+_digest_memo: OrderedDict[str, tuple[tuple[int, int], str]] = OrderedDict()
+
+
+def snap_variant_size(size: int) -> int:
+    """Smallest variant size that covers the requested size.
+
+    Args:
+        size: Requested edge length in px
+
+    Returns:
+        One of VARIANT_SIZES (the largest if size exceeds them all)
+    """
+    for variant in VARIANT_SIZES:
+        if size <= variant:
+            return variant
+    return VARIANT_SIZES[-1]
+
+
+def content_digest(path: Path) -> str | None:
+    """Content digest of an image file (memoized by size + mtime).
+
+    Hey future me - SYNC on purpose, get_display_url() is called from Jinja2.
+    A hit costs one stat(); only new/changed files are read and hashed.
+
+    Args:
+        path: Image file
+
+    Returns:
+        16 hex chars of the sha256, or None if the file doesn't exist
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    key = str(path)
+    fingerprint = (stat.st_size, stat.st_mtime_ns)
+    memo = _digest_memo.get(key)
+    if memo is not None and memo[0] == fingerprint:
+        _digest_memo.move_to_end(key)
+        return memo[1]
+
+    hasher = hashlib.sha256()
+    try:
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(chunk)
+    except OSError:
+        return None
+    digest = hasher.hexdigest()[:DIGEST_LENGTH]
+
+    _digest_memo[key] = (fingerprint, digest)
+    _digest_memo.move_to_end(key)
+    while len(_digest_memo) > _DIGEST_MEMO_ENTRIES:
+        _digest_memo.popitem(last=False)
+    return digest
+
+
+def make_etag(digest: str, size: int | None = None) -> str:
+    """Strong ETag of an original (size=None) or a variant."""
+    return f'"{digest}-{size}"' if size else f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Does an If-None-Match header match our ETag?
+
+    Handles lists ("a", "b"), weak validators (W/"a" - If-None-Match uses the weak
+    comparison) and "*".
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ImageVariantStore:
+    """Generates and caches resized WebP variants of cached images."""
+
+    def __init__(self, base_path: Path | str) -> None:
+        """Initialize the store.
+
+        Args:
+            base_path: Image cache root (settings.storage.image_path)
+        """
+        self.base_path = Path(base_path)
+        self._flight: SingleFlight[Path | None] = SingleFlight("image_variants")
+
+    def variant_path(self, digest: str, size: int) -> Path:
+        """Where the variant of a source digest lives."""
+        return self.base_path / VARIANT_DIR / digest[:2] / f"{digest}_{size}.webp"
+
+    async def get_variant(self, source: Path, digest: str, size: int) -> Path | None:
+        """Path of the size variant of source, generated on first request.
+
+        Concurrent requests for the same variant (a grid page loading the same
+        placeholder-ish cover 10x) generate it once.
+
+        Args:
+            source: Original image file
+            digest: content_digest(source)
+            size: Variant size (already snapped)
+
+        Returns:
+            Variant file, or None if it couldn't be generated (serve the original)
+        """
+        target = self.variant_path(digest, size)
+        if target.exists():
+            return target
+
+        async def generate() -> Path | None:
+            try:
+                await asyncio.to_thread(self._generate_sync, source, target, size)
+            except Exception as e:
+                logger.warning(
+                    "Could not generate %dpx variant of %s: %s", size, source, e
+                )
+                return None
+            return target
+
+        return await self._flight.do((digest, size), generate)
+
+    @staticmethod
+    def _generate_sync(source: Path, target: Path, size: int) -> None:
+        """Resize + encode (thread pool), written atomically."""
+        from PIL import Image as PILImage
+
+        with PILImage.open(source) as opened:
+            img: PILImage.Image = opened
+            if img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGB")
+            img.thumbnail((size, size), PILImage.Resampling.LANCZOS)
+
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # tmp + replace: a concurrent reader never sees a half-written file
+            fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as out:
+                    img.save(out, format="WEBP", quality=VARIANT_QUALITY, method=4)
+                os.replace(tmp_name, target)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+
+
+__all__ = [
+    "IMMUTABLE_CACHE_CONTROL",
+    "REVALIDATE_CACHE_CONTROL",
+    "VARIANT_SIZES",
+    "ImageVariantStore",
+    "content_digest",
+    "etag_matches",
+    "make_etag",
+    "snap_variant_size",
+]
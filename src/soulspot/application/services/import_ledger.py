@@ -0,0 +1,263 @@
+"""Persistent ledger of files the auto-import already looked at.
+
+Hey future me - this is why leftover files in downloads don't cost anything anymore!
+
+Before: every auto-import cycle re-read the tags (mutagen, on the event loop!) of
+EVERY file it couldn't import last time - unmatched rips, files whose download isn't
+marked completed yet. A few thousand leftovers = the loop blocked for seconds, every
+60s, forever.
+
+Now every examined file gets a row (path, size, mtime, outcome + the tags we read):
+- unchanged size + mtime -> the file is never examined again
+- file changed on disk -> examined again (new tags may match now)
+- a download completes -> only rows that could belong to that track are re-queued
+  (same track_id, ISRC or title) and re-matched from the STORED tags, no file I/O
+- imported / deleted files -> row removed
+
+Outcomes: "no_match" (no track in DB), "not_completed" (track found, download not
+completed yet), "error" (import failed - retried after ERROR_RETRY_SECONDS).
+
+The whole ledger is cached in memory (it only covers the downloads directory),
+every write goes through to the auto_import_ledger table. Without a session it's
+memory-only - same behaviour, just forgotten on restart.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+OUTCOME_NO_MATCH = "no_match"
+OUTCOME_NOT_COMPLETED = "not_completed"
+OUTCOME_ERROR = "error"
+
+# Failed imports (locked file, full disk...) get another try after this long
+ERROR_RETRY_SECONDS = 3600
+
+
+@dataclass(slots=True)
+class FileTags:
+    """The tags the auto-import matches on."""
+
+    isrc: str | None = None
+    title: str | None = None
+    artist: str | None = None
+
+
+@dataclass(slots=True)
+class LedgerEntry:
+    """What we know about one file in the downloads directory."""
+
+    file_size: int
+    file_mtime: float
+    outcome: str
+    tags: FileTags
+    track_id: str | None = None
+    detail: str | None = None
+    examined_at: float = 0.0  # time.time()
+    requeued: bool = False
+
+
+class ImportLedger:
+    """In-memory ledger with write-through to auto_import_ledger."""
+
+    def __init__(self, session: Any | None = None) -> None:
+        """
+        Initialize the ledger.
+
+        Args:
+            session: Async DB session for persistence (None = memory only)
+        """
+        self._session = session
+        self._entries: dict[str, LedgerEntry] = {}
+        self._loaded = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def load(self) -> None:
+        """Load all rows once (idempotent)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self._session is None:
+            return
+
+        from sqlalchemy import select
+
+        from soulspot.infrastructure.persistence.models import AutoImportLedgerModel
+
+        result = await self._session.execute(select(AutoImportLedgerModel))
+        for row in result.scalars().all():
+            self._entries[row.file_path] = LedgerEntry(
+                file_size=row.file_size,
+                file_mtime=row.file_mtime,
+                outcome=row.outcome,
+                tags=FileTags(isrc=row.isrc, title=row.title, artist=row.artist),
+                track_id=row.track_id,
+                detail=row.detail,
+                examined_at=row.examined_at.timestamp() if row.examined_at else 0.0,
+            )
+        logger.debug(f"Loaded {len(self._entries)} auto-import ledger entries")
+
+    def get(self, file_path: str) -> LedgerEntry | None:
+        """Ledger entry of a file (None = never examined)."""
+        return self._entries.get(file_path)
+
+    def paths(self) -> set[str]:
+        """All paths in the ledger."""
+        return set(self._entries)
+
+    def needs_examination(self, file_path: str, size: int, mtime: float) -> bool:
+        """True unless the file was examined before and nothing changed since.
+
+        Args:
+            file_path: Absolute path
+            size: Current size in bytes
+            mtime: Current mtime
+
+        Returns:
+            Whether the file must be (re)examined
+        """
+        entry = self._entries.get(file_path)
+        if entry is None or entry.requeued:
+            return True
+        if entry.file_size != size or entry.file_mtime != mtime:
+            return True
+        if entry.outcome == OUTCOME_ERROR:
+            return time.time() - entry.examined_at >= ERROR_RETRY_SECONDS
+        return False
+
+    def requeued_paths(self) -> set[str]:
+        """Paths re-queued by requeue_for_tracks() and not examined since."""
+        return {path for path, entry in self._entries.items() if entry.requeued}
+
+    async def requeue_for_tracks(self, track_ids: set[str]) -> int:
+        """Re-queue files that could belong to tracks whose download just completed.
+
+        A file is re-queued if it was matched to one of the tracks, or if its stored
+        ISRC / title equals the track's. One small query for the tracks, the rest is
+        in memory.
+
+        Args:
+            track_ids: Track IDs with newly completed downloads
+
+        Returns:
+            Number of re-queued files
+        """
+        if not track_ids or not self._entries:
+            return 0
+
+        isrcs: set[str] = set()
+        titles: set[str] = set()
+        if self._session is not None:
+            from sqlalchemy import select
+
+            from soulspot.infrastructure.persistence.models import TrackModel
+
+            ids = list(track_ids)
+            for i in range(0, len(ids), 500):
+                result = await self._session.execute(
+                    select(TrackModel.isrc, TrackModel.title).where(
+                        TrackModel.id.in_(ids[i : i + 500])
+                    )
+                )
+                for isrc, title in result.all():
+                    if isrc:
+                        isrcs.add(isrc.upper())
+                    if title:
+                        titles.add(title.casefold())
+
+        count = 0
+        for entry in self._entries.values():
+            tags = entry.tags
+            if (
+                entry.track_id in track_ids
+                or (tags.isrc and tags.isrc.upper() in isrcs)
+                or (tags.title and tags.title.casefold() in titles)
+            ):
+                entry.requeued = True
+                count += 1
+        return count
+
+    async def record(
+        self,
+        file_path: str,
+        size: int,
+        mtime: float,
+        outcome: str,
+        tags: FileTags,
+        track_id: str | None = None,
+        detail: str | None = None,
+    ) -> None:
+        """Store the outcome of examining a file (insert or update)."""
+        now = time.time()
+        self._entries[file_path] = LedgerEntry(
+            file_size=size,
+            file_mtime=mtime,
+            outcome=outcome,
+            tags=tags,
+            track_id=track_id,
+            detail=detail,
+            examined_at=now,
+        )
+        if self._session is None:
+            return
+
+        from soulspot.infrastructure.persistence.models import AutoImportLedgerModel
+
+        await self._session.merge(
+            AutoImportLedgerModel(
+                file_path=file_path,
+                file_size=size,
+                file_mtime=mtime,
+                outcome=outcome,
+                track_id=track_id,
+                isrc=tags.isrc,
+                title=tags.title,
+                artist=tags.artist,
+                detail=detail[:1000] if detail else None,
+                examined_at=datetime.fromtimestamp(now, UTC),
+            )
+        )
+
+    async def forget(self, file_paths: set[str]) -> None:
+        """Drop files that were imported or disappeared."""
+        file_paths = {p for p in file_paths if p in self._entries}
+        if not file_paths:
+            return
+        for path in file_paths:
+            del self._entries[path]
+        if self._session is None:
+            return
+
+        from sqlalchemy import delete
+
+        from soulspot.infrastructure.persistence.models import AutoImportLedgerModel
+
+        paths = list(file_paths)
+        for i in range(0, len(paths), 500):
+            await self._session.execute(
+                delete(AutoImportLedgerModel).where(
+                    AutoImportLedgerModel.file_path.in_(paths[i : i + 500])
+                )
+            )
+
+    async def commit(self) -> None:
+        """Commit pending ledger writes."""
+        if self._session is not None:
+            await self._session.commit()
+
+
+__all__ = [
+    "ERROR_RETRY_SECONDS",
+    "OUTCOME_ERROR",
+    "OUTCOME_NOT_COMPLETED",
+    "OUTCOME_NO_MATCH",
+    "FileTags",
+    "ImportLedger",
+    "LedgerEntry",
+]
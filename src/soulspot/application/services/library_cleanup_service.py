@@ -10,6 +10,10 @@ from typing import Any
 from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from soulspot.infrastructure.persistence.library_aggregates import (
+    refresh_artist_aggregates,
+    refresh_library_aggregates,
+)
 from soulspot.infrastructure.persistence.models import (
     AlbumModel,
     ArtistModel,
@@ -174,6 +178,10 @@ class LibraryCleanupService:
                     stats["deleted_artists"],
                 )
 
+            # Every local track is gone → recompute ALL maintained aggregates
+            # (set-based, same transaction as the deletes)
+            await refresh_library_aggregates(self._session, full=True)
+
             await self._session.commit()
 
             logger.info(
@@ -212,6 +220,8 @@ class LibraryCleanupService:
             "albums": 0,
             "artists": 0,
         }
+        # Surviving artists of deleted albums - their album_count changes
+        affected_artist_ids: set[str] = set()
 
         logger.info("Starting orphan cleanup...")
 
@@ -219,14 +229,16 @@ class LibraryCleanupService:
             # Step 1: Delete orphaned albums (albums with no tracks)
             while True:
                 orphan_albums_stmt = (
-                    select(AlbumModel.id)
+                    select(AlbumModel.id, AlbumModel.artist_id)
                     .outerjoin(TrackModel, AlbumModel.id == TrackModel.album_id)
-                    .group_by(AlbumModel.id)
+                    .group_by(AlbumModel.id, AlbumModel.artist_id)
                     .having(func.count(TrackModel.id) == 0)
                     .limit(batch_size)
                 )
                 result = await self._session.execute(orphan_albums_stmt)
-                orphan_ids = [row[0] for row in result.all()]
+                rows = result.all()
+                orphan_ids = [row[0] for row in rows]
+                affected_artist_ids.update(row[1] for row in rows)
 
                 if not orphan_ids:
                     break
@@ -272,6 +284,10 @@ class LibraryCleanupService:
                 if batch_count < batch_size:
                     break
 
+            # Deleted artists simply match no row
+            if affected_artist_ids:
+                await refresh_artist_aggregates(self._session, affected_artist_ids)
+
             await self._session.commit()
 
             if stats["albums"] > 0 or stats["artists"] > 0:
@@ -51,6 +51,9 @@ from sqlalchemy import func, select, update
 
 from soulspot.domain.exceptions import BusinessRuleViolation, EntityNotFoundError
 from soulspot.domain.value_objects.artist_normalization import normalize_artist_name
+from soulspot.infrastructure.persistence.library_aggregates import (
+    refresh_library_aggregates,
+)
 from soulspot.infrastructure.persistence.models import (
     AlbumModel,
     ArtistModel,
@@ -379,6 +382,10 @@ class LibraryMergeService:
 
         keep_artist.updated_at = datetime.now(UTC)
 
+        # Bulk UPDATEs above bypass the ORM flush hook - refresh the keep artist's
+        # maintained counts explicitly
+        await refresh_library_aggregates(self._session, artist_ids=[keep_id])
+
         await self._session.commit()
 
         logger.info(
@@ -492,6 +499,10 @@ class LibraryMergeService:
 
         keep_album.updated_at = datetime.now(UTC)
 
+        # Bulk UPDATE above bypasses the ORM flush hook - refresh the keep album
+        # (and its artist) explicitly
+        await refresh_library_aggregates(self._session, album_ids=[keep_id])
+
         await self._session.commit()
 
         logger.info(
@@ -11,15 +11,18 @@ import asyncio
 import contextlib
 import hashlib
 import logging
+import multiprocessing
 import os
 import time
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import AsyncGenerator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from mutagen import File as MutagenFile  # type: ignore[attr-defined]
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from soulspot.config import Settings
@@ -32,7 +35,7 @@ from soulspot.domain.value_objects.album_types import (
 from soulspot.domain.value_objects.folder_parsing import (
     AUDIO_EXTENSIONS,
     LibraryFolderParser,
-    LibraryScanResult,
+    ScannedAlbumBatch,
     ScannedTrack,
     is_disc_folder,
     parse_album_folder,
@@ -42,10 +45,14 @@ from soulspot.infrastructure.observability.logger_template import (
     end_operation,
     start_operation,
 )
+from soulspot.infrastructure.persistence.library_aggregates import (
+    refresh_library_aggregates,
+)
 from soulspot.infrastructure.persistence.models import (
     AlbumModel,
     ArtistModel,
     TrackModel,
+    ensure_utc_aware,
 )
 from soulspot.infrastructure.persistence.repositories import (
     AlbumRepository,
@@ -62,6 +69,157 @@ logger = logging.getLogger(__name__)
 # Keeping for reference but can be removed in future cleanup.
 # _DISCOGRAPHY_SYNC_SEMAPHORE = asyncio.Semaphore(2)
 
+# Hey future me - SQLite's default SQLITE_MAX_VARIABLE_NUMBER is 999 on older builds.
+# Every "WHERE id IN (...)" from the scanner is chunked to stay well below that.
+_IN_CLAUSE_CHUNK_SIZE = 500
+
+
+@dataclass(slots=True)
+class _KnownTrackFile:
+    """Change fingerprint of a track file as stored in the DB.
+
+    Hey future me - loaded for ALL local tracks in ONE streaming query at scan start.
+    slots=True keeps 180k of these at a few MB instead of dict-per-row overhead.
+    """
+
+    track_id: str
+    file_size: int | None
+    file_mtime: float | None
+    last_scanned_at: datetime | None
+
+
+@dataclass(slots=True)
+class _ScannedFileState:
+    """Resolved path + stat result of a file found on disk during the walk."""
+
+    path: str
+    size: int
+    mtime: float
+
+
+# (scanned track, resolved path + stat, stored fingerprint or None if new)
+_PlannedTrack = tuple[ScannedTrack, _ScannedFileState, _KnownTrackFile | None]
+
+
+# =========================================================================
+# AUDIO INFO EXTRACTION (runs in thread OR process pool)
+# =========================================================================
+# Hey future me - these are MODULE-LEVEL on purpose! ProcessPoolExecutor pickles
+# the callable + arguments, bound methods of the scanner (session, executor...)
+# can't cross the process boundary. Keep them free of service state.
+
+# Never hand a worker fewer files than this - per-submit overhead (pickling,
+# IPC for process pools) would eat the win on small albums.
+_MIN_EXTRACT_CHUNK = 4
+
+
+@dataclass(slots=True)
+class _AudioInfo:
+    """Compact audio info record returned by the extraction pool.
+
+    Hey future me - this crosses the process boundary for every file, so it is
+    a slim slots dataclass instead of the old free-form dict.
+    """
+
+    format: str
+    duration_ms: int = 0
+    bitrate: int | None = None
+    sample_rate: int | None = None
+    genre: str | None = None
+
+
+def _extract_genre_tag(tags: Any) -> str | None:
+    """Extract genre from audio tags.
+
+    Hey future me - genre is the ONLY tag we need from ID3/Vorbis/MP4!
+    Everything else (artist, album, title) comes from folder structure.
+
+    Args:
+        tags: Audio tags from mutagen
+
+    Returns:
+        Genre string or None
+    """
+    # Genre tag mappings for different formats
+    genre_tags = ["TCON", "genre", "©gen"]
+
+    for tag_key in genre_tags:
+        if tag_key in tags:
+            value = tags[tag_key]
+            if isinstance(value, list) and value:
+                value = value[0]
+            if hasattr(value, "text"):
+                value = value.text[0] if isinstance(value.text, list) else value.text
+            if value:
+                return str(value)
+    return None
+
+
+def _extract_audio_info(file_path: str) -> _AudioInfo:
+    """Extract ONLY audio technical info from file (NOT artist/album/title!).
+
+    Hey future me - this is the simplified extraction for Lidarr-based scanning!
+    We ONLY extract:
+    - duration_ms (from audio stream)
+    - bitrate (from audio stream)
+    - sample_rate (from audio stream)
+    - format (from file extension)
+    - genre (from ID3 tag - this is the ONLY tag we read!)
+
+    Artist, album, title come from FOLDER STRUCTURE, not from tags!
+    SHA256 is NOT computed here - the nightly DUPLICATE_SCAN job does that.
+
+    Args:
+        file_path: Path to audio file
+
+    Returns:
+        _AudioInfo (format + zero duration if mutagen can't parse the file)
+    """
+    audio_info = _AudioInfo(format=os.path.splitext(file_path)[1].lstrip(".").lower())
+
+    try:
+        audio = MutagenFile(file_path)
+        if audio is None:
+            return audio_info
+
+        # Duration from audio stream
+        if hasattr(audio.info, "length") and audio.info.length:
+            audio_info.duration_ms = int(audio.info.length * 1000)
+
+        # Bitrate from audio stream
+        if hasattr(audio.info, "bitrate") and audio.info.bitrate:
+            audio_info.bitrate = audio.info.bitrate
+
+        # Sample rate from audio stream
+        if hasattr(audio.info, "sample_rate") and audio.info.sample_rate:
+            audio_info.sample_rate = audio.info.sample_rate
+
+        # Genre is the ONLY tag we extract (not in folder structure)
+        if hasattr(audio, "tags") and audio.tags:
+            audio_info.genre = _extract_genre_tag(audio.tags)
+
+        return audio_info
+
+    except Exception as e:
+        # Hey future me - some exceptions (especially from FLAC parsing) have empty str(e)!
+        # We log exception TYPE + message to actually debug these issues.
+        exc_type = type(e).__name__
+        exc_msg = str(e) if str(e) else "(no message)"
+        logger.warning(
+            f"Error extracting audio info from {os.path.basename(file_path)}: "
+            f"[{exc_type}] {exc_msg}"
+        )
+        return audio_info
+
+
+def _extract_audio_batch(file_paths: list[str]) -> list[_AudioInfo]:
+    """Extract audio info for a chunk of files in ONE pool job.
+
+    One submit per chunk (not per file) keeps pickling/IPC overhead of process
+    pools negligible. Order of the result matches file_paths.
+    """
+    return [_extract_audio_info(file_path) for file_path in file_paths]
+
 
 class LibraryScannerService:
     """Service for scanning Lidarr-organized music library and importing to database.
@@ -106,9 +264,8 @@ class LibraryScannerService:
         # Hey future me - this runs metadata parsing in parallel threads
         # so the event loop stays responsive. DB work stays async/serial.
         # SHA256 hashing is NOT done here - it runs in a separate nightly DUPLICATE_SCAN job!
-        self._executor = ThreadPoolExecutor(
-            max_workers=min(8, max(2, os.cpu_count() or 4))
-        )
+        self._executor_workers = min(8, max(2, os.cpu_count() or 4))
+        self._executor = ThreadPoolExecutor(max_workers=self._executor_workers)
 
     # =========================================================================
     # DEPRECATED: AUTO-DISCOGRAPHY SYNC (Jan 2026)
@@ -198,8 +355,14 @@ class LibraryScannerService:
             "new_artists": 0,
             "new_albums": 0,
             "new_tracks": 0,
+            "updated_tracks": 0,
+            "touched_unchanged": 0,
             "existing_artists": 0,
             "existing_albums": 0,
+            # Files known in DB but gone from disk (exact diff, both scan modes)
+            "missing_files": 0,
+            # Unseen files kept because their folder/album errored during this scan
+            "missing_files_kept": 0,
             # Cleanup stats (only populated if defer_cleanup=False)
             "removed_tracks": 0,
             "removed_albums": 0,
@@ -211,12 +374,18 @@ class LibraryScannerService:
             "cleanup_file_paths": None,  # Serialized for cleanup job payload
             # Auto-discography sync stats (Jan 2025)
             "discography_sync_queued": 0,
+            # Throughput (walk + diff + extraction + DB writes)
+            "scan_duration_seconds": 0.0,
+            "files_per_second": 0.0,
+            "extracted_files_per_second": 0.0,
         }
 
         # Hey future me - track newly created artists for AUTO-DISCOGRAPHY SYNC!
         # After scan completes, we queue discography sync for these artists.
         # This ensures LOCAL artists get their FULL discography from providers.
         newly_created_artist_ids: list[tuple[str, str]] = []  # [(artist_id, artist_name), ...]
+        # Per-scan extraction pool (process pool / custom thread count), shut down at the end
+        owned_extract_pool: Executor | None = None
 
         try:
             # Validate music path
@@ -231,166 +400,360 @@ class LibraryScannerService:
                 f"cleanup: {'deferred' if defer_cleanup else 'immediate'}"
             )
 
-            # Use LibraryFolderParser for structured discovery
-            # Hey future me - this parses the entire Artist→Album→Track hierarchy ONCE!
-            # Much faster than parsing each file's path separately.
-            parser = LibraryFolderParser(music_root)
-            scan_result: LibraryScanResult = parser.scan()
-
-            logger.info(
-                f"LibraryFolderParser found: {scan_result.total_artists} artists, "
-                f"{scan_result.total_albums} albums, {scan_result.total_tracks} tracks"
-            )
-
-            # Collect all file paths for cleanup check
-            all_file_paths: set[str] = set()
-            for artist in scan_result.artists:
-                for album in artist.albums:
-                    for track in album.tracks:
-                        all_file_paths.add(str(track.path.resolve()))
-
-            stats["total_files"] = len(all_file_paths)
-
-            # For FULL scan: Handle cleanup (immediate or deferred)
-            if not incremental:
-                if defer_cleanup:
-                    # Fast check: are there any tracks to clean up?
-                    cleanup_count = await self._count_missing_tracks(all_file_paths)
-                    if cleanup_count > 0:
-                        stats["cleanup_needed"] = True
-                        # Store file paths for cleanup job (as list for JSON serialization)
-                        stats["cleanup_file_paths"] = list(all_file_paths)
-                        logger.info(
-                            f"Cleanup deferred: ~{cleanup_count} tracks to remove "
-                            "(will run as separate job)"
-                        )
-                else:
-                    # Immediate cleanup (old behavior, blocks UI longer)
-                    cleanup_stats = await self._cleanup_missing_files(all_file_paths)
-                    stats["removed_tracks"] = cleanup_stats["removed_tracks"]
-                    stats["removed_albums"] = cleanup_stats["removed_albums"]
-                    stats["removed_artists"] = cleanup_stats["removed_artists"]
-
-                    # Clear caches after cleanup
-                    self._artist_cache.clear()
-                    self._album_cache.clear()
+            # Hey future me - SET-BASED INCREMENTAL SCAN (Jan 2026)!
+            # Before: one "SELECT ... WHERE file_path = ?" per file (unindexed!).
+            # 180k tracks = 180k full table scans for a "nothing changed" rescan.
+            # Now: load the known (path, size, mtime, last_scanned_at) set in ONE
+            # streaming query and diff it in memory against the stat results the
+            # folder walk already has. Only new/changed/removed files cause DB work.
+            known_files = await self._load_known_files()
 
             # Pre-load artist/album caches for exact name matching
             await self._load_caches()
 
+            # Use LibraryFolderParser for structured discovery
+            # Hey future me - STREAMING WALK (Jan 2026)! The parser walks artist folders
+            # in parallel (os.scandir, thread pool) and hands us album batches through
+            # a bounded queue while it is still walking. Import starts after the first
+            # artist, and we never hold the whole library tree in memory.
+            parser = LibraryFolderParser(music_root)
+
             # Process structured data: Artist → Album → Tracks
             # Hey future me - this is the BIG CHANGE! We iterate by structure, not by file.
             # Artist/Album are created ONCE per folder, then tracks are added.
             #
             # LOCK OPTIMIZATION (Dec 2025):
-            # Reduced BATCH_SIZE from 250 to 10 to minimize SQLite lock contention!
-            # Also commit after EACH ALBUM (natural transaction boundary).
-            # Why: SQLite locks entire DB during writes. With 250 tracks per commit,
+            # Commit after EACH ALBUM (natural transaction boundary).
+            # Why: SQLite locks entire DB during writes. With big transactions,
             # other workers (downloads, enrichment) get "database is locked" errors.
-            # With smaller batches + album commits, lock is released frequently.
-            BATCH_SIZE = 10  # Small batches to release DB lock frequently
+            # With album commits, lock is released frequently.
+            #
+            # BATCHED EXTRACTION (Jan 2026):
+            # Mutagen used to run one file at a time (await per track), so the pool
+            # never held more than one job. Now every walk batch is diffed in memory
+            # first, then ALL its albums go to the extraction pool at once, and each
+            # album is written with ONE multi-row INSERT (+ one bulk UPDATE).
+            extract_pool, extract_workers = self._create_extract_pool()
+            if extract_pool is not self._executor:
+                owned_extract_pool = extract_pool
             processed = 0
-            total_tracks = scan_result.total_tracks
-
-            for scanned_artist in scan_result.artists:
-                # Get or create artist (exact name match, no fuzzy!)
-                # Hey future me - we pass musicbrainz_id AND disambiguation from folder!
-                # Name is CLEAN (no UUID/disambiguation), perfect for Spotify search.
-                # Disambiguation is stored separately for UI display.
-                artist_id, is_new_artist = await self._get_or_create_artist_exact(
-                    scanned_artist.name,
-                    musicbrainz_id=scanned_artist.musicbrainz_id,
-                    disambiguation=scanned_artist.disambiguation,
-                )
-                if is_new_artist:
-                    stats["new_artists"] += 1
-                    # Hey future me - track for auto-discography sync!
-                    # Skip "Various Artists" - they're compilations, not real artists.
-                    if not is_various_artists(scanned_artist.name):
-                        newly_created_artist_ids.append(
-                            (str(artist_id.value), scanned_artist.name)
-                        )
-                else:
-                    stats["existing_artists"] += 1
-
-                # Check if this is a VA artist (for compilation detection)
-                is_va_artist = is_various_artists(scanned_artist.name)
-
-                for scanned_album in scanned_artist.albums:
-                    # Get or create album (exact name match)
-                    album_id, is_new_album = await self._get_or_create_album_exact(
-                        title=scanned_album.title,
-                        artist_id=artist_id,
-                        release_year=scanned_album.year,
-                        is_compilation=is_va_artist,
-                        album_artist=scanned_artist.name if is_va_artist else None,
-                    )
-                    if is_new_album:
-                        stats["new_albums"] += 1
-                        if is_va_artist:
-                            stats["compilations_detected"] += 1
-                    else:
-                        stats["existing_albums"] += 1
-
-                    # Process tracks in this album
-                    for scanned_track in scanned_album.tracks:
+            # Total is unknown while the walk runs - known tracks are the best estimate
+            expected_tracks = len(known_files)
+
+            # Unchanged files are NOT touched one by one - their IDs are collected
+            # and stamped with ONE bulk UPDATE per chunk after the walk.
+            unchanged_track_ids: list[str] = []
+            # Legacy rows (scanned before file_mtime existed) get size+mtime backfilled
+            legacy_fingerprints: list[dict[str, Any]] = []
+            seen_paths: set[str] = set()
+            # Files/folders that errored → NOT seen doesn't mean gone, the
+            # missing-file cleanup below must keep their tracks
+            error_paths: set[str] = set()
+            error_dirs: list[Path] = []
+            # Big artist folders arrive as several batches - resolve each artist ONCE
+            artist_ids_by_path: dict[Path, ArtistId] = {}
+            extract_seconds = 0.0
+            loop_started = time.monotonic()
+
+            async with contextlib.aclosing(
+                self._stream_album_batches(parser)
+            ) as batches:
+                async for batch in batches:
+                    scanned_artist = batch.artist
+                    artist_id = artist_ids_by_path.get(scanned_artist.path)
+                    if artist_id is None:
+                        # Get or create artist (exact name match, no fuzzy!)
+                        # Hey future me - we pass musicbrainz_id AND disambiguation from folder!
+                        # Name is CLEAN (no UUID/disambiguation), perfect for Spotify search.
+                        # Disambiguation is stored separately for UI display.
                         try:
-                            # Check if file changed (incremental mode)
-                            if incremental:
-                                existing = await self._get_track_by_file_path(
-                                    scanned_track.path
+                            (
+                                artist_id,
+                                is_new_artist,
+                            ) = await self._get_or_create_artist_exact(
+                                scanned_artist.name,
+                                musicbrainz_id=scanned_artist.musicbrainz_id,
+                                disambiguation=scanned_artist.disambiguation,
+                            )
+                        except Exception as e:
+                            # No artist → none of this batch's albums can be written.
+                            # Fail them like a broken album (tracks kept, scan goes on).
+                            await self._session.rollback()
+                            await self._reload_caches()
+                            for scanned_album in batch.albums:
+                                error_dirs.append(scanned_album.path)
+                                stats["errors"] += 1
+                                stats["error_files"].append(
+                                    {"path": str(scanned_album.path), "error": str(e)}
                                 )
-                                if existing:
-                                    # Update last_scanned_at
-                                    existing.last_scanned_at = datetime.now(UTC)
-                                    stats["skipped"] += 1
-                                    processed += 1
-                                    continue
-
-                            # Import track with folder-based metadata
-                            result = await self._import_track_from_scan(
-                                scanned_track=scanned_track,
-                                artist_id=artist_id,
-                                album_id=album_id,
-                                is_va_album=is_va_artist,
+                                processed += len(scanned_album.tracks)
+                            logger.warning(
+                                f"Error importing artist {scanned_artist.path}: {e}",
+                                exc_info=True,
                             )
+                            continue
+                        if is_new_artist:
+                            stats["new_artists"] += 1
+                            # Hey future me - track for auto-discography sync!
+                            # Skip "Various Artists" - they're compilations, not real artists.
+                            if not is_various_artists(scanned_artist.name):
+                                newly_created_artist_ids.append(
+                                    (str(artist_id.value), scanned_artist.name)
+                                )
+                        else:
+                            stats["existing_artists"] += 1
+
+                        artist_ids_by_path[scanned_artist.path] = artist_id
+
+                    # Check if this is a VA artist (for compilation detection)
+                    is_va_artist = is_various_artists(scanned_artist.name)
+
+                    # Artists/albums whose maintained aggregates (track/album counts,
+                    # duration, has_local_files) this batch changes
+                    dirty_artist_ids: set[str] = set()
+                    dirty_album_ids: set[str] = set()
+
+                    # Pass 1 (no DB, no mutagen): diff every file of the batch against
+                    # the known set and submit each album's new/changed files to the pool.
+                    album_plans = []
+                    for scanned_album in batch.albums:
+                        planned: list[_PlannedTrack] = []
+                        for scanned_track in scanned_album.tracks:
+                            try:
+                                file_state = self._file_state_for(scanned_track)
+                            except OSError as e:
+                                stats["errors"] += 1
+                                stats["error_files"].append(
+                                    {"path": str(scanned_track.path), "error": str(e)}
+                                )
+                                error_paths.add(str(scanned_track.path))
+                                logger.warning(
+                                    f"Error importing {scanned_track.path.name}: {e}",
+                                    exc_info=False,
+                                )
+                                processed += 1
+                                continue
+
+                            # Same resolved file reachable twice (symlinks) → once only
+                            if file_state.path in seen_paths:
+                                stats["skipped"] += 1
+                                processed += 1
+                                continue
+                            seen_paths.add(file_state.path)
+
+                            # Incremental mode: in-memory diff, no DB round-trip!
+                            known = known_files.get(file_state.path)
+                            if (
+                                incremental
+                                and known is not None
+                                and not self._is_file_changed(known, file_state)
+                            ):
+                                if known.file_mtime is None:
+                                    legacy_fingerprints.append(
+                                        {
+                                            "id": known.track_id,
+                                            "file_size": file_state.size,
+                                            "file_mtime": file_state.mtime,
+                                        }
+                                    )
+                                else:
+                                    unchanged_track_ids.append(known.track_id)
+                                stats["skipped"] += 1
+                                processed += 1
+                                continue
+
+                            # New track (or changed one to refresh in place)
+                            planned.append((scanned_track, file_state, known))
+
+                        extraction = (
+                            self._submit_audio_extraction(
+                                extract_pool,
+                                extract_workers,
+                                [file_state.path for _, file_state, _ in planned],
+                            )
+                            if planned
+                            else None
+                        )
+                        album_plans.append((scanned_album, planned, extraction))
 
-                            stats["scanned"] += 1
-                            if result["imported"]:
-                                stats["imported"] += 1
-                                stats["new_tracks"] += 1
-
-                            processed += 1
+                    # Pass 2: per album - get/create album, await its extraction, write
+                    # all rows at once, commit. Later albums keep extracting meanwhile.
+                    # Hey future me - ONE broken album must not abort the whole scan!
+                    # Everything before this point is committed, so a rollback after a
+                    # failed album only drops that album's own writes.
+                    await self._session.commit()
+                    try:
+                        for scanned_album, planned, extraction in album_plans:
+                            try:
+                                # Get or create album (exact name match)
+                                (
+                                    album_id,
+                                    is_new_album,
+                                ) = await self._get_or_create_album_exact(
+                                    title=scanned_album.title,
+                                    artist_id=artist_id,
+                                    release_year=scanned_album.year,
+                                    is_compilation=is_va_artist,
+                                    album_artist=scanned_artist.name
+                                    if is_va_artist
+                                    else None,
+                                )
 
-                            # Batch commit
-                            if processed % BATCH_SIZE == 0:
-                                await self._session.commit()
-                                logger.debug(f"Committed batch ({processed} tracks)")
+                                result = None
+                                if extraction is not None:
+                                    waited_from = time.monotonic()
+                                    audio_infos = [
+                                        info
+                                        for chunk in await extraction
+                                        for info in chunk
+                                    ]
+                                    extract_seconds += time.monotonic() - waited_from
+
+                                    result = await self._import_album_tracks(
+                                        planned,
+                                        audio_infos,
+                                        artist_id=artist_id,
+                                        album_id=album_id,
+                                        is_va_album=is_va_artist,
+                                    )
+
+                                # LOCK OPTIMIZATION: Commit after EACH album!
+                                # This is a natural transaction boundary - all tracks for one album.
+                                # Releases SQLite lock so other workers can proceed.
+                                if is_new_album or result is not None:
+                                    await self._session.commit()
+                            except Exception as e:
+                                await self._session.rollback()
+                                # Rolled back album/VA artist rows may sit in the caches
+                                await self._reload_caches()
+                                error_dirs.append(scanned_album.path)
+                                stats["errors"] += 1
+                                stats["error_files"].append(
+                                    {"path": str(scanned_album.path), "error": str(e)}
+                                )
+                                logger.warning(
+                                    f"Error importing album {scanned_album.path}: {e}",
+                                    exc_info=True,
+                                )
+                                processed += len(planned)
+                                continue
+
+                            if is_new_album:
+                                stats["new_albums"] += 1
+                                if is_va_artist:
+                                    stats["compilations_detected"] += 1
+                                # New album → artist's album_count changes
+                                dirty_album_ids.add(str(album_id.value))
+                            else:
+                                stats["existing_albums"] += 1
+
+                            if result is None:
+                                continue
+
+                            imported = result["new_tracks"] + result["updated_tracks"]
+                            if imported:
+                                dirty_album_ids.add(str(album_id.value))
+                                dirty_artist_ids.update(result["artist_ids"])
+                            stats["scanned"] += len(planned)
+                            stats["imported"] += imported
+                            stats["new_tracks"] += result["new_tracks"]
+                            stats["updated_tracks"] += result["updated_tracks"]
+                            stats["errors"] += len(result["error_files"])
+                            stats["error_files"].extend(result["error_files"])
+                            processed += len(planned)
+                            logger.debug(
+                                f"Committed album '{scanned_album.title}' "
+                                f"({imported} tracks written)"
+                            )
 
                             # Progress callback
-                            if progress_callback and total_tracks > 0:
-                                progress = processed / total_tracks * 100
+                            if progress_callback:
+                                expected = max(expected_tracks, processed)
+                                progress = processed / expected * 100
                                 await progress_callback(progress, stats)
+                    finally:
+                        # Error mid-batch → don't leave orphaned extraction futures behind
+                        for _, _, extraction in album_plans:
+                            if extraction is not None and not extraction.done():
+                                extraction.cancel()
+
+                    # Refresh the maintained aggregates of everything this batch
+                    # touched (set-based, only these IDs - not the whole library)
+                    if dirty_album_ids or dirty_artist_ids:
+                        await refresh_library_aggregates(
+                            self._session,
+                            artist_ids=dirty_artist_ids,
+                            album_ids=dirty_album_ids,
+                        )
 
-                        except Exception as e:
-                            stats["errors"] += 1
-                            stats["error_files"].append(
-                                {"path": str(scanned_track.path), "error": str(e)}
-                            )
-                            logger.warning(
-                                f"Error importing {scanned_track.path.name}: {e}",
-                                exc_info=False,
-                            )
-                            processed += 1
+                    await self._session.commit()
+
+            scan_seconds = time.monotonic() - loop_started
+            stats["scan_duration_seconds"] = round(scan_seconds, 2)
+            stats["files_per_second"] = (
+                round(processed / scan_seconds, 1) if scan_seconds > 0 else 0.0
+            )
+            # Throughput of the extraction stage alone (time the importer WAITED on
+            # the pool, so overlap with walk + DB writes makes this an upper bound)
+            stats["extracted_files_per_second"] = (
+                round(stats["scanned"] / extract_seconds, 1)
+                if extract_seconds > 0
+                else 0.0
+            )
+
+            walk_totals = parser.walk_totals
+            logger.info(
+                f"LibraryFolderParser found: {walk_totals.total_artists} artists, "
+                f"{walk_totals.total_albums} albums, {walk_totals.total_tracks} tracks"
+            )
+            stats["total_files"] = len(seen_paths)
+            error_dirs.extend(walk_totals.error_paths)
 
-                    # LOCK OPTIMIZATION: Commit after EACH album!
-                    # This is a natural transaction boundary - all tracks for one album.
-                    # Releases SQLite lock so other workers can proceed.
+            # Stamp unchanged files in bulk (set-based, no per-row SELECT/UPDATE)
+            stats["touched_unchanged"] = await self._touch_unchanged_tracks(
+                unchanged_track_ids, legacy_fingerprints
+            )
+
+            # Removed files = known in DB but not seen on disk (exact, no estimate).
+            # Unseen files below a folder that errored are kept - the error, not a
+            # deletion, is why we didn't see them.
+            error_prefixes = tuple(os.path.join(str(d), "") for d in error_dirs)
+            missing_track_ids: list[str] = []
+            kept_paths: list[str] = []
+            for path, known in known_files.items():
+                if path in seen_paths:
+                    continue
+                if path in error_paths or path.startswith(error_prefixes):
+                    kept_paths.append(path)
+                else:
+                    missing_track_ids.append(known.track_id)
+            stats["missing_files"] = len(missing_track_ids)
+            stats["missing_files_kept"] = len(kept_paths)
+            if kept_paths:
+                logger.warning(
+                    f"Keeping {len(kept_paths)} unseen tracks below "
+                    f"{len(error_dirs) + len(error_paths)} errored folders/files"
+                )
+
+            if missing_track_ids:
+                if defer_cleanup:
+                    stats["cleanup_needed"] = True
+                    # Store file paths for cleanup job (as list for JSON serialization).
+                    # The job removes every track NOT in this list → kept paths go in too.
+                    stats["cleanup_file_paths"] = [*seen_paths, *kept_paths]
+                    logger.info(
+                        f"Cleanup deferred: {len(missing_track_ids)} tracks to remove "
+                        "(will run as separate job)"
+                    )
+                else:
+                    # Immediate cleanup (old behavior, blocks UI longer)
                     await self._session.commit()
-                    logger.debug(
-                        f"Committed album '{scanned_album.title}' "
-                        f"({len(scanned_album.tracks)} tracks)"
+                    cleanup_stats = await self._cleanup_missing_files(
+                        seen_paths, missing_track_ids=missing_track_ids
                     )
+                    stats["removed_tracks"] = cleanup_stats["removed_tracks"]
+                    stats["removed_albums"] = cleanup_stats["removed_albums"]
+                    stats["removed_artists"] = cleanup_stats["removed_artists"]
 
             # Final commit
             await self._session.commit()
@@ -400,7 +763,8 @@ class LibraryScannerService:
                 f"Library scan complete: {stats['imported']} imported, "
                 f"{stats['skipped']} skipped, {stats['errors']} errors, "
                 f"{stats['new_artists']} new artists, {stats['new_albums']} new albums, "
-                f"{stats['compilations_detected']} compilations"
+                f"{stats['compilations_detected']} compilations, "
+                f"{stats['files_per_second']} files/s"
             )
 
             # ================================================================
@@ -442,6 +806,7 @@ class LibraryScannerService:
                 new_albums=stats["new_albums"],
                 new_tracks=stats["new_tracks"],
                 compilations_detected=stats["compilations_detected"],
+                files_per_second=stats["files_per_second"],
                 cleanup_needed=stats.get("cleanup_needed", False),
             )
 
@@ -464,6 +829,9 @@ class LibraryScannerService:
                 success=False,
                 error=e,
             )
+        finally:
+            if owned_extract_pool is not None:
+                owned_extract_pool.shutdown(wait=False, cancel_futures=True)
 
         return stats
 
@@ -698,298 +1066,370 @@ class LibraryScannerService:
         is_matched = not is_new
         return album_id, is_new, is_matched
 
-    async def _import_track_from_scan(
+    async def _import_album_tracks(
         self,
-        scanned_track: ScannedTrack,
+        planned: list[_PlannedTrack],
+        audio_infos: list[_AudioInfo],
         artist_id: ArtistId,
         album_id: AlbumId,
         is_va_album: bool = False,
     ) -> dict[str, Any]:
-        """Import a track from LibraryFolderParser scan result.
+        """Import the new/changed tracks of ONE album with batched writes.
+
+        Hey future me - this replaced the old per-track _import_track_from_scan!
+        Audio info for the whole album was already extracted by the pool (see
+        _submit_audio_extraction), so here we only build rows and write them:
+        ONE multi-row INSERT for new tracks and ONE bulk UPDATE by primary key for
+        changed files, instead of a session.add() + flush per track.
 
-        Hey future me - this uses folder-based metadata (title, track_number, disc_number)
-        and calls Mutagen for audio info (duration, bitrate, genre) IN THREAD POOL!
-        This prevents blocking the event loop during I/O-heavy metadata extraction.
+        Track metadata (title, track_number, disc_number) comes from the folder
+        parser, mutagen only delivers duration/bitrate/sample_rate/genre.
 
         Args:
-            scanned_track: Track info from folder parser
+            planned: (scanned track, resolved path + stat, stored fingerprint or None)
+            audio_infos: Extraction results, same order as planned
             artist_id: Parent artist ID (from folder)
             album_id: Parent album ID (from folder)
             is_va_album: True if this is a VA compilation
 
         Returns:
-            Dict with import result
+            Dict with new_tracks/updated_tracks counts, per-file error_files and
+            artist_ids (every artist the written tracks belong to - for the
+            maintained aggregates)
         """
-        result = {"imported": False, "new_track": False}
-
-        file_path = scanned_track.path
-
-        # Hey future me - ALWAYS check if track exists FIRST to prevent duplicates!
-        # This is critical for full scan (incremental=False) which doesn't pre-filter.
-        # Without this check, full scan creates duplicate tracks in albums.
-        existing = await self._get_track_by_file_path(file_path)
-        if existing:
-            # Update last_scanned_at and return early (no duplicate!)
-            existing.last_scanned_at = datetime.now(UTC)
-            result["imported"] = True
-            return result
-
-        # For VA tracks, the actual track artist may be in the filename
-        # (e.g., "01 - Michael Jackson - Billie Jean.flac")
-        track_artist_id = artist_id
-        if is_va_album and scanned_track.artist:
-            # Get or create the actual track artist
-            track_artist_id, _ = await self._get_or_create_artist_exact(
-                scanned_track.artist
-            )
-
-        # Extract audio info and compute hash IN THREAD POOL to avoid blocking event loop
-        # Hey future me - this is the BIG PERFORMANCE WIN! Mutagen + SHA256 are CPU-bound,
-        # running them in executor keeps the event loop responsive for UI requests.
-        loop = asyncio.get_running_loop()
-        audio_info, file_hash, file_size = await loop.run_in_executor(
-            self._executor,
-            self._extract_audio_and_hash_sync,
-            file_path,
-        )
+        result: dict[str, Any] = {
+            "new_tracks": 0,
+            "updated_tracks": 0,
+            "error_files": [],
+            "artist_ids": {str(artist_id.value)},
+        }
+        now = datetime.now(UTC)
+        new_rows: list[dict[str, Any]] = []
+        updated_rows: list[dict[str, Any]] = []
+
+        for (scanned_track, file_state, existing), audio in zip(
+            planned, audio_infos, strict=True
+        ):
+            try:
+                if existing is not None:
+                    # Changed file → refresh audio info in place. The old hash is stale
+                    # now, clear it so the nightly DUPLICATE_SCAN job recomputes it.
+                    row: dict[str, Any] = {
+                        "id": existing.track_id,
+                        "duration_ms": audio.duration_ms,
+                        "file_size": file_state.size,
+                        "file_mtime": file_state.mtime,
+                        "file_hash": None,
+                        "file_hash_algorithm": None,
+                        "audio_bitrate": audio.bitrate,
+                        "audio_format": audio.format,
+                        "audio_sample_rate": audio.sample_rate,
+                        "last_scanned_at": now,
+                        "is_broken": False,
+                    }
+                    if audio.genre:
+                        row["genre"] = audio.genre
+                    updated_rows.append(row)
+                    continue
+
+                # For VA tracks, the actual track artist may be in the filename
+                # (e.g., "01 - Michael Jackson - Billie Jean.flac")
+                track_artist_id = artist_id
+                if is_va_album and scanned_track.artist:
+                    # Get or create the actual track artist
+                    track_artist_id, _ = await self._get_or_create_artist_exact(
+                        scanned_track.artist
+                    )
 
-        # Create track entity
-        track = Track(
-            id=TrackId.generate(),
-            title=scanned_track.title,  # From folder parsing!
-            artist_id=track_artist_id,
-            album_id=album_id,
-            duration_ms=audio_info.get("duration_ms", 0),
-            track_number=scanned_track.track_number,  # From folder parsing!
-            disc_number=scanned_track.disc_number,  # From folder parsing!
-            file_path=FilePath.from_string(str(file_path.resolve())),
-            genres=[audio_info["genre"]] if audio_info.get("genre") else [],
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
-        )
+                # Create track entity (validates title/track/disc numbers)
+                track = Track(
+                    id=TrackId.generate(),
+                    title=scanned_track.title,  # From folder parsing!
+                    artist_id=track_artist_id,
+                    album_id=album_id,
+                    duration_ms=audio.duration_ms,
+                    track_number=scanned_track.track_number,  # From folder parsing!
+                    disc_number=scanned_track.disc_number,  # From folder parsing!
+                    file_path=FilePath.from_string(file_state.path),
+                    genres=[audio.genre] if audio.genre else [],
+                    created_at=now,
+                    updated_at=now,
+                )
+                result["artist_ids"].add(str(track.artist_id.value))
+                new_rows.append(
+                    {
+                        "id": str(track.id.value),
+                        "title": track.title,
+                        "artist_id": str(track.artist_id.value),
+                        "album_id": str(album_id.value),
+                        "duration_ms": track.duration_ms,
+                        "track_number": track.track_number,
+                        "disc_number": track.disc_number,
+                        "file_path": str(track.file_path),
+                        "genre": audio.genre,
+                        "file_size": file_state.size,
+                        "file_mtime": file_state.mtime,
+                        # Hash is computed later by the nightly DUPLICATE_SCAN job
+                        "file_hash": None,
+                        "file_hash_algorithm": None,
+                        "audio_bitrate": audio.bitrate,
+                        "audio_format": audio.format,
+                        "audio_sample_rate": audio.sample_rate,
+                        "last_scanned_at": now,
+                        "is_broken": False,
+                        "created_at": track.created_at,
+                        "updated_at": track.updated_at,
+                    }
+                )
+            except Exception as e:
+                result["error_files"].append(
+                    {"path": str(scanned_track.path), "error": str(e)}
+                )
+                logger.warning(
+                    f"Error importing {scanned_track.path.name}: {e}", exc_info=False
+                )
 
-        # Create track model with file info
-        primary_genre = track.genres[0] if track.genres else None
-        model = TrackModel(
-            id=str(track.id.value),
-            title=track.title,
-            artist_id=str(track.artist_id.value),
-            album_id=str(track.album_id.value) if track.album_id else None,
-            duration_ms=track.duration_ms,
-            track_number=track.track_number,
-            disc_number=track.disc_number,
-            file_path=str(track.file_path) if track.file_path else None,
-            genre=primary_genre,
-            file_size=file_size,
-            file_hash=file_hash
-            if file_hash
-            else None,  # Empty = computed later by nightly job
-            file_hash_algorithm="sha256" if file_hash else None,
-            audio_bitrate=audio_info.get("bitrate"),
-            audio_format=audio_info.get("format"),
-            audio_sample_rate=audio_info.get("sample_rate"),
-            last_scanned_at=datetime.now(UTC),
-            is_broken=False,
-            created_at=track.created_at,
-            updated_at=track.updated_at,
-        )
-        self._session.add(model)
+        if new_rows:
+            await self._session.execute(insert(TrackModel), new_rows)
+        if updated_rows:
+            await self._session.execute(update(TrackModel), updated_rows)
 
-        result["imported"] = True
-        result["new_track"] = True
+        result["new_tracks"] = len(new_rows)
+        result["updated_tracks"] = len(updated_rows)
         return result
 
-    async def _filter_changed_files(self, files: list[Path]) -> list[Path]:
-        """Filter to only new or modified files (incremental scan).
+    # =========================================================================
+    # BATCHED AUDIO EXTRACTION (thread or process pool)
+    # =========================================================================
 
-        Compares file mtime with last_scanned_at in database.
+    def _create_extract_pool(self) -> tuple[Executor, int]:
+        """Create the pool for mutagen extraction according to LibraryScanSettings.
 
-        Args:
-            files: List of all audio file paths
+        Hey future me - mutagen is pure Python and holds the GIL, so threads only
+        overlap the file I/O. extract_executor="process" gives real multi-core
+        parsing; the pool lives for ONE scan and is shut down afterwards.
+        "spawn" instead of fork: the scanner runs next to the event loop and walk
+        threads, forking a multi-threaded process is asking for deadlocks.
 
         Returns:
-            List of files that are new or modified since last scan
+            (executor, worker count) - thread mode reuses self._executor
         """
-        # Get all known file paths with their last_scanned_at
-        stmt = select(TrackModel.file_path, TrackModel.last_scanned_at).where(
-            TrackModel.file_path.isnot(None)
-        )
-        result = await self._session.execute(stmt)
-        known_files = {row[0]: row[1] for row in result.all()}
+        scan_settings = self.settings.library_scan
+        workers = scan_settings.extract_workers or min(8, os.cpu_count() or 4)
+
+        if scan_settings.extract_executor == "process":
+            logger.info(f"Audio extraction: process pool with {workers} workers")
+            return (
+                ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                ),
+                workers,
+            )
+
+        if scan_settings.extract_workers:
+            return (
+                ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="library-extract"
+                ),
+                workers,
+            )
+        return self._executor, self._executor_workers
 
-        changed_files = []
-        for file_path in files:
-            # Hey future me - ALWAYS resolve to absolute path for DB comparison!
-            # DB stores absolute paths, so ./music/x.mp3 won't match /music/x.mp3
-            path_str = str(file_path.resolve())
+    def _submit_audio_extraction(
+        self, pool: Executor, workers: int, file_paths: list[str]
+    ) -> asyncio.Future[list[list[_AudioInfo]]]:
+        """Submit a whole album to the extraction pool at once.
 
-            # New file (not in DB)
-            if path_str not in known_files:
-                changed_files.append(file_path)
-                continue
+        The files are split into at most `workers` chunks (never smaller than
+        _MIN_EXTRACT_CHUNK), so one big album keeps every worker busy while a
+        small one costs a single submit. All albums of a walk batch are submitted
+        before the first one is awaited → the pool always has work queued while
+        the event loop does DB writes.
 
-            # Check if modified since last scan
-            last_scanned = known_files[path_str]
-            if last_scanned:
-                # Handle timezone-naive datetimes from SQLite
-                if last_scanned.tzinfo is None:
-                    last_scanned = last_scanned.replace(tzinfo=UTC)
-                file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime, tz=UTC)
-                if file_mtime > last_scanned:
-                    changed_files.append(file_path)
+        Returns:
+            Future resolving to the per-chunk results (flatten in order!)
+        """
+        loop = asyncio.get_running_loop()
+        chunk_size = max(_MIN_EXTRACT_CHUNK, -(-len(file_paths) // max(1, workers)))
+        return asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    pool, _extract_audio_batch, file_paths[i : i + chunk_size]
+                )
+                for i in range(0, len(file_paths), chunk_size)
+            )
+        )
 
-        return changed_files
+    # =========================================================================
+    # SET-BASED CHANGE DETECTION (incremental scan)
+    # =========================================================================
 
-    async def _count_tracks(self) -> int:
-        """Count total tracks in database.
+    def _stat_file(self, file_path: Path) -> _ScannedFileState:
+        """Resolve and stat a single file (sync, call from thread pool).
 
-        Hey future me - used for auto-detect scan mode!
-        If we have tracks, use incremental. If empty, use full scan.
+        Hey future me - DB stores RESOLVED absolute paths, so ./music/x.mp3 must
+        become /music/x.mp3 before comparing with known files!
         """
-        stmt = select(func.count(TrackModel.id))
-        result = await self._session.execute(stmt)
-        return result.scalar() or 0
+        st = os.stat(file_path)
+        return _ScannedFileState(
+            path=str(file_path.resolve()), size=st.st_size, mtime=st.st_mtime
+        )
 
-    async def _get_track_by_file_path(self, file_path: Path) -> TrackModel | None:
-        """Get track by file path.
+    def _file_state_for(self, scanned_track: ScannedTrack) -> _ScannedFileState:
+        """Build the change-detection state for a scanned track.
 
-        Hey future me - use resolved path for consistent DB lookup!
+        Hey future me - the streaming walk already took size/mtime from the
+        DirEntry and built canonical paths, so normally this is free (no stat,
+        no resolve). Only tracks whose DirEntry stat failed get stat'd again.
         """
-        stmt = select(TrackModel).where(
-            TrackModel.file_path == str(file_path.resolve())
+        if scanned_track.size is None or scanned_track.mtime is None:
+            return self._stat_file(scanned_track.path)
+        return _ScannedFileState(
+            path=str(scanned_track.path),
+            size=scanned_track.size,
+            mtime=scanned_track.mtime,
         )
-        result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
 
-    def _compute_file_hash(self, file_path: Path, chunk_size: int = 8192) -> str:
-        """Compute SHA256 hash of file for deduplication."""
-        sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(chunk_size), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+    async def _stream_album_batches(
+        self, parser: LibraryFolderParser
+    ) -> AsyncGenerator[ScannedAlbumBatch, None]:
+        """Bridge the parser's blocking batch generator onto the event loop.
 
-    def _extract_audio_and_hash_sync(
-        self, file_path: Path
-    ) -> tuple[dict[str, Any], str, int]:
-        """Extract audio info in ThreadPool (non-blocking).
-
-        Hey future me - this is called via run_in_executor() to avoid blocking
-        the event loop! Combines Mutagen extraction + file size into one call.
+        Each next() runs in the default executor, so waiting for the walk never
+        blocks the loop. Closing this generator closes the parser generator,
+        which stops its walk threads.
+        """
+        scan_settings = self.settings.library_scan
+        loop = asyncio.get_running_loop()
+        batches = parser.iter_album_batches(
+            max_workers=scan_settings.walk_workers,
+            max_pending_batches=scan_settings.walk_queue_size,
+            albums_per_batch=scan_settings.walk_albums_per_batch,
+        )
+        try:
+            while True:
+                batch = await loop.run_in_executor(None, next, batches, None)
+                if batch is None:
+                    break
+                yield batch
+        finally:
+            await loop.run_in_executor(None, batches.close)
 
-        PERFORMANCE NOTE (Dec 2025): SHA256 hash is NEVER computed during scan!
-        Hash computation reads the entire file (~55% of scan time!). Instead,
-        duplicate detection runs as a separate nightly DUPLICATE_SCAN job that
-        computes hashes for tracks without file_hash. This keeps scans fast!
+    async def _load_known_files(self) -> dict[str, _KnownTrackFile]:
+        """Load change fingerprints of ALL local tracks in one streaming query.
 
-        Args:
-            file_path: Path to audio file
+        Hey future me - this replaces the old per-file "SELECT by file_path" lookups!
+        stream() + yield_per keeps memory flat while rows are fetched, only the
+        compact _KnownTrackFile objects stay around for the in-memory diff.
 
         Returns:
-            Tuple of (audio_info dict, file_hash (always empty), file_size)
+            Dict mapping resolved file_path to its stored fingerprint
         """
-        # Extract audio info (always needed for duration, bitrate, genre)
-        audio_info = self._extract_audio_info(file_path)
-
-        # SHA256 hash is NEVER computed during scan - runs in nightly DUPLICATE_SCAN job!
-        # Hey future me - this was the BIG PERFORMANCE WIN! Scans are ~2x faster
-        # because we don't read entire files for SHA256. The nightly job handles it.
-        file_hash = ""
-        file_size = 0
-        try:
-            file_size = file_path.stat().st_size
-        except Exception as e:
-            logger.warning(f"Could not get file size for {file_path}: {e}")
+        stmt = (
+            select(
+                TrackModel.id,
+                TrackModel.file_path,
+                TrackModel.file_size,
+                TrackModel.file_mtime,
+                TrackModel.last_scanned_at,
+            )
+            .where(TrackModel.file_path.isnot(None))
+            .execution_options(yield_per=5000)
+        )
+        known: dict[str, _KnownTrackFile] = {}
+        result = await self._session.stream(stmt)
+        async for track_id, file_path, file_size, file_mtime, last_scanned in result:
+            if file_path is None:  # excluded by the WHERE, narrows the type
+                continue
+            known[file_path] = _KnownTrackFile(
+                track_id=track_id,
+                file_size=file_size,
+                file_mtime=file_mtime,
+                last_scanned_at=last_scanned,
+            )
 
-        return audio_info, file_hash, file_size
+        logger.debug(f"Loaded {len(known)} known track files for change detection")
+        return known
 
-    def _extract_audio_info(self, file_path: Path) -> dict[str, Any]:
-        """Extract ONLY audio technical info from file (NOT artist/album/title!).
+    @staticmethod
+    def _is_file_changed(known: _KnownTrackFile, state: _ScannedFileState) -> bool:
+        """Decide if a known file changed on disk since it was last scanned.
 
-        Hey future me - this is the NEW simplified extraction for Lidarr-based scanning!
-        We ONLY extract:
-        - duration_ms (from audio stream)
-        - bitrate (from audio stream)
-        - sample_rate (from audio stream)
-        - format (from file extension)
-        - genre (from ID3 tag - this is the ONLY tag we read!)
+        Size + mtime is the fingerprint (same quick check rsync uses).
+        Legacy rows without file_mtime fall back to "mtime newer than last scan".
+        """
+        if known.file_size is not None and known.file_size != state.size:
+            return True
+        if known.file_mtime is not None:
+            return known.file_mtime != state.mtime
+        if known.last_scanned_at is None:
+            return True
+        last_scanned = ensure_utc_aware(known.last_scanned_at).timestamp()
+        return state.mtime > last_scanned
+
+    async def _touch_unchanged_tracks(
+        self,
+        track_ids: list[str],
+        legacy_fingerprints: list[dict[str, Any]],
+    ) -> int:
+        """Bulk-update last_scanned_at for files that did not change.
 
-        Artist, album, title come from FOLDER STRUCTURE, not from tags!
+        Hey future me - ONE UPDATE per 500 IDs instead of dirtying 180k ORM objects
+        one by one. Legacy rows additionally get their size/mtime fingerprint
+        backfilled (executemany by primary key, happens only once per row).
 
         Args:
-            file_path: Path to audio file
+            track_ids: IDs of unchanged tracks with a stored fingerprint
+            legacy_fingerprints: [{"id", "file_size", "file_mtime"}] for legacy rows
 
         Returns:
-            Dict with audio info (duration_ms, bitrate, sample_rate, format, genre)
+            Number of tracks touched
         """
-        audio_info: dict[str, Any] = {
-            "format": file_path.suffix.lstrip(".").lower(),
-            "duration_ms": 0,
-        }
-
-        try:
-            audio = MutagenFile(file_path)
-            if audio is None:
-                return audio_info
-
-            # Duration from audio stream
-            if hasattr(audio.info, "length") and audio.info.length:
-                audio_info["duration_ms"] = int(audio.info.length * 1000)
-
-            # Bitrate from audio stream
-            if hasattr(audio.info, "bitrate") and audio.info.bitrate:
-                audio_info["bitrate"] = audio.info.bitrate
-
-            # Sample rate from audio stream
-            if hasattr(audio.info, "sample_rate") and audio.info.sample_rate:
-                audio_info["sample_rate"] = audio.info.sample_rate
-
-            # Genre is the ONLY tag we extract (not in folder structure)
-            if hasattr(audio, "tags") and audio.tags:
-                genre = self._extract_genre_tag(audio.tags)
-                if genre:
-                    audio_info["genre"] = genre
-
-            return audio_info
-
-        except Exception as e:
-            # Hey future me - some exceptions (especially from FLAC parsing) have empty str(e)!
-            # We log exception TYPE + message to actually debug these issues.
-            exc_type = type(e).__name__
-            exc_msg = str(e) if str(e) else "(no message)"
-            logger.warning(
-                f"Error extracting audio info from {file_path.name}: "
-                f"[{exc_type}] {exc_msg}"
+        now = datetime.now(UTC)
+
+        # updated_at pinned: scan bookkeeping is not a change of the track (its
+        # onupdate would otherwise mark EVERY track as changed for the incremental
+        # near-duplicate pass, same rule as library_aggregates.py)
+        for i in range(0, len(track_ids), _IN_CLAUSE_CHUNK_SIZE):
+            chunk = track_ids[i : i + _IN_CLAUSE_CHUNK_SIZE]
+            await self._session.execute(
+                update(TrackModel)
+                .where(TrackModel.id.in_(chunk))
+                .values(last_scanned_at=now, updated_at=TrackModel.updated_at)
+                .execution_options(synchronize_session=False)
             )
-            return audio_info
 
-    def _extract_genre_tag(self, tags: Any) -> str | None:
-        """Extract genre from audio tags.
+        if legacy_fingerprints:
+            for row in legacy_fingerprints:
+                row["last_scanned_at"] = now
+            await self._session.execute(
+                update(TrackModel).values(updated_at=TrackModel.updated_at),
+                legacy_fingerprints,
+            )
+            logger.info(
+                f"Backfilled size/mtime fingerprint for {len(legacy_fingerprints)} tracks"
+            )
 
-        Hey future me - genre is the ONLY tag we need from ID3/Vorbis/MP4!
-        Everything else (artist, album, title) comes from folder structure.
+        return len(track_ids) + len(legacy_fingerprints)
 
-        Args:
-            tags: Audio tags from mutagen
+    async def _count_tracks(self) -> int:
+        """Count total tracks in database.
 
-        Returns:
-            Genre string or None
+        Hey future me - used for auto-detect scan mode!
+        If we have tracks, use incremental. If empty, use full scan.
         """
-        # Genre tag mappings for different formats
-        genre_tags = ["TCON", "genre", "©gen"]
-
-        for tag_key in genre_tags:
-            if tag_key in tags:
-                value = tags[tag_key]
-                if isinstance(value, list) and value:
-                    value = value[0]
-                if hasattr(value, "text"):
-                    value = (
-                        value.text[0] if isinstance(value.text, list) else value.text
-                    )
-                if value:
-                    return str(value)
-        return None
+        stmt = select(func.count(TrackModel.id))
+        result = await self._session.execute(stmt)
+        return result.scalar() or 0
+
+    def _compute_file_hash(self, file_path: Path, chunk_size: int = 8192) -> str:
+        """Compute SHA256 hash of file for deduplication."""
+        sha256 = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                sha256.update(chunk)
+        return sha256.hexdigest()
 
     # =========================================================================
     # CACHE LOADING (for exact name matching)
@@ -1029,6 +1469,12 @@ class LibraryScannerService:
             f"{len(self._album_cache)} albums"
         )
 
+    async def _reload_caches(self) -> None:
+        """Rebuild the artist/album caches from the DB (after a rollback)."""
+        self._artist_cache.clear()
+        self._album_cache.clear()
+        await self._load_caches()
+
     # =========================================================================
     # UTILITY METHODS
     # =========================================================================
@@ -1139,37 +1585,10 @@ class LibraryScannerService:
 
         return metadata
 
-    async def _count_missing_tracks(self, existing_file_paths: set[str]) -> int:
-        """Fast check: count tracks whose files no longer exist.
-
-        Hey future me - this is a FAST pre-check for deferred cleanup!
-        Instead of loading all tracks, we just count how many would be removed.
-        Used to decide if cleanup job is needed (cleanup_needed flag).
-
-        Args:
-            existing_file_paths: Set of file paths that currently exist on disk
-
-        Returns:
-            Approximate count of tracks to remove (0 = no cleanup needed)
-        """
-        # Get count of tracks with file_path
-        total_stmt = select(func.count(TrackModel.id)).where(
-            TrackModel.file_path.isnot(None)
-        )
-        total_result = await self._session.execute(total_stmt)
-        total_in_db = total_result.scalar() or 0
-
-        # If we have more files on disk than in DB, no cleanup needed
-        # (new files will be added, not removed)
-        if len(existing_file_paths) >= total_in_db:
-            return 0
-
-        # Rough estimate: difference between DB count and file count
-        # This is faster than loading all paths and comparing
-        return total_in_db - len(existing_file_paths)
-
     async def _cleanup_missing_files(
-        self, existing_file_paths: set[str]
+        self,
+        existing_file_paths: set[str],
+        missing_track_ids: list[str] | None = None,
     ) -> dict[str, int]:
         """Remove tracks from DB whose files no longer exist on disk.
 
@@ -1178,10 +1597,12 @@ class LibraryScannerService:
         - Uses yielding pattern for large libraries (100k+ tracks)
         - Orphan cleanup uses efficient NOT EXISTS subqueries
 
-        Called during full scan (incremental=False) or by LIBRARY_SCAN_CLEANUP job.
+        Called during scan_library (defer_cleanup=False) or by LIBRARY_SCAN_CLEANUP job.
 
         Args:
             existing_file_paths: Set of file paths that currently exist on disk
+            missing_track_ids: Precomputed IDs of tracks to remove (scan_library
+                already has the exact diff) - skips the chunked path comparison
 
         Returns:
             Dict with cleanup statistics
@@ -1197,9 +1618,9 @@ class LibraryScannerService:
 
         CHUNK_SIZE = 5000  # Process in chunks to limit memory usage
         offset = 0
-        tracks_to_remove: list[str] = []
+        tracks_to_remove: list[str] = list(missing_track_ids or [])
 
-        while True:
+        while missing_track_ids is None:
             # Fetch a chunk of track file paths
             stmt = (
                 select(TrackModel.id, TrackModel.file_path)
@@ -1224,6 +1645,10 @@ class LibraryScannerService:
             if offset % (CHUNK_SIZE * 5) == 0:
                 await asyncio.sleep(0)
 
+        # Parents of the removed tracks - their maintained aggregates change
+        affected_artist_ids: set[str] = set()
+        affected_album_ids: set[str] = set()
+
         if tracks_to_remove:
             logger.info(
                 f"Removing {len(tracks_to_remove)} tracks with missing files..."
@@ -1234,6 +1659,15 @@ class LibraryScannerService:
             # This allows other workers to proceed during large cleanup operations.
             for i in range(0, len(tracks_to_remove), 500):
                 batch = tracks_to_remove[i : i + 500]
+                parents = await self._session.execute(
+                    select(TrackModel.artist_id, TrackModel.album_id).where(
+                        TrackModel.id.in_(batch)
+                    )
+                )
+                for artist_id, album_id in parents.all():
+                    affected_artist_ids.add(artist_id)
+                    if album_id:
+                        affected_album_ids.add(album_id)
                 delete_stmt = delete(TrackModel).where(TrackModel.id.in_(batch))
                 await self._session.execute(delete_stmt)
                 await self._session.commit()  # Commit each batch to release lock
@@ -1265,6 +1699,20 @@ class LibraryScannerService:
         if orphan_album_count > 0:
             logger.info(f"Removing {orphan_album_count} orphaned albums...")
 
+            # Their artists lose albums → remember them for the aggregate refresh
+            orphan_parents = await self._session.execute(
+                select(AlbumModel.artist_id)
+                .where(
+                    ~AlbumModel.id.in_(
+                        select(TrackModel.album_id)
+                        .where(TrackModel.album_id.isnot(None))
+                        .distinct()
+                    )
+                )
+                .distinct()
+            )
+            affected_artist_ids.update(row[0] for row in orphan_parents.all())
+
             # Delete orphaned albums (set-based, no Python loops!)
             delete_albums_stmt = delete(AlbumModel).where(
                 ~AlbumModel.id.in_(
@@ -1320,7 +1768,17 @@ class LibraryScannerService:
         else:
             logger.info("No orphaned artists found")
 
-        # Note: No final commit needed - each operation commits immediately
+        # Step 4: Refresh maintained aggregates of the surviving parents
+        # (deleted orphans simply match no row)
+        if affected_artist_ids or affected_album_ids:
+            await refresh_library_aggregates(
+                self._session,
+                artist_ids=affected_artist_ids,
+                album_ids=affected_album_ids,
+            )
+            await self._session.commit()
+
+        # Note: Every step commits on its own
         # (LOCK OPTIMIZATION: shorter transactions, fewer lock conflicts)
 
         logger.info(
@@ -0,0 +1,383 @@
+"""Blocked, sub-quadratic near-duplicate detection for tracks (sorted neighborhood).
+
+Hey future me - this replaces "load every track, bucket by key, compare all pairs"!
+
+The old ways both had the same two problems:
+- DuplicateDetectorWorker grouped ALL tracks in memory and scored every pair inside
+  a group - O(n²) per group, whole library in RAM
+- DeduplicationHousekeepingService bucketed duration with `duration_ms // 3000` - a
+  2.9s vs 3.1s pair lands in buckets 0 and 1 and is never compared
+
+Sorted neighborhood fixes both:
+1. BLOCK: tracks come out of the DB ordered by (block, duration_ms, id) - block is
+   artist_id (worker) or album_id (housekeeping). Different blocks never compare.
+2. WINDOW: inside a block, a sliding window keeps the tracks whose duration is within
+   `duration_tolerance_ms` of the current one. Overlapping windows instead of fixed
+   buckets - every pair closer than the tolerance meets, nothing else does.
+3. SCORE: the current track is scored against the window in ONE rapidfuzz
+   process.extract() call on normalized titles (C++, score_cutoff skips the rest).
+
+Memory = one page of rows + one window (capped at max_window), not the library.
+Pages use keyset pagination (no open cursor), so callers can write candidates
+between pages on the same session.
+
+Incremental: pass `since` (last pass watermark) and only blocks containing tracks
+with updated_at > since are read, and only pairs with at least one changed track are
+scored. Unchanged pairs were already found (and persisted) by an earlier pass.
+
+Tracks without duration (0) only meet other tracks shorter than the tolerance - we
+can't tell whether they are the same recording, so they don't match real lengths.
+"""
+
+import asyncio
+import logging
+import re
+import unicodedata
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from rapidfuzz import fuzz, process
+
+logger = logging.getLogger(__name__)
+
+# Patterns to strip from titles for normalization
+STRIP_PATTERNS = [
+    r"\s*\(.*?remaster.*?\)\s*",  # (2023 Remaster), (Remastered) etc
+    r"\s*\[.*?remaster.*?\]\s*",
+    r"\s*-\s*remaster.*$",
+    r"\s*\(.*?bonus.*?\)\s*",  # (Bonus Track)
+    r"\s*\[.*?bonus.*?\]\s*",
+    r"\s*\(.*?deluxe.*?\)\s*",  # (Deluxe Edition)
+    r"\s*\(.*?anniversary.*?\)\s*",  # (25th Anniversary Edition)
+]
+
+# Feat patterns to normalize
+FEAT_PATTERNS = [
+    (r"\s*\(feat\.?\s+", " feat. "),
+    (r"\s*\[feat\.?\s+", " feat. "),
+    (r"\s*ft\.?\s+", " feat. "),
+    (r"\s*featuring\s+", " feat. "),
+]
+
+_STRIP_RE = [re.compile(p, re.IGNORECASE) for p in STRIP_PATTERNS]
+_FEAT_RE = [(re.compile(p, re.IGNORECASE), r) for p, r in FEAT_PATTERNS]
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+# Default rows per keyset page
+DEFAULT_PAGE_SIZE = 2000
+# Hard cap on the window - a block full of same-length tracks (e.g. 500 tracks
+# without duration) must not turn back into O(n²)
+DEFAULT_MAX_WINDOW = 256
+
+
+def normalize_text(text: str | None) -> str:
+    """Normalize text for comparison.
+
+    Operations:
+    - Lowercase
+    - Unicode normalization (NFD -> ASCII)
+    - Strip "The " prefix
+    - Remove punctuation
+    - Collapse whitespace
+    """
+    if not text:
+        return ""
+
+    text = text.lower()
+    # Unicode normalization (é -> e, etc)
+    text = unicodedata.normalize("NFD", text)
+    text = text.encode("ascii", "ignore").decode("ascii")
+    if text.startswith("the "):
+        text = text[4:]
+    text = _PUNCTUATION_RE.sub("", text)
+    return " ".join(text.split())
+
+
+def normalize_title(title: str | None) -> str:
+    """Normalize a track title: strip remaster/bonus/deluxe suffixes, unify feat."""
+    if not title:
+        return ""
+    for pattern in _STRIP_RE:
+        title = pattern.sub("", title)
+    for pattern, replacement in _FEAT_RE:
+        title = pattern.sub(replacement, title)
+    return normalize_text(title)
+
+
+@dataclass(frozen=True, slots=True)
+class NearDuplicateTrack:
+    """One track as the engine sees it - just enough to block, window and score."""
+
+    track_id: str
+    block: str
+    title_key: str  # normalized title
+    duration_ms: int
+    changed: bool = True  # updated since the last pass
+
+
+@dataclass(frozen=True, slots=True)
+class NearDuplicatePair:
+    """Two tracks in the same block, within tolerance, with similar titles."""
+
+    track_id_1: str  # always the smaller ID (matches duplicate_candidates ordering)
+    track_id_2: str
+    title_score: float  # 0-100 rapidfuzz score of the normalized titles
+    duration_diff_ms: int
+
+    @property
+    def similarity(self) -> float:
+        """Similarity 0.0-1.0: same block 0.4 + title 0.4 + duration 0.2.
+
+        Same weights as the old worker formula; the block (artist) always matches
+        here, the title part is scaled by the fuzzy score instead of all-or-nothing.
+        """
+        score = 0.4 + 0.4 * self.title_score / 100
+        if self.duration_diff_ms < 5000:
+            score += 0.2
+        elif self.duration_diff_ms < 10000:
+            score += 0.1
+        return round(score, 4)
+
+
+class SortedNeighborhood:
+    """The window walk over tracks sorted by (block, duration_ms).
+
+    Pure + synchronous, so the same code serves the DB-streaming engine and
+    in-memory callers. Feed tracks in sort order, get the pairs each one closes.
+    """
+
+    def __init__(
+        self,
+        duration_tolerance_ms: int = 5000,
+        title_threshold: float = 90.0,
+        max_window: int = DEFAULT_MAX_WINDOW,
+    ) -> None:
+        """
+        Initialize the window.
+
+        Args:
+            duration_tolerance_ms: Max duration difference of a pair (inclusive)
+            title_threshold: Min rapidfuzz token_sort_ratio of the normalized
+                titles (100 = exact key match, no fuzzy call at all)
+            max_window: Max tracks kept in the window (oldest dropped first)
+        """
+        self._tolerance = duration_tolerance_ms
+        self._threshold = title_threshold
+        self._window: deque[NearDuplicateTrack] = deque(maxlen=max_window)
+        self._block: str | None = None
+        self.tracks_seen = 0
+        self.comparisons = 0
+
+    def feed(self, track: NearDuplicateTrack) -> list[NearDuplicatePair]:
+        """Add the next track (in sort order) and return its pairs with the window."""
+        self.tracks_seen += 1
+        window = self._window
+        if track.block != self._block:
+            window.clear()
+            self._block = track.block
+        while window and track.duration_ms - window[0].duration_ms > self._tolerance:
+            window.popleft()
+
+        # Incremental: two unchanged tracks were already compared by an earlier pass
+        others = [w for w in window if track.changed or w.changed]
+        window.append(track)
+        if not others or not track.title_key:
+            return []
+
+        self.comparisons += len(others)
+        if self._threshold >= 100:
+            matches = [
+                (100.0, i)
+                for i, other in enumerate(others)
+                if other.title_key == track.title_key
+            ]
+        else:
+            matches = [
+                (score, i)
+                for _key, score, i in process.extract(
+                    track.title_key,
+                    [other.title_key for other in others],
+                    scorer=fuzz.token_sort_ratio,
+                    score_cutoff=self._threshold,
+                    limit=None,
+                )
+            ]
+
+        pairs = []
+        for score, i in matches:
+            other = others[i]
+            id_1, id_2 = sorted((track.track_id, other.track_id))
+            pairs.append(
+                NearDuplicatePair(
+                    track_id_1=id_1,
+                    track_id_2=id_2,
+                    title_score=float(score),
+                    duration_diff_ms=track.duration_ms - other.duration_ms,
+                )
+            )
+        return pairs
+
+    def feed_many(
+        self, tracks: Iterable[NearDuplicateTrack]
+    ) -> list[NearDuplicatePair]:
+        """feed() for a whole page."""
+        pairs: list[NearDuplicatePair] = []
+        for track in tracks:
+            pairs.extend(self.feed(track))
+        return pairs
+
+
+def group_pairs(pairs: Iterable[NearDuplicatePair]) -> list[list[str]]:
+    """Connected components of the pair graph (union-find), each sorted by ID.
+
+    A~B and B~C become one group [A, B, C] - same as the old bucket semantics.
+    """
+    parent: dict[str, str] = {}
+
+    def find(node: str) -> str:
+        root = parent.setdefault(node, node)
+        while root != parent[root]:
+            root = parent[root]
+        while parent[node] != root:  # path compression
+            parent[node], node = root, parent[node]
+        return root
+
+    for pair in pairs:
+        root_1, root_2 = find(pair.track_id_1), find(pair.track_id_2)
+        if root_1 != root_2:
+            parent[max(root_1, root_2)] = min(root_1, root_2)
+
+    groups: dict[str, list[str]] = {}
+    for node in parent:
+        groups.setdefault(find(node), []).append(node)
+    return [sorted(members) for members in groups.values()]
+
+
+class NearDuplicateEngine:
+    """Streams tracks from the DB through a SortedNeighborhood.
+
+    Usage:
+        engine = NearDuplicateEngine(session, block_by="artist")
+        async for pairs in engine.iter_pairs(since=last_pass):
+            ...  # persist, then the next page is read
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        block_by: str = "artist",
+        duration_tolerance_ms: int = 5000,
+        title_threshold: float = 90.0,
+        normalize: Callable[[str | None], str] = normalize_title,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_window: int = DEFAULT_MAX_WINDOW,
+    ) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            session: Async DB session
+            block_by: "artist" (artist_id) or "album" (album_id, tracks without
+                album are skipped)
+            duration_tolerance_ms: Max duration difference of a pair
+            title_threshold: Min fuzzy title score (100 = exact normalized match)
+            normalize: Title -> comparison key
+            page_size: Rows per keyset page
+            max_window: Window cap, see SortedNeighborhood
+        """
+        if block_by not in ("artist", "album"):
+            raise ValueError(f"block_by must be 'artist' or 'album', got {block_by!r}")
+        self._session = session
+        self._block_by = block_by
+        self._normalize = normalize
+        self._page_size = page_size
+        self.neighborhood = SortedNeighborhood(
+            duration_tolerance_ms=duration_tolerance_ms,
+            title_threshold=title_threshold,
+            max_window=max_window,
+        )
+
+    async def iter_pairs(
+        self, since: datetime | None = None
+    ) -> AsyncIterator[list[NearDuplicatePair]]:
+        """Yield the candidate pairs page by page.
+
+        Args:
+            since: Only consider blocks with tracks updated after this (None = all)
+
+        Yields:
+            Pairs closed by each page (may be empty lists)
+        """
+        from sqlalchemy import literal, select, tuple_
+
+        from soulspot.infrastructure.persistence.models import TrackModel
+
+        block_column = (
+            TrackModel.artist_id if self._block_by == "artist" else TrackModel.album_id
+        )
+        # "changed" is decided in SQL - updated_at is stored naive, since is aware
+        changed = (
+            (TrackModel.updated_at > since).label("changed")
+            if since is not None
+            else literal(True).label("changed")
+        )
+        base = select(
+            block_column,
+            TrackModel.duration_ms,
+            TrackModel.id,
+            TrackModel.title,
+            changed,
+        ).where(block_column.isnot(None))
+        if since is not None:
+            changed_blocks = (
+                select(block_column).where(TrackModel.updated_at > since).distinct()
+            )
+            base = base.where(block_column.in_(changed_blocks))
+
+        # Keyset pagination over (block, duration, id) - no OFFSET, no open cursor
+        last_key: tuple[str, int, str] | None = None
+        while True:
+            stmt = base
+            if last_key is not None:
+                stmt = stmt.where(
+                    tuple_(block_column, TrackModel.duration_ms, TrackModel.id)
+                    > tuple_(*last_key)
+                )
+            stmt = stmt.order_by(
+                block_column, TrackModel.duration_ms, TrackModel.id
+            ).limit(self._page_size)
+            rows = (await self._session.execute(stmt)).all()
+            if not rows:
+                return
+
+            tracks = [
+                NearDuplicateTrack(
+                    track_id=str(track_id),
+                    block=str(block),
+                    title_key=self._normalize(title),
+                    duration_ms=duration_ms or 0,
+                    changed=bool(is_changed),
+                )
+                for block, duration_ms, track_id, title, is_changed in rows
+            ]
+            # rapidfuzz releases the GIL - keep the event loop free meanwhile
+            yield await asyncio.to_thread(self.neighborhood.feed_many, tracks)
+
+            if len(rows) < self._page_size:
+                return
+            block, duration_ms, track_id = rows[-1][:3]
+            last_key = (block, duration_ms, track_id)
+
+
+__all__ = [
+    "NearDuplicateEngine",
+    "NearDuplicatePair",
+    "NearDuplicateTrack",
+    "SortedNeighborhood",
+    "group_pairs",
+    "normalize_text",
+    "normalize_title",
+]
@@ -0,0 +1,144 @@
+"""Bounded in-memory cache for album artwork bytes.
+
+Hey future me - this is why a 20-track album downloads its cover ONCE, not 20 times!
+
+Before: PostProcessingPipeline called MetadataService.download_artwork() per track.
+Every track of an album = same HTTP download + same PIL resize/JPEG re-encode.
+
+Now the processed JPEG bytes are cached per album:
+- Key = album ID (tracks without album use their own track ID → no sharing)
+- Concurrent misses for the same key are coalesced (SingleFlight) - auto-import
+  processes several files at once, they'd all miss at the same moment otherwise
+- Bounded by entries AND bytes (a 1200px JPEG is ~200-500 KB), LRU eviction
+- "No artwork found" is cached too, but only for NEGATIVE_TTL_SECONDS - the next
+  album batch (or a provider that was down) gets another chance
+
+Memory only - the embedded cover lives in the files anyway.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from soulspot.infrastructure.integrations.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+NEGATIVE_TTL_SECONDS = 600
+
+
+@dataclass
+class ArtworkCacheStats:
+    """Counters of the artwork cache."""
+
+    hits: int = 0
+    misses: int = 0  # = actual artwork downloads
+    coalesced: int = 0  # misses that piggybacked on an in-flight download
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups that didn't need their own download (0.0-1.0)."""
+        total = self.hits + self.misses + self.coalesced
+        return (self.hits + self.coalesced) / total if total else 0.0
+
+
+class AlbumArtworkCache:
+    """LRU cache of processed artwork bytes, keyed by album."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Max number of cached albums
+            max_bytes: Max total size of cached artwork
+        """
+        self._max_entries = max(1, max_entries)
+        self._max_bytes = max_bytes
+        # key -> (artwork bytes or None, stored at monotonic)
+        self._entries: OrderedDict[str, tuple[bytes | None, float]] = OrderedDict()
+        self._bytes = 0
+        self._flight: SingleFlight[bytes | None] = SingleFlight("artwork")
+        self._hits = 0
+        self._misses = 0
+
+    async def get_or_fetch(
+        self, key: str, fetch: Callable[[], Awaitable[bytes | None]]
+    ) -> bytes | None:
+        """Cached artwork of key, or fetch it (once, even for concurrent callers).
+
+        Args:
+            key: Album key (see album_key())
+            fetch: Downloads + processes the artwork
+
+        Returns:
+            Artwork bytes or None if the album has no artwork
+        """
+        cached = self._entries.get(key)
+        if cached is not None:
+            data, stored_at = cached
+            if data is not None or time.monotonic() - stored_at < NEGATIVE_TTL_SECONDS:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return data
+            self._remove(key)
+
+        async def fetch_and_store() -> bytes | None:
+            self._misses += 1
+            data = await fetch()
+            self._store(key, data)
+            return data
+
+        return await self._flight.do(key, fetch_and_store)
+
+    def _store(self, key: str, data: bytes | None) -> None:
+        """Insert an entry and evict least recently used ones over the limits."""
+        if data is not None and len(data) > self._max_bytes:
+            return  # would evict everything else
+        self._remove(key)
+        self._entries[key] = (data, time.monotonic())
+        self._bytes += len(data) if data else 0
+        while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry[0]:
+            self._bytes -= len(entry[0])
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def get_stats(self) -> ArtworkCacheStats:
+        """Get a snapshot of the cache counters."""
+        return ArtworkCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            coalesced=self._flight.get_stats().coalesced,
+            entries=len(self._entries),
+            bytes=self._bytes,
+        )
+
+
+def album_key(album_id: str | None, track_id: str) -> str:
+    """Cache key: the album, or the track itself for tracks without album."""
+    return f"album:{album_id}" if album_id else f"track:{track_id}"
+
+
+__all__ = [
+    "AlbumArtworkCache",
+    "ArtworkCacheStats",
+    "album_key",
+]
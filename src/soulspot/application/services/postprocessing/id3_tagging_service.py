@@ -1,5 +1,6 @@
 """ID3 tagging service using mutagen."""
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Any
@@ -106,6 +107,32 @@ class ID3TaggingService:
             logger.warning("ID3 tagging only supports MP3 files: %s", file_path)
             return
 
+        # Hey future me - mutagen is blocking file I/O (read + rewrite of the whole
+        # tag, with artwork). In a thread the event loop keeps going, and album mode
+        # can write several files at once.
+        await asyncio.to_thread(
+            self._write_tags_sync, file_path, track, artist, album, artwork_data, lyrics
+        )
+
+    def _write_tags_sync(
+        self,
+        file_path: Path,
+        track: Track,
+        artist: Artist,
+        album: Album | None,
+        artwork_data: bytes | None,
+        lyrics: str | None,
+    ) -> None:
+        """Write the tags (blocking - runs in a worker thread).
+
+        Args:
+            file_path: Validated path to an MP3 file
+            track: Track entity
+            artist: Artist entity
+            album: Optional album entity
+            artwork_data: Optional artwork image data
+            lyrics: Optional lyrics text
+        """
         # Hey future me: The two-pass approach - EasyID3 for simple tags, then full ID3 for complex stuff
         # WHY two passes? EasyID3 is user-friendly but limited (no artwork, lyrics, custom frames)
         # WHY MP3(file_path, ID3=ID3)? This loads the file WITH ID3 support for advanced tags
@@ -0,0 +1,318 @@
+"""Persistent lyrics cache with per-provider negative entries.
+
+Hey future me - this is why re-tagging an album doesn't hammer LRCLIB/Genius/Musixmatch!
+
+Before: every fetch_lyrics() walked the whole provider chain. Re-processing a track,
+re-tagging an album or importing a duplicate download = the same requests again,
+including the slow misses on providers that never had the song.
+
+Now every provider answer is remembered (lyrics_cache table + in-memory LRU front):
+- Hit: synced AND plain lyrics, kept forever (lyrics don't change)
+- Miss: "provider X doesn't have it", per provider, expires after the negative TTL
+  (providers add songs; we want to ask again some day, not every time)
+- Errors (timeouts, 5xx, 429) are NOT cached - that's not an answer
+
+Keys:
+- cache_key = normalized artist | normalized title | duration bucket (5s)
+  The bucket keeps radio edit (3:50) and album version (5:55) apart, like LRCLIB's
+  own duration matching does.
+- isrc: a hit stored under another spelling of artist/title is found via the ISRC.
+  Only hits - a miss for "Song (Remastered)" says nothing about "Song".
+
+The memory front makes repeat lookups dict lookups; the DB is only asked for keys
+not seen since startup. Without session_scope it's memory-only.
+"""
+
+import logging
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_LRCLIB = "lrclib"
+PROVIDER_GENIUS = "genius"
+PROVIDER_MUSIXMATCH = "musixmatch"
+# Preference when several providers have lyrics (LRCLIB has synced ones)
+PROVIDER_ORDER = (PROVIDER_LRCLIB, PROVIDER_GENIUS, PROVIDER_MUSIXMATCH)
+
+DURATION_BUCKET_MS = 5000
+DEFAULT_NEGATIVE_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MEMORY_ENTRIES = 5000
+
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+
+
+def _normalize(text: str | None) -> str:
+    """Casefold, strip accents and punctuation - but keep non-latin scripts!
+
+    Hey future me - NOT near_duplicates.normalize_text(): that one drops everything
+    non-ASCII, all Japanese titles of an artist would share one key.
+    """
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    text = _NON_WORD_RE.sub(" ", text.casefold())
+    return " ".join(text.split())
+
+
+def lyrics_cache_key(artist: str | None, title: str, duration_ms: int | None) -> str:
+    """Cache key of a lyrics lookup.
+
+    Args:
+        artist: Artist name
+        title: Track title
+        duration_ms: Track duration (0/None = unknown, own bucket)
+
+    Returns:
+        "artist|title|bucket"
+    """
+    bucket = (duration_ms or 0) // DURATION_BUCKET_MS
+    return f"{_normalize(artist)}|{_normalize(title)}|{bucket}"[:512]
+
+
+@dataclass(frozen=True, slots=True)
+class CachedLyrics:
+    """Lyrics one provider returned."""
+
+    provider: str
+    synced: str | None = None
+    plain: str | None = None
+
+    @property
+    def best(self) -> tuple[str | None, bool]:
+        """(lyrics, is_synced) - synced preferred, like LyricsService returns them."""
+        if self.synced:
+            return self.synced, True
+        return self.plain, False
+
+
+@dataclass(frozen=True, slots=True)
+class LyricsLookup:
+    """What the cache knows about one track."""
+
+    lyrics: CachedLyrics | None = None
+    known_misses: frozenset[str] = field(default_factory=frozenset)
+
+
+@dataclass(slots=True)
+class _Entry:
+    found: bool
+    synced: str | None = None
+    plain: str | None = None
+    expires_at: float | None = None  # time.time(), misses only
+
+
+class LyricsCache:
+    """Lyrics cache: in-memory LRU in front of the lyrics_cache table."""
+
+    def __init__(
+        self,
+        session_scope: Callable[[], Any] | None = None,
+        negative_ttl_seconds: int = DEFAULT_NEGATIVE_TTL_SECONDS,
+        max_memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            session_scope: Async context manager factory for DB sessions
+                (e.g. Database.session_scope) - None = memory only
+            negative_ttl_seconds: How long "provider doesn't have it" is trusted
+            max_memory_entries: Keys kept in the in-memory front
+        """
+        self._session_scope = session_scope
+        self._negative_ttl = negative_ttl_seconds
+        self._max_memory_entries = max(1, max_memory_entries)
+        # cache_key -> provider -> entry ({} = we asked the DB, nothing there)
+        self._memory: OrderedDict[str, dict[str, _Entry]] = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "skipped_providers": 0, "db_errors": 0}
+
+    async def lookup(self, cache_key: str, isrc: str | None = None) -> LyricsLookup:
+        """Cached lyrics and known provider misses of a track.
+
+        Args:
+            cache_key: See lyrics_cache_key()
+            isrc: Track ISRC (finds hits stored under another key)
+
+        Returns:
+            Cached lyrics (if any provider had them) + providers to skip
+        """
+        entries = self._memory.get(cache_key)
+        if entries is None:
+            entries = await self._load(cache_key, isrc)
+            self._remember(cache_key, entries)
+        else:
+            self._memory.move_to_end(cache_key)
+
+        for provider in sorted(entries, key=_provider_rank):
+            entry = entries[provider]
+            if entry.found and (entry.synced or entry.plain):
+                self._stats["hits"] += 1
+                return LyricsLookup(
+                    lyrics=CachedLyrics(provider, entry.synced, entry.plain)
+                )
+
+        now = time.time()
+        misses = frozenset(
+            provider
+            for provider, entry in entries.items()
+            if not entry.found
+            and entry.expires_at is not None
+            and entry.expires_at > now
+        )
+        self._stats["misses"] += 1
+        self._stats["skipped_providers"] += len(misses)
+        return LyricsLookup(known_misses=misses)
+
+    async def store_hit(
+        self,
+        cache_key: str,
+        provider: str,
+        synced: str | None,
+        plain: str | None,
+        isrc: str | None = None,
+    ) -> None:
+        """Remember lyrics a provider returned."""
+        await self._store(cache_key, provider, _Entry(True, synced, plain), isrc)
+
+    async def store_miss(
+        self, cache_key: str, provider: str, isrc: str | None = None
+    ) -> None:
+        """Remember that a provider has no lyrics for this track (for the TTL)."""
+        entry = _Entry(False, expires_at=time.time() + self._negative_ttl)
+        await self._store(cache_key, provider, entry, isrc)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Cache counters (memory entries, hits, misses, skipped provider calls)."""
+        return {"memory_entries": len(self._memory), **self._stats}
+
+    def _remember(self, cache_key: str, entries: dict[str, _Entry]) -> None:
+        self._memory[cache_key] = entries
+        self._memory.move_to_end(cache_key)
+        while len(self._memory) > self._max_memory_entries:
+            self._memory.popitem(last=False)
+
+    async def _store(
+        self, cache_key: str, provider: str, entry: _Entry, isrc: str | None
+    ) -> None:
+        entries = self._memory.get(cache_key)
+        if entries is None:
+            entries = {}
+            self._remember(cache_key, entries)
+        entries[provider] = entry
+
+        if self._session_scope is None:
+            return
+
+        from soulspot.infrastructure.persistence.models import LyricsCacheModel
+
+        # Hey - a failing cache write must never fail the lyrics step itself
+        try:
+            async with self._session_scope() as session:
+                await session.merge(
+                    LyricsCacheModel(
+                        cache_key=cache_key,
+                        provider=provider,
+                        isrc=isrc.upper() if isrc else None,
+                        found=entry.found,
+                        synced_lyrics=entry.synced,
+                        plain_lyrics=entry.plain,
+                        fetched_at=datetime.now(UTC),
+                        expires_at=(
+                            datetime.fromtimestamp(entry.expires_at, UTC)
+                            if entry.expires_at is not None
+                            else None
+                        ),
+                    )
+                )
+                await session.commit()
+        except Exception as e:
+            self._stats["db_errors"] += 1
+            logger.warning("Could not persist lyrics cache entry: %s", e)
+
+    async def _load(self, cache_key: str, isrc: str | None) -> dict[str, _Entry]:
+        """Rows of this key + hits with the same ISRC (any key)."""
+        if self._session_scope is None:
+            return {}
+
+        from sqlalchemy import and_, or_, select
+
+        from soulspot.infrastructure.persistence.models import LyricsCacheModel
+
+        condition = LyricsCacheModel.cache_key == cache_key
+        if isrc:
+            condition = or_(
+                condition,
+                and_(
+                    LyricsCacheModel.isrc == isrc.upper(),
+                    LyricsCacheModel.found.is_(True),
+                ),
+            )
+
+        # Plain columns, not entities - session_scope commits (= expires) on exit
+        stmt = select(
+            LyricsCacheModel.cache_key,
+            LyricsCacheModel.provider,
+            LyricsCacheModel.found,
+            LyricsCacheModel.synced_lyrics,
+            LyricsCacheModel.plain_lyrics,
+            LyricsCacheModel.expires_at,
+        ).where(condition)
+
+        entries: dict[str, _Entry] = {}
+        try:
+            async with self._session_scope() as session:
+                rows = (await session.execute(stmt)).all()
+        except Exception as e:
+            self._stats["db_errors"] += 1
+            logger.warning("Could not read lyrics cache: %s", e)
+            return entries
+
+        # Own key first; an ISRC hit only replaces this key's own MISS
+        for _key, provider, found, synced, plain, expires_at in sorted(
+            rows, key=lambda r: r[0] != cache_key
+        ):
+            existing = entries.get(provider)
+            if existing is not None and (existing.found or not found):
+                continue
+            entries[provider] = _Entry(
+                found=found,
+                synced=synced,
+                plain=plain,
+                expires_at=_timestamp(expires_at),
+            )
+        return entries
+
+
+def _provider_rank(provider: str) -> int:
+    try:
+        return PROVIDER_ORDER.index(provider)
+    except ValueError:
+        return len(PROVIDER_ORDER)
+
+
+def _timestamp(value: datetime | None) -> float | None:
+    """DB datetime -> time.time() (SQLite hands back naive datetimes = UTC)."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+__all__ = [
+    "PROVIDER_GENIUS",
+    "PROVIDER_LRCLIB",
+    "PROVIDER_MUSIXMATCH",
+    "CachedLyrics",
+    "LyricsCache",
+    "LyricsLookup",
+    "lyrics_cache_key",
+]
@@ -3,6 +3,13 @@
 import logging
 from typing import Any
 
+from soulspot.application.services.postprocessing.lyrics_cache import (
+    PROVIDER_GENIUS,
+    PROVIDER_LRCLIB,
+    PROVIDER_MUSIXMATCH,
+    LyricsCache,
+    lyrics_cache_key,
+)
 from soulspot.config import Settings
 from soulspot.domain.entities import Track
 
@@ -16,6 +23,10 @@ class LyricsService:
     1. LRClib (primary - has synced lyrics)
     2. Genius (secondary - comprehensive database)
     3. Musixmatch (fallback - large database)
+
+    Every provider answer goes through LyricsCache: known lyrics come back without
+    any request, providers known to NOT have the song are skipped until the
+    negative entry expires.
     """
 
     # API endpoints
@@ -28,6 +39,7 @@ class LyricsService:
         settings: Settings,
         genius_api_key: str | None = None,
         musixmatch_api_key: str | None = None,
+        lyrics_cache: LyricsCache | None = None,
     ) -> None:
         """Initialize lyrics service.
 
@@ -35,10 +47,19 @@ class LyricsService:
             settings: Application settings
             genius_api_key: Optional Genius API key
             musixmatch_api_key: Optional Musixmatch API key
+            lyrics_cache: Lyrics cache (default: memory-only)
         """
         self._settings = settings
         self._genius_api_key = genius_api_key
         self._musixmatch_api_key = musixmatch_api_key
+        self._cache = (
+            lyrics_cache
+            if lyrics_cache is not None
+            else LyricsCache(
+                negative_ttl_seconds=settings.postprocessing.lyrics_negative_ttl_hours
+                * 3600
+            )
+        )
 
     # Hey future me: Lyrics fetching - the three-source fallback chain
     # WHY LRClib first? It has SYNCED lyrics (LRC format with timestamps) for karaoke/display
@@ -64,30 +85,68 @@ class LyricsService:
             Tuple of (lyrics text, is_synced)
             Returns (None, False) if no lyrics found
         """
+        cache_key = lyrics_cache_key(artist_name, track.title, track.duration_ms)
+        cached = await self._cache.lookup(cache_key, track.isrc)
+        if cached.lyrics:
+            logger.debug(
+                "Lyrics cache hit (%s) for: %s - %s",
+                cached.lyrics.provider,
+                artist_name,
+                track.title,
+            )
+            return cached.lyrics.best
+
+        # Hey future me - a provider returning None = "doesn't have it" (cached as
+        # miss), a provider RAISING = error (not cached, asked again next time).
         # Try LRClib first (has synced lyrics)
-        logger.info("Trying LRClib for: %s - %s", artist_name, track.title)
-        lyrics, is_synced = await self._fetch_from_lrclib(
-            artist_name, track.title, album_name, track.duration_ms
-        )
-        if lyrics:
-            logger.info("Found lyrics on LRClib (synced: %s)", is_synced)
-            return lyrics, is_synced
+        if PROVIDER_LRCLIB not in cached.known_misses:
+            logger.info("Trying LRClib for: %s - %s", artist_name, track.title)
+            try:
+                synced, plain = await self._fetch_from_lrclib(
+                    artist_name, track.title, album_name, track.duration_ms
+                )
+            except Exception as e:
+                logger.warning("Error fetching from LRClib: %s", e)
+            else:
+                if synced or plain:
+                    await self._cache.store_hit(
+                        cache_key, PROVIDER_LRCLIB, synced, plain, track.isrc
+                    )
+                    logger.info("Found lyrics on LRClib (synced: %s)", bool(synced))
+                    return (synced, True) if synced else (plain, False)
+                await self._cache.store_miss(cache_key, PROVIDER_LRCLIB, track.isrc)
 
         # Try Genius as fallback
-        if self._genius_api_key:
+        if self._genius_api_key and PROVIDER_GENIUS not in cached.known_misses:
             logger.info("Trying Genius for: %s - %s", artist_name, track.title)
-            lyrics = await self._fetch_from_genius(artist_name, track.title)
-            if lyrics:
-                logger.info("Found lyrics on Genius")
-                return lyrics, False
+            try:
+                lyrics = await self._fetch_from_genius(artist_name, track.title)
+            except Exception as e:
+                logger.exception("Error fetching lyrics from Genius: %s", e)
+            else:
+                if lyrics:
+                    await self._cache.store_hit(
+                        cache_key, PROVIDER_GENIUS, None, lyrics, track.isrc
+                    )
+                    logger.info("Found lyrics on Genius")
+                    return lyrics, False
+                await self._cache.store_miss(cache_key, PROVIDER_GENIUS, track.isrc)
 
         # Try Musixmatch as last resort
-        if self._musixmatch_api_key:
+        if self._musixmatch_api_key and PROVIDER_MUSIXMATCH not in cached.known_misses:
             logger.info("Trying Musixmatch for: %s - %s", artist_name, track.title)
-            lyrics = await self._fetch_from_musixmatch(artist_name, track.title)
-            if lyrics:
-                logger.info("Found lyrics on Musixmatch")
-                return lyrics, False
+            try:
+                lyrics = await self._fetch_from_musixmatch(artist_name, track.title)
+            except Exception as e:
+                logger.exception("Error fetching lyrics from Musixmatch: %s", e)
+            else:
+                if lyrics:
+                    await self._cache.store_hit(
+                        cache_key, PROVIDER_MUSIXMATCH, None, lyrics, track.isrc
+                    )
+                    logger.info("Found lyrics on Musixmatch")
+                    return lyrics, False
+                await self._cache.store_miss(cache_key, PROVIDER_MUSIXMATCH, track.isrc)
 
         logger.warning("No lyrics found for: %s - %s", artist_name, track.title)
         return None, False
@@ -102,7 +161,7 @@ class LyricsService:
         title: str,
         album: str | None,
         duration_ms: int,
-    ) -> tuple[str | None, bool]:
+    ) -> tuple[str | None, str | None]:
         """Fetch lyrics from LRClib.
 
         Args:
@@ -112,7 +171,10 @@ class LyricsService:
             duration_ms: Track duration in milliseconds
 
         Returns:
-            Tuple of (lyrics, is_synced)
+            Tuple of (synced lyrics, plain lyrics) - both None if LRClib has none
+
+        Raises:
+            Exception: On request errors other than 404 (not cacheable)
         """
         try:
             params: dict[str, Any] = {
@@ -138,24 +200,16 @@ class LyricsService:
             response.raise_for_status()
             data = response.json()
 
-            # LRClib returns synced lyrics (LRC format) and plain lyrics
-            synced_lyrics = data.get("syncedLyrics")
-            plain_lyrics = data.get("plainLyrics")
-
-            if synced_lyrics:
-                return synced_lyrics, True
-            elif plain_lyrics:
-                return plain_lyrics, False
-
-            return None, False
+            # LRClib returns synced lyrics (LRC format) and plain lyrics - we keep
+            # both (the cache stores both, the caller prefers synced)
+            return data.get("syncedLyrics") or None, data.get("plainLyrics") or None
 
         except Exception as e:
             # Check for 404 (no lyrics found) vs other errors
             if hasattr(e, "response") and e.response.status_code == 404:
                 logger.debug("No lyrics found on LRClib")
-            else:
-                logger.warning("Error fetching from LRClib: %s", e)
-            return None, False
+                return None, None
+            raise
 
     async def _fetch_from_genius(
         self,
@@ -174,39 +228,37 @@ class LyricsService:
 
         Returns:
             Lyrics text or None
+
+        Raises:
+            Exception: On request errors (not cacheable)
         """
         if not self._genius_api_key:
             return None
 
-        try:
-            # Search for song using shared HTTP pool
-            from soulspot.infrastructure.integrations.http_pool import HttpClientPool
+        # Search for song using shared HTTP pool
+        from soulspot.infrastructure.integrations.http_pool import HttpClientPool
 
-            search_query = f"{artist} {title}"
-            headers = {"Authorization": f"Bearer {self._genius_api_key}"}
+        search_query = f"{artist} {title}"
+        headers = {"Authorization": f"Bearer {self._genius_api_key}"}
 
-            client = await HttpClientPool.get_client()
-            response = await client.get(
-                f"{self.GENIUS_API_BASE}/search",
-                params={"q": search_query},
-                headers=headers,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # Get first hit
-            hits = data.get("response", {}).get("hits", [])
-            if not hits:
-                return None
+        client = await HttpClientPool.get_client()
+        response = await client.get(
+            f"{self.GENIUS_API_BASE}/search",
+            params={"q": search_query},
+            headers=headers,
+        )
+        response.raise_for_status()
+        data = response.json()
 
-            # Note: We would need to scrape the lyrics URL here
-            # For now, just return None to indicate not implemented
-            logger.debug("Genius API integration requires web scraping")
+        # Get first hit
+        hits = data.get("response", {}).get("hits", [])
+        if not hits:
             return None
 
-        except Exception as e:
-            logger.exception("Error fetching lyrics from Genius: %s", e)
-            return None
+        # Note: We would need to scrape the lyrics URL here
+        # For now, just return None to indicate not implemented
+        logger.debug("Genius API integration requires web scraping")
+        return None
 
     async def _fetch_from_musixmatch(
         self,
@@ -221,60 +273,58 @@ class LyricsService:
 
         Returns:
             Lyrics text or None
+
+        Raises:
+            Exception: On request errors (not cacheable)
         """
         if not self._musixmatch_api_key:
             return None
 
-        try:
-            # Search for track using shared HTTP pool
-            from soulspot.infrastructure.integrations.http_pool import HttpClientPool
-
-            params: dict[str, str | int] = {
-                "apikey": self._musixmatch_api_key,
-                "q_artist": artist,
-                "q_track": title,
-                "f_has_lyrics": 1,
-            }
-
-            client = await HttpClientPool.get_client()
-            # First, search for the track
-            response = await client.get(
-                f"{self.MUSIXMATCH_API_BASE}/track.search",
-                params=params,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            track_list = data.get("message", {}).get("body", {}).get("track_list", [])
-            if not track_list:
-                return None
+        # Search for track using shared HTTP pool
+        from soulspot.infrastructure.integrations.http_pool import HttpClientPool
+
+        params: dict[str, str | int] = {
+            "apikey": self._musixmatch_api_key,
+            "q_artist": artist,
+            "q_track": title,
+            "f_has_lyrics": 1,
+        }
+
+        client = await HttpClientPool.get_client()
+        # First, search for the track
+        response = await client.get(
+            f"{self.MUSIXMATCH_API_BASE}/track.search",
+            params=params,
+        )
+        response.raise_for_status()
+        data = response.json()
 
-            # Get track ID
-            track_id = track_list[0].get("track", {}).get("track_id")
-            if not track_id:
-                return None
+        track_list = data.get("message", {}).get("body", {}).get("track_list", [])
+        if not track_list:
+            return None
 
-            # Fetch lyrics
-            lyrics_params: dict[str, str | int] = {
-                "apikey": self._musixmatch_api_key,
-                "track_id": track_id,
-            }
-            lyrics_response = await client.get(
-                f"{self.MUSIXMATCH_API_BASE}/track.lyrics.get",
-                params=lyrics_params,
-            )
-            lyrics_response.raise_for_status()
-            lyrics_data = lyrics_response.json()
-
-            lyrics_body: str | None = (
-                lyrics_data.get("message", {})
-                .get("body", {})
-                .get("lyrics", {})
-                .get("lyrics_body")
-            )
+        # Get track ID
+        track_id = track_list[0].get("track", {}).get("track_id")
+        if not track_id:
+            return None
 
-            return lyrics_body
+        # Fetch lyrics
+        lyrics_params: dict[str, str | int] = {
+            "apikey": self._musixmatch_api_key,
+            "track_id": track_id,
+        }
+        lyrics_response = await client.get(
+            f"{self.MUSIXMATCH_API_BASE}/track.lyrics.get",
+            params=lyrics_params,
+        )
+        lyrics_response.raise_for_status()
+        lyrics_data = lyrics_response.json()
+
+        lyrics_body: str | None = (
+            lyrics_data.get("message", {})
+            .get("body", {})
+            .get("lyrics", {})
+            .get("lyrics_body")
+        )
 
-        except Exception as e:
-            logger.exception("Error fetching lyrics from Musixmatch: %s", e)
-            return None
+        return lyrics_body
@@ -1,14 +1,21 @@
 """Post-processing pipeline orchestrator."""
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from soulspot.application.services.postprocessing.artwork_cache import (
+    AlbumArtworkCache,
+    album_key,
+)
 from soulspot.application.services.postprocessing.id3_tagging_service import (
     ID3TaggingService,
 )
+from soulspot.application.services.postprocessing.lyrics_cache import LyricsCache
 from soulspot.application.services.postprocessing.lyrics_service import LyricsService
 from soulspot.application.services.postprocessing.metadata_service import (
     MetadataService,
@@ -17,7 +24,7 @@ from soulspot.application.services.postprocessing.renaming_service import (
     RenamingService,
 )
 from soulspot.config import Settings
-from soulspot.domain.entities import Track
+from soulspot.domain.entities import Album, Artist, Track
 from soulspot.domain.ports import IAlbumRepository, IArtistRepository
 
 if TYPE_CHECKING:
@@ -47,6 +54,34 @@ class ProcessingResult:
     errors: list[str]
 
 
+@dataclass
+class PipelineStats:
+    """Throughput counters of the pipeline."""
+
+    tracks_processed: int = 0
+    albums_processed: int = 0  # process_album() calls (single tracks count as one)
+    album_seconds: float = 0.0  # wall time spent in process_album()
+    artwork_downloads: int = 0
+    artwork_cache_hits: int = 0
+
+    @property
+    def albums_per_minute(self) -> float:
+        """Albums finished per minute of album processing."""
+        if not self.album_seconds:
+            return 0.0
+        return self.albums_processed * 60 / self.album_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Stats for logs / status endpoints."""
+        return {
+            "tracks_processed": self.tracks_processed,
+            "albums_processed": self.albums_processed,
+            "albums_per_minute": round(self.albums_per_minute, 2),
+            "artwork_downloads": self.artwork_downloads,
+            "artwork_cache_hits": self.artwork_cache_hits,
+        }
+
+
 class PostProcessingPipeline:
     """Orchestrates all post-processing steps after download.
 
@@ -61,6 +96,11 @@ class PostProcessingPipeline:
     3. Writes comprehensive ID3 tags
     4. Renames file based on template (from DB if app_settings_service provided)
     5. Provides detailed error handling and logging
+
+    Album mode (process_album): all files of one release share the artist/album
+    lookups and ONE artwork download (AlbumArtworkCache), and run concurrently -
+    tag writes happen in threads, so a 20-track album no longer means 20x
+    download + resize + blocking mutagen writes on the event loop.
     """
 
     def __init__(
@@ -75,6 +115,7 @@ class PostProcessingPipeline:
         spotify_plugin: "SpotifyPlugin | None" = None,
         deezer_plugin: "DeezerPlugin | None" = None,
         app_settings_service: "AppSettingsService | None" = None,
+        lyrics_cache: LyricsCache | None = None,
     ) -> None:
         """Initialize post-processing pipeline.
 
@@ -92,6 +133,7 @@ class PostProcessingPipeline:
             spotify_plugin: Optional SpotifyPlugin for artwork downloads
             deezer_plugin: Optional DeezerPlugin for artwork fallback (NO AUTH!)
             app_settings_service: Optional app settings service for dynamic naming templates
+            lyrics_cache: Optional persistent lyrics cache for the default lyrics service
         """
         self._settings = settings
         self._artist_repository = artist_repository
@@ -106,7 +148,9 @@ class PostProcessingPipeline:
             spotify_plugin=spotify_plugin,
             deezer_plugin=deezer_plugin,
         )
-        self._lyrics_service = lyrics_service or LyricsService(settings)
+        self._lyrics_service = lyrics_service or LyricsService(
+            settings, lyrics_cache=lyrics_cache
+        )
         self._id3_tagging_service = id3_tagging_service or ID3TaggingService(settings)
         self._renaming_service = renaming_service or RenamingService(settings)
 
@@ -114,6 +158,28 @@ class PostProcessingPipeline:
         if app_settings_service:
             self._renaming_service.set_app_settings_service(app_settings_service)
 
+        # Shared by ALL calls - concurrent single-track process() calls of the same
+        # album coalesce on one download too
+        self._artwork_cache = AlbumArtworkCache(
+            max_entries=settings.postprocessing.artwork_cache_albums
+        )
+        # Renaming checks "does the target exist?" and then moves - two files of the
+        # same album must not do that at the same time
+        self._rename_lock = asyncio.Lock()
+        # Hey future me - repositories + app settings share ONE AsyncSession (the
+        # auto-import worker session), which must never be used concurrently. Every
+        # DB call of concurrent process_album() runs under this lock - callers
+        # sharing that session (AutoImportService) take it for their own DB calls.
+        self.session_lock = asyncio.Lock()
+        self._stats = PipelineStats()
+
+    def get_stats(self) -> PipelineStats:
+        """Get the pipeline throughput counters."""
+        cache_stats = self._artwork_cache.get_stats()
+        self._stats.artwork_downloads = cache_stats.misses
+        self._stats.artwork_cache_hits = cache_stats.hits + cache_stats.coalesced
+        return self._stats
+
     # Hey future me: The post-processing orchestrator - runs ALL the steps in sequence
     # WHY sequential not parallel? Each step depends on previous (can't embed artwork until we have it)
     # WHY track completed_steps? User needs feedback on what worked vs what failed
@@ -132,15 +198,105 @@ class PostProcessingPipeline:
         Returns:
             Processing result with success status and errors
         """
+        results = await self.process_album([(file_path, track)])
+        return results[0]
+
+    # Hey future me: Album mode - the shared work happens ONCE per album:
+    # artist/album lookups, artwork download + resize. The per-file steps (lyrics,
+    # tags, renaming) run concurrently, bounded by tag_write_workers.
+    # WHY bounded? Every file = one thread doing a full mutagen read/rewrite, plus a
+    # lyrics request. 4 at once keeps the disk and the lyrics providers happy.
+    # The DB update is NOT done here - the caller updates all tracks in one go.
+    async def process_album(
+        self,
+        items: list[tuple[Path, Track]],
+    ) -> list[ProcessingResult]:
+        """Run post-processing on downloaded files of one album.
+
+        The files should belong to one release (same album_id) - mixed input
+        still works, it just shares less.
+
+        Args:
+            items: (file path, track) pairs
+
+        Returns:
+            One processing result per item, in input order
+        """
         if not self._settings.postprocessing.enabled:
             logger.info("Post-processing disabled, skipping")
-            return ProcessingResult(
-                success=True,
-                final_path=file_path,
-                completed_steps=[],
-                errors=[],
-            )
+            return [
+                ProcessingResult(
+                    success=True,
+                    final_path=file_path,
+                    completed_steps=[],
+                    errors=[],
+                )
+                for file_path, _track in items
+            ]
+
+        if not items:
+            return []
+
+        started = time.monotonic()
+        artists: dict[str, Artist | None] = {}
+        albums: dict[str, Album | None] = {}
+        sem = asyncio.Semaphore(self._settings.postprocessing.tag_write_workers)
+
+        async def process_one(file_path: Path, track: Track) -> ProcessingResult:
+            async with sem:
+                return await self._process_track(file_path, track, artists, albums)
+
+        # Fetch related entities ONCE per album (shared dicts, sequential lookups).
+        # Other albums may be processed at the same time → hold the session lock.
+        async with self.session_lock:
+            for _file_path, track in items:
+                await self._get_artist(track, artists)
+                await self._get_album(track, albums)
+
+        results = await asyncio.gather(
+            *[process_one(file_path, track) for file_path, track in items]
+        )
 
+        self._stats.tracks_processed += len(items)
+        self._stats.albums_processed += 1
+        self._stats.album_seconds += time.monotonic() - started
+        if len(items) > 1:
+            logger.info(
+                "Post-processed album batch: %d files in %.1fs (%.1f albums/min)",
+                len(items),
+                time.monotonic() - started,
+                self._stats.albums_per_minute,
+            )
+        return list(results)
+
+    async def _get_artist(
+        self, track: Track, cache: dict[str, Artist | None]
+    ) -> Artist | None:
+        """Artist of a track, looked up once per batch."""
+        key = str(track.artist_id.value)
+        if key not in cache:
+            cache[key] = await self._artist_repository.get_by_id(track.artist_id)
+        return cache[key]
+
+    async def _get_album(
+        self, track: Track, cache: dict[str, Album | None]
+    ) -> Album | None:
+        """Album of a track, looked up once per batch."""
+        if not track.album_id:
+            return None
+        key = str(track.album_id.value)
+        if key not in cache:
+            cache[key] = await self._album_repository.get_by_id(track.album_id)
+        return cache[key]
+
+    async def _process_track(
+        self,
+        file_path: Path,
+        track: Track,
+        artists: dict[str, Artist | None],
+        albums: dict[str, Album | None],
+    ) -> ProcessingResult:
+        """Run the pipeline steps for one file (entities already looked up)."""
         completed_steps: list[ProcessingStep] = []
         errors: list[str] = []
         current_path = file_path
@@ -153,8 +309,8 @@ class PostProcessingPipeline:
             # WHY continue if artwork fails? Nice to have, not essential - user can add it manually later
             # GOTCHA: Each step is wrapped in try/except to isolate failures - one bad step doesn't kill the whole pipeline
 
-            # Fetch related entities
-            artist = await self._artist_repository.get_by_id(track.artist_id)
+            # Fetch related entities (cached by process_album)
+            artist = artists.get(str(track.artist_id.value))
             if not artist:
                 error_msg = f"Artist not found: {track.artist_id}"
                 logger.error(error_msg)
@@ -166,16 +322,18 @@ class PostProcessingPipeline:
                     errors=errors,
                 )
 
-            album = None
-            if track.album_id:
-                album = await self._album_repository.get_by_id(track.album_id)
+            album = albums.get(str(track.album_id.value)) if track.album_id else None
 
-            # Step 1: Download artwork
+            # Step 1: Download artwork (once per album - AlbumArtworkCache)
             artwork_data = None
             if self._settings.postprocessing.artwork_enabled:
                 try:
-                    artwork_data = await self._metadata_service.download_artwork(
-                        track, album
+                    artwork_data = await self._artwork_cache.get_or_fetch(
+                        album_key(
+                            str(album.id.value) if album else None,
+                            str(track.id.value),
+                        ),
+                        lambda: self._metadata_service.download_artwork(track, album),
                     )
                     if artwork_data:
                         completed_steps.append(ProcessingStep.ARTWORK)
@@ -225,12 +383,14 @@ class PostProcessingPipeline:
             # Step 4: Rename and organize file
             if self._settings.postprocessing.file_renaming_enabled:
                 try:
-                    new_path = await self._renaming_service.rename_file(
-                        current_path,
-                        track,
-                        artist,
-                        album,
-                    )
+                    # Renaming reads its templates from the DB (app settings)
+                    async with self._rename_lock, self.session_lock:
+                        new_path = await self._renaming_service.rename_file(
+                            current_path,
+                            track,
+                            artist,
+                            album,
+                        )
                     current_path = new_path
                     completed_steps.append(ProcessingStep.RENAMING)
                     logger.info("✓ File renamed to: %s", new_path)
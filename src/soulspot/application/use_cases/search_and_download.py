@@ -1,5 +1,8 @@
 """Search and download track use case."""
 
+import asyncio
+import contextlib
+import logging
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
@@ -7,12 +10,16 @@ from typing import Any
 from soulspot.application.services.advanced_search import (
     AdvancedSearchService,
     SearchFilters,
+    SearchResult,
 )
+from soulspot.application.services.filter_service import FilterService
 from soulspot.application.use_cases import UseCase
 from soulspot.domain.entities import Download, DownloadStatus, Track
 from soulspot.domain.ports import IDownloadRepository, ISlskdClient, ITrackRepository
 from soulspot.domain.value_objects import DownloadId, TrackId
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class SearchAndDownloadTrackRequest:
@@ -29,6 +36,9 @@ class SearchAndDownloadTrackRequest:
     exclusion_keywords: list[str] | None = None  # Keywords to exclude
     fuzzy_threshold: int = 80  # Fuzzy match threshold (0-100)
     use_advanced_search: bool = True  # Enable advanced search features
+    # Stop the Soulseek search once a candidate scores at least this (0-100 match_score).
+    # None = wait for the whole search. Only used with use_advanced_search.
+    accept_score: float | None = None
 
 
 @dataclass
@@ -63,6 +73,7 @@ class SearchAndDownloadTrackUseCase(
         track_repository: ITrackRepository,
         download_repository: IDownloadRepository,
         advanced_search_service: AdvancedSearchService | None = None,
+        filter_service: FilterService | None = None,
     ) -> None:
         """Initialize the use case with required dependencies.
 
@@ -71,6 +82,8 @@ class SearchAndDownloadTrackUseCase(
             track_repository: Repository for track persistence
             download_repository: Repository for download persistence
             advanced_search_service: Optional advanced search service
+            filter_service: Optional filter service - drops blocklisted sources
+                and results rejected by the user's filter rules before ranking
         """
         self._slskd_client = slskd_client
         self._track_repository = track_repository
@@ -78,6 +91,7 @@ class SearchAndDownloadTrackUseCase(
         self._advanced_search_service = (
             advanced_search_service or AdvancedSearchService()
         )
+        self._filter_service = filter_service
 
     def _build_search_query(self, track: Track) -> str:
         """Build a search query from track metadata.
@@ -96,12 +110,14 @@ class SearchAndDownloadTrackUseCase(
     # - Fuzzy matching: "Bohemian Rhapsody" vs "Bohemian Rhapsody (2011 Remaster).flac"
     # - Quality: 320kbps MP3 vs 1411kbps FLAC vs 128kbps MP3
     # - Exclusions: Not live, not remix, not karaoke versions
+    # - Duration: a 7:30 file for a 3:20 track is an extended mix, not our track
     # GOTCHA: If advanced search returns nothing, we fall back to legacy logic (simpler but dumber)
     def _select_best_file(
         self,
         results: list[dict[str, Any]],
         request: SearchAndDownloadTrackRequest,
         search_query: str,
+        expected_duration: int | None = None,
     ) -> dict[str, Any] | None:
         """Select the best quality file from search results.
 
@@ -109,6 +125,7 @@ class SearchAndDownloadTrackUseCase(
             results: List of search results from slskd
             request: Search request with preferences
             search_query: The search query used
+            expected_duration: Track length in seconds (duration plausibility)
 
         Returns:
             Best file match or None
@@ -118,33 +135,105 @@ class SearchAndDownloadTrackUseCase(
 
         # Use advanced search if enabled
         if request.use_advanced_search:
-            filters = SearchFilters(
-                min_bitrate=request.min_bitrate,
-                formats=request.formats,
-                exclusion_keywords=request.exclusion_keywords,
-                fuzzy_threshold=request.fuzzy_threshold,
-            )
-
             best_match = self._advanced_search_service.select_best_match(
-                search_query, results, filters
+                search_query,
+                results,
+                self._search_filters(request),
+                expected_duration=expected_duration,
             )
-
-            if best_match:
-                # Convert SearchResult back to dict format
-                return {
-                    "username": best_match.username,
-                    "filename": best_match.filename,
-                    "size": best_match.size,
-                    "bitrate": best_match.bitrate,
-                    "length": best_match.length,
-                    "quality": best_match.quality,
-                }
-
-            return None
+            return self._to_file_dict(best_match) if best_match else None
 
         # Fallback to original logic for backward compatibility
         return self._select_best_file_legacy(results, request.quality_preference)
 
+    @staticmethod
+    def _search_filters(request: SearchAndDownloadTrackRequest) -> SearchFilters:
+        return SearchFilters(
+            min_bitrate=request.min_bitrate,
+            formats=request.formats,
+            exclusion_keywords=request.exclusion_keywords,
+            fuzzy_threshold=request.fuzzy_threshold,
+        )
+
+    @staticmethod
+    def _to_file_dict(match: SearchResult) -> dict[str, Any]:
+        """Convert a ranked SearchResult back to the slskd result dict format."""
+        return {
+            "username": match.username,
+            "filename": match.filename,
+            "size": match.size,
+            "bitrate": match.bitrate,
+            "length": match.length,
+            "quality": match.quality,
+        }
+
+    # Hey future me - this is the STREAMING search + early accept! Peers answer over
+    # several seconds; the old code waited for the whole search before even looking.
+    # Now every batch is filtered and ranked the moment it arrives, and we keep the best
+    # candidate so far. match_score of a result doesn't depend on the other results, so
+    # "best of the per-batch bests" == best of everything (strict > keeps the earlier
+    # one on ties, same as the stable full sort). Once the best reaches accept_score we
+    # stop iterating - aclosing() then closes the stream, which stops the slskd search.
+    async def _stream_and_select(
+        self,
+        request: SearchAndDownloadTrackRequest,
+        search_query: str,
+        expected_duration: int | None,
+    ) -> tuple[int, dict[str, Any] | None]:
+        """Search via the result stream, ranking each batch as it arrives.
+
+        Args:
+            request: Search request (filters, timeout, accept_score)
+            search_query: The search query
+            expected_duration: Track length in seconds (duration plausibility)
+
+        Returns:
+            (number of results received, best file or None)
+
+        Raises:
+            Exception: Anything the slskd client raises while searching
+        """
+        filters = self._search_filters(request)
+        received = 0
+        best: SearchResult | None = None
+
+        stream = self._slskd_client.search_stream(
+            query=search_query, timeout=request.timeout_seconds
+        )
+        async with contextlib.aclosing(stream):
+            async for batch in stream:
+                received += len(batch)
+                if self._filter_service is not None:
+                    batch = await self._filter_service.filter_search_results(batch)
+                if not batch:
+                    continue
+                # Ranking is CPU work - keep it off the event loop
+                match = await asyncio.to_thread(
+                    self._advanced_search_service.select_best_match,
+                    search_query,
+                    batch,
+                    filters,
+                    expected_duration,
+                )
+                if match is not None and (
+                    best is None or match.match_score > best.match_score
+                ):
+                    best = match
+                if (
+                    best is not None
+                    and request.accept_score is not None
+                    and best.match_score >= request.accept_score
+                ):
+                    logger.debug(
+                        "Accepting %s (score %.1f) after %d results, stopping search",
+                        best.filename,
+                        best.match_score,
+                        received,
+                    )
+                    break
+
+        return received, self._to_file_dict(best) if best else None
+
     def _select_best_file_legacy(
         self,
         results: list[dict[str, Any]],
@@ -250,12 +339,33 @@ class SearchAndDownloadTrackUseCase(
         # 2. Build search query
         search_query = request.search_query or self._build_search_query(track)
 
-        # 3. Search for files on Soulseek
+        # 3. Search for files on Soulseek, 4. drop blocked sources + filtered results
+        # (compiled matchers, no per-result DB queries) and select the best file.
+        # Advanced search ranks the result stream while peers are still answering.
+        expected_duration = track.duration_ms // 1000 if track.duration_ms else None
         try:
-            search_results = await self._slskd_client.search(
-                query=search_query,
-                timeout=request.timeout_seconds,
-            )
+            if request.use_advanced_search:
+                results_count, selected_file = await self._stream_and_select(
+                    request, search_query, expected_duration
+                )
+            else:
+                search_results = await self._slskd_client.search(
+                    query=search_query,
+                    timeout=request.timeout_seconds,
+                )
+                candidates = (
+                    search_results.get("results", [])
+                    if isinstance(search_results, dict)
+                    else search_results
+                )
+                results_count = len(candidates) if candidates else 0
+                if self._filter_service is not None and candidates:
+                    candidates = await self._filter_service.filter_search_results(
+                        candidates
+                    )
+                selected_file = self._select_best_file(
+                    candidates, request, search_query
+                )
         except Exception as e:
             return SearchAndDownloadTrackResponse(
                 download=None,  # type: ignore
@@ -265,19 +375,10 @@ class SearchAndDownloadTrackUseCase(
                 error_message=f"Search failed: {e}",
             )
 
-        # 4. Select best quality file
-        selected_file = self._select_best_file(
-            search_results.get("results", [])
-            if isinstance(search_results, dict)
-            else search_results,
-            request,
-            search_query,
-        )
-
         if not selected_file:
             return SearchAndDownloadTrackResponse(
                 download=None,  # type: ignore
-                search_results_count=len(search_results) if search_results else 0,
+                search_results_count=results_count,
                 selected_file=None,
                 status=DownloadStatus.FAILED,
                 error_message="No suitable files found in search results",
@@ -292,7 +393,7 @@ class SearchAndDownloadTrackUseCase(
         except Exception as e:
             return SearchAndDownloadTrackResponse(
                 download=None,  # type: ignore
-                search_results_count=len(search_results) if search_results else 0,
+                search_results_count=results_count,
                 selected_file=selected_file,
                 status=DownloadStatus.FAILED,
                 slskd_download_id=None,
@@ -314,7 +415,7 @@ class SearchAndDownloadTrackUseCase(
 
         return SearchAndDownloadTrackResponse(
             download=download,
-            search_results_count=len(search_results) if search_results else 0,
+            search_results_count=results_count,
             selected_file=selected_file,
             status=DownloadStatus.QUEUED,
             slskd_download_id=download_id_str,
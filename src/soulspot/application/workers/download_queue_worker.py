@@ -53,6 +53,7 @@ from sqlalchemy import select
 from soulspot.application.workers.job_queue import JobQueue, JobType
 from soulspot.domain.entities import DownloadStatus
 from soulspot.domain.value_objects import TrackId
+from soulspot.infrastructure.event_bus import publish_download_update
 from soulspot.infrastructure.observability.logger_template import log_worker_health
 from soulspot.infrastructure.persistence.models import DownloadModel
 from soulspot.infrastructure.persistence.repositories import DownloadRepository
@@ -139,6 +140,9 @@ class DownloadQueueWorker:
         # Track slskd availability state
         self._last_available: bool | None = None
 
+        # State changes of the current cycle, published once the cycle committed
+        self._cycle_deltas: list[dict[str, Any]] = []
+
         # Lifecycle tracking
         self._cycles_completed = 0
         self._errors_total = 0
@@ -258,7 +262,9 @@ class DownloadQueueWorker:
         2. Process retries (FAILED → WAITING) - always runs
         3. Process blocklist (permanent failures)
         4. Dispatch waiting downloads (only if slskd available)
+        5. Publish the state changes on the event bus (after commit)
         """
+        self._cycle_deltas = []
         async with self._session_factory() as session:
             # 1. Process retries (runs even if slskd offline)
             await self._process_retries(session)
@@ -282,6 +288,10 @@ class DownloadQueueWorker:
 
             await session.commit()
 
+        for delta in self._cycle_deltas:
+            publish_download_update(**delta)
+        self._cycle_deltas = []
+
     # =========================================================================
     # RETRY PROCESSING (from RetrySchedulerWorker)
     # =========================================================================
@@ -315,6 +325,7 @@ class DownloadQueueWorker:
                     # Permanent failure → blocklist
                     download.status = DownloadStatus.BLOCKLISTED
                     await repo.update(download)
+                    self._record_delta(download)
                     blocklisted += 1
                     logger.info(
                         f"Blocklisted download {download.id.value}: {download.last_error_code}"
@@ -326,6 +337,7 @@ class DownloadQueueWorker:
                     # Max retries reached → blocklist
                     download.status = DownloadStatus.BLOCKLISTED
                     await repo.update(download)
+                    self._record_delta(download)
                     blocklisted += 1
                     logger.info(
                         f"Blocklisted download {download.id.value} after {MAX_RETRIES} retries"
@@ -339,6 +351,7 @@ class DownloadQueueWorker:
                 # Activate for retry
                 download.activate_for_retry()
                 await repo.update(download)
+                self._record_delta(download)
                 activated += 1
                 logger.info(
                     f"Activated retry for download {download.id.value} "
@@ -363,6 +376,18 @@ class DownloadQueueWorker:
         if blocklisted > 0:
             logger.info(f"Blocklisted {blocklisted} downloads")
 
+    def _record_delta(self, download: Any) -> None:
+        """Remember a Download entity's new state for publishing after commit."""
+        self._cycle_deltas.append(
+            {
+                "download_id": str(download.id.value),
+                "status": download.status.value,
+                "track_id": str(download.track_id.value),
+                "priority": download.priority,
+                "created_at": download.created_at.isoformat(),
+            }
+        )
+
     # =========================================================================
     # DISPATCH (from QueueDispatcherWorker)
     # =========================================================================
@@ -404,6 +429,15 @@ class DownloadQueueWorker:
             # Dispatch: WAITING → PENDING
             download.status = DownloadStatus.PENDING.value
             download.updated_at = datetime.now(UTC)
+            self._cycle_deltas.append(
+                {
+                    "download_id": download.id,
+                    "status": download.status,
+                    "track_id": download.track_id,
+                    "priority": download.priority,
+                    "created_at": download.created_at.isoformat(),
+                }
+            )
 
             # Enqueue job
             track_id = TrackId.from_string(download.track_id)
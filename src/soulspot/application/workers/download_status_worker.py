@@ -49,13 +49,21 @@ import time
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select, update
+from sqlalchemy import Row, select, update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from soulspot.application.workers.job_queue import JobQueue, JobStatus, JobType
 from soulspot.domain.entities import DownloadStatus
+from soulspot.infrastructure.event_bus import publish_download_update
 from soulspot.infrastructure.observability.logger_template import log_worker_health
-from soulspot.infrastructure.persistence.models import DownloadModel, TrackModel
+from soulspot.infrastructure.persistence.library_aggregates import (
+    refresh_track_parent_aggregates,
+)
+from soulspot.infrastructure.persistence.models import (
+    DownloadModel,
+    TrackModel,
+    slskd_transfer_key,
+)
 
 if TYPE_CHECKING:
     from soulspot.domain.ports import ISlskdClient
@@ -71,6 +79,12 @@ logger = logging.getLogger(__name__)
 STALE_TIMEOUT_HOURS = 12
 STALE_CHECK_INTERVAL_POLLS = 60  # ~10 minutes at 10s poll interval
 
+# Adaptive polling: slow heartbeat while nothing is downloading
+IDLE_POLL_INTERVAL_SECONDS = 30
+
+# Max transfer keys per "IN (...)" (SQLite variable limit on older builds is 999)
+_IN_CLAUSE_CHUNK_SIZE = 500
+
 # slskd state mappings
 SLSKD_COMPLETED_STATES = {"Completed", "CompletedSucceeded", "Succeeded"}
 SLSKD_FAILED_STATES = {
@@ -133,6 +147,7 @@ class DownloadStatusWorker:
         stale_timeout_hours: int = STALE_TIMEOUT_HOURS,
         max_consecutive_failures: int = 5,
         circuit_breaker_timeout: int = 60,
+        idle_poll_interval_seconds: int = IDLE_POLL_INTERVAL_SECONDS,
     ) -> None:
         """Initialize the unified download status worker.
 
@@ -144,9 +159,11 @@ class DownloadStatusWorker:
             stale_timeout_hours: Hours without progress before restart (default 12)
             max_consecutive_failures: Failures before circuit opens (default 5)
             circuit_breaker_timeout: Seconds before recovery attempt (default 60)
+            idle_poll_interval_seconds: Heartbeat when no transfer is active (default 30)
 
         Hey future me - poll_interval=5s is aggressive but needed for good UX.
-        Users expect to see progress update quickly.
+        Users expect to see progress update quickly. It's only used while transfers
+        actually progress - see _adapt_poll_interval().
         """
         self._session_factory = session_factory
         self._slskd_client = slskd_client
@@ -155,6 +172,8 @@ class DownloadStatusWorker:
         self._stale_timeout = timedelta(hours=stale_timeout_hours)
         self._max_consecutive_failures = max_consecutive_failures
         self._circuit_breaker_timeout = circuit_breaker_timeout
+        self._idle_poll_interval = max(poll_interval_seconds, idle_poll_interval_seconds)
+        self._current_poll_interval = poll_interval_seconds
 
         # State
         self._running = False
@@ -172,6 +191,11 @@ class DownloadStatusWorker:
         self._last_failure_time: datetime | None = None
         self._last_successful_sync: datetime | None = None
 
+        # Change-detection cursor: download_id → (state, bytes, progress) as of the
+        # last successful cycle. Lets each cycle skip the (mostly completed, never
+        # changing) slskd history in memory.
+        self._transfer_cursor: dict[str, tuple[Any, Any, Any]] = {}
+
         # Stats for monitoring
         self._stats: dict[str, int | str | None] = {
             "polls_completed": 0,
@@ -179,6 +203,7 @@ class DownloadStatusWorker:
             "downloads_failed": 0,
             "downloads_restarted": 0,
             "db_synced": 0,
+            "transfers_changed": 0,
             "last_poll_at": None,
             "last_error": None,
         }
@@ -239,6 +264,7 @@ class DownloadStatusWorker:
             "running": self._running,
             "status": "active" if self._running else "stopped",
             "poll_interval_seconds": self._poll_interval,
+            "current_poll_interval_seconds": self._current_poll_interval,
             "circuit_state": self._circuit_state,
             "stats": self._stats.copy(),
         }
@@ -305,6 +331,9 @@ class DownloadStatusWorker:
                 # Check for stale downloads periodically
                 if self._poll_count % STALE_CHECK_INTERVAL_POLLS == 0:
                     await self._check_stale_downloads()
+                    # Same cadence: reset the cursor → next cycle does a full
+                    # reconcile (safety net for rows created after their transfer)
+                    self._transfer_cursor.clear()
 
             except Exception as e:
                 self._errors_total += 1
@@ -351,22 +380,46 @@ class DownloadStatusWorker:
         """
         try:
             # 1. Poll slskd EINMAL
-            all_downloads = await self._fetch_slskd_downloads()
-
-            if not all_downloads:
-                # No downloads but connection succeeded
-                return True
-
-            # Create lookup maps
-            download_map = self._build_download_map(all_downloads)
+            transfers = await self._fetch_slskd_downloads()
+
+            # CHANGE-DETECTION CURSOR: compare every transfer's compact fingerprint
+            # with the previous cycle → only the delta flows into the update stages.
+            # slskd keeps its whole history, so in steady state the delta is empty.
+            fingerprints = {
+                transfer_id: self._transfer_fingerprint(transfer)
+                for transfer_id, transfer in transfers.items()
+            }
+            changed = {
+                transfer_id: transfers[transfer_id]
+                for transfer_id, fingerprint in fingerprints.items()
+                if self._transfer_cursor.get(transfer_id) != fingerprint
+            }
+            self._stats["transfers_changed"] = len(changed)
 
             # 2. Update JobQueue (from DownloadMonitorWorker)
-            await self._update_job_queue(download_map)
+            running_jobs = 0
+            if transfers:
+                running_jobs = await self._update_job_queue(transfers, changed)
 
             # 3. Update DB (from DownloadStatusSyncWorker)
-            async with self._session_factory() as session:
-                await self._update_db_downloads(session, all_downloads)
-                await session.commit()
+            if changed:
+                async with self._session_factory() as session:
+                    deltas = await self._update_db_downloads(
+                        session, list(changed.values())
+                    )
+                    await session.commit()
+
+                # 4. Tell SSE clients - only AFTER the commit, never publish a state
+                # the DB might still roll back
+                for delta in deltas:
+                    publish_download_update(**delta)
+            else:
+                self._stats["db_synced"] = 0
+
+            # Advance the cursor only after BOTH stages succeeded - a failed cycle
+            # re-delivers the same delta next time.
+            self._transfer_cursor = fingerprints
+            self._adapt_poll_interval(transfers, changed, running_jobs)
 
             return True
 
@@ -410,53 +463,90 @@ class DownloadStatusWorker:
     # SLSKD DATA FETCHING
     # =========================================================================
 
-    async def _fetch_slskd_downloads(self) -> list[dict[str, Any]]:
+    async def _fetch_slskd_downloads(self) -> dict[str, dict[str, Any]]:
         """Fetch all downloads from slskd.
 
+        Hey future me - the client already flattens slskd's user → directories →
+        files tree into one dict per file transfer (see ISlskdClient.list_downloads).
+
         Returns:
-            List of download dicts with username attached.
+            Lookup map: download_id ("username/filename") -> download data.
         """
-        response = await self._slskd_client.list_downloads()
+        downloads = await self._slskd_client.list_downloads()
+        return {d["id"]: d for d in downloads if d.get("id")}
+
+    @staticmethod
+    def _transfer_fingerprint(transfer: dict[str, Any]) -> tuple[Any, Any, Any]:
+        """Compact (state, bytes, percent) fingerprint - unchanged = nothing to do."""
+        return (
+            transfer.get("state"),
+            transfer.get("bytes_transferred", transfer.get("bytesTransferred")),
+            transfer.get("progress", transfer.get("percentComplete")),
+        )
+
+    def _adapt_poll_interval(
+        self,
+        transfers: dict[str, dict[str, Any]],
+        changed: dict[str, dict[str, Any]],
+        running_jobs: int,
+    ) -> None:
+        """Tighten polling while transfers progress, back off when idle.
 
-        all_downloads = []
-        if isinstance(response, dict):
-            for username, user_data in response.items():
-                if isinstance(user_data, dict):
-                    directories = user_data.get("directories", [])
-                    for directory in directories:
-                        files = directory.get("files", [])
-                        for file in files:
-                            file["username"] = username
-                            all_downloads.append(file)
+        Hey future me - three speeds:
+        - Something active MOVED this cycle → base interval (responsive progress bars)
+        - Work pending but nothing moved (remote queue, just-started job) → double
+          the interval each cycle, capped at the idle heartbeat
+        - Everything completed/idle → idle heartbeat (no point hammering slskd)
+        """
+        progressing = any(
+            transfer.get("state") in SLSKD_ACTIVE_STATES for transfer in changed.values()
+        )
+        pending = running_jobs > 0 or any(
+            transfer.get("state") in SLSKD_ACTIVE_STATES
+            for transfer in transfers.values()
+        )
 
-        return all_downloads
+        if progressing:
+            interval = self._poll_interval
+        elif pending:
+            interval = min(self._current_poll_interval * 2, self._idle_poll_interval)
+        else:
+            interval = self._idle_poll_interval
 
-    def _build_download_map(self, downloads: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
-        """Build lookup map: download_id -> download data."""
-        return {d.get("id", ""): d for d in downloads if d.get("id")}
+        self._current_poll_interval = max(self._poll_interval, interval)
 
     # =========================================================================
     # JOBQUEUE UPDATES (from DownloadMonitorWorker)
     # =========================================================================
 
-    async def _update_job_queue(self, download_map: dict[str, dict[str, Any]]) -> None:
-        """Update JobQueue with slskd progress."""
+    async def _update_job_queue(
+        self,
+        download_map: dict[str, dict[str, Any]],
+        changed: dict[str, dict[str, Any]],
+    ) -> int:
+        """Update JobQueue with slskd progress.
+
+        Returns:
+            Number of running download jobs (feeds the adaptive poll interval)
+        """
         running_jobs = await self._job_queue.list_jobs(
             status=JobStatus.RUNNING,
             job_type=JobType.DOWNLOAD,
         )
 
-        if not running_jobs:
-            return
-
         for job in running_jobs:
             try:
-                await self._update_job_status(job, download_map)
+                await self._update_job_status(job, download_map, changed)
             except Exception as e:
                 logger.error(f"Error updating job {job.id}: {e}")
 
+        return len(running_jobs)
+
     async def _update_job_status(
-        self, job: Any, download_map: dict[str, dict[str, Any]]
+        self,
+        job: Any,
+        download_map: dict[str, dict[str, Any]],
+        changed: dict[str, dict[str, Any]],
     ) -> None:
         """Update a single job's status based on slskd data."""
         if not job.result:
@@ -468,6 +558,15 @@ class DownloadStatusWorker:
 
         slskd_status = download_map.get(slskd_download_id)
 
+        # Unchanged transfer → skip. Exception: the job hasn't seen the current
+        # state yet (job got its slskd id after the transfer already settled).
+        if (
+            slskd_status is not None
+            and slskd_download_id not in changed
+            and job.result.get("slskd_state") == slskd_status.get("state")
+        ):
+            return
+
         if slskd_status is None:
             # Download not found - check existing state
             existing_state = job.result.get("slskd_state")
@@ -475,6 +574,9 @@ class DownloadStatusWorker:
                 await self._mark_job_completed(job)
             elif existing_state in SLSKD_FAILED_STATES:
                 await self._mark_job_failed(job, f"Download failed: {existing_state}")
+            else:
+                return
+            self._job_queue.publish_job_update(job)
             return
 
         # Update job result with progress
@@ -497,6 +599,8 @@ class DownloadStatusWorker:
         elif state in SLSKD_FAILED_STATES:
             await self._mark_job_failed(job, f"Download failed: {state}")
 
+        self._job_queue.publish_job_update(job)
+
     async def _mark_job_completed(self, job: Any) -> None:
         """Mark a job as successfully completed."""
         job.status = JobStatus.COMPLETED
@@ -520,101 +624,118 @@ class DownloadStatusWorker:
 
     async def _update_db_downloads(
         self, session: AsyncSession, slskd_downloads: list[dict[str, Any]]
-    ) -> None:
-        """Update DownloadModel entries from slskd data."""
-        synced = 0
-
-        for slskd_dl in slskd_downloads:
-            result = await self._sync_single_download(session, slskd_dl)
-            if result in ("updated", "completed"):
-                synced += 1
-
-        self._stats["db_synced"] = synced
-
-    async def _sync_single_download(
-        self, session: AsyncSession, slskd_dl: dict[str, Any]
-    ) -> str:
-        """Sync a single slskd download to DB.
+    ) -> list[dict[str, Any]]:
+        """Reconcile DownloadModel entries with CHANGED slskd transfers - set-based.
+
+        Hey future me - this used to be one "source_url = ?" SELECT per transfer plus
+        an unindexed LIKE '%filename%' on a miss, for slskd's WHOLE history (5k
+        completed transfers = up to 10k queries every cycle, all while holding the
+        SQLite write lock). Now:
+        1. The change-detection cursor in _poll_cycle only hands us transfers whose
+           (state, bytes, progress) moved since the previous cycle
+        2. Those are resolved via the indexed transfer_key in ONE IN query
+           (chunked at _IN_CLAUSE_CHUNK_SIZE)
+        3. Rows whose status/progress already match are left alone, the others are
+           written with ONE bulk UPDATE by primary key (+ one for track file paths)
 
         Returns:
-            Result type: "updated", "completed", "failed", "not_found"
+            One delta per written row (id, status, changed fields) - _poll_cycle
+            publishes them on the event bus once the session is committed
         """
-        username = slskd_dl.get("username", "")
-        filename = slskd_dl.get("filename", "")
-        state = slskd_dl.get("state", "Unknown")
-
-        if not username or not filename:
-            return "not_found"
-
-        # Find matching Download by source_url
-        source_url_pattern = f"slskd://{username}/{filename}"
-        stmt = select(DownloadModel).where(
-            DownloadModel.source_url == source_url_pattern
-        )
-        result = await session.execute(stmt)
-        download = result.scalar_one_or_none()
-
-        # Try alternative matching
-        if not download:
-            stmt_alt = select(DownloadModel).where(
-                DownloadModel.source_url.contains(filename)
+        pending: dict[str, dict[str, Any]] = {}
+        for slskd_dl in slskd_downloads:
+            username = slskd_dl.get("username", "")
+            filename = slskd_dl.get("filename", "")
+            if not username or not filename:
+                continue
+            if SLSKD_STATUS_TO_SOULSPOT.get(slskd_dl.get("state", "Unknown")) is None:
+                continue
+            pending[slskd_transfer_key(username, filename)] = slskd_dl
+
+        self._stats["db_synced"] = 0
+        if not pending:
+            return []
+
+        keys = list(pending)
+        # (id, transfer_key, track_id, status, progress_percent) of the pending downloads
+        rows: list[Row[str, str | None, str, str, float]] = []
+        for i in range(0, len(keys), _IN_CLAUSE_CHUNK_SIZE):
+            result = await session.execute(
+                select(
+                    DownloadModel.id,
+                    DownloadModel.transfer_key,
+                    DownloadModel.track_id,
+                    DownloadModel.status,
+                    DownloadModel.progress_percent,
+                ).where(
+                    DownloadModel.transfer_key.in_(keys[i : i + _IN_CLAUSE_CHUNK_SIZE])
+                )
             )
-            result_alt = await session.execute(stmt_alt)
-            download = result_alt.scalar_one_or_none()
-
-        if not download:
-            return "not_found"
-
-        # Map state
-        new_status = SLSKD_STATUS_TO_SOULSPOT.get(state)
-        if not new_status:
-            return "not_found"
+            rows.extend(result.all())
 
-        # Update status
-        old_status = DownloadStatus(download.status)
-        download.status = new_status.value
-        download.updated_at = datetime.now(UTC)
-
-        # Update progress
-        percent = slskd_dl.get("percentComplete", 0.0)
-        if isinstance(percent, (int, float)):
-            download.progress_percent = float(percent)
-
-        # Handle completion
-        if new_status == DownloadStatus.COMPLETED:
-            await self._handle_completion(session, download, slskd_dl)
-            return "completed"
-
-        if new_status == DownloadStatus.FAILED:
-            download.error_message = slskd_dl.get("error", "Download failed")
-            return "failed"
-
-        return "updated" if old_status != new_status else "not_found"
-
-    async def _handle_completion(
-        self,
-        session: AsyncSession,
-        download: DownloadModel,
-        slskd_dl: dict[str, Any],
-    ) -> None:
-        """Handle download completion - update Track.file_path.
-
-        Hey future me - THIS IS LIDARR-STYLE COMPLETED DOWNLOAD HANDLING!
-        Like Lidarr's post-processing, we update the track with the file path.
-        """
-        download.progress_percent = 100.0
-        download.completed_at = datetime.now(UTC)
-
-        local_path = slskd_dl.get("localPath") or slskd_dl.get("filename")
-
-        if local_path and download.track_id:
-            stmt = (
-                update(TrackModel)
-                .where(TrackModel.id == download.track_id)
-                .values(file_path=local_path, updated_at=datetime.now(UTC))
+        now = datetime.now(UTC)
+        download_updates: list[dict[str, Any]] = []
+        track_updates: list[dict[str, Any]] = []
+        deltas: list[dict[str, Any]] = []
+
+        for download_id, key, track_id, old_status, old_progress in rows:
+            if key is None:  # excluded by the IN filter, narrows the type
+                continue
+            slskd_dl = pending[key]
+            new_status = SLSKD_STATUS_TO_SOULSPOT[slskd_dl.get("state", "Unknown")]
+
+            values: dict[str, Any] = {"id": download_id}
+            percent = slskd_dl.get("progress", slskd_dl.get("percentComplete", 0.0))
+            if new_status == DownloadStatus.COMPLETED:
+                percent = 100.0
+            if isinstance(percent, (int, float)) and float(percent) != old_progress:
+                values["progress_percent"] = float(percent)
+
+            if new_status.value != old_status:
+                values["status"] = new_status.value
+                if new_status == DownloadStatus.COMPLETED:
+                    # Hey future me - THIS IS LIDARR-STYLE COMPLETED DOWNLOAD HANDLING!
+                    # Only on the transition: re-setting file_path every cycle would
+                    # clobber the library path postprocessing moved the file to.
+                    values["completed_at"] = now
+                    local_path = slskd_dl.get("localPath") or slskd_dl.get("filename")
+                    if local_path and track_id:
+                        track_updates.append(
+                            {"id": track_id, "file_path": local_path, "updated_at": now}
+                        )
+                        logger.info(
+                            f"Download completed: track_id={track_id}, file={local_path}"
+                        )
+                elif new_status == DownloadStatus.FAILED:
+                    values["error_message"] = slskd_dl.get("error", "Download failed")
+
+            if len(values) == 1:
+                continue  # Row already matches slskd
+            values["updated_at"] = now
+            download_updates.append(values)
+
+            delta: dict[str, Any] = {
+                "download_id": download_id,
+                "status": new_status.value,
+                "track_id": track_id,
+            }
+            if "progress_percent" in values:
+                delta["progress_percent"] = values["progress_percent"]
+            if "error_message" in values:
+                delta["error_message"] = values["error_message"]
+            deltas.append(delta)
+
+        if download_updates:
+            await session.execute(update(DownloadModel), download_updates)
+        if track_updates:
+            await session.execute(update(TrackModel), track_updates)
+            # Track got its file → "X/Y local" counts of its artist/album change
+            await refresh_track_parent_aggregates(
+                session, [row["id"] for row in track_updates]
             )
-            await session.execute(stmt)
-            logger.info(f"Download completed: track_id={download.track_id}, file={local_path}")
+
+        self._stats["db_synced"] = len(download_updates)
+        return deltas
 
     # =========================================================================
     # STALE DOWNLOAD HANDLING (from DownloadMonitorWorker)
@@ -760,7 +881,7 @@ class DownloadStatusWorker:
     def _calculate_backoff_interval(self) -> float:
         """Calculate sleep interval with exponential backoff."""
         if self._consecutive_failures == 0:
-            return float(self._poll_interval)
+            return float(self._current_poll_interval)
 
         backoff = self._poll_interval * (2 ** self._consecutive_failures)
         return min(float(backoff), float(self._circuit_breaker_timeout))
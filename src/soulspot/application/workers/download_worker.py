@@ -59,6 +59,7 @@ class DownloadWorker:
         job_queue: JobQueue,
         slskd_client: ISlskdClient,
         session_factory: SessionFactory,
+        search_accept_score: float | None = None,
     ) -> None:
         """Initialize download worker.
 
@@ -66,10 +67,13 @@ class DownloadWorker:
             job_queue: Job queue for background processing
             slskd_client: Client for Soulseek operations
             session_factory: Factory to create new DB sessions (e.g., db.session_scope)
+            search_accept_score: Match score that ends a Soulseek search early
+                (None = always wait for the full search timeout)
         """
         self._job_queue = job_queue
         self._slskd_client = slskd_client
         self._session_factory = session_factory
+        self._search_accept_score = search_accept_score
 
     # Yo, this is the registration step - tells the job queue "when you see a DOWNLOAD job, call my
     # _handle_download_job method". This is separate from __init__ so you can create the worker without
@@ -118,6 +122,7 @@ class DownloadWorker:
         # This ensures short-lived transactions that release SQLite locks quickly.
         async with self._session_factory() as session:
             # Lazy imports to avoid circular dependencies
+            from soulspot.application.services.filter_service import FilterService
             from soulspot.application.use_cases.search_and_download import (
                 SearchAndDownloadTrackRequest,
                 SearchAndDownloadTrackUseCase,
@@ -136,6 +141,7 @@ class DownloadWorker:
                 slskd_client=self._slskd_client,
                 track_repository=track_repository,
                 download_repository=download_repository,
+                filter_service=FilterService(session),
             )
 
             # Execute use case
@@ -145,6 +151,7 @@ class DownloadWorker:
                 max_results=max_results,
                 timeout_seconds=timeout_seconds,
                 quality_preference=quality_preference,
+                accept_score=self._search_accept_score,
             )
 
             response = await use_case.execute(request)
@@ -12,15 +12,19 @@
 # - Berechnet nur für Tracks ohne file_hash (inkrementell)
 # - ThreadPool für CPU-intensive I/O
 #
-# STUFE 2: METADATA-HASH für Duplicate Detection
-# - Hash aus: artist_name + track_title (normalized)
-# - Optional: + duration_ms (within tolerance)
-# - Optional: + album_name
+# STUFE 2: NEAR-DUPLICATES (sorted neighborhood, siehe near_duplicates.py)
+# - Block = artist_id, sortiert nach duration_ms
+# - Sliding window ±5s statt fester Buckets, rapidfuzz auf normalisierten Titeln
+# - Inkrementell: nur Tracks mit updated_at nach dem letzten Pass
 #
-# NICHT implementiert (Phase 3): Audio-Fingerprinting
-# - Chromaprint/AcoustID wäre genauer
+# STUFE 1b: AUDIO-HASH (tag-unabhängig)
+# - Hash NUR über die Audio-Frames (ID3/APE/Vorbis-Comments/Cover übersprungen)
+# - Retagging ändert ihn nicht → gleiche Audio-Daten werden trotzdem gefunden
+# - Siehe application/services/audio_fingerprint.py
+#
+# NICHT implementiert: akustisches Fingerprinting (Chromaprint/AcoustID)
+# - Würde auch verschiedene Encodes desselben Songs finden
 # - Aber braucht externe Lib und ist CPU-intensiv
-# - Für V1 reicht Metadata + FileHash
 #
 # Stolperfallen:
 # - "feat." vs "ft." vs "(feat. " - alles normalisieren!
@@ -30,8 +34,8 @@
 """Duplicate detector worker for finding duplicate tracks in library.
 
 This worker performs TWO functions:
-1. Computes SHA256 file hashes for tracks without them (nightly, incremental)
-2. Detects duplicates using both metadata matching and file hash matching
+1. Computes SHA256 file hashes and tag-independent audio hashes (nightly, incremental)
+2. Detects duplicates using metadata matching and file/audio hash matching
 
 The hash computation is separated from library scan for performance!
 Library scan stays fast (~1s/file), hashing runs in nightly batch.
@@ -39,14 +43,11 @@ Library scan stays fast (~1s/file), hashing runs in nightly batch.
 
 import asyncio
 import contextlib
-import hashlib
 import logging
 import os
-import re
-import unicodedata
+from collections.abc import Sequence
 from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -57,25 +58,15 @@ from soulspot.application.workers.job_queue import Job, JobQueue, JobType
 
 logger = logging.getLogger(__name__)
 
+# Rows per executemany UPDATE when writing computed hashes back
+HASH_UPDATE_CHUNK_SIZE = 500
+
 
-# Patterns to strip from titles for normalization
-STRIP_PATTERNS = [
-    r"\s*\(.*?remaster.*?\)\s*",  # (2023 Remaster), (Remastered) etc
-    r"\s*\[.*?remaster.*?\]\s*",
-    r"\s*-\s*remaster.*$",
-    r"\s*\(.*?bonus.*?\)\s*",  # (Bonus Track)
-    r"\s*\[.*?bonus.*?\]\s*",
-    r"\s*\(.*?deluxe.*?\)\s*",  # (Deluxe Edition)
-    r"\s*\(.*?anniversary.*?\)\s*",  # (25th Anniversary Edition)
-]
+# Candidate pairs per existence lookup + commit
+CANDIDATE_BATCH_SIZE = 500
 
-# Feat patterns to normalize
-FEAT_PATTERNS = [
-    (r"\s*\(feat\.?\s+", " feat. "),
-    (r"\s*\[feat\.?\s+", " feat. "),
-    (r"\s*ft\.?\s+", " feat. "),
-    (r"\s*featuring\s+", " feat. "),
-]
+# Last completed near-duplicate pass - only tracks updated after it are re-checked
+NEAR_DUPLICATE_WATERMARK_KEY = "automation.duplicate_detection_near_last_pass"
 
 
 class DuplicateDetectorWorker:
@@ -84,14 +75,17 @@ class DuplicateDetectorWorker:
     This worker performs TWO functions (Dec 2025 update):
 
     1. SHA256 FILE HASH COMPUTATION (runs first):
-       - Finds tracks without file_hash (empty or NULL)
-       - Computes SHA256 in ThreadPool (non-blocking)
-       - Updates tracks with computed hashes
-       - Incremental: only processes tracks without hashes
+       - Groups local files by size - unique sizes can't be exact duplicates
+       - Head/tail partial hash for same-size files, full SHA256 only on collision
+       - Parallel reads in ThreadPool (non-blocking), bulk UPDATEs
+       - Incremental: stored full/partial hashes are reused
+       - Same funnel over the audio frames only (audio_hash) - survives retagging
 
     2. DUPLICATE DETECTION (runs after hashing):
-       - Metadata-based: normalizes artist + title, groups by hash
+       - Metadata-based: blocked sorted-neighborhood engine (same artist, fuzzy
+         normalized title, duration window), incremental via updated_at watermark
        - File-based: groups tracks with identical file_hash
+       - Audio-based: groups tracks with identical audio_hash (tags may differ)
        - Creates duplicate candidates for user review
 
     The hash computation is separated from library scan for performance!
@@ -149,17 +143,19 @@ class DuplicateDetectorWorker:
         # ThreadPool for CPU-intensive SHA256 hash computation
         # Hey future me - this is the KEY performance optimization! SHA256 reads entire files,
         # which blocks I/O. Running in ThreadPool keeps the event loop responsive.
-        self._executor = ThreadPoolExecutor(
-            max_workers=min(4, max(2, os.cpu_count() or 2))
-        )
+        self._hash_workers = min(4, max(2, os.cpu_count() or 2))
+        self._executor = ThreadPoolExecutor(max_workers=self._hash_workers)
 
         # Stats - values can be int, str, or None
         self._stats: dict[str, int | str | None] = {
             "scans_completed": 0,
             "duplicates_found": 0,
-            "tracks_scanned": 0,
+            "tracks_scanned": 0,  # tracks read by the last near-duplicate pass
+            "near_duplicate_comparisons": 0,  # title comparisons in that pass
             "hashes_computed": 0,  # NEW: tracks with newly computed SHA256 hashes
             "hash_errors": 0,  # NEW: files that couldn't be hashed (missing, permission)
+            "hash_bytes_read": 0,  # bytes read by the last hashing run
+            "hash_unique_size_skipped": 0,  # files never read - no same-size twin
             "last_scan_at": None,
             "last_error": None,
         }
@@ -197,7 +193,7 @@ class DuplicateDetectorWorker:
             "name": "Duplicate Detector",
             "running": self._running,
             "status": "active" if self._running else "stopped",
-            "detection_method": "metadata-hash + file-hash",
+            "detection_method": "near-duplicate + file-hash + audio-hash",
             "stats": self._stats.copy(),
         }
 
@@ -247,14 +243,22 @@ class DuplicateDetectorWorker:
         """Execute one duplicate detection scan.
 
         Hey future me - das ist der Hauptalgorithmus (Dec 2025 update):
-        1. PHASE 1: Compute SHA256 hashes for tracks without them
-        2. PHASE 2: Load all tracks for duplicate detection
-        3. PHASE 3: Group by metadata hash (artist+title)
-        4. PHASE 4: Group by file hash (exact duplicates)
-        5. PHASE 5: Store candidates for user review
+        1. PHASE 1: Compute file + audio hashes for tracks without them
+        2. PHASE 2: Exact duplicates - GROUP BY over the hash indexes
+        3. PHASE 3: Near duplicates - blocked sorted-neighborhood engine, only
+           tracks changed since the last pass (see near_duplicates.py)
+
+        Candidates are written batch by batch, nothing library-sized stays in memory.
         """
         logger.info("Starting duplicate detection scan (with hash computation)")
 
+        from soulspot.application.services.audio_fingerprint import (
+            AUDIO_HASH_ALGORITHM,
+        )
+        from soulspot.application.services.file_hashing import FULL_HASH_ALGORITHM
+        from soulspot.domain.entities import DuplicateMatchType
+        from soulspot.infrastructure.persistence.models import TrackModel
+
         # Hey future me - using session_scope context manager ensures proper connection cleanup!
         async with self._session_scope() as session:
             # PHASE 1: Compute SHA256 hashes for tracks without them
@@ -262,149 +266,180 @@ class DuplicateDetectorWorker:
             hashes_computed, hash_errors = await self._compute_missing_file_hashes(
                 session
             )
-            self._stats["hashes_computed"] = hashes_computed
-            self._stats["hash_errors"] = hash_errors
-            logger.info(
-                f"Phase 1 complete: computed {hashes_computed} hashes, "
-                f"{hash_errors} errors"
+            # PHASE 1b: Audio payload hashes (survive retagging)
+            audio_computed, audio_errors = await self._compute_missing_audio_hashes(
+                session
             )
-
-            # PHASE 2: Load all tracks for duplicate detection
-            tracks = await self._load_tracks(session)
-            self._stats["tracks_scanned"] = len(tracks)
-
-            if not tracks:
-                logger.info("No tracks to scan for duplicates")
-                return
-
-            # PHASE 3: Group tracks by metadata hash (artist+title normalized)
-            metadata_groups: dict[str, list[dict[str, Any]]] = {}
-            for track in tracks:
-                track_hash = self._compute_track_hash(track)
-                if track_hash not in metadata_groups:
-                    metadata_groups[track_hash] = []
-                metadata_groups[track_hash].append(track)
-
-            # Find groups with duplicates (metadata-based)
-            metadata_duplicate_groups = {
-                h: group for h, group in metadata_groups.items() if len(group) > 1
-            }
-
+            self._stats["hashes_computed"] = hashes_computed + audio_computed
+            self._stats["hash_errors"] = hash_errors + audio_errors
             logger.info(
-                f"Phase 3: Found {len(metadata_duplicate_groups)} metadata-based "
-                f"duplicate groups from {len(tracks)} tracks"
+                f"Phase 1 complete: computed {hashes_computed} file hashes, "
+                f"{audio_computed} audio hashes, {hash_errors + audio_errors} errors"
             )
 
-            # PHASE 4: Group by file hash (exact file duplicates)
-            # Only for tracks that have file_hash computed
-            file_hash_groups: dict[str, list[dict[str, Any]]] = {}
-            for track in tracks:
-                file_hash = track.get("file_hash")
-                if file_hash:  # Only tracks with computed hash
-                    if file_hash not in file_hash_groups:
-                        file_hash_groups[file_hash] = []
-                    file_hash_groups[file_hash].append(track)
-
-            # Find exact file duplicates
-            file_duplicate_groups = {
-                h: group for h, group in file_hash_groups.items() if len(group) > 1
-            }
-
-            logger.info(
-                f"Phase 4: Found {len(file_duplicate_groups)} exact file duplicate groups"
-            )
-
-            # PHASE 5: Store duplicate candidates
+            # PHASE 2: Exact duplicates straight from the hash indexes - identical
+            # bytes (file_hash) and identical audio with any tags (audio_hash).
+            # File duplicates first - the same pair found again by audio hash is
+            # skipped, and so is a later near-duplicate hit on an exact pair.
             candidates_added = 0
+            for match_type, hash_column, algorithm_column, algorithm in (
+                (
+                    DuplicateMatchType.FILE_HASH,
+                    TrackModel.file_hash,
+                    TrackModel.file_hash_algorithm,
+                    FULL_HASH_ALGORITHM,
+                ),
+                (
+                    DuplicateMatchType.AUDIO_HASH,
+                    TrackModel.audio_hash,
+                    TrackModel.audio_hash_algorithm,
+                    AUDIO_HASH_ALGORITHM,
+                ),
+            ):
+                groups = await self._exact_hash_groups(
+                    session, hash_column, algorithm_column, algorithm
+                )
+                exact_pairs = [
+                    (group[i], group[j], 1.0, None)  # Exact match = 100% similarity
+                    for group in groups
+                    for i in range(len(group))
+                    for j in range(i + 1, len(group))
+                ]
+                added = await self._store_candidates(session, exact_pairs, match_type)
+                candidates_added += added
+                logger.info(
+                    f"Phase 2: {len(groups)} exact {match_type.value} groups, "
+                    f"{added} new candidates"
+                )
 
-            # Store metadata-based duplicates
-            for _hash_key, group in metadata_duplicate_groups.items():
-                for i in range(len(group)):
-                    for j in range(i + 1, len(group)):
-                        track_1 = group[i]
-                        track_2 = group[j]
-                        score = self._calculate_similarity(track_1, track_2)
-                        await self._store_candidate(
-                            session,
-                            track_1["id"],
-                            track_2["id"],
-                            score,
-                            "metadata-hash",
-                        )
-                        candidates_added += 1
-
-            # Store file-hash based duplicates (exact matches = 100% similarity)
-            for _hash_key, group in file_duplicate_groups.items():
-                for i in range(len(group)):
-                    for j in range(i + 1, len(group)):
-                        track_1 = group[i]
-                        track_2 = group[j]
-                        await self._store_candidate(
-                            session,
-                            track_1["id"],
-                            track_2["id"],
-                            1.0,  # Exact file match = 100% similarity
-                            "file-hash",
-                        )
-                        candidates_added += 1
+            # PHASE 3: Near duplicates (same artist, similar title + duration)
+            candidates_added += await self._find_near_duplicates(session)
 
-            await session.commit()
             dups = self._stats.get("duplicates_found")
             self._stats["duplicates_found"] = (
                 int(dups) if dups else 0
             ) + candidates_added
 
-            logger.info(f"Phase 5: Stored {candidates_added} duplicate candidates")
+            logger.info(
+                f"Scan complete: stored {candidates_added} duplicate candidates"
+            )
+
+    async def _find_near_duplicates(self, session: Any) -> int:
+        """Run the near-duplicate engine over tracks changed since the last pass.
 
-    async def _load_tracks(self, session: Any) -> list[dict[str, Any]]:
-        """Load all tracks from database for duplicate detection.
+        Hey future me - the watermark is taken BEFORE the pass starts, so a track
+        edited while we run is simply looked at again next time. Pairs are stored
+        page by page - a crash midway keeps what was found, the watermark only moves
+        once the pass is complete.
 
         Args:
             session: DB session
 
         Returns:
-            List of track dicts with id, title, artist_name, duration_ms, file_hash
+            Number of new candidates stored
         """
-        # Import here to avoid circular deps
-        from sqlalchemy import select
+        import json
+
+        from soulspot.application.services.near_duplicates import NearDuplicateEngine
+        from soulspot.domain.entities import DuplicateMatchType
+
+        settings = AppSettingsService(session)
+        since = await settings.get_datetime(NEAR_DUPLICATE_WATERMARK_KEY)
+        pass_started = datetime.now(UTC)
+
+        engine = NearDuplicateEngine(session, block_by="artist")
+        pairs_found = 0
+        added = 0
+        async for pairs in engine.iter_pairs(since=since):
+            pairs_found += len(pairs)
+            added += await self._store_candidates(
+                session,
+                [
+                    (
+                        pair.track_id_1,
+                        pair.track_id_2,
+                        pair.similarity,
+                        json.dumps(
+                            {
+                                "title_score": pair.title_score,
+                                "duration_diff_ms": pair.duration_diff_ms,
+                            }
+                        ),
+                    )
+                    for pair in pairs
+                ],
+                DuplicateMatchType.METADATA,
+            )
+
+        await settings.set_datetime(
+            NEAR_DUPLICATE_WATERMARK_KEY, pass_started, category="automation"
+        )
+        await session.commit()
+
+        neighborhood = engine.neighborhood
+        self._stats["tracks_scanned"] = neighborhood.tracks_seen
+        self._stats["near_duplicate_comparisons"] = neighborhood.comparisons
+        logger.info(
+            f"Near duplicates ({'full pass' if since is None else f'since {since}'}): "
+            f"{neighborhood.tracks_seen} tracks, {neighborhood.comparisons} "
+            f"comparisons, {pairs_found} pairs, {added} new candidates"
+        )
+        return added
+
+    async def _exact_hash_groups(
+        self, session: Any, hash_column: Any, algorithm_column: Any, algorithm: str
+    ) -> list[list[str]]:
+        """Track IDs sharing a full hash - one GROUP BY over the hash index.
+
+        Args:
+            session: DB session
+            hash_column: TrackModel.file_hash or TrackModel.audio_hash
+            algorithm_column: Matching *_algorithm column
+            algorithm: Full-hash algorithm (partial hashes never prove a duplicate)
+
+        Returns:
+            One list of track IDs per duplicated hash
+        """
+        from sqlalchemy import func, select
 
         from soulspot.infrastructure.persistence.models import TrackModel
 
+        duplicated = (
+            select(hash_column)
+            .where(hash_column.isnot(None), algorithm_column == algorithm)
+            .group_by(hash_column)
+            .having(func.count() > 1)
+            .subquery()
+        )
         result = await session.execute(
-            select(
-                TrackModel.id,
-                TrackModel.title,
-                TrackModel.artist_id,
-                TrackModel.duration_ms,
-                TrackModel.file_hash,  # NEW: for file-based duplicate detection
+            select(hash_column, TrackModel.id)
+            .where(
+                hash_column.in_(select(duplicated.c[0])),
+                algorithm_column == algorithm,
             )
+            .order_by(hash_column, TrackModel.id)
         )
-        rows = result.all()
-
-        return [
-            {
-                "id": str(row.id),
-                "title": row.title or "",
-                # Note: artist_id instead of artist_name - for duplicate detection
-                # we use artist_id as a proxy since actual name requires a join
-                "artist_name": str(row.artist_id) if row.artist_id else "",
-                "duration_ms": row.duration_ms or 0,
-                "file_hash": row.file_hash or "",  # NEW: for file-based duplicates
-            }
-            for row in rows
-        ]
+        groups: dict[str, list[str]] = {}
+        for digest, track_id in result.all():
+            groups.setdefault(digest, []).append(str(track_id))
+        return list(groups.values())
 
     async def _compute_missing_file_hashes(self, session: Any) -> tuple[int, int]:
-        """Compute SHA256 hashes for tracks that don't have them.
+        """Hash exactly the files that could be byte-identical duplicates.
 
         Hey future me - this is the KEY performance optimization from Dec 2025!
         SHA256 hashing was removed from library scan (took ~55% of scan time).
         Instead, we compute hashes here in the nightly job, incrementally.
 
+        UPDATE: No more "SHA256 every file, one at a time". FileHashPipeline groups
+        by size first (unique size = never read), head/tail-hashes same-size files
+        and full-hashes only partial collisions, N reads in flight in the ThreadPool.
+        Results go back as executemany UPDATEs per chunk instead of one per row.
+
         Process:
-        1. Query tracks WHERE file_hash IS NULL AND file_path IS NOT NULL
-        2. Compute SHA256 in ThreadPool (non-blocking I/O)
-        3. Batch update tracks with computed hashes
+        1. Load ALL local tracks (sizes of hashed files matter for new ones)
+        2. Run the size -> partial -> full funnel in the ThreadPool
+        3. Bulk update hashes (and sizes the scanner didn't store)
         4. Return (hashes_computed, errors_count)
 
         Args:
@@ -413,232 +448,232 @@ class DuplicateDetectorWorker:
         Returns:
             Tuple of (hashes_computed, errors_count)
         """
-        from sqlalchemy import or_, select, update
+        from sqlalchemy import select
 
+        from soulspot.application.services.file_hashing import (
+            FileHashPipeline,
+            HashCandidate,
+        )
         from soulspot.infrastructure.persistence.models import TrackModel
 
-        # Find tracks without file_hash but with valid file_path
         result = await session.execute(
-            select(TrackModel.id, TrackModel.file_path).where(
-                or_(
-                    TrackModel.file_hash.is_(None),
-                    TrackModel.file_hash == "",
-                ),
+            select(
+                TrackModel.id,
+                TrackModel.file_path,
+                TrackModel.file_size,
+                TrackModel.file_hash,
+                TrackModel.file_hash_algorithm,
+            ).where(
                 TrackModel.file_path.isnot(None),
                 TrackModel.file_path != "",
             )
         )
-        tracks_to_hash = result.all()
-
-        if not tracks_to_hash:
-            logger.info("No tracks need hash computation")
+        candidates = [
+            HashCandidate(
+                track_id=str(row.id),
+                file_path=row.file_path,
+                size=row.file_size,
+                file_hash=row.file_hash,
+                algorithm=row.file_hash_algorithm,
+            )
+            for row in result.all()
+        ]
+        if not candidates:
+            logger.info("No local tracks to hash")
             return 0, 0
 
-        logger.info(f"Computing SHA256 hashes for {len(tracks_to_hash)} tracks")
-
-        hashes_computed = 0
-        errors = 0
-        batch_size = 100  # Commit every N tracks to avoid huge transactions
-
-        loop = asyncio.get_running_loop()
-
-        for i, (track_id, file_path) in enumerate(tracks_to_hash):
-            try:
-                # Compute hash in ThreadPool (non-blocking)
-                file_hash = await loop.run_in_executor(
-                    self._executor, self._compute_sha256_sync, file_path
-                )
-
-                if file_hash:
-                    # Update track with computed hash
-                    await session.execute(
-                        update(TrackModel)
-                        .where(TrackModel.id == track_id)
-                        .values(file_hash=file_hash, file_hash_algorithm="sha256")
-                    )
-                    hashes_computed += 1
-                else:
-                    errors += 1
+        pipeline = FileHashPipeline(
+            self._executor, max_in_flight=self._hash_workers * 2
+        )
+        outcome = await pipeline.run(candidates)
 
-            except Exception as e:
-                logger.warning(f"Error computing hash for track {track_id}: {e}")
-                errors += 1
+        await self._bulk_update_tracks(session, outcome.size_updates)
+        await self._bulk_update_tracks(session, outcome.hash_updates)
 
-            # Batch commit for memory efficiency
-            if (i + 1) % batch_size == 0:
-                await session.commit()
-                logger.info(
-                    f"Hash progress: {i + 1}/{len(tracks_to_hash)} "
-                    f"(computed: {hashes_computed}, errors: {errors})"
-                )
+        self._stats["hash_bytes_read"] = outcome.bytes_read
+        self._stats["hash_unique_size_skipped"] = outcome.unique_size_skipped
+        logger.info(
+            f"Hashing: {outcome.files_considered} files, "
+            f"{outcome.unique_size_skipped} skipped (unique size), "
+            f"{outcome.partial_hashed} partial, {outcome.full_hashed} full, "
+            f"{outcome.bytes_read / 1_048_576:.1f} MiB read, {outcome.errors} errors"
+        )
 
-        # Final commit
-        await session.commit()
+        return outcome.partial_hashed + outcome.full_hashed, outcome.errors
 
-        return hashes_computed, errors
+    async def _compute_missing_audio_hashes(self, session: Any) -> tuple[int, int]:
+        """Hash the audio frames (not the tags) of files that could be duplicates.
 
-    def _compute_sha256_sync(
-        self, file_path: str, chunk_size: int = 8192
-    ) -> str | None:
-        """Compute SHA256 hash of a file (sync, for ThreadPool).
+        Hey future me - same funnel as the file hashes, but over the audio payload
+        (AUDIO_HASH_SCHEME): group by payload length, head/tail hash same-length
+        payloads, full hash only on collision.
 
-        Hey future me - this runs in ThreadPool! It's the same SHA256 computation
-        that was removed from library scanner. Full file read is expensive (~55%
-        of old scan time), but running in parallel threads keeps things responsive.
+        The scanner doesn't clear audio_hash when a file changes (that's the point -
+        retagging changes the file, not the audio). Instead, rows whose file_mtime
+        moved since audio_hash_mtime get revalidated here by re-locating the payload
+        (header reads only): same payload length = tag edit, hash stays. Different
+        length = new audio, hash is dropped and recomputed.
 
         Args:
-            file_path: Path to the audio file
-            chunk_size: Read chunk size (default 8KB)
+            session: DB session
 
         Returns:
-            SHA256 hex digest, or None if file is inaccessible
-        """
-        try:
-            path = Path(file_path)
-            if not path.exists():
-                logger.debug(f"File not found for hashing: {file_path}")
-                return None
-
-            sha256 = hashlib.sha256()
-            with open(path, "rb") as f:
-                for chunk in iter(lambda: f.read(chunk_size), b""):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
-
-        except PermissionError:
-            logger.warning(f"Permission denied for hashing: {file_path}")
-            return None
-        except Exception as e:
-            logger.warning(f"Error computing SHA256 for {file_path}: {e}")
-            return None
-
-    def _compute_track_hash(self, track: dict[str, Any]) -> str:
-        """Compute metadata hash for a track.
-
-        Hey future me - NORMALISIERUNG ist der Schlüssel!
-        Ohne sie matchst du "The Beatles" nicht mit "Beatles, The".
-
-        Hash = MD5(normalized_artist + "|" + normalized_title)
-        """
-        artist = self._normalize_text(track["artist_name"])
-        title = self._normalize_title(track["title"])
-
-        # Combine and hash
-        # Note: MD5 is used here only for grouping duplicates, not for security
-        combined = f"{artist}|{title}"
-        return hashlib.md5(  # nosec B324 - MD5 used for hash grouping, not security
-            combined.encode("utf-8"), usedforsecurity=False
-        ).hexdigest()
-
-    def _normalize_text(self, text: str) -> str:
-        """Normalize text for comparison.
-
-        Operations:
-        - Lowercase
-        - Unicode normalization (NFD -> ASCII)
-        - Strip "The " prefix
-        - Remove punctuation
-        - Collapse whitespace
+            Tuple of (hashes_computed, errors_count)
         """
-        if not text:
-            return ""
+        from sqlalchemy import select
 
-        # Lowercase
-        text = text.lower()
+        from soulspot.application.services.audio_fingerprint import (
+            AUDIO_HASH_SCHEME,
+            audio_payload_region_sync,
+        )
+        from soulspot.application.services.file_hashing import (
+            FileHashPipeline,
+            HashCandidate,
+        )
+        from soulspot.infrastructure.persistence.models import TrackModel
 
-        # Unicode normalization (é -> e, etc)
-        text = unicodedata.normalize("NFD", text)
-        text = text.encode("ascii", "ignore").decode("ascii")
+        result = await session.execute(
+            select(
+                TrackModel.id,
+                TrackModel.file_path,
+                TrackModel.file_mtime,
+                TrackModel.audio_hash,
+                TrackModel.audio_hash_algorithm,
+                TrackModel.audio_payload_size,
+                TrackModel.audio_hash_mtime,
+            ).where(
+                TrackModel.file_path.isnot(None),
+                TrackModel.file_path != "",
+            )
+        )
 
-        # Strip "The " prefix
-        if text.startswith("the "):
-            text = text[4:]
+        candidates: list[HashCandidate] = []
+        changed: list[HashCandidate] = []
+        new: list[HashCandidate] = []
+        mtimes: dict[str, float | None] = {}
+        for row in result.all():
+            unchanged = row.audio_hash_mtime == row.file_mtime
+            if row.audio_payload_size == 0 and unchanged:
+                continue  # Unsupported container, nothing to hash until it changes
+            candidate = HashCandidate(
+                track_id=str(row.id),
+                file_path=row.file_path,
+                size=row.audio_payload_size or None,
+                file_hash=row.audio_hash,
+                algorithm=row.audio_hash_algorithm,
+                offset=None,  # Located only for files that actually get read
+            )
+            mtimes[candidate.track_id] = row.file_mtime
+            if candidate.size is None:
+                new.append(candidate)
+            elif not unchanged:
+                changed.append(candidate)
+            candidates.append(candidate)
+
+        if not candidates:
+            logger.info("No local tracks to audio-hash")
+            return 0, 0
 
-        # Remove punctuation except spaces
-        text = re.sub(r"[^\w\s]", "", text)
+        pipeline = FileHashPipeline(
+            self._executor,
+            max_in_flight=self._hash_workers * 2,
+            scheme=AUDIO_HASH_SCHEME,
+        )
 
-        # Collapse whitespace
-        text = " ".join(text.split())
+        # Revalidate changed files: tag edit (same payload length) or new audio?
+        revalidated: list[dict[str, Any]] = []
+        regions = await pipeline.map(
+            audio_payload_region_sync, [(c.file_path,) for c in changed]
+        )
+        for candidate, region in zip(changed, regions, strict=True):
+            offset, length = region if region is not None else (None, 0)
+            if length != candidate.size:
+                candidate.file_hash = None
+                candidate.algorithm = None
+            candidate.offset, candidate.size = offset, length or None
+            revalidated.append(
+                {
+                    "id": candidate.track_id,
+                    "audio_hash": candidate.file_hash,
+                    "audio_hash_algorithm": candidate.algorithm,
+                    "audio_payload_size": length,
+                    "audio_hash_mtime": mtimes[candidate.track_id],
+                }
+            )
+        # Track IDs, not "c in new": HashCandidate is a dataclass, list membership
+        # would be an __eq__ scan per candidate (O(n²) on a first run)
+        new_ids = {c.track_id for c in new}
+        candidates = [
+            c for c in candidates if c.size is not None or c.track_id in new_ids
+        ]
 
-        return text.strip()
+        outcome = await pipeline.run(candidates)
 
-    def _normalize_title(self, title: str) -> str:
-        """Normalize track title with extra rules.
+        # Payload sizes found by the pipeline (new rows) + unsupported new rows
+        # (size 0 = don't look again until the file changes)
+        located = {row["id"] for row in outcome.size_updates}
+        size_rows = [
+            {**row, "audio_hash_mtime": mtimes[row["id"]]}
+            for row in outcome.size_updates
+        ]
+        size_rows.extend(
+            {
+                "id": c.track_id,
+                "audio_payload_size": 0,
+                "audio_hash_mtime": mtimes[c.track_id],
+            }
+            for c in new
+            if c.track_id not in located
+        )
 
-        Additional to base normalization:
-        - Strip remaster/bonus/deluxe suffixes
-        - Normalize feat. patterns
-        """
-        if not title:
-            return ""
+        # Order matters: revalidation may clear a hash the pipeline recomputed
+        await self._bulk_update_tracks(session, revalidated)
+        await self._bulk_update_tracks(session, size_rows)
+        await self._bulk_update_tracks(session, outcome.hash_updates)
 
-        # Apply strip patterns (remaster etc)
-        for pattern in STRIP_PATTERNS:
-            title = re.sub(pattern, "", title, flags=re.IGNORECASE)
+        logger.info(
+            f"Audio hashing: {outcome.files_considered} files "
+            f"({len(changed)} changed revalidated), "
+            f"{outcome.unique_size_skipped} skipped (unique payload length), "
+            f"{outcome.partial_hashed} partial, {outcome.full_hashed} full, "
+            f"{outcome.bytes_read / 1_048_576:.1f} MiB read, {outcome.errors} errors"
+        )
+        return outcome.partial_hashed + outcome.full_hashed, outcome.errors
 
-        # Normalize feat patterns
-        for pattern, replacement in FEAT_PATTERNS:
-            title = re.sub(pattern, replacement, title, flags=re.IGNORECASE)
+    async def _bulk_update_tracks(
+        self, session: Any, rows: list[dict[str, Any]]
+    ) -> None:
+        """executemany UPDATE of tracks by primary key, committed per chunk.
 
-        # Then apply base normalization
-        return self._normalize_text(title)
+        Commit per chunk keeps transactions (and SQLite write locks) short.
+        All rows must have the same keys. updated_at is pinned - sizes and hashes
+        are bookkeeping, bumping it would mark the tracks as changed for the
+        incremental near-duplicate pass.
+        """
+        from sqlalchemy import update
 
-    def _calculate_similarity(
-        self, track_1: dict[str, Any], track_2: dict[str, Any]
-    ) -> float:
-        """Calculate similarity score between two tracks.
+        from soulspot.infrastructure.persistence.models import TrackModel
 
-        Score 0.0 - 1.0 based on:
-        - Title match (normalized): 0.4
-        - Artist match (normalized): 0.4
-        - Duration within tolerance: 0.2
+        stmt = update(TrackModel).values(updated_at=TrackModel.updated_at)
+        for i in range(0, len(rows), HASH_UPDATE_CHUNK_SIZE):
+            await session.execute(stmt, rows[i : i + HASH_UPDATE_CHUNK_SIZE])
+            await session.commit()
 
-        Returns:
-            Similarity score 0.0 - 1.0
-        """
-        score = 0.0
-
-        # Title match (40%)
-        title_1 = self._normalize_title(track_1["title"])
-        title_2 = self._normalize_title(track_2["title"])
-        if title_1 == title_2:
-            score += 0.4
-
-        # Artist match (40%)
-        artist_1 = self._normalize_text(track_1["artist_name"])
-        artist_2 = self._normalize_text(track_2["artist_name"])
-        if artist_1 == artist_2:
-            score += 0.4
-
-        # Duration match with tolerance (20%)
-        # Tracks within 5 seconds are considered matching
-        duration_1 = track_1.get("duration_ms", 0)
-        duration_2 = track_2.get("duration_ms", 0)
-        if duration_1 > 0 and duration_2 > 0:
-            diff_ms = abs(duration_1 - duration_2)
-            if diff_ms < 5000:  # 5 seconds
-                score += 0.2
-            elif diff_ms < 10000:  # 10 seconds
-                score += 0.1
-
-        return score
-
-    async def _store_candidate(
+    async def _store_candidates(
         self,
         session: Any,
-        track_id_1: str,
-        track_id_2: str,
-        similarity_score: float,
-        match_type: str,
-    ) -> None:
-        """Store a duplicate candidate pair in database.
+        pairs: Sequence[tuple[str, str, float, str | None]],
+        match_type: Any,
+    ) -> int:
+        """Store duplicate candidate pairs that aren't stored yet, then commit.
 
         Args:
             session: DB session
-            track_id_1: First track ID
-            track_id_2: Second track ID
-            similarity_score: Similarity score 0.0-1.0
-            match_type: Detection method (metadata-hash, fingerprint, etc)
+            pairs: (track_id_1, track_id_2, similarity 0.0-1.0, match_details JSON)
+            match_type: DuplicateMatchType of all pairs
+
+        Returns:
+            Number of new candidates
         """
         # Hey future me - NOW we use DuplicateCandidateRepository! Clean Architecture.
         from uuid import uuid4
@@ -646,33 +681,38 @@ class DuplicateDetectorWorker:
         from soulspot.domain.entities import (
             DuplicateCandidate,
             DuplicateCandidateStatus,
-            DuplicateMatchType,
         )
         from soulspot.infrastructure.persistence.repositories import (
             DuplicateCandidateRepository,
         )
 
-        repo = DuplicateCandidateRepository(session)
+        if not pairs:
+            return 0
+
+        candidates = []
+        for track_id_1, track_id_2, similarity_score, details in pairs:
+            # Ensure consistent ordering (smaller ID first)
+            if track_id_1 > track_id_2:
+                track_id_1, track_id_2 = track_id_2, track_id_1
+            candidates.append(
+                DuplicateCandidate(
+                    id=str(uuid4()),
+                    track_id_1=track_id_1,
+                    track_id_2=track_id_2,
+                    # Note: similarity_score is 0.0-1.0, but entity expects 0-100 int
+                    similarity_score=int(similarity_score * 100),
+                    match_type=match_type,
+                    status=DuplicateCandidateStatus.PENDING,
+                    match_details=details,
+                )
+            )
 
-        # Ensure consistent ordering (smaller ID first)
-        if track_id_1 > track_id_2:
-            track_id_1, track_id_2 = track_id_2, track_id_1
-
-        # Check if this pair already exists
-        if await repo.exists(track_id_1, track_id_2):
-            return  # Already exists
-
-        # Create candidate entity
-        # Note: similarity_score is 0.0-1.0, but entity expects 0-100 int
-        candidate = DuplicateCandidate(
-            id=str(uuid4()),
-            track_id_1=track_id_1,
-            track_id_2=track_id_2,
-            similarity_score=int(similarity_score * 100),  # Convert to 0-100
-            match_type=DuplicateMatchType(match_type),
-            status=DuplicateCandidateStatus.PENDING,
-        )
-        await repo.add(candidate)
+        repo = DuplicateCandidateRepository(session)
+        added = 0
+        for i in range(0, len(candidates), CANDIDATE_BATCH_SIZE):
+            added += await repo.add_missing(candidates[i : i + CANDIDATE_BATCH_SIZE])
+            await session.commit()
+        return added
 
     async def trigger_scan_now(self) -> str:
         """Manually trigger a duplicate scan.
@@ -8,7 +8,10 @@ Use "WorkItem" in new code, "Job" still works for backward compatibility.
 """
 
 import asyncio
+import bisect
+import heapq
 import logging
+import time
 import uuid
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
@@ -16,6 +19,8 @@ from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
+from soulspot.infrastructure.event_bus import JOB_TOPIC, get_event_bus
+
 logger = logging.getLogger(__name__)
 
 
@@ -112,31 +117,166 @@ class Job:
         return self.status == JobStatus.FAILED and self.retries < self.max_retries
 
 
+# Hey future me - histogram buckets (seconds) for queue-wait and run-time per JobType.
+# Covers "picked up instantly" up to "hour-long library scan", Prometheus-style
+# cumulative counts so /metrics can export them without any conversion.
+_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    15.0,
+    60.0,
+    300.0,
+    900.0,
+    3600.0,
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (count, sum, max + cumulative buckets)."""
+
+    def __init__(self, buckets: tuple[float, ...] = _LATENCY_BUCKETS) -> None:
+        """Initialize empty histogram.
+
+        Args:
+            buckets: Sorted upper bounds in seconds (+Inf is implicit)
+        """
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one observation."""
+        self._counts[bisect.bisect_left(self._buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export as dict with cumulative bucket counts."""
+        buckets: dict[str, int] = {}
+        cumulative = 0
+        for bound, count in zip(self._buckets, self._counts, strict=False):
+            cumulative += count
+            buckets[f"{bound:g}"] = cumulative
+        buckets["+Inf"] = self.count
+        return {
+            "count": self.count,
+            "sum": round(self.total, 3),
+            "avg": round(self.total / self.count, 3) if self.count else 0.0,
+            "max": round(self.max, 3),
+            "buckets": buckets,
+        }
+
+
+@dataclass
+class JobTypeLimit:
+    """Concurrency pool settings of one JobType.
+
+    max_concurrent: Running jobs of this type at most (None = only the global limit)
+    weight: Share of free slots when several types are waiting (stride scheduling)
+    """
+
+    max_concurrent: int | None = None
+    weight: float = 1.0
+
+
+# Hey future me - defaults for the per-type pools! The global limit still applies on
+# top. Heavy library jobs get ONE slot each, so a LIBRARY_SCAN can never occupy every
+# slot while downloads wait. DOWNLOAD gets the biggest share of free slots.
+DEFAULT_JOB_TYPE_LIMITS: dict[JobType, JobTypeLimit] = {
+    JobType.DOWNLOAD: JobTypeLimit(weight=4.0),
+    JobType.LIBRARY_SCAN: JobTypeLimit(max_concurrent=1, weight=2.0),
+    JobType.LIBRARY_SCAN_CLEANUP: JobTypeLimit(max_concurrent=1),
+    JobType.LIBRARY_SPOTIFY_ENRICHMENT: JobTypeLimit(max_concurrent=1),
+    JobType.DUPLICATE_SCAN: JobTypeLimit(max_concurrent=1),
+    JobType.CLEANUP: JobTypeLimit(max_concurrent=1),
+    JobType.AUTO_IMPORT: JobTypeLimit(max_concurrent=1),
+}
+
+
+@dataclass
+class _JobTypeState:
+    """Scheduler state of one JobType pool."""
+
+    limit: JobTypeLimit
+    # Heap of (-priority, seq, job). Cancelled jobs stay in here as tombstones
+    # (not in JobQueue._queued_ids anymore) and are skipped when they surface.
+    ready: list[tuple[int, int, Job]] = field(default_factory=list)
+    pending: int = 0  # live entries in ready
+    running: int = 0
+    pass_value: float = 0.0  # stride scheduling: lowest pass runs next
+    wait_hist: LatencyHistogram = field(default_factory=LatencyHistogram)
+    run_hist: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def has_slot(self) -> bool:
+        """True if another job of this type may start."""
+        return (
+            self.limit.max_concurrent is None
+            or self.running < self.limit.max_concurrent
+        )
+
+
 class JobQueue:
     """In-memory job queue for background workers.
 
     This is a simple in-memory implementation. For production use,
     consider using Redis, RabbitMQ, or Celery.
+
+    Hey future me - scheduling is EVENT-DRIVEN since Jan 2026:
+    - One dispatcher task sleeps on an asyncio.Event and wakes up on enqueue,
+      job completion, resume, limit changes or when the next retry is due.
+      No more sleep(0.1)/sleep(0.5) polling loops.
+    - Every JobType has its own ready heap and concurrency pool (JobTypeLimit).
+      Free slots go to the waiting type with the lowest stride "pass" value, so
+      weights decide the share and no type can starve the others.
+    - Failed jobs go into a delayed-retry heap instead of sleeping in a slot.
+    - cancel_job() is O(1): the heap entry becomes a tombstone that the
+      dispatcher skips when it reaches the top.
     """
 
-    def __init__(self, max_concurrent_jobs: int = 5) -> None:
+    def __init__(
+        self,
+        max_concurrent_jobs: int = 5,
+        job_type_limits: dict[JobType, JobTypeLimit] | None = None,
+    ) -> None:
         """Initialize job queue.
 
         Args:
             max_concurrent_jobs: Maximum number of jobs to run concurrently
+            job_type_limits: Per-type pools (default: DEFAULT_JOB_TYPE_LIMITS)
         """
-        self._queue: asyncio.PriorityQueue[tuple[int, int, Job]] = (
-            asyncio.PriorityQueue()
-        )
         self._jobs: dict[str, Job] = {}
         self._running_jobs: set[str] = set()
         self._max_concurrent = max_concurrent_jobs
+        self._num_workers = max_concurrent_jobs
         self._workers: list[asyncio.Task[None]] = []
         self._shutdown = False
         self._paused = False
         self._handlers: dict[JobType, Callable[[Job], Coroutine[Any, Any, Any]]] = {}
         self._counter = 0  # Counter for stable sorting
 
+        limits = DEFAULT_JOB_TYPE_LIMITS if job_type_limits is None else job_type_limits
+        self._type_states: dict[JobType, _JobTypeState] = {
+            job_type: _JobTypeState(
+                limit=JobTypeLimit(
+                    max_concurrent=limit.max_concurrent, weight=limit.weight
+                )
+            )
+            for job_type, limit in limits.items()
+        }
+        self._queued_ids: set[str] = set()  # jobs live in a ready heap
+        self._ready_since: dict[str, float] = {}  # job_id -> monotonic enqueue time
+        self._delayed: list[tuple[float, int, Job]] = []  # (due, seq, job) retry heap
+        self._delayed_ids: set[str] = set()
+        self._vtime = 0.0  # pass value of the last dispatched type
+        self._wakeup = asyncio.Event()
+        self._active_tasks: set[asyncio.Task[None]] = set()
+
     def register_handler(
         self,
         job_type: JobType,
@@ -182,10 +322,8 @@ class JobQueue:
         )
 
         self._jobs[job.id] = job
-        # Use negative priority for max heap behavior (higher priority first)
-        # Use counter for stable sorting (FIFO for same priority)
-        await self._queue.put((-job.priority, self._counter, job))
-        self._counter += 1
+        self._push_job(job)
+        self.publish_job_update(job)
 
         return job.id
 
@@ -217,6 +355,14 @@ class JobQueue:
             return False
 
         job.mark_cancelled()
+
+        # O(1): heap entries become tombstones, the dispatcher skips them
+        if job.id in self._queued_ids:
+            self._queued_ids.discard(job.id)
+            self._ready_since.pop(job.id, None)
+            self._type_state(job.job_type).pending -= 1
+        self._delayed_ids.discard(job.id)
+        self.publish_job_update(job)
         return True
 
     async def pause(self) -> None:
@@ -226,6 +372,7 @@ class JobQueue:
     async def resume(self) -> None:
         """Resume job processing globally."""
         self._paused = False
+        self._wake()
 
     def is_paused(self) -> bool:
         """Check if queue is paused."""
@@ -240,6 +387,7 @@ class JobQueue:
         if max_concurrent < 1:
             raise ValueError("max_concurrent must be at least 1")
         self._max_concurrent = max_concurrent
+        self._wake()
 
     def get_max_concurrent_jobs(self) -> int:
         """Get maximum concurrent jobs."""
@@ -274,10 +422,37 @@ class JobQueue:
 
         return jobs[:limit]
 
+    def set_job_type_limit(
+        self,
+        job_type: JobType,
+        max_concurrent: int | None = None,
+        weight: float = 1.0,
+    ) -> None:
+        """Configure the concurrency pool of a job type.
+
+        Args:
+            job_type: Job type to configure
+            max_concurrent: Max running jobs of this type (None = global limit only)
+            weight: Relative share of free slots while other types are waiting
+        """
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        self._type_state(job_type).limit = JobTypeLimit(
+            max_concurrent=max_concurrent, weight=weight
+        )
+        self._wake()
+
+    def get_job_type_limits(self) -> dict[JobType, JobTypeLimit]:
+        """Get the configured per-type pools."""
+        return {job_type: state.limit for job_type, state in self._type_states.items()}
+
     # Hey future me: Job execution with retry logic - exponential backoff on failures
     # WHY exponential backoff? 1s, 2s, 4s delays - gives transient issues time to resolve
     # Example: Network glitch fails download - retry immediately fails again, but retry after 2s succeeds
-    # GOTCHA: Re-queued jobs go to BACK of queue (by priority) - could delay if queue is full
+    # The backoff happens in the delayed-retry heap, NOT in the slot - the slot is free
+    # for other jobs while this one waits. Job is PENDING again during the backoff.
     async def _process_job(self, job: Job) -> None:
         """Process a single job.
 
@@ -289,6 +464,8 @@ class JobQueue:
 
         job.mark_running()
         self._running_jobs.add(job.id)
+        self.publish_job_update(job)
+        start = time.monotonic()
 
         try:
             # Get handler for job type
@@ -316,81 +493,201 @@ class JobQueue:
                     backoff_delay,
                     error_msg,
                 )
-                await asyncio.sleep(backoff_delay)
-                # Re-queue with same priority
-                await self._queue.put((-job.priority, self._counter, job))
-                self._counter += 1
+                self._schedule_retry(job, backoff_delay)
 
         finally:
             self._running_jobs.discard(job.id)
+            self._type_state(job.job_type).run_hist.observe(time.monotonic() - start)
+            self.publish_job_update(job)
+
+    def publish_job_update(self, job: Job) -> None:
+        """Publish the current state of a job on the event bus (JOB_TOPIC).
+
+        Hey future me - call this after changing a job from OUTSIDE the queue too
+        (DownloadStatusWorker writes slskd progress into job.result), otherwise
+        SSE clients never hear about it.
+        """
+        data: dict[str, Any] = {
+            "id": job.id,
+            "job_type": job.job_type.value,
+            "status": job.status.value,
+            "priority": job.priority,
+            "retries": job.retries,
+            "error": job.error,
+        }
+        if isinstance(job.result, dict) and "progress_percent" in job.result:
+            data["progress_percent"] = job.result["progress_percent"]
+        get_event_bus().publish(JOB_TOPIC, data)
+
+    # ==================== Scheduler ====================
+
+    def _wake(self) -> None:
+        """Wake the dispatcher (something changed that may free/need a slot)."""
+        self._wakeup.set()
+
+    def _type_state(self, job_type: JobType) -> _JobTypeState:
+        """Get (or lazily create) the scheduler state of a job type."""
+        state = self._type_states.get(job_type)
+        if state is None:
+            state = _JobTypeState(limit=JobTypeLimit())
+            self._type_states[job_type] = state
+        return state
+
+    def _push_job(self, job: Job, priority: int | None = None) -> None:
+        """Put a job into its type's ready heap.
 
-    # Hey future me: Worker loop - the main event loop that processes jobs
+        Args:
+            job: Job to queue
+            priority: Sort priority (default: job.priority, higher = earlier)
+        """
+        state = self._type_state(job.job_type)
+        if job.id not in self._queued_ids:
+            if state.pending == 0:
+                # Idle type re-joins at the current virtual time - no saved-up credit
+                state.pass_value = max(state.pass_value, self._vtime)
+            state.pending += 1
+            self._queued_ids.add(job.id)
+            self._ready_since[job.id] = time.monotonic()
+
+        # Negative priority for max heap behavior, counter for FIFO within a priority
+        sort_priority = job.priority if priority is None else priority
+        heapq.heappush(state.ready, (-sort_priority, self._counter, job))
+        self._counter += 1
+
+        # Too many tombstones (mass cancel) → rebuild, amortized O(1) per cancel
+        if len(state.ready) > 64 and len(state.ready) > 2 * state.pending:
+            state.ready = [e for e in state.ready if e[2].id in self._queued_ids]
+            heapq.heapify(state.ready)
+
+        self._wake()
+
+    def _schedule_retry(self, job: Job, delay: float) -> None:
+        """Park a failed job in the delayed-retry heap."""
+        job.status = JobStatus.PENDING
+        heapq.heappush(self._delayed, (time.monotonic() + delay, self._counter, job))
+        self._counter += 1
+        self._delayed_ids.add(job.id)
+        self._wake()
+
+    def _promote_due_retries(self) -> float | None:
+        """Move due retries to their ready heaps.
+
+        Returns:
+            Seconds until the next retry is due, None if there is none.
+        """
+        now = time.monotonic()
+        while self._delayed:
+            due, _, job = self._delayed[0]
+            if job.id not in self._delayed_ids:
+                heapq.heappop(self._delayed)  # cancelled while waiting
+                continue
+            if due > now:
+                return due - now
+            heapq.heappop(self._delayed)
+            self._delayed_ids.discard(job.id)
+            if job.status != JobStatus.CANCELLED:
+                self._push_job(job)
+        return None
+
+    def _peek(self, state: _JobTypeState) -> Job | None:
+        """Head of a type's ready heap (drops tombstones on the way)."""
+        while state.ready:
+            job = state.ready[0][2]
+            if job.id in self._queued_ids and job.status != JobStatus.CANCELLED:
+                return job
+            heapq.heappop(state.ready)
+        return None
+
+    def _next_job(self) -> Job | None:
+        """Pick the next job: lowest stride pass among types with a free slot."""
+        best: tuple[float, int, int] | None = None
+        best_state: _JobTypeState | None = None
+        for state in self._type_states.values():
+            if state.pending <= 0 or not state.has_slot():
+                continue
+            head = self._peek(state)
+            if head is None:
+                continue
+            neg_priority, seq, _ = state.ready[0]
+            key = (state.pass_value, neg_priority, seq)
+            if best is None or key < best:
+                best, best_state = key, state
+
+        if best_state is None:
+            return None
+
+        _, _, job = heapq.heappop(best_state.ready)
+        self._queued_ids.discard(job.id)
+        best_state.pending -= 1
+        self._vtime = best_state.pass_value
+        best_state.pass_value += 1.0 / best_state.limit.weight
+        ready_since = self._ready_since.pop(job.id, None)
+        if ready_since is not None:
+            best_state.wait_hist.observe(time.monotonic() - ready_since)
+        return job
+
+    async def _run_job(self, job: Job, state: _JobTypeState) -> None:
+        """Run one dispatched job and give its slot back."""
+        try:
+            await self._process_job(job)
+        except Exception as e:
+            logger.exception("Worker error: %s", e)
+        finally:
+            state.running -= 1
+            self._wake()
+
+    # Hey future me: Dispatcher - the ONE loop that hands out slots
     # WHY respect max_concurrent? slskd has limits, don't DDoS it with 100 simultaneous downloads
-    # WHY sleep intervals (0.1s, 0.5s, 1.0s)? Prevent busy-waiting and CPU spinning
-    # GOTCHA: Shutdown is checked every second max - could delay shutdown up to 1 second
-    async def _worker_loop(self) -> None:
-        """Worker loop to process jobs from queue."""
+    # WHY an Event instead of sleep()? Zero CPU while idle, zero latency when work arrives
+    # GOTCHA: Jobs are dequeued only when a slot is free - the heaps stay intact while all slots are busy
+    async def _dispatch_loop(self) -> None:
+        """Dispatcher loop: start jobs while slots are free, sleep until woken."""
         while not self._shutdown:
-            try:
-                # Skip processing if paused
-                if self._paused:
-                    await asyncio.sleep(0.5)
-                    continue
-
-                # Hey future me: The concurrency limit enforcement - wait for free slot before taking next job
-                # WHY while loop? Keep checking until slot opens or shutdown requested
-                # WHY 0.1s sleep? Fast enough response without CPU burning
-                # GOTCHA: We wait for slot BEFORE dequeuing - prevents queue from being drained while all workers busy
-
-                # Wait for available slot
-                while (
-                    len(self._running_jobs) >= self._max_concurrent
-                    and not self._shutdown
-                ):
-                    await asyncio.sleep(0.1)
-
-                if self._shutdown:
-                    break
-
-                # Wait for job with timeout to allow checking shutdown flag
-                priority_tuple = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-                _, _, job = priority_tuple  # Extract job from priority tuple
-
-                # Skip if paused while waiting
-                if self._paused:
-                    # Put job back in queue
-                    await self._queue.put(priority_tuple)
-                    await asyncio.sleep(0.5)
-                    continue
-
-                # Process job directly (not as a new task) to respect concurrency limit
-                await self._process_job(job)
+            self._wakeup.clear()
+            next_due = self._promote_due_retries()
+
+            if not self._paused:
+                limit = min(self._max_concurrent, self._num_workers)
+                while len(self._active_tasks) < limit:
+                    job = self._next_job()
+                    if job is None:
+                        break
+                    state = self._type_state(job.job_type)
+                    state.running += 1
+                    task = asyncio.create_task(
+                        self._run_job(job, state), name=f"job-{job.job_type.value}"
+                    )
+                    self._active_tasks.add(task)
+                    task.add_done_callback(self._active_tasks.discard)
 
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=next_due)
             except TimeoutError:
                 continue
-            except Exception as e:
-                # Log error but continue processing
-                logger.exception("Worker error: %s", e)
-                continue
 
     async def start(self, num_workers: int = 3) -> None:
-        """Start worker threads.
+        """Start the dispatcher.
 
         Args:
-            num_workers: Number of worker threads to start
+            num_workers: Max jobs running at the same time (together with
+                max_concurrent_jobs, the lower one wins)
         """
         self._shutdown = False
+        self._num_workers = max(1, num_workers)
         self._workers = [
-            asyncio.create_task(self._worker_loop()) for _ in range(num_workers)
+            asyncio.create_task(self._dispatch_loop(), name="job-queue-dispatcher")
         ]
 
     async def stop(self) -> None:
-        """Stop all workers and wait for completion."""
+        """Stop the dispatcher and wait for running jobs to finish."""
         self._shutdown = True
+        self._wake()
 
-        # Wait for workers to finish
+        # Wait for dispatcher + running jobs to finish
         if self._workers:
             await asyncio.gather(*self._workers, return_exceptions=True)
+        if self._active_tasks:
+            await asyncio.gather(*self._active_tasks, return_exceptions=True)
 
         self._workers = []
 
@@ -443,7 +740,29 @@ class JobQueue:
             "completed": len([j for j in jobs if j.status == JobStatus.COMPLETED]),
             "failed": len([j for j in jobs if j.status == JobStatus.FAILED]),
             "cancelled": len([j for j in jobs if j.status == JobStatus.CANCELLED]),
-            "queue_size": self._queue.qsize(),
+            "queue_size": len(self._queued_ids),
+            "delayed_retries": len(self._delayed_ids),
+            "by_type": self.get_scheduler_stats(),
+        }
+
+    def get_scheduler_stats(self) -> dict[str, Any]:
+        """Get per-JobType pool state and latency histograms.
+
+        Returns:
+            Dict job_type -> {limit, weight, queued, running, queue_wait_seconds,
+            run_seconds}
+        """
+        return {
+            job_type.value: {
+                "max_concurrent": state.limit.max_concurrent,
+                "weight": state.limit.weight,
+                "queued": state.pending,
+                "running": state.running,
+                "queue_wait_seconds": state.wait_hist.to_dict(),
+                "run_seconds": state.run_hist.to_dict(),
+            }
+            for job_type, state in self._type_states.items()
+            if state.pending or state.running or state.run_hist.count
         }
 
 
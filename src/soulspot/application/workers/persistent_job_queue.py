@@ -169,8 +169,8 @@ class PersistentJobQueue(JobQueue):
             priority=priority,
         )
         self._jobs[job.id] = job
-        await self._queue.put((-job.priority, self._counter, job))
-        self._counter += 1
+        self._push_job(job)
+        self.publish_job_update(job)
 
         self._stats.total_jobs += 1
         self._stats.pending_jobs += 1
@@ -290,8 +290,7 @@ class PersistentJobQueue(JobQueue):
             try:
                 job = self._model_to_job(model)
                 self._jobs[job.id] = job
-                await self._queue.put((-job.priority, self._counter, job))
-                self._counter += 1
+                self._push_job(job)
                 recovered_count += 1
             except Exception as e:
                 logger.error(f"Failed to recover job {model.id}: {e}")
@@ -333,6 +332,7 @@ class PersistentJobQueue(JobQueue):
                 return False
 
         job.mark_running()
+        self.publish_job_update(job)
         self._stats.pending_jobs -= 1
         self._stats.running_jobs += 1
 
@@ -366,6 +366,7 @@ class PersistentJobQueue(JobQueue):
         if job:
             job.mark_completed(result)
             self._running_jobs.discard(job_id)
+            self.publish_job_update(job)
 
         self._stats.running_jobs -= 1
         self._stats.completed_jobs += 1
@@ -429,8 +430,9 @@ class PersistentJobQueue(JobQueue):
             if should_retry and job.should_retry():
                 # Re-enqueue with lower priority
                 job.status = JobStatus.PENDING
-                await self._queue.put((-job.priority + 1, self._counter, job))
-                self._counter += 1
+                self._push_job(job, priority=job.priority - 1)
+
+            self.publish_job_update(job)
 
         self._stats.running_jobs -= 1
         if should_retry:
@@ -1556,8 +1556,25 @@ class UnifiedLibraryManager:
         - Find artists/albums with URL but no local image_path
         - Download from CDN via ImageService
         - Convert to WebP and cache locally
+
+        CONCURRENT (Jan 2026): every step runs on ImageRepairEngine - bounded pool,
+        paced by the shared Deezer token bucket instead of sleep(0.2)/sleep(0.3)
+        per item, recently viewed entities first, committed every few results.
+        Workers only do HTTP/PIL; DB updates happen in the engine's coordinator.
         """
-        from soulspot.application.services.images import ImageService
+        import dataclasses
+
+        from soulspot.application.services.images import (
+            ImageDownloadJob,
+            ImagePriority,
+            ImageService,
+            guess_provider_from_url,
+        )
+        from soulspot.application.services.images.queue import priority_for_entity
+        from soulspot.application.services.images.repair_engine import (
+            ImageRepairEngine,
+        )
+        from soulspot.domain.value_objects import ImageRef
         from soulspot.infrastructure.persistence.repositories import (
             AlbumRepository,
             ArtistRepository,
@@ -1582,6 +1599,16 @@ class UnifiedLibraryManager:
                 "ImageService", "download_and_cache() + URL enrichment (incl. name search)"
             ))
 
+            engine: ImageRepairEngine[Any] = ImageRepairEngine()
+            # Workers never touch the session (see store_entity_image)
+            downloader = dataclasses.replace(image_service, session=None)
+
+            async def commit_progress(_final: bool) -> None:
+                await session.commit()
+
+            def job_priority(entity_type: str, entity_id: str) -> int:
+                return priority_for_entity(entity_type, entity_id, ImagePriority.LOW)
+
             # ================================================================
             # PHASE 1: URL ENRICHMENT (fetch URLs from Deezer)
             # ================================================================
@@ -1591,49 +1618,78 @@ class UnifiedLibraryManager:
             try:
                 artists = await artist_repo.get_missing_artwork(limit=batch_size)
                 if artists and self._deezer_plugin:
-                    for artist in artists:
-                        try:
-                            image_url = None
-                            
-                            # Strategy 1: Direct ID lookup (fast, accurate)
-                            if artist.deezer_id:
-                                artist_data = await self._deezer_plugin.get_artist(
-                                    artist.deezer_id
-                                )
-                                if artist_data and artist_data.image_url:
-                                    image_url = artist_data.image_url
-                                    urls_fetched["artists"] += 1
-                            
-                            # Strategy 2: Name search for LOCAL artists without deezer_id
-                            # Hey future me - THIS IS THE FIX for imported local artists!
-                            if not image_url and artist.name:
-                                search_results = await self._deezer_plugin.search_artists(
-                                    artist.name, limit=1
-                                )
-                                if search_results and search_results.items:
-                                    best_match = search_results.items[0]
-                                    if best_match.image_url:
-                                        image_url = best_match.image_url
-                                        # Also save deezer_id for future lookups!
-                                        if best_match.deezer_id:
-                                            artist.deezer_id = best_match.deezer_id
-                                        urls_fetched["artists_by_search"] += 1
-                                        logger.debug(
-                                            f"Found image for local artist '{artist.name}' via Deezer search"
-                                        )
-                            
-                            # Update artist if we found an image URL
-                            if image_url:
-                                from soulspot.domain.value_objects import ImageRef
-                                artist.image = ImageRef(
-                                    url=image_url,
-                                    path=artist.image.path if artist.image else None,
-                                )
-                                await artist_repo.update(artist)
-                            
-                            await asyncio.sleep(0.2)  # Rate limit
-                        except Exception as e:
-                            logger.debug(f"Failed to get URL for artist {artist.name}: {e}")
+                    deezer = self._deezer_plugin
+                    artists_by_id = {str(artist.id): artist for artist in artists}
+
+                    async def find_artist_url(
+                        job: ImageDownloadJob,
+                    ) -> tuple[str | None, str | None]:
+                        """(image_url, deezer_id found via search)"""
+                        artist = artists_by_id[job.entity_id]
+
+                        # Strategy 1: Direct ID lookup (fast, accurate)
+                        if artist.deezer_id:
+                            artist_data = await deezer.get_artist(artist.deezer_id)
+                            if artist_data and artist_data.image.url:
+                                return artist_data.image.url, None
+
+                        # Strategy 2: Name search for LOCAL artists without deezer_id
+                        # Hey future me - THIS IS THE FIX for imported local artists!
+                        if artist.name:
+                            search_results = await deezer.search_artists(
+                                artist.name, limit=1
+                            )
+                            if search_results and search_results.items:
+                                best_match = search_results.items[0]
+                                if best_match.image.url:
+                                    return best_match.image.url, best_match.deezer_id or ""
+                        return None, None
+
+                    async def apply_artist_url(
+                        job: ImageDownloadJob,
+                        found: tuple[str | None, str | None] | None,
+                        error: Exception | None,
+                    ) -> None:
+                        artist = artists_by_id[job.entity_id]
+                        if error is not None or found is None:
+                            logger.debug(f"Failed to get URL for artist {artist.name}: {error}")
+                            return
+                        image_url, search_deezer_id = found
+                        if not image_url:
+                            return
+
+                        if search_deezer_id is None:
+                            urls_fetched["artists"] += 1
+                        else:
+                            urls_fetched["artists_by_search"] += 1
+                            # Also save deezer_id for future lookups!
+                            if search_deezer_id:
+                                artist.deezer_id = search_deezer_id
+                            logger.debug(
+                                f"Found image for local artist '{artist.name}' via Deezer search"
+                            )
+
+                        artist.image = ImageRef(
+                            url=image_url,
+                            path=artist.image.path if artist.image else None,
+                        )
+                        await artist_repo.update(artist)
+
+                    await engine.run(
+                        [
+                            ImageDownloadJob.for_artist(
+                                entity_id=entity_id,
+                                provider_id=artist.deezer_id or "",
+                                url="",
+                                provider="deezer",
+                                priority=job_priority("artist", entity_id),
+                            )
+                            for entity_id, artist in artists_by_id.items()
+                        ],
+                        find_artist_url,
+                        apply_artist_url,
+                        checkpoint=commit_progress,
+                    )
             except Exception as e:
                 logger.warning(f"Artist URL enrichment failed: {e}")
 
@@ -1641,6 +1697,7 @@ class UnifiedLibraryManager:
             try:
                 albums = await album_repo.get_albums_without_cover_url(limit=batch_size)
                 if albums and self._deezer_plugin:
+                    deezer = self._deezer_plugin
                     # Pre-fetch artist names for all albums (batch lookup, more efficient)
                     # Hey future me - Album entity has artist_id: ArtistId, NOT artist_name!
                     artist_names: dict[str, str] = {}
@@ -1652,54 +1709,85 @@ class UnifiedLibraryManager:
                                 artist_names[str(aid)] = artist.name
                         except Exception:
                             pass  # Continue without artist name
-                    
-                    for album in albums:
-                        try:
-                            cover_url = None
-                            
-                            # Strategy 1: Direct ID lookup
-                            if album.deezer_id:
-                                album_data = await self._deezer_plugin.get_album(
-                                    album.deezer_id
-                                )
-                                if album_data and album_data.cover_url:
-                                    cover_url = album_data.cover_url
-                                    urls_fetched["albums"] += 1
-                            
-                            # Strategy 2: Search by album title + artist name
-                            # Hey future me - THIS IS THE FIX for imported local albums!
-                            if not cover_url and album.title:
-                                # Build search query: "Artist - Album" (better search results)
-                                artist_name = artist_names.get(str(album.artist_id))
-                                search_query = album.title
-                                if artist_name:
-                                    search_query = f"{artist_name} {album.title}"
-                                
-                                search_results = await self._deezer_plugin.search_albums(
-                                    search_query, limit=1
-                                )
-                                if search_results and search_results.items:
-                                    best_match = search_results.items[0]
-                                    if best_match.cover_url:
-                                        cover_url = best_match.cover_url
-                                        # Also save deezer_id for future lookups!
-                                        if best_match.deezer_id:
-                                            album.deezer_id = best_match.deezer_id
-                                        urls_fetched["albums_by_search"] += 1
-                                        logger.debug(
-                                            f"Found cover for local album '{album.title}' via Deezer search"
-                                        )
-                            
-                            # Update album if we found a cover URL
-                            if cover_url:
-                                await album_repo.update_cover_url(album.id, cover_url)
-                                # Also update deezer_id if found via search
-                                if hasattr(album, 'deezer_id') and album.deezer_id:
-                                    await album_repo.update(album)
-                            
-                            await asyncio.sleep(0.2)  # Rate limit
-                        except Exception as e:
-                            logger.debug(f"Failed to get URL for album {album.title}: {e}")
+
+                    albums_by_id = {str(album.id): album for album in albums}
+
+                    async def find_cover_url(
+                        job: ImageDownloadJob,
+                    ) -> tuple[str | None, str | None]:
+                        """(cover_url, deezer_id found via search)"""
+                        album = albums_by_id[job.entity_id]
+
+                        # Strategy 1: Direct ID lookup
+                        if album.deezer_id:
+                            album_data = await deezer.get_album(album.deezer_id)
+                            if album_data and album_data.cover.url:
+                                return album_data.cover.url, None
+
+                        # Strategy 2: Search by album title + artist name
+                        # Hey future me - THIS IS THE FIX for imported local albums!
+                        if album.title:
+                            # Build search query: "Artist - Album" (better search results)
+                            artist_name = artist_names.get(str(album.artist_id))
+                            search_query = album.title
+                            if artist_name:
+                                search_query = f"{artist_name} {album.title}"
+
+                            search_results = await deezer.search_albums(
+                                search_query, limit=1
+                            )
+                            if search_results and search_results.items:
+                                best_match = search_results.items[0]
+                                if best_match.cover.url:
+                                    return best_match.cover.url, best_match.deezer_id or ""
+                        return None, None
+
+                    async def apply_cover_url(
+                        job: ImageDownloadJob,
+                        found: tuple[str | None, str | None] | None,
+                        error: Exception | None,
+                    ) -> None:
+                        album = albums_by_id[job.entity_id]
+                        if error is not None or found is None:
+                            logger.debug(f"Failed to get URL for album {album.title}: {error}")
+                            return
+                        cover_url, search_deezer_id = found
+                        if not cover_url:
+                            return
+
+                        if search_deezer_id is None:
+                            urls_fetched["albums"] += 1
+                        else:
+                            urls_fetched["albums_by_search"] += 1
+                            # Also save deezer_id for future lookups!
+                            if search_deezer_id:
+                                album.deezer_id = search_deezer_id
+                            logger.debug(
+                                f"Found cover for local album '{album.title}' via Deezer search"
+                            )
+
+                        # Also update deezer_id if found via search - BEFORE
+                        # update_cover_url(), update() writes the whole entity
+                        # (with its old cover) and would clobber the new URL
+                        if search_deezer_id:
+                            await album_repo.update(album)
+                        await album_repo.update_cover_url(album.id, cover_url)
+
+                    await engine.run(
+                        [
+                            ImageDownloadJob.for_album(
+                                entity_id=entity_id,
+                                provider_id=album.deezer_id or "",
+                                url="",
+                                provider="deezer",
+                                priority=job_priority("album", entity_id),
+                            )
+                            for entity_id, album in albums_by_id.items()
+                        ],
+                        find_cover_url,
+                        apply_cover_url,
+                        checkpoint=commit_progress,
+                    )
             except Exception as e:
                 logger.warning(f"Album URL enrichment failed: {e}")
 
@@ -1715,30 +1803,56 @@ class UnifiedLibraryManager:
             # PHASE 2: LOCAL DOWNLOAD (download and cache images locally)
             # ================================================================
             downloads = {"artists": 0, "albums": 0, "errors": 0}
+            names: dict[str, str] = {}
+
+            async def store_image(job: ImageDownloadJob) -> Any:
+                return await downloader.store_entity_image(
+                    job.image_url, job.entity_type, job.entity_id
+                )
+
+            async def apply_download(
+                job: ImageDownloadJob, result: Any, error: Exception | None
+            ) -> None:
+                name = names.get(job.entity_id, job.entity_id)
+                if error is not None or result is None:
+                    downloads["errors"] += 1
+                    logger.debug(f"Error downloading {job.entity_type} image {name}: {error}")
+                    return
+                if not result.success or result.image_info is None:
+                    downloads["errors"] += 1
+                    logger.debug(f"❌ Failed to download image for {name}: {result.error}")
+                    return
+                await image_service.update_entity_image_path(
+                    job.entity_type,
+                    job.entity_id,
+                    job.image_url,
+                    result.image_info.local_path or "",
+                )
+                downloads[f"{job.entity_type}s"] += 1
+                logger.debug(f"✅ Downloaded {job.entity_type} image: {name}")
 
             # Download artist images (have URL but no local file)
             try:
                 artists_needing_download = await artist_repo.get_artists_needing_image_download(
                     limit=batch_size
                 )
+                artist_jobs: list[ImageDownloadJob] = []
                 for artist in artists_needing_download:
-                    try:
-                        if artist.image and artist.image.url:
-                            result = await image_service.download_and_cache(
-                                source_url=artist.image.url,
-                                entity_type="artist",
-                                entity_id=str(artist.id),
+                    if artist.image and artist.image.url:
+                        entity_id = str(artist.id)
+                        names[entity_id] = artist.name
+                        artist_jobs.append(
+                            ImageDownloadJob.for_artist(
+                                entity_id=entity_id,
+                                provider_id=artist.deezer_id or entity_id,
+                                url=artist.image.url,
+                                provider=guess_provider_from_url(artist.image.url),
+                                priority=job_priority("artist", entity_id),
                             )
-                            if result.success:
-                                downloads["artists"] += 1
-                                logger.debug(f"✅ Downloaded image for artist: {artist.name}")
-                            else:
-                                downloads["errors"] += 1
-                                logger.debug(f"❌ Failed to download image for {artist.name}: {result.error}")
-                        await asyncio.sleep(0.3)  # Rate limit downloads
-                    except Exception as e:
-                        downloads["errors"] += 1
-                        logger.debug(f"Error downloading artist image {artist.name}: {e}")
+                        )
+                await engine.run(
+                    artist_jobs, store_image, apply_download, checkpoint=commit_progress
+                )
             except Exception as e:
                 logger.warning(f"Artist image download phase failed: {e}")
 
@@ -1747,26 +1861,25 @@ class UnifiedLibraryManager:
                 albums_needing_download = await album_repo.get_albums_needing_cover_download(
                     limit=batch_size
                 )
+                album_jobs: list[ImageDownloadJob] = []
                 for album in albums_needing_download:
-                    try:
-                        # Album uses cover: ImageRef, not cover_url directly
-                        cover_url = album.cover.url if album.cover else None
-                        if cover_url:
-                            result = await image_service.download_and_cache(
-                                source_url=cover_url,
-                                entity_type="album",
-                                entity_id=str(album.id),
+                    # Album uses cover: ImageRef, not cover_url directly
+                    cover_url = album.cover.url if album.cover else None
+                    if cover_url:
+                        entity_id = str(album.id)
+                        names[entity_id] = album.title
+                        album_jobs.append(
+                            ImageDownloadJob.for_album(
+                                entity_id=entity_id,
+                                provider_id=album.deezer_id or entity_id,
+                                url=cover_url,
+                                provider=guess_provider_from_url(cover_url),
+                                priority=job_priority("album", entity_id),
                             )
-                            if result.success:
-                                downloads["albums"] += 1
-                                logger.debug(f"✅ Downloaded cover for album: {album.title}")
-                            else:
-                                downloads["errors"] += 1
-                                logger.debug(f"❌ Failed to download cover for {album.title}: {result.error}")
-                        await asyncio.sleep(0.3)  # Rate limit downloads
-                    except Exception as e:
-                        downloads["errors"] += 1
-                        logger.debug(f"Error downloading album cover {album.title}: {e}")
+                        )
+                await engine.run(
+                    album_jobs, store_image, apply_download, checkpoint=commit_progress
+                )
             except Exception as e:
                 logger.warning(f"Album cover download phase failed: {e}")
 
@@ -75,6 +75,8 @@ class DatabaseSettings(BaseSettings):
 # api_key OR username+password for auth. api_key is preferred (more secure, doesn't expire). The URL
 # should point to your slskd instance (usually http://localhost:5030 in dev, could be remote in prod).
 # If slskd is down/unreachable, downloads fail but app stays up. Check slskd health in /ready endpoint.
+# search_poll_interval = how often search_stream() asks slskd for new peer responses. Lower = results
+# arrive sooner but more HTTP round trips per search (2 per poll).
 class SlskdSettings(BaseSettings):
     """slskd client configuration."""
 
@@ -94,6 +96,12 @@ class SlskdSettings(BaseSettings):
         default=None,
         description="slskd API key (optional)",
     )
+    search_poll_interval: float = Field(
+        default=1.0,
+        description="Seconds between polls of a running slskd search",
+        ge=0.1,
+        le=10.0,
+    )
 
     model_config = SettingsConfigDict(env_prefix="SLSKD_")
 
@@ -404,10 +412,65 @@ class DownloadSettings(BaseSettings):
         ge=1,
         le=10,
     )
+    search_early_accept: bool = Field(
+        default=True,
+        description="Stop a Soulseek search as soon as a good enough candidate arrived",
+    )
+    search_accept_score: float = Field(
+        default=85.0,
+        description="Match score (0-100) a candidate needs to end the search early",
+        ge=0.0,
+        le=100.0,
+    )
 
     model_config = SettingsConfigDict(env_prefix="DOWNLOAD_")
 
 
+# Hey future me, LibraryScanSettings tunes the local library scanner (LibraryScannerService)! The folder
+# walk fans artist folders out across walk_workers threads and hands parsed albums to the importer through
+# a bounded queue (walk_queue_size batches of walk_albums_per_batch albums) - that bound is what keeps peak
+# memory flat on huge libraries. More walk threads help a lot on NFS/SMB (latency bound), barely on local
+# SSDs. Don't crank walk_queue_size up to "buffer everything", that's exactly what the old scan() did!
+# extract_executor="process" runs mutagen in worker processes - real multi-core parsing for big full scans,
+# at the cost of spawning workers per scan. "thread" is fine for incremental scans (few files change).
+class LibraryScanSettings(BaseSettings):
+    """Local library scan configuration."""
+
+    walk_workers: int = Field(
+        default=4,
+        description="Number of threads walking artist folders in parallel",
+        ge=1,
+        le=32,
+    )
+    walk_queue_size: int = Field(
+        default=32,
+        description="Max parsed album batches buffered between walk and DB import",
+        ge=1,
+        le=1024,
+    )
+    walk_albums_per_batch: int = Field(
+        default=25,
+        description="Max albums per batch handed from the walk to the importer",
+        ge=1,
+        le=500,
+    )
+    extract_executor: Literal["thread", "process"] = Field(
+        default="thread",
+        description=(
+            "Pool for mutagen audio-info extraction: 'thread' (low overhead) or "
+            "'process' (scales with CPU cores, mutagen is GIL-bound)"
+        ),
+    )
+    extract_workers: int = Field(
+        default=0,
+        description="Audio-info extraction workers (0 = CPU count, max 8)",
+        ge=0,
+        le=64,
+    )
+
+    model_config = SettingsConfigDict(env_prefix="LIBRARY_SCAN_")
+
+
 # Hey future me, NamingSettings configures Lidarr-style file and folder naming! This mirrors Lidarr's
 # Media Management > Track Naming settings. The format strings use tokens like {Artist Name}, {Album Title},
 # {track:00} that get replaced with actual metadata. Default formats match Lidarr defaults and work with
@@ -507,6 +570,15 @@ class PostProcessingSettings(BaseSettings):
         default=True,
         description="Enable lyrics fetching and embedding",
     )
+    lyrics_negative_ttl_hours: int = Field(
+        default=168,
+        description=(
+            "How long a lyrics provider that didn't have a song is skipped for it "
+            "(found lyrics are cached permanently)"
+        ),
+        ge=1,
+        le=8760,
+    )
     id3_tagging_enabled: bool = Field(
         default=True,
         description="Enable ID3 tag writing",
@@ -515,6 +587,25 @@ class PostProcessingSettings(BaseSettings):
         default=True,
         description="Enable file renaming based on templates",
     )
+    album_batching: bool = Field(
+        default=True,
+        description=(
+            "Post-process completed downloads of the same album together: artwork "
+            "fetched once, tags written concurrently, one DB update per album"
+        ),
+    )
+    artwork_cache_albums: int = Field(
+        default=32,
+        description="Number of albums whose processed artwork is kept in memory",
+        ge=1,
+        le=1000,
+    )
+    tag_write_workers: int = Field(
+        default=4,
+        description="Files of one album post-processed concurrently (tag writes run in threads)",
+        ge=1,
+        le=32,
+    )
     file_naming_template: str = Field(
         default="{Artist CleanName} - {Album Type} - {Release Year} - {Album CleanTitle}/{medium:02d}{track:02d} - {Track CleanTitle}",
         description="File naming template",
@@ -525,6 +616,14 @@ class PostProcessingSettings(BaseSettings):
         ge=10,
         le=600,
     )
+    auto_import_watch: bool = Field(
+        default=True,
+        description=(
+            "Watch the downloads directory for changes (inotify) instead of "
+            "rescanning it every poll interval. Falls back to polling when file "
+            "events are unavailable (e.g. network mounts)"
+        ),
+    )
 
     model_config = SettingsConfigDict(env_prefix="POSTPROCESSING_")
 
@@ -610,6 +709,10 @@ class Settings(BaseSettings):
         default_factory=NamingSettings,
         description="Lidarr-style naming configuration for files and folders",
     )
+    library_scan: LibraryScanSettings = Field(
+        default_factory=LibraryScanSettings,
+        description="Local library scanner configuration",
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
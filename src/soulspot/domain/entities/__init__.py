@@ -1330,7 +1330,9 @@ class DuplicateMatchType(str, Enum):
     """How the duplicate was detected."""
 
     METADATA = "metadata"  # Same artist+title, similar duration
-    FINGERPRINT = "fingerprint"  # Audio fingerprint match (future)
+    FINGERPRINT = "fingerprint"  # Acoustic fingerprint match (future)
+    FILE_HASH = "file_hash"  # Byte-identical files
+    AUDIO_HASH = "audio_hash"  # Identical audio frames, tags may differ
 
 
 class DuplicateResolutionAction(str, Enum):
@@ -382,6 +382,9 @@ class QualityMatcher:
 
     def __init__(self, profile: QualityProfile):
         self.profile = profile
+        # Lowercased once here, not per result (rank_results runs match() thousands of times)
+        self._excluded_users = {u.lower() for u in profile.exclude_users}
+        self._excluded_keywords = [k.lower() for k in profile.exclude_keywords]
 
     def match(self, file_info: dict) -> MatchResult:
         """Check if file matches profile and calculate score.
@@ -403,14 +406,14 @@ class QualityMatcher:
         size_mb = size_bytes / (1024 * 1024) if size_bytes else 0
 
         # 1. Check excluded users
-        if username and username.lower() in [
-            u.lower() for u in self.profile.exclude_users
-        ]:
+        if username and username.lower() in self._excluded_users:
             return MatchResult(False, 0, f"User '{username}' is blocked")
 
         # 2. Check excluded keywords
-        for keyword in self.profile.exclude_keywords:
-            if keyword.lower() in filename:
+        for keyword, keyword_lower in zip(
+            self.profile.exclude_keywords, self._excluded_keywords, strict=True
+        ):
+            if keyword_lower in filename:
                 return MatchResult(False, 0, f"Keyword '{keyword}' excluded")
 
         # 3. Detect format
@@ -1,6 +1,8 @@
 """Domain ports (interfaces) for dependency inversion."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator
+from datetime import datetime
 from typing import Any, Optional
 
 from soulspot.domain.entities import (
@@ -618,6 +620,11 @@ class ITrackRepository(ABC):
         """Update an existing track."""
         pass
 
+    @abstractmethod
+    async def update_batch(self, tracks: list[Track]) -> None:
+        """Update multiple tracks in a single batch operation."""
+        pass
+
     @abstractmethod
     async def delete(self, track_id: TrackId) -> None:
         """Delete a track."""
@@ -906,6 +913,22 @@ class IDownloadRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_completed_track_ids_since(
+        self, since: datetime | None
+    ) -> tuple[set[str], datetime | None]:
+        """Get track IDs of downloads that became completed after `since`.
+
+        Incremental version of get_completed_track_ids() for AutoImportService.
+
+        Args:
+            since: Watermark from the previous call (None = all completed)
+
+        Returns:
+            (track IDs, new watermark to pass next time)
+        """
+        pass
+
     @abstractmethod
     async def list_retry_eligible(self, limit: int = 10) -> list[Download]:
         """List downloads eligible for automatic retry.
@@ -995,6 +1018,14 @@ class IBlocklistRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def list_all_active(self) -> list["BlocklistEntry"]:
+        """List ALL active (non-expired) blocklist entries.
+
+        Used to compile the in-memory blocklist matcher for bulk result filtering.
+        """
+        pass
+
     @abstractmethod
     async def list_expired(self, limit: int = 100) -> list["BlocklistEntry"]:
         """List expired blocklist entries.
@@ -1126,6 +1157,30 @@ class ISlskdClient(ABC):
         """
         pass
 
+    # Hey future me - NOT abstract on purpose: clients without incremental results (test
+    # doubles, other backends) just get one batch with everything. SlskdClient overrides
+    # it with real polling so callers can stop early and cancel the search.
+    async def search_stream(
+        self,
+        query: str,
+        timeout: int = 30,
+        poll_interval: float | None = None,  # noqa: ARG002
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """
+        Search for files, yielding result batches as they arrive.
+
+        Args:
+            query: Search query string
+            timeout: Search timeout in seconds
+            poll_interval: Seconds between polls (implementation default if None)
+
+        Yields:
+            Lists of new search results (same format as search())
+        """
+        results = await self.search(query, timeout=timeout)
+        if results:
+            yield results
+
     @abstractmethod
     async def download(self, username: str, filename: str) -> str:
         """
@@ -1159,7 +1214,8 @@ class ISlskdClient(ABC):
         List all downloads.
 
         Returns:
-            List of downloads with status information
+            Flat list, one dict per file transfer (id "username/filename",
+            username, filename, state, progress, bytes_transferred, size)
         """
         pass
 
@@ -251,13 +251,13 @@ class IImageService(Protocol):
 
     async def optimize_cache(
         self,
-        max_age_days: int = 90,
+        orphan_grace_hours: int = 24,
         dry_run: bool = True,
     ) -> dict[str, int]:
-        """Clean up old/orphaned cached images.
+        """Clean up orphaned cached images.
 
         Args:
-            max_age_days: Delete images older than this
+            orphan_grace_hours: Only delete images unreferenced at least this long
             dry_run: If True, just report what would be deleted
 
         Returns:
@@ -38,6 +38,7 @@ from soulspot.domain.value_objects.folder_parsing import (
     ParsedAlbumFolder,
     ParsedTrackFilename,
     ScannedAlbum,
+    ScannedAlbumBatch,
     ScannedArtist,
     ScannedTrack,
     is_audio_file,
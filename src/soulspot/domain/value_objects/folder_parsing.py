@@ -25,11 +25,19 @@ Usage:
 
     parser = LibraryFolderParser(root_path)
     scan_result = parser.scan()
+
+    # Streaming variant (parallel walk, bounded memory):
+    for batch in parser.iter_album_batches(max_workers=4):
+        print(batch.artist.name, len(batch.albums))
 """
 
 import logging
+import os
+import queue
 import re
-from collections.abc import Iterator
+import threading
+from collections.abc import Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -350,6 +358,28 @@ class ScannedTrack:
     extension: str = ""
     """File extension."""
 
+    size: int | None = None
+    """File size in bytes from the walk's DirEntry stat (None if stat failed)."""
+
+    mtime: float | None = None
+    """File modification time (st_mtime) from the walk's DirEntry stat."""
+
+
+@dataclass
+class ScannedAlbumBatch:
+    """Batch of albums of ONE artist, yielded by LibraryFolderParser.iter_album_batches().
+
+    Hey future me - `artist` is a header only (its `albums` list stays EMPTY in
+    streaming mode), the albums of this batch live in `albums`. A big artist folder
+    can arrive as several batches - always key by artist.path, not by batch!
+    """
+
+    artist: "ScannedArtist"
+    """Artist the albums belong to (albums list NOT populated)."""
+
+    albums: list["ScannedAlbum"] = field(default_factory=list)
+    """Albums parsed so far for this artist (only albums with tracks)."""
+
 
 @dataclass
 class LibraryScanResult:
@@ -363,6 +393,8 @@ class LibraryScanResult:
     total_tracks: int = 0
     skipped_files: int = 0
     parse_errors: list[str] = field(default_factory=list)
+    error_paths: list[Path] = field(default_factory=list)
+    """Folders that couldn't be (fully) read - their files may be missing above."""
 
 
 # =============================================================================
@@ -605,10 +637,18 @@ def is_audio_file(filename: str) -> bool:
     Returns:
         True if the file has a supported audio extension.
     """
-    ext = Path(filename).suffix.lower()
+    ext = os.path.splitext(filename)[1].lower()
     return ext in AUDIO_EXTENSIONS
 
 
+@dataclass
+class _ArtistWalkDone:
+    """End-of-artist marker sent by walk threads in iter_album_batches()."""
+
+    artist_path: Path
+    error: str | None = None
+
+
 # =============================================================================
 # LIBRARY FOLDER PARSER
 # =============================================================================
@@ -638,6 +678,8 @@ class LibraryFolderParser:
             root_path: Path to the root of the music library.
         """
         self.root_path = root_path.resolve()
+        # Running totals of the last walk (artists list unused by iter_album_batches)
+        self.walk_totals = LibraryScanResult()
 
     def scan(self) -> LibraryScanResult:
         """Scan the library and extract metadata.
@@ -646,6 +688,8 @@ class LibraryFolderParser:
             LibraryScanResult with all discovered artists, albums, and tracks.
         """
         result = LibraryScanResult()
+        # Folder read errors deep in the walk are recorded on walk_totals
+        self.walk_totals = result
 
         if not self.root_path.exists():
             logger.warning(f"Library path does not exist: {self.root_path}")
@@ -669,6 +713,7 @@ class LibraryFolderParser:
             except Exception as e:
                 logger.warning(f"Error scanning artist folder {artist_path}: {e}")
                 result.parse_errors.append(f"{artist_path}: {e}")
+                result.error_paths.append(artist_path)
 
         logger.info(
             f"Library scan complete: {result.total_artists} artists, "
@@ -676,6 +721,103 @@ class LibraryFolderParser:
         )
         return result
 
+    def iter_album_batches(
+        self,
+        max_workers: int = 4,
+        max_pending_batches: int = 32,
+        albums_per_batch: int = 25,
+    ) -> Generator[ScannedAlbumBatch, None, None]:
+        """Walk the library in parallel and yield album batches as soon as they're parsed.
+
+        Hey future me - this is the STREAMING variant of scan()! Differences:
+        - Artist folders fan out across a bounded thread pool (NFS: stat/readdir
+          latency overlaps instead of adding up)
+        - Batches are yielded while the walk is still running, so the caller can
+          start importing after the first artist instead of after the last one
+        - The hand-off queue is bounded (max_pending_batches), walk threads block
+          when the consumer is slower → peak memory stays bounded
+        - Nothing is accumulated here, running totals live in self.walk_totals
+
+        Closing the generator early (break / exception in the consumer) stops
+        the walk threads within a fraction of a second.
+
+        Args:
+            max_workers: Number of walk threads (artist folders in flight).
+            max_pending_batches: Max parsed batches waiting for the consumer.
+            albums_per_batch: Split big artist folders into batches of this size.
+
+        Yields:
+            ScannedAlbumBatch per (part of an) artist folder. Artists without any
+            album yield one empty batch (same as scan(), which lists them too).
+        """
+        self.walk_totals = LibraryScanResult()
+        totals = self.walk_totals
+
+        if not self.root_path.is_dir():
+            logger.warning(f"Library path is not a directory: {self.root_path}")
+            return
+
+        artist_paths = list(self._iter_artist_folders())
+        if not artist_paths:
+            return
+
+        results: queue.Queue[ScannedAlbumBatch | _ArtistWalkDone] = queue.Queue(
+            maxsize=max(1, max_pending_batches)
+        )
+        stop = threading.Event()
+
+        def put(item: ScannedAlbumBatch | _ArtistWalkDone) -> bool:
+            # Timeout loop instead of a plain blocking put() - otherwise a consumer
+            # that stopped iterating would leave walk threads blocked forever.
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.25)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def walk_artist(artist_path: Path) -> None:
+            error: str | None = None
+            try:
+                for batch in self._scan_artist_batches(artist_path, albums_per_batch):
+                    if not put(batch):
+                        return
+            except Exception as e:
+                error = f"{artist_path}: {e}"
+            put(_ArtistWalkDone(artist_path=artist_path, error=error))
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="library-walk"
+        )
+        try:
+            for artist_path in artist_paths:
+                executor.submit(walk_artist, artist_path)
+
+            remaining = len(artist_paths)
+            while remaining:
+                item = results.get()
+                if isinstance(item, _ArtistWalkDone):
+                    remaining -= 1
+                    totals.total_artists += 1
+                    if item.error:
+                        logger.warning(f"Error scanning artist folder {item.error}")
+                        totals.parse_errors.append(item.error)
+                        totals.error_paths.append(item.artist_path)
+                    continue
+
+                totals.total_albums += len(item.albums)
+                totals.total_tracks += sum(len(a.tracks) for a in item.albums)
+                yield item
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        logger.info(
+            f"Library walk complete: {totals.total_artists} artists, "
+            f"{totals.total_albums} albums, {totals.total_tracks} tracks"
+        )
+
     def _iter_artist_folders(self) -> Iterator[Path]:
         """Iterate over artist folders (top-level directories).
 
@@ -683,12 +825,25 @@ class LibraryFolderParser:
             Path to each artist folder.
         """
         try:
-            for item in self.root_path.iterdir():
-                if item.is_dir() and not item.name.startswith("."):
-                    yield item
+            with os.scandir(self.root_path) as entries:
+                for entry in entries:
+                    if entry.is_dir() and not entry.name.startswith("."):
+                        yield self._entry_path(entry)
         except PermissionError as e:
             logger.warning(f"Permission denied accessing {self.root_path}: {e}")
 
+    @staticmethod
+    def _entry_path(entry: os.DirEntry[str]) -> Path:
+        """Build the canonical path for a scandir entry.
+
+        Hey future me - the root is resolve()'d once, so child paths are already
+        canonical. Only symlinks need realpath() (DB stores resolved paths!).
+        is_symlink() comes from d_type, no extra syscall for regular entries.
+        """
+        if entry.is_symlink():
+            return Path(os.path.realpath(entry.path))
+        return Path(entry.path)
+
     def _scan_artist(self, artist_path: Path) -> ScannedArtist:
         """Scan an artist folder and its albums.
 
@@ -702,31 +857,67 @@ class LibraryFolderParser:
         Returns:
             ScannedArtist with discovered albums.
         """
-        parsed = parse_artist_folder(artist_path.name)
+        artist = self._new_scanned_artist(artist_path)
+        for batch in self._scan_artist_batches(artist_path, albums_per_batch=0):
+            artist.albums.extend(batch.albums)
+        return artist
 
-        artist = ScannedArtist(
+    @staticmethod
+    def _new_scanned_artist(artist_path: Path) -> ScannedArtist:
+        """Create the (album-less) ScannedArtist for an artist folder."""
+        parsed = parse_artist_folder(artist_path.name)
+        return ScannedArtist(
             name=parsed.name,  # Clean name without UUID/disambiguation for Spotify search!
             path=artist_path,
             musicbrainz_id=parsed.uuid,  # Preserve UUID for Lidarr compatibility
             disambiguation=parsed.disambiguation,  # Text disambiguation for display
         )
 
+    def _scan_artist_batches(
+        self, artist_path: Path, albums_per_batch: int
+    ) -> Iterator[ScannedAlbumBatch]:
+        """Scan an artist folder, yielding its albums in batches.
+
+        Args:
+            artist_path: Path to the artist folder.
+            albums_per_batch: Max albums per batch (0 = one batch for the whole artist).
+
+        Yields:
+            ScannedAlbumBatch with a header-only artist (albums list empty).
+        """
+        artist = self._new_scanned_artist(artist_path)
+
         # Scan album folders (second level)
+        album_paths: list[Path] = []
         try:
-            for item in artist_path.iterdir():
-                if item.is_dir() and not item.name.startswith("."):
-                    album = self._scan_album(item)
-                    if album.tracks:  # Only add albums with tracks
-                        artist.albums.append(album)
+            with os.scandir(artist_path) as entries:
+                for entry in entries:
+                    if entry.is_dir() and not entry.name.startswith("."):
+                        album_paths.append(self._entry_path(entry))
         except PermissionError as e:
             logger.warning(f"Permission denied accessing {artist_path}: {e}")
-
-        return artist
+            self.walk_totals.error_paths.append(artist_path)
+
+        pending: list[ScannedAlbum] = []
+        yielded = False
+        for album_path in album_paths:
+            album = self._scan_album(album_path)
+            if album.tracks:  # Only add albums with tracks
+                pending.append(album)
+            if albums_per_batch and len(pending) >= albums_per_batch:
+                yield ScannedAlbumBatch(artist=artist, albums=pending)
+                yielded = True
+                pending = []
+
+        if pending or not yielded:
+            yield ScannedAlbumBatch(artist=artist, albums=pending)
 
     def _scan_album(self, album_path: Path) -> ScannedAlbum:
         """Scan an album folder and its tracks.
 
-        Handles both flat structure and disc subfolders.
+        Handles both flat structure and disc subfolders. Uses os.scandir so the
+        file type comes from the directory listing and the stat result of every
+        track is taken once from its DirEntry (size/mtime for change detection).
 
         Args:
             album_path: Path to the album folder.
@@ -745,32 +936,59 @@ class LibraryFolderParser:
 
         # Scan for tracks - both direct files and disc subfolders
         try:
-            for item in album_path.iterdir():
-                if item.is_file() and is_audio_file(item.name):
-                    # Direct track file
-                    track = self._parse_track_file(item, disc_number=1)
-                    album.tracks.append(track)
-
-                elif item.is_dir():
-                    # Check if it's a disc subfolder
-                    is_disc, disc_num = is_disc_folder(item.name)
-                    if is_disc and disc_num is not None:
-                        # Scan disc subfolder
-                        for track_file in item.iterdir():
-                            if track_file.is_file() and is_audio_file(track_file.name):
-                                track = self._parse_track_file(
-                                    track_file, disc_number=disc_num
-                                )
-                                album.tracks.append(track)
+            with os.scandir(album_path) as entries:
+                for entry in entries:
+                    if entry.is_file() and is_audio_file(entry.name):
+                        # Direct track file
+                        album.tracks.append(self._parse_track_entry(entry, 1))
+
+                    elif entry.is_dir():
+                        # Check if it's a disc subfolder
+                        is_disc, disc_num = is_disc_folder(entry.name)
+                        if is_disc and disc_num is not None:
+                            # Scan disc subfolder
+                            with os.scandir(self._entry_path(entry)) as disc_entries:
+                                for disc_entry in disc_entries:
+                                    if disc_entry.is_file() and is_audio_file(
+                                        disc_entry.name
+                                    ):
+                                        album.tracks.append(
+                                            self._parse_track_entry(
+                                                disc_entry, disc_num
+                                            )
+                                        )
 
         except PermissionError as e:
             logger.warning(f"Permission denied accessing {album_path}: {e}")
+            self.walk_totals.error_paths.append(album_path)
 
         # Sort tracks by disc and track number
         album.tracks.sort(key=lambda t: (t.disc_number, t.track_number))
 
         return album
 
+    def _parse_track_entry(
+        self, entry: os.DirEntry[str], disc_number: int
+    ) -> ScannedTrack:
+        """Parse a track DirEntry, reusing its cached stat result.
+
+        Args:
+            entry: scandir entry of the audio file.
+            disc_number: Disc number (overridden if parsed from filename).
+
+        Returns:
+            ScannedTrack with size/mtime filled in (None if stat failed).
+        """
+        track = self._parse_track_file(self._entry_path(entry), disc_number)
+        try:
+            st = entry.stat()
+        except OSError as e:
+            logger.debug(f"Could not stat {entry.path}: {e}")
+            return track
+        track.size = st.st_size
+        track.mtime = st.st_mtime
+        return track
+
     def _parse_track_file(self, track_path: Path, disc_number: int = 1) -> ScannedTrack:
         """Parse a track file and create ScannedTrack.
 
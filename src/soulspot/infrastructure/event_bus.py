@@ -0,0 +1,313 @@
+"""In-process publish/subscribe event bus.
+
+Hey future me - this is how workers tell the UI "something changed" WITHOUT the UI
+asking the database!
+
+Before: every SSE client ran its own loop calling download_repository.list_active()
+every 2 seconds and held a DB session for the whole connection. 10 browser tabs =
+10 identical queries every 2s, all fighting the workers for the SQLite lock.
+
+Now the producers publish state changes right after they committed them:
+- DownloadStatusWorker → slskd progress/status deltas        (DOWNLOAD_TOPIC)
+- DownloadQueueWorker  → WAITING → PENDING, retries, blocklist (DOWNLOAD_TOPIC)
+- JobQueue             → job enqueued/running/completed/failed (JOB_TOPIC)
+
+SSE endpoints subscribe and forward the deltas. Number of SSE clients = zero extra
+DB load.
+
+Rules:
+- publish() is sync and never blocks: it just put_nowait()s into each subscriber's
+  bounded queue. A slow consumer can't stall a worker.
+- Slow consumer → its queue is cleared and gets ONE RESYNC_TOPIC event. Deltas are
+  useless with holes in them, so the consumer re-sends a full snapshot instead.
+- "Retained" events (MQTT-style): publish(..., key=..., retain=True) also merges the
+  data into the bus' last-known state for that key, retain=False forgets the key.
+  New subscribers build their initial snapshot from retained() instead of the DB.
+- Single event loop only (like the rest of the app) - no thread safety.
+
+Usage:
+    bus = get_event_bus()
+    bus.publish(DOWNLOAD_TOPIC, {"id": ..., "status": ...}, key=download_id, retain=True)
+
+    with bus.subscribe((DOWNLOAD_TOPIC, JOB_TOPIC)) as subscription:
+        event = await subscription.get(timeout=15.0)
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Any
+
+from soulspot.domain.entities import DownloadStatus
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_TOPIC = "download.updated"
+JOB_TOPIC = "job.updated"
+RESYNC_TOPIC = "bus.resync"  # only ever sent to the ONE subscriber that overflowed
+
+# Events buffered per subscriber before it counts as "slow"
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 256
+
+# Download states that stay in the retained "active downloads" view
+# (same set as DownloadRepository.list_active)
+ACTIVE_DOWNLOAD_STATUSES = frozenset(
+    {
+        DownloadStatus.WAITING.value,
+        DownloadStatus.PENDING.value,
+        DownloadStatus.QUEUED.value,
+        DownloadStatus.DOWNLOADING.value,
+    }
+)
+
+
+@dataclass(frozen=True)
+class BusEvent:
+    """One published state change."""
+
+    topic: str
+    data: dict[str, Any]
+    seq: int  # Monotonic per bus - lets clients spot reordering/gaps
+    published_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class EventBusStats:
+    """Counters of the event bus."""
+
+    published: int = 0
+    delivered: int = 0
+    overflows: int = 0  # Times a slow subscriber's queue was dropped
+    subscribers: int = 0
+
+
+class Subscription:
+    """A subscriber's bounded inbox. Use as context manager to unsubscribe."""
+
+    def __init__(self, bus: "EventBus", topics: tuple[str, ...], maxsize: int) -> None:
+        """Initialize an empty inbox.
+
+        Args:
+            bus: Owning bus
+            topics: Topics to receive (exact match)
+            maxsize: Queue bound before the subscriber counts as slow
+        """
+        self._bus = bus
+        self.topics = topics
+        self._queue: asyncio.Queue[BusEvent] = asyncio.Queue(maxsize=maxsize)
+        self.overflows = 0
+        self.closed = False
+
+    def _offer(self, event: BusEvent) -> bool:
+        """Enqueue an event without blocking.
+
+        Returns:
+            False if the subscriber was too slow and got a resync instead
+        """
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        # Slow consumer: drop everything it hasn't read, tell it to resync.
+        # The queue is empty afterwards, so the resync marker always fits.
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self.overflows += 1
+        self._queue.put_nowait(BusEvent(topic=RESYNC_TOPIC, data={}, seq=event.seq))
+        return False
+
+    async def get(self, timeout: float | None = None) -> BusEvent | None:
+        """Wait for the next event.
+
+        Args:
+            timeout: Max seconds to wait (None = forever)
+
+        Returns:
+            Next event, or None on timeout
+        """
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except TimeoutError:
+            return None
+
+    def pending(self) -> int:
+        """Number of events waiting in the inbox."""
+        return self._queue.qsize()
+
+    def close(self) -> None:
+        """Unsubscribe (idempotent)."""
+        if not self.closed:
+            self.closed = True
+            self._bus._unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class EventBus:
+    """Fan-out of published events to bounded per-subscriber queues."""
+
+    def __init__(self) -> None:
+        """Initialize a bus without subscribers."""
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._retained: dict[str, dict[Hashable, dict[str, Any]]] = {}
+        self._seeded_at: dict[str, float] = {}
+        self._seq = itertools.count(1)
+        self._published = 0
+        self._delivered = 0
+        self._overflows = 0
+
+    def subscribe(
+        self,
+        topics: Iterable[str],
+        maxsize: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+    ) -> Subscription:
+        """Subscribe to one or more topics.
+
+        Args:
+            topics: Topics to receive
+            maxsize: Inbox bound (see DEFAULT_SUBSCRIBER_QUEUE_SIZE)
+
+        Returns:
+            Subscription - close() it (or use "with") when done!
+        """
+        subscription = Subscription(self, tuple(topics), maxsize)
+        for topic in subscription.topics:
+            self._subscribers.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        for topic in subscription.topics:
+            subscribers = self._subscribers.get(topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[topic]
+
+    def publish(
+        self,
+        topic: str,
+        data: dict[str, Any],
+        key: Hashable | None = None,
+        retain: bool = False,
+    ) -> None:
+        """Publish an event to all subscribers of a topic (never blocks).
+
+        Args:
+            topic: Event topic
+            data: JSON-serializable payload (shared by all subscribers - don't mutate!)
+            key: Entity key for the retained state (e.g. download id)
+            retain: True = merge data into retained state of key, False = forget key
+        """
+        if key is not None:
+            retained = self._retained.setdefault(topic, {})
+            if retain:
+                retained[key] = {**retained.get(key, {}), **data}
+            else:
+                retained.pop(key, None)
+
+        self._published += 1
+        subscribers = self._subscribers.get(topic)
+        if not subscribers:
+            return
+
+        event = BusEvent(topic=topic, data=data, seq=next(self._seq))
+        for subscription in subscribers:
+            if subscription._offer(event):
+                self._delivered += 1
+            else:
+                self._overflows += 1
+                logger.debug(
+                    f"EventBus: slow subscriber on '{topic}' dropped, resync requested"
+                )
+
+    def retained(self, topic: str) -> list[dict[str, Any]]:
+        """Get the retained state of a topic (one merged dict per key)."""
+        return list(self._retained.get(topic, {}).values())
+
+    def seed(self, topic: str, entries: dict[Hashable, dict[str, Any]]) -> None:
+        """Replace the retained state of a topic (e.g. loaded once from the DB).
+
+        Args:
+            topic: Topic to seed
+            entries: key -> data
+        """
+        self._retained[topic] = dict(entries)
+        self._seeded_at[topic] = time.monotonic()
+
+    def seed_age(self, topic: str) -> float | None:
+        """Seconds since the topic was last seeded, None if never."""
+        seeded_at = self._seeded_at.get(topic)
+        return None if seeded_at is None else time.monotonic() - seeded_at
+
+    def get_stats(self) -> EventBusStats:
+        """Get a snapshot of the bus counters."""
+        return EventBusStats(
+            published=self._published,
+            delivered=self._delivered,
+            overflows=self._overflows,
+            subscribers=len(
+                {s for subscribers in self._subscribers.values() for s in subscribers}
+            ),
+        )
+
+
+# Module-level bus (one per process)
+# Hey future me - same idea as get_single_flight(): workers and routers are built in
+# different places, they still have to meet on the same bus.
+_event_bus: EventBus | None = None
+
+
+def get_event_bus() -> EventBus:
+    """Get (or create) the process-wide event bus."""
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = EventBus()
+    return _event_bus
+
+
+def publish_download_update(download_id: str, status: str, **fields: Any) -> None:
+    """Publish a download state change on DOWNLOAD_TOPIC.
+
+    Active downloads stay in the retained view, finished ones drop out of it
+    (subscribers still get the final event).
+
+    Args:
+        download_id: Download ID
+        status: New DownloadStatus value
+        **fields: Changed fields (track_id, progress_percent, priority, ...)
+    """
+    get_event_bus().publish(
+        DOWNLOAD_TOPIC,
+        {"id": download_id, "status": status, **fields},
+        key=download_id,
+        retain=status in ACTIVE_DOWNLOAD_STATUSES,
+    )
+
+
+__all__ = [
+    "ACTIVE_DOWNLOAD_STATUSES",
+    "DOWNLOAD_TOPIC",
+    "JOB_TOPIC",
+    "RESYNC_TOPIC",
+    "BusEvent",
+    "EventBus",
+    "EventBusStats",
+    "Subscription",
+    "get_event_bus",
+    "publish_download_update",
+]
@@ -1,6 +1,7 @@
 """Circuit breaker wrappers for external integration clients."""
 
 import logging
+from collections.abc import AsyncGenerator, AsyncIterator
 from typing import Any, cast
 
 from soulspot.config.settings import Settings
@@ -13,6 +14,14 @@ from soulspot.infrastructure.observability.circuit_breaker import (
 logger = logging.getLogger(__name__)
 
 
+async def _next_batch(stream: AsyncIterator[Any]) -> Any:
+    """Next item of a stream, None when exhausted (StopAsyncIteration is no failure)."""
+    try:
+        return await anext(stream)
+    except StopAsyncIteration:
+        return None
+
+
 class CircuitBreakerSlskdClient(ISlskdClient):
     """slskd client with circuit breaker protection."""
 
@@ -54,6 +63,30 @@ class CircuitBreakerSlskdClient(ISlskdClient):
         )
         return cast(list[dict[str, Any]], result)
 
+    # Hey future me - an async generator can't go through breaker.call() as a whole (the
+    # call would "succeed" the moment the generator object exists). So every POLL is one
+    # breaker call: an open breaker fails fast even mid-search, and a dead slskd counts
+    # failures per request like everywhere else. aclose() in finally forwards an early
+    # stop from the consumer, so the inner client still cancels the slskd search.
+    async def search_stream(
+        self,
+        query: str,
+        timeout: int = 30,
+        poll_interval: float | None = None,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Search the Soulseek network, yielding result batches as peers respond."""
+        stream = self._client.search_stream(
+            query, timeout=timeout, poll_interval=poll_interval
+        )
+        try:
+            while True:
+                batch = await self._circuit_breaker.call(_next_batch, stream)
+                if batch is None:
+                    return
+                yield cast(list[dict[str, Any]], batch)
+        finally:
+            await stream.aclose()
+
     async def download(self, username: str, filename: str) -> str:
         """Start a download from a user."""
         result = await self._circuit_breaker.call(
@@ -0,0 +1,209 @@
+"""Process-wide registry of long-lived provider clients.
+
+Hey future me - this is WHY API requests stopped building clients per request!
+
+Before: every request that needed Spotify/slskd/Deezer/MusicBrainz ran a credentials
+query, built a fresh client, and that client lazily opened its OWN httpx.AsyncClient
+(new TCP + TLS handshake every time, keep-alive never kicked in, and the client was
+usually never closed). Bursty UI pages (library, browse) paid that on every call.
+
+Now: one client per provider lives for the whole process. Its httpx client IS the
+shared keep-alive connection pool for that provider (base_url/auth/headers differ per
+provider, so one HttpClientPool client for everything doesn't fit). Rate limiting is
+process-wide anyway (rate_limiter.py), so sharing the client changes nothing there.
+
+When do we rebuild a client? Credentials change at runtime (Settings UI, onboarding):
+- Callers pass a cheap "version" number (AppSettingsService namespace counter, bumped
+  on every set()/delete() of "<provider>.*"). Version unchanged + recently checked →
+  cached client, NO DB access at all.
+- Version moved or RECHECK_SECONDS elapsed (covers .env / other-process changes and
+  loads that raced with a not-yet-committed save) → the loader re-reads the config.
+  Same fingerprint → keep the client. Different → build a new client, retire the
+  old one.
+- Retired clients are closed after RETIRE_GRACE_SECONDS so requests still using them
+  can finish.
+
+Usage:
+    client = await ProviderClientRegistry.get_client(
+        "slskd",
+        version=CredentialsService.credentials_version("slskd"),
+        load=load_slskd_config,  # async () -> hashable config
+        build=lambda cfg: SlskdClient(...),
+    )
+
+Don't forget ProviderClientRegistry.close_all() at app shutdown (see lifecycle.py)!
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, ClassVar, TypeVar, cast
+
+logger = logging.getLogger(__name__)
+
+C = TypeVar("C", bound=Hashable)
+T = TypeVar("T")
+
+
+@dataclass
+class _RegistryEntry:
+    """A cached provider client plus what it was built from."""
+
+    client: Any
+    fingerprint: Hashable
+    version: int
+    checked_at: float
+
+
+class ProviderClientRegistry:
+    """Singleton registry handing out one long-lived client per provider.
+
+    Same ClassVar pattern as HttpClientPool - no instance needed, state is shared
+    by every caller in the process.
+    """
+
+    _entries: ClassVar[dict[str, _RegistryEntry]] = {}
+    _locks: ClassVar[dict[str, asyncio.Lock]] = {}
+    _retiring: ClassVar[dict[asyncio.Task[None], tuple[str, Any]]] = {}
+    _stats: ClassVar[dict[str, int]] = {"hits": 0, "checks": 0, "builds": 0}
+
+    # Re-run the loader at least this often even if the version didn't move.
+    # Catches credential changes the version counter can't see (.env edit + reload,
+    # another process writing app_settings).
+    RECHECK_SECONDS: ClassVar[float] = 60.0
+
+    # How long a replaced client stays open for requests that still hold it.
+    RETIRE_GRACE_SECONDS: ClassVar[float] = 30.0
+
+    @classmethod
+    async def get_client(
+        cls,
+        provider: str,
+        version: int,
+        load: Callable[[], Awaitable[C]],
+        build: Callable[[C], T],
+    ) -> T:
+        """Get the shared client of a provider, (re)building it if needed.
+
+        Args:
+            provider: Registry key ("spotify", "slskd", "deezer", "musicbrainz")
+            version: Cheap change counter of the provider's config
+            load: Reads the current config (may hit the DB). Must return a hashable
+                value - it's compared with the config the cached client was built from
+            build: Creates a new client from a config (sync, no I/O)
+
+        Returns:
+            The shared client instance
+        """
+        # Entries hold different client types (one per provider) - the caller's
+        # build() fixes T for its provider, hence the casts
+        entry = cls._entries.get(provider)
+        if entry is not None and cls._is_fresh(entry, version):
+            cls._stats["hits"] += 1
+            return cast(T, entry.client)
+
+        lock = cls._locks.setdefault(provider, asyncio.Lock())
+        async with lock:
+            # Another request may have refreshed it while we waited for the lock
+            entry = cls._entries.get(provider)
+            if entry is not None and cls._is_fresh(entry, version):
+                cls._stats["hits"] += 1
+                return cast(T, entry.client)
+
+            cls._stats["checks"] += 1
+            config = await load()
+
+            if entry is not None and entry.fingerprint == config:
+                entry.version = version
+                entry.checked_at = time.monotonic()
+                return cast(T, entry.client)
+
+            client = build(config)
+            cls._stats["builds"] += 1
+            cls._entries[provider] = _RegistryEntry(
+                client=client,
+                fingerprint=config,
+                version=version,
+                checked_at=time.monotonic(),
+            )
+            if entry is not None:
+                logger.info(f"Config of provider '{provider}' changed, client rebuilt")
+                cls._retire(provider, entry.client)
+            return client
+
+    @classmethod
+    def _is_fresh(cls, entry: _RegistryEntry, version: int) -> bool:
+        """True if the cached client can be handed out without re-checking."""
+        return (
+            entry.version == version
+            and time.monotonic() - entry.checked_at < cls.RECHECK_SECONDS
+        )
+
+    @classmethod
+    def invalidate(cls, provider: str) -> None:
+        """Drop a provider's client (next get_client() rebuilds it).
+
+        Args:
+            provider: Registry key
+        """
+        entry = cls._entries.pop(provider, None)
+        if entry is not None:
+            cls._retire(provider, entry.client)
+
+    @classmethod
+    def _retire(cls, provider: str, client: Any) -> None:
+        """Close a replaced client after the grace period (in the background)."""
+        try:
+            task = asyncio.get_running_loop().create_task(
+                cls._close_later(provider, client, cls.RETIRE_GRACE_SECONDS)
+            )
+        except RuntimeError:
+            # No running loop (sync context) - nothing we can await, just drop it
+            return
+        cls._retiring[task] = (provider, client)
+        task.add_done_callback(lambda t: cls._retiring.pop(t, None))
+
+    @classmethod
+    async def _close_later(cls, provider: str, client: Any, delay: float) -> None:
+        """Wait, then close a client (errors are logged, never raised)."""
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await cls._close_client(provider, client)
+
+    @staticmethod
+    async def _close_client(provider: str, client: Any) -> None:
+        """Close a client if it has an async close()."""
+        close = getattr(client, "close", None)
+        if close is None:
+            return
+        try:
+            await close()
+        except Exception as e:
+            logger.warning(f"Error closing {provider} client: {e}")
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close all cached and retiring clients. Call at app shutdown!"""
+        retiring = list(cls._retiring.items())
+        cls._retiring.clear()
+        for task, _ in retiring:
+            task.cancel()
+        entries = list(cls._entries.items())
+        cls._entries.clear()
+        for provider, entry in entries:
+            await cls._close_client(provider, entry.client)
+        for _, (provider, client) in retiring:
+            await cls._close_client(provider, client)
+        if entries:
+            logger.info(f"Closed {len(entries)} shared provider client(s)")
+
+    @classmethod
+    def get_stats(cls) -> dict[str, Any]:
+        """Get registry statistics (hits = requests served without any DB access)."""
+        return {
+            "providers": sorted(cls._entries),
+            "retiring": len(cls._retiring),
+            **cls._stats,
+        }
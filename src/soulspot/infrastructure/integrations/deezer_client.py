@@ -30,6 +30,10 @@ from urllib.parse import urlencode
 import httpx
 
 from soulspot.domain.exceptions import ConfigurationError
+from soulspot.infrastructure.integrations.single_flight import (
+    get_single_flight,
+    request_key,
+)
 from soulspot.infrastructure.rate_limiter import get_deezer_limiter
 
 logger = logging.getLogger(__name__)
@@ -171,6 +175,7 @@ class DeezerClient:
     # Hey future me - CENTRALIZED API REQUEST with Rate Limiting!
     # All Deezer API calls go through here to respect rate limits.
     # Deezer is more lenient (50 req/5 sec) but we're still responsible.
+    # Concurrent identical GETs share ONE request (single_flight.py).
     async def _api_request(
         self,
         method: str,
@@ -182,6 +187,39 @@ class DeezerClient:
         """Make rate-limited API request with automatic retry on 429.
 
         Hey future me - ALL Deezer API calls should use this method!
+        GET requests already in flight with the same endpoint/params/token
+        are coalesced.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path (e.g., "/search/track")
+            params: Query parameters
+            access_token: OAuth access token (only for user-authenticated endpoints)
+            max_retries: Max retries on 429 (default 3)
+
+        Returns:
+            httpx.Response object (shared with coalesced callers - read-only!)
+        """
+        if method.upper() != "GET":
+            return await self._send_api_request(
+                method, endpoint, params, access_token, max_retries
+            )
+        return await get_single_flight("deezer").do(
+            request_key(method, endpoint, params, access_token),
+            lambda: self._send_api_request(
+                method, endpoint, params, access_token, max_retries
+            ),
+        )
+
+    async def _send_api_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        access_token: str | None = None,
+        max_retries: int = 3,
+    ) -> httpx.Response:
+        """Send one rate-limited API request with automatic retry on 429.
 
         Args:
             method: HTTP method (GET, POST, etc.)
@@ -1,12 +1,19 @@
 """MusicBrainz HTTP client implementation with rate limiting."""
 
-import asyncio
+import logging
 from typing import Any, cast
 
 import httpx
 
 from soulspot.config.settings import MusicBrainzSettings
 from soulspot.domain.ports import IMusicBrainzClient
+from soulspot.infrastructure.integrations.single_flight import (
+    get_single_flight,
+    request_key,
+)
+from soulspot.infrastructure.rate_limiter import get_musicbrainz_limiter
+
+logger = logging.getLogger(__name__)
 
 
 class MusicBrainzClient(IMusicBrainzClient):
@@ -16,10 +23,11 @@ class MusicBrainzClient(IMusicBrainzClient):
     RATE_LIMIT_DELAY = 1.0  # 1 request per second as per MusicBrainz guidelines
 
     # Hey future me, MusicBrainz is STRICT about rate limiting - 1 req/sec, NO EXCEPTIONS!
-    # That's why we track _last_request_time and have a lock. If you violate this, they'll
-    # IP-ban you for hours (or days if you're really naughty). The lock ensures even with
-    # concurrent requests, we stay compliant. Don't remove this thinking "oh we're not busy
-    # enough" - you WILL get banned eventually!
+    # If you violate this, they'll IP-ban you for hours (or days if you're really naughty).
+    # The budget is per IP, NOT per client instance - that's why we use the process-wide
+    # token bucket from rate_limiter.py instead of a per-instance lock. Before that, every
+    # request/worker that built its own MusicBrainzClient got its own "1 req/sec" and
+    # together they happily went way over it. Don't add a local lock back!
     def __init__(self, settings: MusicBrainzSettings) -> None:
         """
         Initialize MusicBrainz client.
@@ -29,8 +37,6 @@ class MusicBrainzClient(IMusicBrainzClient):
         """
         self.settings = settings
         self._client: httpx.AsyncClient | None = None
-        self._last_request_time: float = 0.0
-        self._rate_limit_lock = asyncio.Lock()
 
     # Listen future me, MusicBrainz REQUIRES a User-Agent with your app name, version, AND
     # contact info. If you don't set this, they'll reject requests with 403. The contact is
@@ -63,21 +69,50 @@ class MusicBrainzClient(IMusicBrainzClient):
             await self._client.aclose()
             self._client = None
 
-    # Yo future me, this is THE CORE of our rate limiting. The lock ensures only one request
-    # happens at a time, even from multiple coroutines. We calculate time since last request
-    # and sleep if needed to hit exactly 1 req/sec. CRITICAL: We update _last_request_time
-    # AFTER the request completes, not before! This accounts for slow requests. If you move
-    # that line before the request, you'll accidentally speed up and violate the rate limit
-    # when responses are slow. I learned this the hard way after getting IP-banned for 6 hours.
+    # Yo future me, this is THE CORE of our rate limiting. ALL MusicBrainzClient instances
+    # share get_musicbrainz_limiter() (1 token, 1 token/sec, no burst), so the whole process
+    # stays at 1 req/sec no matter how many clients/workers exist. MusicBrainz answers 503
+    # when we're too fast → adaptive backoff on the SHARED limiter (everybody slows down,
+    # not just this caller), then retry.
+    # With 1 req/sec, coalescing concurrent identical GETs (single_flight.py) is a BIG deal:
+    # every duplicate would otherwise cost a full second of the budget.
     async def _rate_limited_request(
-        self, method: str, url: str, **kwargs: Any
+        self, method: str, url: str, max_retries: int = 2, **kwargs: Any
     ) -> httpx.Response:
         """
         Make a rate-limited request to MusicBrainz API.
 
+        Concurrent GETs with the same URL/params share one request.
+
         Args:
             method: HTTP method
             url: Request URL
+            max_retries: Max retries on 503 (rate limited)
+            **kwargs: Additional request parameters
+
+        Returns:
+            HTTP response (shared with coalesced callers - read-only!)
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        if method.upper() != "GET" or set(kwargs) - {"params"}:
+            return await self._send_request(method, url, max_retries, **kwargs)
+        return await get_single_flight("musicbrainz").do(
+            request_key(method, url, kwargs.get("params")),
+            lambda: self._send_request(method, url, max_retries, **kwargs),
+        )
+
+    async def _send_request(
+        self, method: str, url: str, max_retries: int = 2, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send one rate-limited request to MusicBrainz API (retries on 503).
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            max_retries: Max retries on 503 (rate limited)
             **kwargs: Additional request parameters
 
         Returns:
@@ -86,20 +121,26 @@ class MusicBrainzClient(IMusicBrainzClient):
         Raises:
             httpx.HTTPError: If the request fails
         """
-        async with self._rate_limit_lock:
-            # Ensure we respect the rate limit
-            current_time = asyncio.get_event_loop().time()
-            time_since_last = current_time - self._last_request_time
+        client = await self._get_client()
+        rate_limiter = get_musicbrainz_limiter()
 
-            if time_since_last < self.RATE_LIMIT_DELAY:
-                await asyncio.sleep(self.RATE_LIMIT_DELAY - time_since_last)
+        for attempt in range(max_retries + 1):
+            async with rate_limiter:
+                response = await client.request(method, url, **kwargs)
 
-            client = await self._get_client()
-            response = await client.request(method, url, **kwargs)
+            if response.status_code != 503 or attempt >= max_retries:
+                return response
 
-            self._last_request_time = asyncio.get_event_loop().time()
+            retry_after = response.headers.get("Retry-After")
+            wait_time = await rate_limiter.handle_rate_limit_response(
+                int(retry_after) if retry_after and retry_after.isdigit() else None
+            )
+            logger.warning(
+                f"MusicBrainz rate limit (attempt {attempt + 1}/{max_retries}): "
+                f"Waited {wait_time:.1f}s, retrying {url}"
+            )
 
-            return response
+        return response
 
     # Listen up, ISRC lookup is GOLD when it works but... ISRC codes aren't always in MB's
     # database. Even major label tracks sometimes missing! When found, MB returns a LIST of
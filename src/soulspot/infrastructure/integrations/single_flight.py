@@ -0,0 +1,160 @@
+"""Single-flight request coalescing for provider API calls.
+
+Hey future me - this is the "don't ask Spotify the same thing twice AT THE SAME TIME" layer!
+
+During syncs the same lookup arrives from several coroutines at once: UnifiedLibraryManager
+album sync, image sync and a user opening that artist page all want /artists/{id}. Without
+coalescing every caller spends its own rate limiter token and does its own HTTP request.
+
+With SingleFlight the FIRST caller (leader) runs the request, everybody who asks for the
+same key while it's in flight just awaits the leader's result (or exception). Once the
+request finishes the key is forgotten - this is NOT a cache, the next call goes out again.
+
+Rules:
+- Only coalesce READS (GET). A POST/PUT/DELETE must never be "shared".
+- The key must contain everything that changes the answer: method, URL, params AND the
+  access token (two users asking the same endpoint can get different results).
+- The shared work runs in its own task: a cancelled caller (closed browser tab) doesn't
+  cancel the request for the other waiters.
+
+Usage:
+    flight = get_single_flight("spotify")
+    response = await flight.do(
+        request_key("GET", url, params, access_token),
+        lambda: self._send_request(...),
+    )
+
+Counters are exposed at /api/metrics (provider_requests_coalesced_total).
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters of one SingleFlight group."""
+
+    leaders: int = 0  # Calls that actually hit the provider
+    coalesced: int = 0  # Calls that piggybacked on an in-flight call
+    in_flight: int = 0  # Keys currently in flight
+
+    @property
+    def coalesce_rate(self) -> float:
+        """Share of calls that didn't need their own request (0.0-1.0)."""
+        total = self.leaders + self.coalesced
+        return self.coalesced / total if total else 0.0
+
+
+class SingleFlight[T]:
+    """Coalesces concurrent calls with the same key into one execution."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize an empty group.
+
+        Args:
+            name: Group name for logs/metrics (usually the provider)
+        """
+        self.name = name
+        self._in_flight: dict[Hashable, asyncio.Task[T]] = {}
+        self._leaders = 0
+        self._coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn once per key, sharing the result with concurrent callers.
+
+        Args:
+            key: Identity of the call (see request_key())
+            fn: Does the actual work - only called by the leader
+
+        Returns:
+            Result of fn (same object for all callers of one flight)
+
+        Raises:
+            Whatever fn raised (for every caller of that flight)
+        """
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._coalesced += 1
+            logger.debug(f"SingleFlight[{self.name}]: coalesced {key!r}")
+        else:
+            self._leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+
+        # shield → one caller getting cancelled doesn't cancel the shared request
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        """Drop a finished flight (next call with this key goes out again)."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Nobody may be left to await an error (all callers cancelled) → mark retrieved
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> SingleFlightStats:
+        """Get a snapshot of this group's counters."""
+        return SingleFlightStats(
+            leaders=self._leaders,
+            coalesced=self._coalesced,
+            in_flight=len(self._in_flight),
+        )
+
+
+def request_key(
+    method: str,
+    url: str,
+    params: Mapping[str, Any] | None = None,
+    *extra: Hashable,
+) -> tuple[Hashable, ...]:
+    """Build a hashable single-flight key for an HTTP request.
+
+    Args:
+        method: HTTP method
+        url: Request URL or endpoint path
+        params: Query parameters (order doesn't matter)
+        *extra: Anything else that changes the response (e.g. access token)
+
+    Returns:
+        Tuple usable as SingleFlight key
+    """
+    frozen_params = tuple(sorted((k, str(v)) for k, v in (params or {}).items()))
+    return (method.upper(), url, frozen_params, *extra)
+
+
+# Module-level groups (one per provider, shared by ALL client instances)
+# Hey future me – same idea as the limiters in rate_limiter.py: workers build their own
+# clients, the coalescing must still see every caller in the process.
+# Every provider coalesces its GET responses, so the groups are typed for those
+_single_flights: dict[str, SingleFlight[httpx.Response]] = {}
+
+
+def get_single_flight(name: str) -> SingleFlight[httpx.Response]:
+    """Get (or create) the process-wide SingleFlight group of a provider."""
+    flight = _single_flights.get(name)
+    if flight is None:
+        flight = _single_flights[name] = SingleFlight(name)
+    return flight
+
+
+def get_single_flight_stats() -> dict[str, SingleFlightStats]:
+    """Get counters of all SingleFlight groups (for /api/metrics)."""
+    return {name: flight.get_stats() for name, flight in _single_flights.items()}
+
+
+__all__ = [
+    "SingleFlight",
+    "SingleFlightStats",
+    "get_single_flight",
+    "get_single_flight_stats",
+    "request_key",
+]
@@ -1,5 +1,9 @@
 """slskd HTTP client implementation for Soulseek downloads."""
 
+import asyncio
+import logging
+import uuid
+from collections.abc import AsyncGenerator, Iterator
 from typing import Any
 
 import httpx
@@ -8,6 +12,11 @@ from soulspot.config.settings import SlskdSettings
 from soulspot.domain.exceptions import ConfigurationError, ValidationError
 from soulspot.domain.ports import ISlskdClient
 
+logger = logging.getLogger(__name__)
+
+# Seconds past searchTimeout we keep polling for slskd to mark the search complete
+_SEARCH_COMPLETE_GRACE = 5.0
+
 
 class SlskdClient(ISlskdClient):
     """HTTP client for slskd API operations."""
@@ -17,12 +26,17 @@ class SlskdClient(ISlskdClient):
     # when you have double slashes in URLs. Learned that the hard way with 404 errors!
     # Client creation is lazy (in _get_client) to avoid asyncio headaches.
     # UPDATE: Now validates URL has http:// or https:// protocol to prevent cryptic httpx errors!
-    def __init__(self, settings: SlskdSettings) -> None:
+    def __init__(
+        self,
+        settings: SlskdSettings,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
         """
         Initialize slskd client.
 
         Args:
             settings: slskd configuration settings
+            transport: Custom httpx transport (e.g. FakeSlskdTransport for offline runs)
 
         Raises:
             ConfigurationError: If URL is missing or doesn't have http:// or https:// protocol
@@ -43,6 +57,7 @@ class SlskdClient(ISlskdClient):
             )
 
         self.base_url = url.rstrip("/")
+        self._transport = transport
         self._client: httpx.AsyncClient | None = None
 
     # Listen up, slskd supports TWO auth methods: API key (preferred) OR basic auth.
@@ -69,6 +84,7 @@ class SlskdClient(ISlskdClient):
                 headers=headers,
                 auth=auth,
                 timeout=30.0,
+                transport=self._transport,
             )
         return self._client
 
@@ -87,6 +103,9 @@ class SlskdClient(ISlskdClient):
     # varies WILDLY - generic terms return tons of crap, specific terms might find nothing.
     # Pro tip: Include artist name + track name for best results. The slskd API uses camelCase
     # (searchText, bitRate) not snake_case - watch out when parsing responses!
+    # UPDATE: The old version did POST + ONE immediate GET - that GET happened a few ms after
+    # the search started, so it mostly returned nothing. search() now drains search_stream()
+    # until slskd reports the search complete (or the timeout hits).
     async def search(self, query: str, timeout: int = 30) -> list[dict[str, Any]]:
         """
         Search for files on the Soulseek network.
@@ -101,41 +120,119 @@ class SlskdClient(ISlskdClient):
         Raises:
             httpx.HTTPError: If the request fails
         """
+        files: list[dict[str, Any]] = []
+        async for batch in self.search_stream(query, timeout=timeout):
+            files.extend(batch)
+        return files
+
+    # Hey future me - this is the STREAMING search! Peers answer over several seconds, so
+    # instead of waiting for the whole search we poll /searches/{id}/responses and yield
+    # each NEW peer's files as soon as slskd has them. The consumer (download path) ranks
+    # every batch and just stops iterating once something good enough showed up.
+    # Stopping early (break / aclose()) lands in the finally block, which tells slskd to
+    # stop the search - otherwise it keeps asking the network until searchTimeout.
+    # Responses are deduped by username: slskd only ever appends peers to the list, and a
+    # peer's response is complete when it shows up (one response message per peer).
+    async def search_stream(
+        self,
+        query: str,
+        timeout: int = 30,
+        poll_interval: float | None = None,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """
+        Search the Soulseek network, yielding result batches as peers respond.
+
+        Args:
+            query: Search query string
+            timeout: Search timeout in seconds
+            poll_interval: Seconds between polls (default: settings.search_poll_interval)
+
+        Yields:
+            Lists of new search results (same dict format as search())
+
+        Raises:
+            httpx.HTTPError: If a request fails
+        """
         client = await self._get_client()
+        interval = (
+            poll_interval
+            if poll_interval is not None
+            else self.settings.search_poll_interval
+        )
 
-        # Start a search
+        # Client-side ID so we can cancel even if the POST response gets lost
         response = await client.post(
             "/api/v0/searches",
-            json={"searchText": query},
-            timeout=timeout,
+            json={
+                "id": str(uuid.uuid4()),
+                "searchText": query,
+                "searchTimeout": timeout * 1000,
+            },
         )
         response.raise_for_status()
-        search_data = response.json()
-        search_id = search_data["id"]
+        search_id = response.json()["id"]
 
-        # Get search results
-        response = await client.get(f"/api/v0/searches/{search_id}")
-        response.raise_for_status()
-        results = response.json()
-
-        # Extract file information from results
-        files = []
-        if "responses" in results:
-            for user_response in results["responses"]:
-                username = user_response.get("username", "")
-                for file in user_response.get("files", []):
-                    files.append(
-                        {
-                            "username": username,
-                            "filename": file.get("filename", ""),
-                            "size": file.get("size", 0),
-                            "bitrate": file.get("bitRate", 0),
-                            "length": file.get("length", 0),
-                            "quality": file.get("quality", 0),
-                        }
-                    )
+        loop = asyncio.get_running_loop()
+        # slskd needs a moment after searchTimeout to flip isComplete - small grace period
+        deadline = loop.time() + timeout + _SEARCH_COMPLETE_GRACE
+        seen_users: set[str] = set()
+        complete = False
 
-        return files
+        try:
+            while True:
+                # State first, responses second: if the state says complete, the
+                # responses fetched after it are guaranteed to be final
+                state_response = await client.get(f"/api/v0/searches/{search_id}")
+                state_response.raise_for_status()
+                complete = bool(state_response.json().get("isComplete"))
+
+                responses = await client.get(f"/api/v0/searches/{search_id}/responses")
+                responses.raise_for_status()
+
+                batch: list[dict[str, Any]] = []
+                for user_response in responses.json() or []:
+                    username = user_response.get("username", "")
+                    if username in seen_users:
+                        continue
+                    seen_users.add(username)
+                    batch.extend(self._response_files(user_response))
+                if batch:
+                    yield batch
+
+                if complete or loop.time() >= deadline:
+                    return
+                await asyncio.sleep(interval)
+        finally:
+            if not complete:
+                await self._stop_search(client, search_id)
+
+    @staticmethod
+    def _response_files(user_response: dict[str, Any]) -> list[dict[str, Any]]:
+        """Convert one peer's slskd search response to our result dicts."""
+        username = user_response.get("username", "")
+        return [
+            {
+                "username": username,
+                "filename": file.get("filename", ""),
+                "size": file.get("size", 0),
+                "bitrate": file.get("bitRate", 0),
+                "length": file.get("length", 0),
+                "quality": file.get("quality", 0),
+            }
+            for file in user_response.get("files") or []
+        ]
+
+    # Hey future me - PUT /searches/{id} = "stop" (DELETE would also drop the results from
+    # slskd's UI). Best effort: runs from a finally block, possibly while a cancelled task
+    # unwinds - a failure here must never mask the real exception or the early return.
+    @staticmethod
+    async def _stop_search(client: httpx.AsyncClient, search_id: str) -> None:
+        """Ask slskd to stop a still running search (errors are logged, not raised)."""
+        try:
+            response = await client.put(f"/api/v0/searches/{search_id}")
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.debug("Could not stop slskd search %s: %s", search_id, e)
 
     # Hey future me, this STARTS a download but doesn't wait for it to finish! It's async.
     # The download happens in the background via P2P. slskd doesn't give us a clean download_id
@@ -204,20 +301,12 @@ class SlskdClient(ISlskdClient):
         response.raise_for_status()
         downloads = response.json()
 
-        for download in downloads:
+        for download in self._iter_transfer_files(downloads):
             if (
                 download.get("username") == username
                 and download.get("filename") == filename
             ):
-                return {
-                    "id": download_id,
-                    "username": username,
-                    "filename": filename,
-                    "state": download.get("state", "unknown"),
-                    "progress": download.get("percentComplete", 0),
-                    "bytes_transferred": download.get("bytesTransferred", 0),
-                    "size": download.get("size", 0),
-                }
+                return self._normalize_transfer(download)
 
         # Not found
         return {
@@ -250,23 +339,44 @@ class SlskdClient(ISlskdClient):
         response.raise_for_status()
         downloads = response.json()
 
-        result = []
-        for download in downloads:
-            username = download.get("username", "")
-            filename = download.get("filename", "")
-            result.append(
-                {
-                    "id": f"{username}/{filename}",
-                    "username": username,
-                    "filename": filename,
-                    "state": download.get("state", "unknown"),
-                    "progress": download.get("percentComplete", 0),
-                    "bytes_transferred": download.get("bytesTransferred", 0),
-                    "size": download.get("size", 0),
-                }
-            )
-
-        return result
+        return [
+            self._normalize_transfer(download)
+            for download in self._iter_transfer_files(downloads)
+        ]
+
+    # Hey future me - /transfers/downloads is NOT a flat list! slskd groups transfers as
+    # [{username, directories: [{directory, files: [...]}]}] and only the innermost file
+    # entries carry state/percentComplete/bytesTransferred. Iterating the top level directly
+    # gave one bogus "transfer" per USER (empty filename). Flat entries (already file-level,
+    # e.g. from older slskd builds or test stubs) are passed through unchanged.
+    @staticmethod
+    def _iter_transfer_files(downloads: Any) -> Iterator[dict[str, Any]]:
+        """Yield file-level transfer dicts from the nested slskd downloads tree."""
+        for user in downloads or []:
+            if "directories" not in user:
+                yield user
+                continue
+            username = user.get("username", "")
+            for directory in user.get("directories") or []:
+                for file in directory.get("files") or []:
+                    if "username" not in file:
+                        file = {**file, "username": username}
+                    yield file
+
+    @staticmethod
+    def _normalize_transfer(download: dict[str, Any]) -> dict[str, Any]:
+        """Convert a slskd file transfer to our download dict format."""
+        username = download.get("username", "")
+        filename = download.get("filename", "")
+        return {
+            "id": f"{username}/{filename}",
+            "username": username,
+            "filename": filename,
+            "state": download.get("state", "unknown"),
+            "progress": download.get("percentComplete", 0),
+            "bytes_transferred": download.get("bytesTransferred", 0),
+            "size": download.get("size", 0),
+        }
 
     # Hey future me, canceling is done via DELETE but the API is weird: username goes in the
     # path, filename goes as a query param. Why? No idea. Just roll with it. If the download
@@ -0,0 +1,175 @@
+"""In-process fake of the slskd search API for offline runs.
+
+Hey future me - this lets you exercise the STREAMING search (SlskdClient.search_stream,
+early accept in SearchAndDownloadTrackUseCase) without a Soulseek network!
+
+It's an httpx transport, so the real SlskdClient code runs unchanged - only the HTTP
+hop is answered in-process:
+
+    transport = FakeSlskdTransport([
+        FakePeer("fast_mp3", delay=0.2, files=[{"filename": "...mp3", "bitRate": 192}]),
+        FakePeer("slow_flac", delay=4.0, files=[{"filename": "...flac", "size": 30e6}]),
+    ])
+    client = SlskdClient(SlskdSettings(url="http://fake-slskd"), transport=transport)
+
+Peers "answer" once their delay (seconds after the search POST, event loop clock)
+has passed, like real peers trickling in. Every search sees the same peers unless
+you pass a responder callable (query -> peers). Stop requests are recorded in
+transport.stopped so callers can check that an early exit cancelled the search.
+
+Only the endpoints the search path needs are faked; downloads are accepted and
+listed as queued, nothing is transferred.
+"""
+
+import asyncio
+import json
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+_SEARCH_PATH = re.compile(r"^/api/v0/searches/(?P<id>[^/]+)(?P<responses>/responses)?$")
+
+
+@dataclass
+class FakePeer:
+    """One Soulseek user answering a search after `delay` seconds."""
+
+    username: str
+    delay: float = 0.0
+    files: list[dict[str, Any]] = field(default_factory=list)
+
+    def response(self) -> dict[str, Any]:
+        """The peer's answer in slskd's search response format."""
+        return {
+            "username": self.username,
+            "fileCount": len(self.files),
+            "files": self.files,
+        }
+
+
+@dataclass
+class _FakeSearch:
+    search_id: str
+    query: str
+    started: float
+    timeout: float
+    peers: list[FakePeer]
+    stopped_at: float | None = None
+
+
+class FakeSlskdTransport(httpx.AsyncBaseTransport):
+    """httpx transport answering slskd search/transfer requests from fake peers."""
+
+    def __init__(
+        self,
+        peers: list[FakePeer] | Callable[[str], list[FakePeer]] | None = None,
+    ) -> None:
+        """
+        Initialize the fake.
+
+        Args:
+            peers: Peers answering every search, or a callable query -> peers
+        """
+        self._responder: Callable[[str], list[FakePeer]] = (
+            peers if callable(peers) else (lambda _query: list(peers or []))
+        )
+        self.searches: dict[str, _FakeSearch] = {}
+        self.stopped: list[str] = []
+        self.downloads: list[dict[str, Any]] = []
+        self.request_count = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.request_count += 1
+        path = request.url.path
+        method = request.method
+
+        if path == "/api/v0/searches" and method == "POST":
+            return self._start_search(json.loads(request.content or b"{}"))
+
+        match = _SEARCH_PATH.match(path)
+        if match:
+            search = self.searches.get(match["id"])
+            if search is None:
+                return httpx.Response(404)
+            if method == "GET" and match["responses"]:
+                return httpx.Response(200, json=self._responses(search))
+            if method == "GET":
+                return httpx.Response(200, json=self._state(search))
+            if method == "PUT":
+                if search.stopped_at is None:
+                    search.stopped_at = asyncio.get_running_loop().time()
+                self.stopped.append(search.search_id)
+                return httpx.Response(200)
+            if method == "DELETE":
+                del self.searches[search.search_id]
+                return httpx.Response(204)
+
+        if path == "/api/v0/transfers/downloads" and method == "POST":
+            body = json.loads(request.content or b"{}")
+            for filename in body.get("files", []):
+                self.downloads.append(
+                    {
+                        "username": body.get("username", ""),
+                        "filename": filename,
+                        "state": "Queued, Remotely",
+                        "percentComplete": 0,
+                        "bytesTransferred": 0,
+                        "size": 0,
+                    }
+                )
+            return httpx.Response(201, json={})
+        if path == "/api/v0/transfers/downloads" and method == "GET":
+            return httpx.Response(200, json=self.downloads)
+        if path == "/api/v0/application" and method == "GET":
+            return httpx.Response(200, json={"version": {"full": "fake"}})
+
+        return httpx.Response(404, json={"error": f"not faked: {method} {path}"})
+
+    def _start_search(self, body: dict[str, Any]) -> httpx.Response:
+        search_id = body.get("id") or f"fake-{len(self.searches) + 1}"
+        query = body.get("searchText", "")
+        self.searches[search_id] = _FakeSearch(
+            search_id=search_id,
+            query=query,
+            started=asyncio.get_running_loop().time(),
+            timeout=body.get("searchTimeout", 15000) / 1000,
+            peers=self._responder(query),
+        )
+        return httpx.Response(200, json={"id": search_id, "searchText": query})
+
+    @staticmethod
+    def _elapsed(search: _FakeSearch) -> float:
+        # A stopped search freezes - peers answering later are not collected anymore
+        now = asyncio.get_running_loop().time()
+        if search.stopped_at is not None:
+            now = min(now, search.stopped_at)
+        return now - search.started
+
+    def _answered(self, search: _FakeSearch) -> list[FakePeer]:
+        elapsed = self._elapsed(search)
+        return [p for p in search.peers if p.delay <= min(elapsed, search.timeout)]
+
+    def _state(self, search: _FakeSearch) -> dict[str, Any]:
+        answered = self._answered(search)
+        complete = (
+            search.stopped_at is not None or self._elapsed(search) >= search.timeout
+        )
+        return {
+            "id": search.search_id,
+            "searchText": search.query,
+            "isComplete": complete,
+            "state": "Completed" if complete else "InProgress",
+            "responseCount": len(answered),
+            "fileCount": sum(len(p.files) for p in answered),
+        }
+
+    def _responses(self, search: _FakeSearch) -> list[dict[str, Any]]:
+        # Peers keep their arrival order - same append-only list as real slskd
+        answered = sorted(self._answered(search), key=lambda p: p.delay)
+        return [peer.response() for peer in answered]
+
+
+__all__ = ["FakePeer", "FakeSlskdTransport"]
@@ -12,6 +12,10 @@ import httpx
 from soulspot.config.settings import SpotifySettings
 from soulspot.domain.exceptions import ConfigurationError
 from soulspot.domain.ports import ISpotifyClient
+from soulspot.infrastructure.integrations.single_flight import (
+    get_single_flight,
+    request_key,
+)
 from soulspot.infrastructure.rate_limiter import get_spotify_limiter
 
 logger = logging.getLogger(__name__)
@@ -62,6 +66,8 @@ class SpotifyClient(ISpotifyClient):
     # - Automatic retry with exponential backoff on 429
     # - Respects Retry-After header from Spotify
     # - Max 3 retries to prevent infinite loops
+    # - Concurrent identical GETs share ONE request (single_flight.py) - album sync, image
+    #   sync and the artist page asking for the same artist cost one token, not three
     async def _api_request(
         self,
         method: str,
@@ -73,7 +79,42 @@ class SpotifyClient(ISpotifyClient):
         """Make rate-limited API request with automatic retry on 429.
 
         Hey future me - ALL Spotify API calls should use this method!
-        It handles rate limiting and retries automatically.
+        It handles rate limiting and retries automatically. GET requests that are
+        already in flight with the same URL/params/token are coalesced.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Full URL to request
+            access_token: OAuth access token
+            params: Query parameters
+            max_retries: Max retries on 429 (default 3)
+
+        Returns:
+            httpx.Response object (shared with coalesced callers - read-only!)
+
+        Raises:
+            httpx.HTTPStatusError: On non-retryable HTTP errors
+        """
+        if method.upper() != "GET":
+            return await self._send_api_request(
+                method, url, access_token, params, max_retries
+            )
+        return await get_single_flight("spotify").do(
+            request_key(method, url, params, access_token),
+            lambda: self._send_api_request(
+                method, url, access_token, params, max_retries
+            ),
+        )
+
+    async def _send_api_request(
+        self,
+        method: str,
+        url: str,
+        access_token: str,
+        params: dict[str, Any] | None = None,
+        max_retries: int = 3,
+    ) -> httpx.Response:
+        """Send one rate-limited API request with automatic retry on 429.
 
         Args:
             method: HTTP method (GET, POST, etc.)
@@ -120,6 +120,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Startup
     auto_import_task = None
+    image_adoption_task = None
     job_queue = None
     token_refresh_worker = None
     try:
@@ -251,6 +252,46 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                     e,
                 )
 
+        # Self-heal the library search index (FTS5 triggers lost to table rebuilds)
+        try:
+            if await db.ensure_search_index():
+                logger.info("Library search index rebuilt")
+        except Exception as e:
+            # Search falls back to LIKE if the index is unusable - never block startup
+            logger.warning("Library search index check failed: %s", e)
+
+        # Content-addressed image store (shared blobs + refcounts + incremental stats).
+        # Hey future me - every ImageService instance finds it via get_image_store().
+        # Images from before the store get registered in place ONCE, in the background
+        # (hashing a big image dir takes a while, startup must not wait for it).
+        from soulspot.application.services.images.content_store import (
+            configure_image_store,
+        )
+
+        image_store = configure_image_store(
+            settings.storage.image_path, session_scope=db.session_scope
+        )
+
+        async def _adopt_existing_images() -> None:
+            try:
+                async with db.session_scope() as adopt_session:
+                    if await AppSettingsService(adopt_session).get_bool(
+                        "images.content_store_adopted", default=False
+                    ):
+                        return
+                await image_store.adopt_existing_images()
+                async with db.session_scope() as adopt_session:
+                    await AppSettingsService(adopt_session).set(
+                        "images.content_store_adopted",
+                        True,
+                        value_type="boolean",
+                        category="images",
+                    )
+            except Exception as e:
+                logger.warning("Registering existing images failed: %s", e)
+
+        image_adoption_task = asyncio.create_task(_adopt_existing_images())
+
         # Initialize database-backed session store for OAuth persistence
         from soulspot.application.services.session_store import DatabaseSessionStore
 
@@ -552,6 +593,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                     job_queue=job_queue,
                     slskd_client=slskd_client,
                     session_factory=db.session_scope,  # Session-per-job for lock optimization!
+                    # Streaming search: stop as soon as a good enough file showed up
+                    search_accept_score=(
+                        settings.download.search_accept_score
+                        if settings.download.search_early_accept
+                        else None
+                    ),
                 )
                 download_worker.register()
                 app.state.download_worker = download_worker
@@ -718,6 +765,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             # Multiple concurrent workers all trying to write to SQLite causes lock contention.
             # For SQLite: use max 1 worker to serialize DB writes.
             # For PostgreSQL: use configured num_workers (default 3).
+            # Per-JobType pools (DEFAULT_JOB_TYPE_LIMITS) only matter with more than
+            # one worker.
             is_sqlite = "sqlite" in settings.database.url
             effective_workers = 1 if is_sqlite else settings.download.num_workers
             await job_queue.start(num_workers=effective_workers)
@@ -753,6 +802,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                     slskd_client=slskd_client,
                     job_queue=job_queue,
                     poll_interval_seconds=5,  # Poll slskd every 5 seconds for responsive UI
+                    idle_poll_interval_seconds=30,  # Slow heartbeat when nothing downloads
                     stale_timeout_hours=12,  # Restart downloads stale after 12h
                     max_consecutive_failures=3,  # Open circuit after 3 failures
                     circuit_breaker_timeout=60,  # Wait 60s before retry when circuit open
@@ -929,6 +979,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
             # Auto-import service
             from soulspot.application.services import AutoImportService
+            from soulspot.application.services.import_ledger import ImportLedger
+            from soulspot.application.services.postprocessing.lyrics_cache import (
+                LyricsCache,
+            )
             from soulspot.infrastructure.persistence.repositories import (
                 AlbumRepository,
                 ArtistRepository,
@@ -945,6 +999,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 poll_interval=settings.postprocessing.auto_import_poll_interval,
                 spotify_plugin=spotify_plugin,
                 app_settings_service=app_settings_service,
+                # Seen-file ledger: leftover files aren't re-read every cycle
+                import_ledger=ImportLedger(worker_session),
+                watch=settings.postprocessing.auto_import_watch,
+                # Session per lookup - album mode fetches lyrics concurrently
+                lyrics_cache=LyricsCache(
+                    session_scope=db.session_scope,
+                    negative_ttl_seconds=(
+                        settings.postprocessing.lyrics_negative_ttl_hours * 3600
+                    ),
+                ),
             )
             app.state.auto_import = auto_import_service
             # AutoImportService runs as blocking coroutine
@@ -1055,6 +1119,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             except Exception as e:
                 logger.exception("Error stopping auto-import service: %s", e)
 
+        # 3b. Stop the one-time image registration if it's still running
+        if image_adoption_task is not None and not image_adoption_task.done():
+            image_adoption_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await image_adoption_task
+
         # 4. Shutdown Hybrid DB Strategy components (BEFORE closing database!)
         # Hey future me - ORDER MATTERS! We must flush WriteBufferCache BEFORE
         # closing the database connection, otherwise pending writes are lost!
@@ -1095,3 +1165,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             logger.info("HTTP client pool closed")
         except Exception as e:
             logger.exception("Error closing HTTP client pool: %s", e)
+
+        # 6. Close shared provider clients (Spotify/slskd/Deezer/MusicBrainz keep-alive pools)
+        try:
+            from soulspot.infrastructure.integrations.client_registry import (
+                ProviderClientRegistry,
+            )
+
+            await ProviderClientRegistry.close_all()
+        except Exception as e:
+            logger.exception("Error closing shared provider clients: %s", e)
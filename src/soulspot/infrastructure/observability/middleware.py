@@ -1,4 +1,4 @@
-"""Middleware for observability: request/response logging."""
+"""Middleware for observability: request/response logging, response compression."""
 
 import logging
 import time
@@ -6,7 +6,7 @@ from collections.abc import Awaitable, Callable
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from soulspot.infrastructure.observability.logging import (
     get_correlation_id,
@@ -99,3 +99,71 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 f"✗ {method} {path} FAILED ({duration * 1000:.0f}ms): {e}",
             )
             raise
+
+
+# Paths whose responses are already compressed (WebP/JPEG/PNG covers, fonts, audio)
+INCOMPRESSIBLE_PATH_PREFIXES = ("/api/images/",)
+INCOMPRESSIBLE_SUFFIXES = (
+    ".webp",
+    ".jpg",
+    ".jpeg",
+    ".png",
+    ".gif",
+    ".avif",
+    ".ico",
+    ".woff",
+    ".woff2",
+    ".mp3",
+    ".flac",
+    ".ogg",
+    ".m4a",
+    ".zip",
+    ".gz",
+)
+
+
+# Hey future me - GZip for everything EXCEPT already-compressed bytes!
+# Plain GZipMiddleware gzipped every WebP cover again: CPU on every request for
+# ~0% savings (and it hides the Content-Length). Newer Starlette can exclude content
+# types itself, the version we pin (0.46) can't - so we decide by path BEFORE the
+# response exists: /api/images/* and image/font/audio file extensions bypass GZip.
+# SVG is NOT on the list, it's text and compresses great.
+class SelectiveGZipMiddleware:
+    """GZipMiddleware that skips images and other already-compressed responses."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        compresslevel: int = 9,
+        skip_path_prefixes: tuple[str, ...] = INCOMPRESSIBLE_PATH_PREFIXES,
+        skip_suffixes: tuple[str, ...] = INCOMPRESSIBLE_SUFFIXES,
+    ) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: ASGI application
+            minimum_size: Don't compress responses smaller than this
+            compresslevel: GZip level (1-9)
+            skip_path_prefixes: Request paths never compressed
+            skip_suffixes: File extensions never compressed
+        """
+        from starlette.middleware.gzip import GZipMiddleware
+
+        self.app = app
+        self.gzip = GZipMiddleware(
+            app, minimum_size=minimum_size, compresslevel=compresslevel
+        )
+        self.skip_path_prefixes = skip_path_prefixes
+        self.skip_suffixes = skip_suffixes
+
+    def _should_skip(self, path: str) -> bool:
+        return path.startswith(self.skip_path_prefixes) or path.lower().endswith(
+            self.skip_suffixes
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and self._should_skip(scope.get("path", "")):
+            await self.app(scope, receive, send)
+            return
+        await self.gzip(scope, receive, send)
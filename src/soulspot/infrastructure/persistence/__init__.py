@@ -7,6 +7,11 @@ from .batch_utils import (
     batch_update,
 )
 from .database import Database
+from .library_aggregates import (
+    refresh_album_aggregates,
+    refresh_artist_aggregates,
+    refresh_library_aggregates,
+)
 from .log_database import LogDatabase
 from .models import (
     AlbumModel,
@@ -40,6 +45,7 @@ from .retry import (
     is_lock_error,
     with_db_retry,
 )
+from .search_index import rebuild_search_index, search_entity_ids
 from .write_buffer_cache import (
     BufferConfig,
     PendingWrite,
@@ -84,6 +90,13 @@ __all__ = [
     "batch_insert",
     "batch_update",
     "IncrementalCommitter",
+    # Maintained library aggregates
+    "refresh_library_aggregates",
+    "refresh_album_aggregates",
+    "refresh_artist_aggregates",
+    # Library search index
+    "search_entity_ids",
+    "rebuild_search_index",
     # Hybrid DB Strategy (Jan 2025)
     "WriteBufferCache",
     "BufferConfig",
@@ -10,6 +10,12 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.pool import NullPool
 
 from soulspot.config import Settings
+from soulspot.infrastructure.persistence.library_aggregates import (
+    install_aggregate_tracking,
+)
+from soulspot.infrastructure.persistence.rule_versions import (
+    install_version_tracking,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -98,6 +104,12 @@ class Database:
             expire_on_commit=False,
         )
 
+        # Keep the maintained artist/album aggregates in sync with ORM writes
+        # (see library_aggregates.py - bulk Core statements refresh explicitly)
+        install_aggregate_tracking()
+        # Invalidate the compiled filter/blocklist matchers when those rows commit
+        install_version_tracking()
+
     # Yo future me, SQLite is EVIL - it has foreign keys DISABLED BY DEFAULT! This hook turns
     # them on for EVERY connection. Without this, you can delete a track that still has downloads
     # pointing to it, and the DB won't complain. Cascades won't work. Relationships break silently.
@@ -405,6 +417,23 @@ class Database:
         """
         return self._session_factory
 
+    # Hey future me - an alembic batch migration recreates a SQLite table and drops the
+    # triggers ON it, which would freeze that part of the FTS5 search index. Called once at
+    # startup: cheap sqlite_master check, full rebuild only if something is missing (or the
+    # index is in an older layout). See search_index.py.
+    async def ensure_search_index(self) -> bool:
+        """Recreate missing search index tables/triggers (SQLite only).
+
+        Returns:
+            True if the index had to be rebuilt
+        """
+        from soulspot.infrastructure.persistence.search_index import (
+            ensure_search_index,
+        )
+
+        async with self._engine.begin() as conn:
+            return await ensure_search_index(conn)
+
     # Hey future me, this is ONLY for testing! Don't use in production - use Alembic migrations
     # instead. This creates tables synchronously using run_sync which blocks the async engine.
     # It's fine for test setup but defeats the purpose of async in real code. Also, this creates
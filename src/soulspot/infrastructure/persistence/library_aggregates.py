@@ -0,0 +1,329 @@
+"""Maintained per-artist / per-album library aggregates.
+
+Hey future me - this is why the library browse pages don't GROUP BY anymore!
+
+Before: every request to /library/artists ran four GROUP BY subqueries over the
+WHOLE tracks/albums tables (total tracks, local tracks, albums, local albums) just to
+show the "3/5 local" badges - on a 200k track library that's the slow part of the page,
+no matter how few rows are shown.
+
+Now the numbers live on the rows themselves:
+- soulspot_albums:  track_count, local_track_count, total_duration_ms, has_local_files
+- soulspot_artists: track_count, local_track_count, album_count, local_album_count,
+                    total_duration_ms, has_local_files
+
+Two ways rows get refreshed, both for exactly the touched IDs and in the same
+transaction as the change:
+1. ORM writes (repositories, provider sync, auto-import's track_repository.update):
+   an after_flush listener (install_aggregate_tracking(), done by Database) sees
+   which tracks/albums were added, moved, got/lost a file or were deleted.
+2. Bulk Core statements bypass the ORM (scanner's multi-row INSERT, cleanup's
+   DELETE ... WHERE) - those paths collect their IDs and call
+   refresh_library_aggregates() themselves.
+Each refresh is one set-based UPDATE with correlated subqueries per chunk, answered
+from the album_id/artist_id indexes - cost depends on the touched rows, not on the
+library size.
+
+Rules:
+- Albums FIRST, artists second: artist.local_album_count reads album.has_local_files.
+- Touching a track? Pass its artist_id AND album_id (old + new ones if it moved).
+- Deleting tracks? Collect their artist_id/album_id BEFORE the delete.
+- Bulk operations that touch "everything" (clear library, migration backfill) call
+  it without IDs → full recompute.
+- updated_at is NOT bumped - aggregates are derived data, not a user-visible change
+  (ix_*_updated_at is used for sync change tracking).
+
+Usage:
+    await refresh_library_aggregates(
+        session, artist_ids={track.artist_id}, album_ids={track.album_id}
+    )
+"""
+
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import Update, and_, event, exists, func, inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .models import AlbumModel, ArtistModel, TrackModel
+
+logger = logging.getLogger(__name__)
+
+# IDs per UPDATE ... WHERE id IN (...) - stays well below SQLite's variable limit
+AGGREGATE_CHUNK_SIZE = 500
+
+
+def _chunks(ids: Iterable[str | None]) -> list[list[str]]:
+    """Deduplicate IDs (None dropped) and split them into IN-list sized chunks."""
+    unique = sorted({i for i in ids if i})
+    return [
+        unique[i : i + AGGREGATE_CHUNK_SIZE]
+        for i in range(0, len(unique), AGGREGATE_CHUNK_SIZE)
+    ]
+
+
+def _album_aggregate_values() -> dict[str, object]:
+    """Correlated subqueries recomputing the aggregates of the album being updated."""
+    album_tracks = TrackModel.album_id == AlbumModel.id
+    local = TrackModel.file_path.isnot(None)
+    return {
+        "track_count": select(func.count(TrackModel.id))
+        .where(album_tracks)
+        .scalar_subquery(),
+        "local_track_count": select(func.count(TrackModel.id))
+        .where(album_tracks, local)
+        .scalar_subquery(),
+        "total_duration_ms": select(func.coalesce(func.sum(TrackModel.duration_ms), 0))
+        .where(album_tracks)
+        .scalar_subquery(),
+        "has_local_files": exists().where(and_(album_tracks, local)),
+        # Derived data - don't let onupdate=utc_now fake a metadata change
+        "updated_at": AlbumModel.updated_at,
+    }
+
+
+def _artist_aggregate_values() -> dict[str, object]:
+    """Correlated subqueries recomputing the aggregates of the artist being updated."""
+    artist_tracks = TrackModel.artist_id == ArtistModel.id
+    artist_albums = AlbumModel.artist_id == ArtistModel.id
+    local = TrackModel.file_path.isnot(None)
+    return {
+        "track_count": select(func.count(TrackModel.id))
+        .where(artist_tracks)
+        .scalar_subquery(),
+        "local_track_count": select(func.count(TrackModel.id))
+        .where(artist_tracks, local)
+        .scalar_subquery(),
+        "album_count": select(func.count(AlbumModel.id))
+        .where(artist_albums)
+        .scalar_subquery(),
+        # Albums of this artist with at least one local track (any track artist -
+        # VA albums count for the album artist, same as the old GROUP BY)
+        "local_album_count": select(func.count(AlbumModel.id))
+        .where(artist_albums, AlbumModel.has_local_files.is_(True))
+        .scalar_subquery(),
+        "total_duration_ms": select(func.coalesce(func.sum(TrackModel.duration_ms), 0))
+        .where(artist_tracks)
+        .scalar_subquery(),
+        "has_local_files": exists().where(and_(artist_tracks, local)),
+        "updated_at": ArtistModel.updated_at,
+    }
+
+
+def _album_update(chunk: list[str] | None) -> Update:
+    """UPDATE statement refreshing the given albums (None = all)."""
+    stmt = update(AlbumModel)
+    if chunk is not None:
+        stmt = stmt.where(AlbumModel.id.in_(chunk))
+    return stmt.values(_album_aggregate_values()).execution_options(
+        synchronize_session=False
+    )
+
+
+def _artist_update(chunk: list[str] | None) -> Update:
+    """UPDATE statement refreshing the given artists (None = all)."""
+    stmt = update(ArtistModel)
+    if chunk is not None:
+        stmt = stmt.where(ArtistModel.id.in_(chunk))
+    return stmt.values(_artist_aggregate_values()).execution_options(
+        synchronize_session=False
+    )
+
+
+async def refresh_album_aggregates(
+    session: AsyncSession, album_ids: Iterable[str | None] | None = None
+) -> int:
+    """Recompute the maintained aggregates of albums.
+
+    Args:
+        session: Database session (caller commits)
+        album_ids: Albums to refresh, None = ALL albums (full recompute)
+
+    Returns:
+        Number of album rows updated
+    """
+    chunks = [None] if album_ids is None else _chunks(album_ids)
+    updated = 0
+    for chunk in chunks:
+        result = await session.execute(_album_update(chunk))
+        updated += result.rowcount or 0  # type: ignore[attr-defined]
+    return updated
+
+
+async def refresh_artist_aggregates(
+    session: AsyncSession, artist_ids: Iterable[str | None] | None = None
+) -> int:
+    """Recompute the maintained aggregates of artists.
+
+    Reads album.has_local_files - refresh the artists' albums first!
+
+    Args:
+        session: Database session (caller commits)
+        artist_ids: Artists to refresh, None = ALL artists (full recompute)
+
+    Returns:
+        Number of artist rows updated
+    """
+    chunks = [None] if artist_ids is None else _chunks(artist_ids)
+    updated = 0
+    for chunk in chunks:
+        result = await session.execute(_artist_update(chunk))
+        updated += result.rowcount or 0  # type: ignore[attr-defined]
+    return updated
+
+
+async def refresh_library_aggregates(
+    session: AsyncSession,
+    artist_ids: Iterable[str | None] | None = None,
+    album_ids: Iterable[str | None] | None = None,
+    full: bool = False,
+) -> None:
+    """Recompute album aggregates, then artist aggregates (correct order!).
+
+    Artists of the given albums are refreshed too - their local_album_count
+    depends on the albums.
+
+    Args:
+        session: Database session (caller commits)
+        artist_ids: Touched artists
+        album_ids: Touched albums
+        full: Recompute EVERY artist and album (bulk operations)
+    """
+    if full:
+        await refresh_album_aggregates(session)
+        await refresh_artist_aggregates(session)
+        return
+
+    album_chunks = _chunks(album_ids or ())
+    touched_artists = {i for i in (artist_ids or ()) if i}
+    for chunk in album_chunks:
+        await refresh_album_aggregates(session, chunk)
+        result = await session.execute(
+            select(AlbumModel.artist_id).where(AlbumModel.id.in_(chunk))
+        )
+        touched_artists.update(row[0] for row in result.all())
+
+    if touched_artists:
+        await refresh_artist_aggregates(session, touched_artists)
+
+
+async def refresh_track_parent_aggregates(
+    session: AsyncSession, track_ids: Iterable[str | None]
+) -> None:
+    """Refresh the artists/albums of tracks changed by a bulk Core UPDATE.
+
+    Hey future me - for paths that bulk-set file_path/duration by track ID
+    (e.g. DownloadStatusWorker marking downloads complete) and don't know the parents.
+
+    Args:
+        session: Database session (caller commits)
+        track_ids: IDs of the changed tracks
+    """
+    artist_ids: set[str] = set()
+    album_ids: set[str] = set()
+    for chunk in _chunks(track_ids):
+        result = await session.execute(
+            select(TrackModel.artist_id, TrackModel.album_id).where(
+                TrackModel.id.in_(chunk)
+            )
+        )
+        for artist_id, album_id in result.all():
+            artist_ids.add(artist_id)
+            if album_id:
+                album_ids.add(album_id)
+    if artist_ids or album_ids:
+        await refresh_library_aggregates(
+            session, artist_ids=artist_ids, album_ids=album_ids
+        )
+
+
+# =============================================================================
+# ORM FLUSH TRACKING
+# =============================================================================
+
+# Track columns that change an aggregate (moving a track between artists/albums,
+# getting/losing its file, new duration)
+_TRACK_AGGREGATE_ATTRS = ("artist_id", "album_id", "file_path", "duration_ms")
+
+
+def _ids_of(obj: Any, attr: str) -> set[str]:
+    """Current AND previous value of an FK attribute (a moved row dirties both)."""
+    history = inspect(obj).attrs[attr].history
+    values = {getattr(obj, attr)}
+    values.update(history.deleted or ())
+    return {v for v in values if v}
+
+
+def _aggregate_relevant_change(obj: Any, attrs: Iterable[str]) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[attr].history.has_changes() for attr in attrs)
+
+
+def _refresh_after_flush(session: Session, _flush_context: Any) -> None:
+    """after_flush hook: refresh aggregates of parents of flushed tracks/albums.
+
+    Hey future me - runs INSIDE the flush (sync, in the async session's greenlet),
+    so it talks to session.connection() directly - session.execute() would try to
+    autoflush again. session.new/dirty/deleted still describe what was just flushed.
+    """
+    artist_ids: set[str] = set()
+    album_ids: set[str] = set()
+
+    for obj in session.new:
+        if isinstance(obj, TrackModel):
+            artist_ids.update(_ids_of(obj, "artist_id"))
+            album_ids.update(_ids_of(obj, "album_id"))
+        elif isinstance(obj, AlbumModel):
+            artist_ids.update(_ids_of(obj, "artist_id"))
+    for obj in session.dirty:
+        if isinstance(obj, TrackModel) and _aggregate_relevant_change(
+            obj, _TRACK_AGGREGATE_ATTRS
+        ):
+            artist_ids.update(_ids_of(obj, "artist_id"))
+            album_ids.update(_ids_of(obj, "album_id"))
+        elif isinstance(obj, AlbumModel) and _aggregate_relevant_change(
+            obj, ("artist_id",)
+        ):
+            artist_ids.update(_ids_of(obj, "artist_id"))
+            album_ids.add(obj.id)
+    for obj in session.deleted:
+        if isinstance(obj, TrackModel):
+            artist_ids.update(_ids_of(obj, "artist_id"))
+            album_ids.update(_ids_of(obj, "album_id"))
+        elif isinstance(obj, AlbumModel):
+            artist_ids.update(_ids_of(obj, "artist_id"))
+
+    if not artist_ids and not album_ids:
+        return
+
+    connection = session.connection()
+    for chunk in _chunks(album_ids):
+        connection.execute(_album_update(chunk))
+        result = connection.execute(
+            select(AlbumModel.artist_id).where(AlbumModel.id.in_(chunk))
+        )
+        artist_ids.update(row[0] for row in result)
+    for chunk in _chunks(artist_ids):
+        connection.execute(_artist_update(chunk))
+
+
+def install_aggregate_tracking() -> None:
+    """Register the after_flush listener on ALL ORM sessions (idempotent).
+
+    Called by Database.__init__ - every AsyncSession wraps a sync Session, so one
+    class-level listener covers repositories, services and workers alike.
+    """
+    if not event.contains(Session, "after_flush", _refresh_after_flush):
+        event.listen(Session, "after_flush", _refresh_after_flush)
+
+
+__all__ = [
+    "AGGREGATE_CHUNK_SIZE",
+    "install_aggregate_tracking",
+    "refresh_album_aggregates",
+    "refresh_artist_aggregates",
+    "refresh_library_aggregates",
+    "refresh_track_parent_aggregates",
+]
@@ -1,5 +1,6 @@
 """SQLAlchemy ORM models for SoulSpot."""
 
+import hashlib
 import uuid
 from datetime import UTC, datetime
 from typing import Any
@@ -15,7 +16,13 @@ from sqlalchemy import (
     Text,
     func,
 )
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    mapped_column,
+    relationship,
+    validates,
+)
 
 
 # Hey future me, utc_now() ensures ALL timestamps are UTC! Never use datetime.now() without
@@ -39,6 +46,34 @@ def ensure_utc_aware(dt: datetime) -> datetime:
     return dt
 
 
+# Hey future me - slskd identifies a transfer by (username, filename), which we store as
+# source_url "slskd://username/filename" (up to 512 chars, Windows-style backslash paths).
+# Matching transfers against that column was an unindexed compare + LIKE per transfer and poll.
+# transfer_key = sha1("username/filename") is a fixed 40-char key that's cheap to index and to
+# look up with ONE "WHERE transfer_key IN (...)" per poll cycle. Both sides MUST use these
+# helpers, otherwise keys silently stop matching!
+_TRANSFER_URL_SCHEMES = ("slskd://", "soulseek://")
+
+
+def _transfer_key(external_id: str) -> str:
+    return hashlib.sha1(external_id.encode(), usedforsecurity=False).hexdigest()
+
+
+def slskd_transfer_key(username: str, filename: str) -> str:
+    """Build the indexed lookup key of a slskd transfer."""
+    return _transfer_key(f"{username}/{filename}")
+
+
+def transfer_key_from_source_url(source_url: str | None) -> str | None:
+    """Derive the transfer key from a download's source_url (None if not slskd)."""
+    if not source_url:
+        return None
+    for scheme in _TRANSFER_URL_SCHEMES:
+        if source_url.startswith(scheme):
+            return _transfer_key(source_url[len(scheme) :])
+    return None
+
+
 # Yo, Base is THE foundation of all ORM models! DeclarativeBase is SQLAlchemy 2.0 style
 # (cleaner than old declarative_base()). ALL models inherit from this - it manages the shared
 # metadata registry (table definitions, relationships, etc.). Don't create multiple Base classes
@@ -137,6 +172,27 @@ class ArtistModel(Base):
     primary_source: Mapped[str | None] = mapped_column(
         String(20), nullable=True, index=True
     )
+    # Hey future me - MAINTAINED AGGREGATES for the library browse pages!
+    # Written by refresh_library_aggregates() (library_aggregates.py) whenever the
+    # scanner/import/cleanup touch this artist - never compute them with GROUP BY again.
+    track_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    local_track_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    album_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    local_album_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    total_duration_ms: Mapped[int] = mapped_column(
+        sa.BigInteger(), nullable=False, default=0, server_default="0"
+    )
+    has_local_files: Mapped[bool] = mapped_column(
+        sa.Boolean(), nullable=False, default=False, server_default="0"
+    )
     created_at: Mapped[datetime] = mapped_column(default=utc_now, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         default=utc_now, onupdate=utc_now, nullable=False
@@ -166,6 +222,10 @@ class ArtistModel(Base):
     __table_args__ = (
         Index("ix_artists_name_lower", func.lower(name)),
         Index("ix_soulspot_artists_last_synced", "last_synced_at"),
+        # Keyset pagination of /library/artists: ORDER BY lower(name), id
+        Index("ix_soulspot_artists_browse", func.lower(name), "id"),
+        # Image store refcount reconcile: who points at this blob?
+        Index("ix_soulspot_artists_image_path", "image_path"),
     )
 
 
@@ -248,6 +308,21 @@ class AlbumModel(Base):
         String(20), nullable=True, index=True
     )
 
+    # Hey future me - MAINTAINED AGGREGATES (see library_aggregates.py)!
+    # track_count = tracks in OUR library, total_tracks above = what the provider says.
+    track_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    local_track_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    total_duration_ms: Mapped[int] = mapped_column(
+        sa.BigInteger(), nullable=False, default=0, server_default="0"
+    )
+    has_local_files: Mapped[bool] = mapped_column(
+        sa.Boolean(), nullable=False, default=False, server_default="0"
+    )
+
     created_at: Mapped[datetime] = mapped_column(default=utc_now, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         default=utc_now, onupdate=utc_now, nullable=False
@@ -280,6 +355,12 @@ class AlbumModel(Base):
     __table_args__ = (
         Index("ix_albums_title_artist", "title", "artist_id"),
         Index("ix_albums_primary_type", "primary_type"),
+        # Keyset pagination of /library/albums: ORDER BY lower(title), id
+        Index("ix_soulspot_albums_browse", func.lower(title), "id"),
+        # Aggregate refresh: count(*) of an artist's albums
+        Index("ix_soulspot_albums_artist_id", "artist_id"),
+        # Image store refcount reconcile: who points at this blob?
+        Index("ix_soulspot_albums_cover_path", "cover_path"),
     )
 
 
@@ -443,7 +524,11 @@ class TrackModel(Base):
     tidal_id: Mapped[str | None] = mapped_column(
         String(50), nullable=True, unique=True, index=True
     )
-    file_path: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    # Hey future me - file_path is INDEXED! The library scanner, auto-import and cleanup
+    # all look tracks up by path. Without the index every lookup is a full table scan.
+    file_path: Mapped[str | None] = mapped_column(
+        String(512), nullable=True, index=True
+    )
 
     # Hey future me - genre stores the primary genre for this track!
     genre: Mapped[str | None] = mapped_column(String(100), nullable=True, index=True)
@@ -452,6 +537,21 @@ class TrackModel(Base):
     file_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
     file_hash: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
     file_hash_algorithm: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    # Hey future me - file_mtime is the st_mtime seen at the last scan. Together with
+    # file_size it's the change fingerprint for incremental scans (no re-read needed).
+    file_mtime: Mapped[float | None] = mapped_column(Float, nullable=True)
+    # Hey future me - audio_hash is a hash over the AUDIO FRAMES only (tags, artwork
+    # and lyrics skipped, see application/services/audio_fingerprint.py), so retagging
+    # doesn't change it. audio_payload_size = length of those frames (groups the
+    # duplicate funnel + tells a tag edit from a re-encode), audio_hash_mtime = the
+    # file_mtime the audio columns were last checked against. The scanner leaves them
+    # alone on change - the duplicate worker revalidates cheaply instead.
+    audio_hash: Mapped[str | None] = mapped_column(
+        String(64), nullable=True, index=True
+    )
+    audio_hash_algorithm: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    audio_payload_size: Mapped[int | None] = mapped_column(sa.BigInteger, nullable=True)
+    audio_hash_mtime: Mapped[float | None] = mapped_column(Float, nullable=True)
     last_scanned_at: Mapped[datetime | None] = mapped_column(nullable=True)
     is_broken: Mapped[bool] = mapped_column(default=False, nullable=False, index=True)
     audio_bitrate: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -466,7 +566,11 @@ class TrackModel(Base):
         String(20), nullable=False, default="owned", server_default="owned", index=True
     )
     download_state: Mapped[str] = mapped_column(
-        String(20), nullable=False, default="not_needed", server_default="not_needed", index=True
+        String(20),
+        nullable=False,
+        default="not_needed",
+        server_default="not_needed",
+        index=True,
     )
     primary_source: Mapped[str | None] = mapped_column(
         String(20), nullable=True, index=True
@@ -504,6 +608,10 @@ class TrackModel(Base):
     __table_args__ = (
         Index("ix_tracks_title_artist", "title", "artist_id"),
         Index("ix_soulspot_tracks_source", "source"),
+        # Aggregate refresh (correlated count/sum per artist/album) + keyset pagination
+        # of /library/tracks inside one artist: ORDER BY lower(title), id
+        Index("ix_soulspot_tracks_artist_browse", "artist_id", func.lower(title), "id"),
+        Index("ix_soulspot_tracks_album_id", "album_id"),
     )
 
 
@@ -556,6 +664,9 @@ class PlaylistModel(Base):
         order_by="PlaylistTrackModel.position",
     )
 
+    # Image store refcount reconcile: who points at this blob?
+    __table_args__ = (Index("ix_playlists_cover_path", "cover_path"),)
+
 
 class PlaylistTrackModel(Base):
     """Association table for Playlist-Track relationship."""
@@ -619,6 +730,10 @@ class DownloadModel(Base):
     )
     target_path: Mapped[str | None] = mapped_column(String(512), nullable=True)
     source_url: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    # sha1 of the slskd "username/filename", kept in sync with source_url (see validator)
+    transfer_key: Mapped[str | None] = mapped_column(
+        String(40), nullable=True, index=True
+    )
     progress_percent: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     started_at: Mapped[datetime | None] = mapped_column(nullable=True)
@@ -649,6 +764,12 @@ class DownloadModel(Base):
         ),
     )
 
+    @validates("source_url")
+    def _sync_transfer_key(self, _key: str, source_url: str | None) -> str | None:
+        """Keep transfer_key in sync on every ORM write of source_url."""
+        self.transfer_key = transfer_key_from_source_url(source_url)
+        return source_url
+
 
 class LibraryScanModel(Base):
     """SQLAlchemy model for Library Scan tracking."""
@@ -1196,7 +1317,7 @@ class DuplicateCandidateModel(Base):
     )
     # Confidence score 0-100 (100 = definitely same track)
     similarity_score: Mapped[int] = mapped_column(Integer, nullable=False)
-    # How the match was found: 'metadata' or 'fingerprint' (future)
+    # How the match was found: 'metadata', 'file_hash', 'audio_hash' or 'fingerprint'
     match_type: Mapped[str] = mapped_column(
         String(20), nullable=False, default="metadata"
     )
@@ -1289,6 +1410,152 @@ class OrphanedFileModel(Base):
     )
 
 
+# =============================================================================
+# AUTO-IMPORT LEDGER
+# =============================================================================
+# Hey future me - AutoImportService remembers every file in downloads it already
+# looked at and couldn't import (see application/services/import_ledger.py).
+# Same size + mtime = never examined again. Imported/deleted files lose their row.
+#
+# outcome: 'no_match', 'not_completed' or 'error'
+# isrc/title/artist: the tags we read - re-matching after a download completes
+# needs no file I/O
+# =============================================================================
+
+
+class AutoImportLedgerModel(Base):
+    """Files in the downloads directory the auto-import examined but didn't import."""
+
+    __tablename__ = "auto_import_ledger"
+
+    file_path: Mapped[str] = mapped_column(String(1024), primary_key=True)
+    file_size: Mapped[int] = mapped_column(sa.BigInteger, nullable=False)
+    file_mtime: Mapped[float] = mapped_column(Float, nullable=False)
+    outcome: Mapped[str] = mapped_column(String(20), nullable=False)
+    # Matched track (not_completed) - plain ID, the row is just a cache
+    track_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    isrc: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    title: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    artist: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    detail: Mapped[str | None] = mapped_column(Text, nullable=True)
+    examined_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
+# =============================================================================
+# LYRICS CACHE
+# =============================================================================
+# Hey future me - LyricsService asks LRCLIB -> Genius -> Musixmatch; every answer
+# lands here (see application/services/postprocessing/lyrics_cache.py).
+# One row per (cache_key, provider):
+# - found=True: synced and/or plain lyrics, never expires
+# - found=False: "provider doesn't have it" - skipped until expires_at
+# cache_key = normalized artist | title | duration bucket; isrc finds the lyrics
+# again under a different spelling of artist/title.
+# =============================================================================
+
+
+class LyricsCacheModel(Base):
+    """Cached lyrics lookups (hits and per-provider misses)."""
+
+    __tablename__ = "lyrics_cache"
+
+    cache_key: Mapped[str] = mapped_column(String(512), primary_key=True)
+    provider: Mapped[str] = mapped_column(String(20), primary_key=True)
+    isrc: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    found: Mapped[bool] = mapped_column(sa.Boolean, nullable=False)
+    synced_lyrics: Mapped[str | None] = mapped_column(Text, nullable=True)
+    plain_lyrics: Mapped[str | None] = mapped_column(Text, nullable=True)
+    fetched_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    # Only for misses - hits stay valid
+    expires_at: Mapped[datetime | None] = mapped_column(
+        sa.DateTime(timezone=True), nullable=True
+    )
+
+    __table_args__ = (Index("ix_lyrics_cache_isrc", "isrc"),)
+
+
+# =============================================================================
+# CONTENT-ADDRESSED IMAGE STORE
+# =============================================================================
+# Hey future me - identical artwork is stored ONCE (see images/content_store.py)!
+#
+# image_blobs: one row per stored file. content_hash = sha256 of the stored WebP.
+#   source_hash = sha256 of the downloaded bytes + target size, so a re-download of
+#   the same picture (other CDN URL, other provider) skips the WebP conversion.
+#   ref_count = how many entities point at relative_path; 0 → orphaned_at is set
+#   and the file is deleted after a grace period (indexed query, no rglob!).
+# image_refs: which entity (ref_key) uses which blob + where it came from.
+#   source_url lookup = "we already have this URL" → no download at all.
+# image_cache_stats: per-category count/bytes, updated with every blob insert/delete,
+#   so the settings page doesn't walk the image directory.
+# =============================================================================
+
+
+class ImageBlobModel(Base):
+    """One stored image file, shared by every entity with the same artwork."""
+
+    __tablename__ = "image_blobs"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    relative_path: Mapped[str] = mapped_column(String(512), nullable=False, unique=True)
+    # artists/albums/playlists - category of the entity that stored it first
+    category: Mapped[str] = mapped_column(String(20), nullable=False)
+    size_bytes: Mapped[int] = mapped_column(sa.BigInteger, nullable=False)
+    source_hash: Mapped[str | None] = mapped_column(String(80), nullable=True)
+    ref_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    # Set when ref_count drops to 0, cleared when it's referenced again
+    orphaned_at: Mapped[datetime | None] = mapped_column(
+        sa.DateTime(timezone=True), nullable=True
+    )
+
+    __table_args__ = (
+        Index("ix_image_blobs_source_hash", "source_hash"),
+        Index("ix_image_blobs_orphans", "ref_count", "orphaned_at"),
+    )
+
+
+class ImageRefModel(Base):
+    """Which entity uses which image blob."""
+
+    __tablename__ = "image_refs"
+
+    # "artist:spotify:<id>", "album:<uuid>", ...
+    ref_key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    source_url: Mapped[str | None] = mapped_column(String(1024), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (
+        Index("ix_image_refs_content_hash", "content_hash"),
+        Index("ix_image_refs_source_url", "source_url"),
+    )
+
+
+class ImageCacheStatsModel(Base):
+    """Incrementally maintained image count + bytes per category."""
+
+    __tablename__ = "image_cache_stats"
+
+    category: Mapped[str] = mapped_column(String(20), primary_key=True)
+    image_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    total_bytes: Mapped[int] = mapped_column(
+        sa.BigInteger, nullable=False, default=0, server_default="0"
+    )
+
+
 # =============================================================================
 # ENRICHMENT CANDIDATES
 # =============================================================================
@@ -8,7 +8,7 @@ import logging
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
-from sqlalchemy import Integer, and_, delete, func, or_, select, update
+from sqlalchemy import Integer, and_, delete, func, or_, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -53,6 +53,7 @@ from soulspot.domain.value_objects import (
     TrackId,
 )
 
+from .library_aggregates import refresh_library_aggregates
 from .models import (
     AlbumModel,
     ArtistDiscographyModel,
@@ -68,6 +69,11 @@ from .models import (
     TrackModel,
     ensure_utc_aware,
 )
+from .rule_versions import (
+    BLOCKLIST_SCOPE,
+    FILTER_RULES_SCOPE,
+    mark_rules_changed,
+)
 
 if TYPE_CHECKING:
     from soulspot.application.services.session_store import Session
@@ -995,10 +1001,16 @@ class AlbumRepository(IAlbumRepository):
 
     async def delete(self, album_id: AlbumId) -> None:
         """Delete an album."""
+        # Hey future me - Core DELETE bypasses the ORM flush hook, so refresh the
+        # maintained aggregates of the album's artist explicitly (library_aggregates.py)
+        artist_id = await self.session.scalar(
+            select(AlbumModel.artist_id).where(AlbumModel.id == str(album_id.value))
+        )
         stmt = delete(AlbumModel).where(AlbumModel.id == str(album_id.value))
         result = await self.session.execute(stmt)
         if result.rowcount == 0:  # type: ignore[attr-defined]  # type: ignore[attr-defined]
             raise EntityNotFoundException("Album", album_id.value)
+        await refresh_library_aggregates(self.session, artist_ids=[artist_id])
 
     async def get_by_id(self, album_id: AlbumId) -> Album | None:
         """Get an album by ID."""
@@ -1797,10 +1809,22 @@ class TrackRepository(ITrackRepository):
 
     async def delete(self, track_id: TrackId) -> None:
         """Delete a track."""
+        # Core DELETE bypasses the ORM flush hook - refresh the parents' aggregates
+        parents = (
+            await self.session.execute(
+                select(TrackModel.artist_id, TrackModel.album_id).where(
+                    TrackModel.id == str(track_id.value)
+                )
+            )
+        ).first()
         stmt = delete(TrackModel).where(TrackModel.id == str(track_id.value))
         result = await self.session.execute(stmt)
         if result.rowcount == 0:  # type: ignore[attr-defined]  # type: ignore[attr-defined]
             raise EntityNotFoundException("Track", track_id.value)
+        if parents is not None:
+            await refresh_library_aggregates(
+                self.session, artist_ids=[parents[0]], album_ids=[parents[1]]
+            )
 
     async def get_by_id(self, track_id: TrackId) -> Track | None:
         """Get a track by ID."""
@@ -1813,6 +1837,19 @@ class TrackRepository(ITrackRepository):
 
         return self._model_to_entity(model)
 
+    async def get_by_ids(self, track_ids: list[str]) -> list[Track]:
+        """Get tracks by ID (chunked IN queries, unknown IDs are skipped).
+
+        Hey future me - duplicate housekeeping loads ONLY the tracks of the
+        duplicate groups through this, never the whole library.
+        """
+        tracks: list[Track] = []
+        for i in range(0, len(track_ids), 500):
+            stmt = select(TrackModel).where(TrackModel.id.in_(track_ids[i : i + 500]))
+            result = await self.session.execute(stmt)
+            tracks.extend(self._model_to_entity(m) for m in result.scalars().all())
+        return tracks
+
     async def get_by_spotify_uri(self, spotify_uri: SpotifyUri) -> Track | None:
         """Get a track by Spotify URI."""
         stmt = select(TrackModel).where(TrackModel.spotify_uri == str(spotify_uri))
@@ -3169,6 +3206,31 @@ class DownloadRepository(IDownloadRepository):
         track_ids = result.scalars().all()
         return set(track_ids)
 
+    async def get_completed_track_ids_since(
+        self, since: datetime | None
+    ) -> tuple[set[str], datetime | None]:
+        """Get track IDs of downloads that became completed after `since`.
+
+        Hey future me - AutoImportService polls this every cycle instead of reloading
+        ALL completed downloads. Completing a download bumps updated_at, so
+        updated_at > since catches it. The watermark is the max updated_at we saw
+        (straight from the DB, no clock or timezone games).
+        """
+        stmt = select(DownloadModel.track_id, DownloadModel.updated_at).where(
+            DownloadModel.status == DownloadStatus.COMPLETED.value
+        )
+        if since is not None:
+            stmt = stmt.where(DownloadModel.updated_at > since)
+        result = await self.session.execute(stmt)
+
+        track_ids: set[str] = set()
+        watermark = since
+        for track_id, updated_at in result.all():
+            track_ids.add(track_id)
+            if updated_at is not None and (watermark is None or updated_at > watermark):
+                watermark = updated_at
+        return track_ids, watermark
+
     async def list_retry_eligible(self, limit: int = 10) -> list[Download]:
         """List downloads eligible for automatic retry.
 
@@ -3501,6 +3563,7 @@ class FilterRuleRepository(IFilterRuleRepository):
             updated_at=filter_rule.updated_at,
         )
         self.session.add(model)
+        mark_rules_changed(self.session, FILTER_RULES_SCOPE)
 
     async def get_by_id(self, rule_id: Any) -> Any:
         """Get a filter rule by ID."""
@@ -3649,6 +3712,7 @@ class FilterRuleRepository(IFilterRuleRepository):
         model.priority = filter_rule.priority
         model.description = filter_rule.description
         model.updated_at = filter_rule.updated_at
+        mark_rules_changed(self.session, FILTER_RULES_SCOPE)
 
     async def delete(self, rule_id: Any) -> None:
         """Delete a filter rule."""
@@ -3658,6 +3722,7 @@ class FilterRuleRepository(IFilterRuleRepository):
         result = await self.session.execute(stmt)
         if result.rowcount == 0:  # type: ignore[attr-defined]
             raise EntityNotFoundException("FilterRule", rule_id.value)
+        mark_rules_changed(self.session, FILTER_RULES_SCOPE)
 
 
 class AutomationRuleRepository(IAutomationRuleRepository):
@@ -4652,6 +4717,44 @@ class DuplicateCandidateRepository:
         result = await self.session.execute(stmt)
         return (result.scalar() or 0) > 0
 
+    async def add_missing(self, candidates: list[Any]) -> int:
+        """Add candidates whose pair isn't stored yet (any status) - one batch.
+
+        Hey future me - batch version of exists() + add() for the near-duplicate
+        engine: ONE tuple IN lookup per batch instead of a query per pair. Dismissed
+        pairs stay dismissed, they are never re-added.
+
+        Args:
+            candidates: DuplicateCandidate entities with track_id_1 < track_id_2
+
+        Returns:
+            Number of candidates added
+        """
+        from .models import DuplicateCandidateModel
+
+        if not candidates:
+            return 0
+
+        keys = {(c.track_id_1, c.track_id_2) for c in candidates}
+        stmt = select(
+            DuplicateCandidateModel.track_id_1, DuplicateCandidateModel.track_id_2
+        ).where(
+            tuple_(
+                DuplicateCandidateModel.track_id_1, DuplicateCandidateModel.track_id_2
+            ).in_(list(keys))
+        )
+        existing = {tuple(row) for row in (await self.session.execute(stmt)).all()}
+
+        added = 0
+        for candidate in candidates:
+            key = (candidate.track_id_1, candidate.track_id_2)
+            if key in existing:
+                continue
+            existing.add(key)  # same pair twice in one batch
+            await self.add(candidate)
+            added += 1
+        return added
+
     async def list_pending(self, limit: int = 100) -> list[Any]:
         """List pending duplicate candidates for review."""
         return await self.list_by_status("pending", limit)
@@ -7169,6 +7272,7 @@ class BlocklistRepository(IBlocklistRepository):
             is_manual=entry.is_manual,
         )
         self.session.add(model)
+        mark_rules_changed(self.session, BLOCKLIST_SCOPE)
 
     async def get_by_id(self, entry_id: str) -> BlocklistEntry | None:
         """Get a blocklist entry by ID."""
@@ -7229,6 +7333,7 @@ class BlocklistRepository(IBlocklistRepository):
         model.blocked_at = entry.blocked_at
         model.expires_at = entry.expires_at
         model.is_manual = entry.is_manual
+        mark_rules_changed(self.session, BLOCKLIST_SCOPE)
 
     async def delete(self, entry_id: str) -> None:
         """Delete a blocklist entry."""
@@ -7236,6 +7341,7 @@ class BlocklistRepository(IBlocklistRepository):
 
         stmt = delete(BlocklistModel).where(BlocklistModel.id == entry_id)
         await self.session.execute(stmt)
+        mark_rules_changed(self.session, BLOCKLIST_SCOPE)
 
     async def is_blocked(self, username: str | None, filepath: str | None) -> bool:
         """Check if a source is currently blocked.
@@ -7330,6 +7436,30 @@ class BlocklistRepository(IBlocklistRepository):
 
         return [self._model_to_entity(m) for m in models]
 
+    async def list_all_active(self) -> list[BlocklistEntry]:
+        """List ALL active blocklist entries (no limit).
+
+        Hey future me - one query for the compiled blocklist matcher
+        (result_matcher.py) instead of one is_blocked() query per search result.
+        """
+        from datetime import UTC, datetime
+
+        from sqlalchemy import or_
+
+        from .models import BlocklistModel
+
+        now = datetime.now(UTC)
+
+        stmt = select(BlocklistModel).where(
+            or_(
+                BlocklistModel.expires_at.is_(None),
+                BlocklistModel.expires_at > now,
+            )
+        )
+
+        result = await self.session.execute(stmt)
+        return [self._model_to_entity(m) for m in result.scalars().all()]
+
     async def list_expired(self, limit: int = 100) -> list[BlocklistEntry]:
         """List expired blocklist entries."""
         from datetime import UTC, datetime
@@ -7367,7 +7497,10 @@ class BlocklistRepository(IBlocklistRepository):
         )
 
         result = await self.session.execute(stmt)
-        return result.rowcount or 0
+        deleted = result.rowcount or 0
+        if deleted:
+            mark_rules_changed(self.session, BLOCKLIST_SCOPE)
+        return deleted
 
     async def count_active(self) -> int:
         """Count active (non-expired) blocklist entries."""
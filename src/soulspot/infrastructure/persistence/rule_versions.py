@@ -0,0 +1,85 @@
+"""Process-wide version counters for filter rules and the blocklist.
+
+Hey future me - this is how the compiled search-result matchers know when to rebuild!
+
+Compiling the filter rules / blocklist into one regex + hash sets is cheap ONCE, but
+loading them from the DB and recompiling per search result was the slow part. So the
+compiled matcher (application/services/result_matcher.py) is cached per process and
+tagged with the version it was built from. It only rebuilds when the version moved.
+
+WHY bump on COMMIT and not on the repository call?
+If we bumped at repository.add() time, a concurrent search could rebuild from the OLD
+committed rows, tag the result with the NEW version and keep the stale matcher until
+the next change. So repositories only mark the session (mark_rules_changed()), and the
+after_commit listener (install_version_tracking(), done by Database) bumps the counter
+once the rows are actually visible. Marks are NOT dropped on rollback on purpose - a
+savepoint rollback must not forget the outer changes, and a spare rebuild is cheap.
+
+Usage:
+    mark_rules_changed(self.session, BLOCKLIST_SCOPE)   # in a mutating repository method
+    version = get_rules_version(BLOCKLIST_SCOPE)        # in the matcher cache
+"""
+
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+FILTER_RULES_SCOPE = "filter_rules"
+BLOCKLIST_SCOPE = "blocklist"
+
+# session.info key holding the scopes changed in the current transaction
+_PENDING_KEY = "soulspot_changed_rule_scopes"
+
+_versions: dict[str, int] = {}
+
+
+def get_rules_version(scope: str) -> int:
+    """Current version of a rule scope (0 = never changed in this process)."""
+    return _versions.get(scope, 0)
+
+
+def bump_rules_version(scope: str) -> int:
+    """Invalidate every compiled matcher of a scope right away.
+
+    Normally done by the after_commit listener - call directly only for changes that
+    don't go through an ORM session (e.g. raw SQL maintenance scripts).
+
+    Returns:
+        The new version
+    """
+    _versions[scope] = _versions.get(scope, 0) + 1
+    return _versions[scope]
+
+
+def mark_rules_changed(session: AsyncSession | Session, scope: str) -> None:
+    """Remember that this transaction changed a rule scope (bumped on commit)."""
+    session.info.setdefault(_PENDING_KEY, set()).add(scope)
+
+
+def _bump_after_commit(session: Session) -> None:
+    for scope in session.info.pop(_PENDING_KEY, ()):
+        version = bump_rules_version(scope)
+        logger.debug("Rule scope %s changed, now at version %d", scope, version)
+
+
+def install_version_tracking() -> None:
+    """Register the after_commit listener on ALL ORM sessions (idempotent).
+
+    Called by Database.__init__, same as install_aggregate_tracking().
+    """
+    if not event.contains(Session, "after_commit", _bump_after_commit):
+        event.listen(Session, "after_commit", _bump_after_commit)
+
+
+__all__ = [
+    "BLOCKLIST_SCOPE",
+    "FILTER_RULES_SCOPE",
+    "bump_rules_version",
+    "get_rules_version",
+    "install_version_tracking",
+    "mark_rules_changed",
+]
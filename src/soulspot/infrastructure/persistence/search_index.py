@@ -0,0 +1,440 @@
+"""Full-text search index for library and playlist names.
+
+Hey future me - this replaces "ilike('%term%')" for the search box!
+
+A leading-wildcard LIKE can't use a b-tree index, so every keystroke in the quick
+search was a full scan of soulspot_tracks (+ join on artists). On a 200k track
+library that's noticeable, and it holds a read transaction while workers want to write.
+
+SQLite (default): one FTS5 table per entity, keyed by the entity's `id` (UNINDEXED
+column) - NOT by the source rowid, which VACUUM and table rebuilds renumber for our
+UUID-keyed tables.
+- tokenize "unicode61 remove_diacritics 2" → "Beyonce" finds "Beyoncé", case-folded
+- prefix='2 3' → prefix queries ("beat*") hit a prefix index instead of scanning terms
+- <fts>_keys (ordinary table) maps id → FTS rowid, so triggers find a row by index
+  instead of scanning the UNINDEXED id column (~60ms per row at 200k tracks)
+- Triggers keep the index in sync. Every trigger ONLY reads FTS/key tables, never
+  another source table: SQLite re-checks all triggers when alembic's batch mode
+  renames its temp table, and a trigger reading soulspot_tracks from
+  soulspot_artists made every tracks rebuild fail. Track/album rows take the artist
+  name from soulspot_artists_fts; renaming an artist pushes the new name into its
+  track/album rows via the artist_id column of the key tables.
+- A batch rebuild drops the triggers ON the rebuilt table (only those).
+  ensure_search_index() runs at startup: anything missing → the whole index is
+  dropped, recreated and refilled. Migrations that rebuild a table can also
+  suspend/restore the triggers themselves (see GGG38031llM79).
+
+PostgreSQL: pg_trgm GIN indexes on soulspot_fold(name) (lower + unaccent, IMMUTABLE
+wrapper so it can be indexed). "LIKE '%term%'" on the folded expression uses the
+trigram index, similarity() ranks.
+
+The DDL lives in migration FFF38030kkL78 too (copied on purpose - migrations must not
+import app code that changes later). Keep both in sync!
+
+Usage:
+    ids = await search_entity_ids(session, "track", "beatles yester", limit=5)
+    # → track IDs, best match first
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+logger = logging.getLogger(__name__)
+
+SearchKind = Literal["track", "artist", "album", "playlist"]
+
+# Artist name of a track/album row - from the artists FTS table, NOT soulspot_artists
+# (triggers must not reference other source tables, see module docstring)
+_ARTIST_NAME = (
+    "(SELECT name FROM soulspot_artists_fts WHERE rowid = "
+    "(SELECT fts_rowid FROM soulspot_artists_fts_keys WHERE id = new.artist_id))"
+)
+
+
+@dataclass(frozen=True)
+class _FtsSpec:
+    """One searchable entity: source table → FTS5 table (+ key table)."""
+
+    source: str
+    fts: str
+    columns: tuple[str, ...]  # source columns indexed as-is
+    with_artist: bool = False  # + denormalized "artist" column (name via artist_id)
+
+    @property
+    def keys(self) -> str:
+        return f"{self.fts}_keys"
+
+    @property
+    def fts_columns(self) -> tuple[str, ...]:
+        return (*self.columns, "artist") if self.with_artist else self.columns
+
+    @property
+    def watch(self) -> tuple[str, ...]:
+        """Source columns whose change must re-index the row."""
+        return (*self.columns, "artist_id") if self.with_artist else self.columns
+
+
+_FTS_SPECS: dict[str, _FtsSpec] = {
+    # artist first: its rows must exist before track/album triggers read the names
+    "artist": _FtsSpec(
+        source="soulspot_artists", fts="soulspot_artists_fts", columns=("name",)
+    ),
+    "track": _FtsSpec(
+        source="soulspot_tracks",
+        fts="soulspot_tracks_fts",
+        columns=("title",),
+        with_artist=True,
+    ),
+    "album": _FtsSpec(
+        source="soulspot_albums",
+        fts="soulspot_albums_fts",
+        columns=("title",),
+        with_artist=True,
+    ),
+    "playlist": _FtsSpec(source="playlists", fts="playlists_fts", columns=("name",)),
+}
+
+# Postgres: (index name, table, column) - one trigram index per searchable column
+_TRGM_INDEXES = (
+    ("ix_soulspot_tracks_title_trgm", "soulspot_tracks", "title"),
+    ("ix_soulspot_artists_name_trgm", "soulspot_artists", "name"),
+    ("ix_soulspot_albums_title_trgm", "soulspot_albums", "title"),
+    ("ix_playlists_name_trgm", "playlists", "name"),
+)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+# =============================================================================
+# DDL
+# =============================================================================
+
+
+def _sqlite_index_row(spec: _FtsSpec, row: str) -> str:
+    """Trigger statements that (re)index one source row ("new")."""
+    key_cols = "id, artist_id" if spec.with_artist else "id"
+    key_vals = f"{row}.id, {row}.artist_id" if spec.with_artist else f"{row}.id"
+    values = [f"{row}.{col}" for col in spec.columns]
+    if spec.with_artist:
+        values.append(_ARTIST_NAME.replace("new.", f"{row}."))
+    return (
+        f"INSERT INTO {spec.keys}({key_cols}) VALUES ({key_vals}); "
+        f"INSERT INTO {spec.fts}(rowid, id, {', '.join(spec.fts_columns)}) VALUES "
+        f"((SELECT fts_rowid FROM {spec.keys} WHERE id = {row}.id), {row}.id, "
+        f"{', '.join(values)}); "
+    )
+
+
+def _sqlite_unindex_row(spec: _FtsSpec, row: str) -> str:
+    """Trigger statements that remove one source row ("old"/"new") from the index."""
+    return (
+        f"DELETE FROM {spec.fts} WHERE rowid = "
+        f"(SELECT fts_rowid FROM {spec.keys} WHERE id = {row}.id); "
+        f"DELETE FROM {spec.keys} WHERE id = {row}.id; "
+    )
+
+
+def _sqlite_push_artist_name() -> str:
+    """Artist trigger statements: new name → its track/album rows."""
+    return "".join(
+        f"UPDATE {spec.fts} SET artist = new.name WHERE rowid IN "
+        f"(SELECT fts_rowid FROM {spec.keys} WHERE artist_id = new.id); "
+        for spec in _FTS_SPECS.values()
+        if spec.with_artist
+    )
+
+
+def sqlite_search_ddl() -> list[str]:
+    """CREATE statements for the FTS5/key tables and their sync triggers (idempotent)."""
+    statements: list[str] = []
+    for kind, spec in _FTS_SPECS.items():
+        statements.append(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {spec.fts} USING fts5("
+            f"id UNINDEXED, {', '.join(spec.fts_columns)}, "
+            "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+        )
+        artist_col = ", artist_id TEXT" if spec.with_artist else ""
+        statements.append(
+            f"CREATE TABLE IF NOT EXISTS {spec.keys} (fts_rowid INTEGER PRIMARY KEY, "
+            f"id TEXT NOT NULL UNIQUE{artist_col})"
+        )
+        if spec.with_artist:
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS ix_{spec.keys}_artist_id "
+                f"ON {spec.keys} (artist_id)"
+            )
+
+        push = _sqlite_push_artist_name() if kind == "artist" else ""
+        changed = " OR ".join(f"old.{col} IS NOT new.{col}" for col in spec.watch)
+        # ai: unindex first - an INSERT OR REPLACE deletes the old row without
+        # firing the delete trigger, its key would block the new one
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS {spec.fts}_ai AFTER INSERT ON {spec.source} "
+            f"BEGIN {_sqlite_unindex_row(spec, 'new')}"
+            f"{_sqlite_index_row(spec, 'new')}{push}END"
+        )
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS {spec.fts}_ad AFTER DELETE ON {spec.source} "
+            f"BEGIN {_sqlite_unindex_row(spec, 'old')}END"
+        )
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS {spec.fts}_au "
+            f"AFTER UPDATE OF {', '.join(spec.watch)} ON {spec.source} "
+            f"WHEN {changed} BEGIN {_sqlite_unindex_row(spec, 'old')}"
+            f"{_sqlite_index_row(spec, 'new')}{push}END"
+        )
+    return statements
+
+
+def sqlite_search_trigger_names() -> list[str]:
+    """Names of all sync triggers (used to detect triggers lost to table rebuilds)."""
+    return [
+        f"{spec.fts}_{suffix}"
+        for spec in _FTS_SPECS.values()
+        for suffix in ("ai", "ad", "au")
+    ]
+
+
+def sqlite_drop_statements() -> list[str]:
+    """DROP statements for every search index object (incl. the old rowid layout)."""
+    statements = [
+        f"DROP TRIGGER IF EXISTS {name}" for name in sqlite_search_trigger_names()
+    ]
+    # Pre-key-table layout had a cross-table rename trigger
+    statements.append("DROP TRIGGER IF EXISTS soulspot_artists_fts_rename")
+    for spec in _FTS_SPECS.values():
+        statements.append(f"DROP TABLE IF EXISTS {spec.fts}")
+        statements.append(f"DROP TABLE IF EXISTS {spec.keys}")
+    return statements
+
+
+def sqlite_rebuild_statements() -> list[str]:
+    """Statements that refill every FTS5/key table from its source table.
+
+    Not triggers - reading the source tables (soulspot_artists for names) is fine here.
+    """
+    statements: list[str] = []
+    for spec in _FTS_SPECS.values():
+        key_cols = "id, artist_id" if spec.with_artist else "id"
+        values = [f"src.{col}" for col in spec.columns]
+        if spec.with_artist:
+            values.append(
+                "(SELECT name FROM soulspot_artists WHERE id = src.artist_id)"
+            )
+        statements.append(f"DELETE FROM {spec.fts}")
+        statements.append(f"DELETE FROM {spec.keys}")
+        statements.append(
+            f"INSERT INTO {spec.keys}({key_cols}) SELECT {key_cols} FROM {spec.source}"
+        )
+        statements.append(
+            f"INSERT INTO {spec.fts}(rowid, id, {', '.join(spec.fts_columns)}) "
+            f"SELECT k.fts_rowid, src.id, {', '.join(values)} FROM {spec.source} AS src "
+            f"JOIN {spec.keys} AS k ON k.id = src.id"
+        )
+    return statements
+
+
+def postgres_search_ddl() -> list[str]:
+    """CREATE statements for pg_trgm/unaccent and the trigram indexes (idempotent)."""
+    statements = [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE EXTENSION IF NOT EXISTS unaccent",
+        # unaccent() is only STABLE → wrap it so it can be used in an index expression
+        "CREATE OR REPLACE FUNCTION soulspot_fold(value text) RETURNS text AS "
+        "$$ SELECT public.unaccent('public.unaccent'::regdictionary, lower(value)) $$ "
+        "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT",
+    ]
+    statements.extend(
+        f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+        f"USING gin (soulspot_fold({column}) gin_trgm_ops)"
+        for name, table, column in _TRGM_INDEXES
+    )
+    return statements
+
+
+# =============================================================================
+# MAINTENANCE
+# =============================================================================
+
+
+async def ensure_search_index(conn: AsyncConnection) -> bool:
+    """Make sure the SQLite FTS tables and triggers exist (self-heal at startup).
+
+    Args:
+        conn: Connection inside a transaction (engine.begin())
+
+    Returns:
+        True if something was (re)created and the index rebuilt
+    """
+    if conn.dialect.name != "sqlite":
+        return False  # Postgres indexes don't depend on triggers
+
+    result = await conn.execute(
+        text("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')")
+    )
+    existing = {row[0] for row in result}
+    expected = {spec.fts for spec in _FTS_SPECS.values()}
+    expected.update(spec.keys for spec in _FTS_SPECS.values())
+    expected.update(sqlite_search_trigger_names())
+    if expected <= existing:
+        return False
+
+    if not {spec.source for spec in _FTS_SPECS.values()} <= existing:
+        return False  # Schema not migrated yet - alembic creates everything
+
+    logger.warning(
+        "Library search index incomplete (missing: %s) - rebuilding",
+        ", ".join(sorted(expected - existing)),
+    )
+    # Drop + recreate everything: also migrates an index in an older layout
+    for statement in [*sqlite_drop_statements(), *sqlite_search_ddl()]:
+        await conn.execute(text(statement))
+    await rebuild_search_index(conn)
+    return True
+
+
+async def rebuild_search_index(conn: AsyncConnection | AsyncSession) -> None:
+    """Refill the SQLite FTS and key tables from the source tables."""
+    for statement in sqlite_rebuild_statements():
+        await conn.execute(text(statement))
+
+
+# =============================================================================
+# QUERIES
+# =============================================================================
+
+
+def build_fts5_query(query: str) -> str | None:
+    """Turn user input into a safe FTS5 prefix query.
+
+    Every word becomes a quoted prefix term ("beat"* "yest"*), all must match.
+    Quoting keeps FTS5 operators (AND, NEAR, -, ^, ...) in user input inert.
+
+    Returns:
+        MATCH expression, None if the input has no searchable word
+    """
+    tokens = _TOKEN_RE.findall(query)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def _like_pattern(query: str) -> str:
+    """Escape LIKE wildcards in user input and wrap it in %...%."""
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+async def search_entity_ids(
+    session: AsyncSession,
+    kind: SearchKind,
+    query: str,
+    limit: int = 10,
+) -> list[str]:
+    """Search one entity kind, best match first.
+
+    Args:
+        session: DB session
+        kind: "track" (title + artist name), "artist", "album" (title + artist
+            name) or "playlist"
+        query: Raw user input
+        limit: Max IDs to return
+
+    Returns:
+        Entity IDs ordered by relevance
+    """
+    dialect = session.bind.dialect.name if session.bind else "sqlite"
+    if dialect == "postgresql":
+        return await _search_postgres(session, kind, query, limit)
+
+    spec = _FTS_SPECS[kind]
+    match = build_fts5_query(query)
+    if match is None:
+        return []
+    try:
+        result = await session.execute(
+            text(
+                f"SELECT id FROM {spec.fts} "
+                f"WHERE {spec.fts} MATCH :match ORDER BY rank LIMIT :limit"
+            ),
+            {"match": match, "limit": limit},
+        )
+    except DBAPIError as e:
+        # FTS table missing (migration not applied yet) → slow but correct fallback
+        logger.warning("Library search index unavailable, using LIKE: %s", e)
+        return await _search_like(session, kind, query, limit)
+    return [row[0] for row in result]
+
+
+async def _search_postgres(
+    session: AsyncSession, kind: SearchKind, query: str, limit: int
+) -> list[str]:
+    """Trigram search on PostgreSQL (LIKE on folded names, ranked by similarity)."""
+    params: dict[str, Any] = {
+        "pattern": _like_pattern(query),
+        "q": query,
+        "limit": limit,
+    }
+    if kind in ("track", "album"):
+        table = "soulspot_tracks" if kind == "track" else "soulspot_albums"
+        sql = (
+            f"SELECT src.id FROM {table} AS src "
+            "JOIN soulspot_artists AS a ON a.id = src.artist_id "
+            "WHERE soulspot_fold(src.title) LIKE soulspot_fold(:pattern) "
+            "OR soulspot_fold(a.name) LIKE soulspot_fold(:pattern) "
+            "ORDER BY GREATEST(similarity(soulspot_fold(src.title), soulspot_fold(:q)), "
+            "similarity(soulspot_fold(a.name), soulspot_fold(:q))) DESC LIMIT :limit"
+        )
+    else:
+        table = "soulspot_artists" if kind == "artist" else "playlists"
+        sql = (
+            f"SELECT src.id FROM {table} AS src "
+            "WHERE soulspot_fold(src.name) LIKE soulspot_fold(:pattern) "
+            "ORDER BY similarity(soulspot_fold(src.name), soulspot_fold(:q)) DESC "
+            "LIMIT :limit"
+        )
+    result = await session.execute(text(sql), params)
+    return [row[0] for row in result]
+
+
+async def _search_like(
+    session: AsyncSession, kind: SearchKind, query: str, limit: int
+) -> list[str]:
+    """Unindexed fallback (the old ilike behaviour) for databases without the index."""
+    params: dict[str, Any] = {"pattern": _like_pattern(query), "limit": limit}
+    if kind in ("track", "album"):
+        table = "soulspot_tracks" if kind == "track" else "soulspot_albums"
+        sql = (
+            f"SELECT src.id FROM {table} AS src "
+            "JOIN soulspot_artists AS a ON a.id = src.artist_id "
+            "WHERE lower(src.title) LIKE lower(:pattern) ESCAPE '\\' "
+            "OR lower(a.name) LIKE lower(:pattern) ESCAPE '\\' LIMIT :limit"
+        )
+    else:
+        table = "soulspot_artists" if kind == "artist" else "playlists"
+        sql = (
+            f"SELECT src.id FROM {table} AS src "
+            "WHERE lower(src.name) LIKE lower(:pattern) ESCAPE '\\' LIMIT :limit"
+        )
+    result = await session.execute(text(sql), params)
+    return [row[0] for row in result]
+
+
+__all__ = [
+    "SearchKind",
+    "build_fts5_query",
+    "ensure_search_index",
+    "postgres_search_ddl",
+    "rebuild_search_index",
+    "search_entity_ids",
+    "sqlite_drop_statements",
+    "sqlite_rebuild_statements",
+    "sqlite_search_ddl",
+    "sqlite_search_trigger_names",
+]
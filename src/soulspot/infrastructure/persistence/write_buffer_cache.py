@@ -25,16 +25,20 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections import defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Set
+from typing import Any
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+# Bound parameters per statement (SQLite < 3.32 allows 999)
+_MAX_SQL_PARAMS = 900
+
 
 class WriteOperation(Enum):
     """Type of buffered write operation."""
@@ -61,7 +65,7 @@ class PendingWrite:
     operation: WriteOperation
     key_column: str
     key_value: Any
-    data: Dict[str, Any]
+    data: dict[str, Any]
     timestamp: datetime = field(
         default_factory=lambda: datetime.now(timezone.utc)
     )
@@ -89,7 +93,7 @@ class BufferConfig:
     batch_size: int = 100
 
     # Critical tables flushed first (downloads need tracks)
-    table_priorities: Dict[str, int] = field(
+    table_priorities: dict[str, int] = field(
         default_factory=lambda: {
             "tracks": 1,
             "downloads": 2,
@@ -112,6 +116,9 @@ class WriteBufferCache:
     Thread Safety:
     - All methods are async-safe via asyncio.Lock
     - Multiple coroutines can buffer writes concurrently
+    - The buffer lock is only held to SWAP the buffer out, DB writes happen
+      outside of it → buffer_*() stays O(1) even during a huge flush
+    - Only one flush runs at a time, flush requests are coalesced
 
     Error Handling:
     - Failed flushes: buffer is preserved, retry on next interval
@@ -149,8 +156,14 @@ class WriteBufferCache:
         self._config = config or BufferConfig()
 
         # Buffer structure: table -> key_value -> PendingWrite
-        self._buffer: Dict[str, Dict[Any, PendingWrite]] = defaultdict(dict)
-        self._lock = asyncio.Lock()
+        self._buffer: dict[str, dict[Any, PendingWrite]] = defaultdict(dict)
+        self._pending_count = 0  # len of all tables in _buffer, kept O(1)
+        # Snapshot currently being written (still visible for read-through)
+        self._flushing: dict[str, dict[Any, PendingWrite]] = {}
+        self._lock = asyncio.Lock()  # guards _buffer/_flushing, NEVER held during I/O
+        self._flush_lock = asyncio.Lock()  # one flush at a time
+        self._flush_requested = asyncio.Event()  # coalesced "please flush now"
+        self._backpressure_task: asyncio.Task | None = None
         self._flush_task: asyncio.Task | None = None
         self._running = False
 
@@ -159,6 +172,7 @@ class WriteBufferCache:
         self._writes_flushed = 0
         self._flush_count = 0
         self._flush_errors = 0
+        self._flush_requests = 0
 
     # ==================== Lifecycle ====================
 
@@ -188,7 +202,12 @@ class WriteBufferCache:
         self._running = False
 
         if self._flush_task:
-            self._flush_task.cancel()
+            if flush_remaining:
+                # Wake the loop instead of cancelling it mid-statement: it finishes
+                # the running flush (or does one more) and exits
+                self._flush_requested.set()
+            else:
+                self._flush_task.cancel()
             try:
                 await self._flush_task
             except asyncio.CancelledError:
@@ -213,7 +232,7 @@ class WriteBufferCache:
         table: str,
         key_column: str,
         key_value: Any,
-        data: Dict[str, Any],
+        data: dict[str, Any],
     ) -> None:
         """
         Buffer an UPSERT operation (INSERT ON CONFLICT UPDATE).
@@ -236,30 +255,22 @@ class WriteBufferCache:
             )
         """
         async with self._lock:
-            self._buffer[table][key_value] = PendingWrite(
-                table=table,
-                operation=WriteOperation.UPSERT,
-                key_column=key_column,
-                key_value=key_value,
-                data=data,
-            )
-            self._writes_buffered += 1
-
-            # Backpressure: force flush if buffer is full
-            total = sum(len(t) for t in self._buffer.values())
-            if total >= self._config.max_pending_writes:
-                logger.warning(
-                    "WriteBufferCache full (%d items), forcing flush", total
+            self._put(
+                PendingWrite(
+                    table=table,
+                    operation=WriteOperation.UPSERT,
+                    key_column=key_column,
+                    key_value=key_value,
+                    data=data,
                 )
-                # Don't await here to avoid blocking the caller
-                asyncio.create_task(self._flush_all())
+            )
 
     async def buffer_update(
         self,
         table: str,
         key_column: str,
         key_value: Any,
-        data: Dict[str, Any],
+        data: dict[str, Any],
     ) -> None:
         """
         Buffer an UPDATE operation (only updates existing rows).
@@ -279,17 +290,18 @@ class WriteBufferCache:
                 # Merge with existing UPSERT
                 existing.data.update(data)
                 existing.timestamp = datetime.now(timezone.utc)
+                self._writes_buffered += 1
             else:
-                self._buffer[table][key_value] = PendingWrite(
-                    table=table,
-                    operation=WriteOperation.UPDATE,
-                    key_column=key_column,
-                    key_value=key_value,
-                    data=data,
+                self._put(
+                    PendingWrite(
+                        table=table,
+                        operation=WriteOperation.UPDATE,
+                        key_column=key_column,
+                        key_value=key_value,
+                        data=data,
+                    )
                 )
 
-            self._writes_buffered += 1
-
     async def buffer_delete(
         self,
         table: str,
@@ -308,14 +320,54 @@ class WriteBufferCache:
         """
         async with self._lock:
             # DELETE overwrites everything
-            self._buffer[table][key_value] = PendingWrite(
-                table=table,
-                operation=WriteOperation.DELETE,
-                key_column=key_column,
-                key_value=key_value,
-                data={},
+            self._put(
+                PendingWrite(
+                    table=table,
+                    operation=WriteOperation.DELETE,
+                    key_column=key_column,
+                    key_value=key_value,
+                    data={},
+                )
+            )
+
+    def _put(self, write: PendingWrite) -> None:
+        """Store a write in the live buffer (caller holds self._lock).
+
+        O(1): no scan over the buffer, the pending counter is kept incrementally.
+        """
+        table_buffer = self._buffer[write.table]
+        if write.key_value not in table_buffer:
+            self._pending_count += 1
+        table_buffer[write.key_value] = write
+        self._writes_buffered += 1
+
+        # Backpressure: ask for a flush if buffer is full (coalesced, never blocks)
+        if self._pending_count >= self._config.max_pending_writes:
+            self._request_flush()
+
+    def _request_flush(self) -> None:
+        """Signal that a flush is needed now.
+
+        Hey future me - this used to spawn a new _flush_all() task on EVERY write
+        past the limit (1000 writes over the limit = 1000 tasks fighting for the
+        lock). Now it just sets an Event: the flush loop wakes up early and
+        repeated requests while a flush is running collapse into one follow-up.
+        Without a running flush loop (cache not started) a single helper task
+        does the flush instead.
+        """
+        if self._flush_requested.is_set():
+            return
+        self._flush_requested.set()
+        self._flush_requests += 1
+        logger.warning(
+            "WriteBufferCache full (%d items), requesting flush", self._pending_count
+        )
+        if not self._running and (
+            self._backpressure_task is None or self._backpressure_task.done()
+        ):
+            self._backpressure_task = asyncio.create_task(
+                self._flush_all(), name="write_buffer_backpressure_flush"
             )
-            self._writes_buffered += 1
 
     # ==================== Read-Through Support ====================
 
@@ -323,7 +375,7 @@ class WriteBufferCache:
         self,
         table: str,
         key_value: Any,
-    ) -> Dict[str, Any] | None:
+    ) -> dict[str, Any] | None:
         """
         Get buffered data for a key (for read-through cache).
 
@@ -346,6 +398,9 @@ class WriteBufferCache:
         """
         async with self._lock:
             pending = self._buffer.get(table, {}).get(key_value)
+            if pending is None:
+                # Not re-buffered since the swap → maybe still being flushed
+                pending = self._flushing.get(table, {}).get(key_value)
             if pending and pending.operation != WriteOperation.DELETE:
                 # Return copy to prevent external modification
                 result = dict(pending.data)
@@ -356,15 +411,23 @@ class WriteBufferCache:
     async def is_key_buffered(self, table: str, key_value: Any) -> bool:
         """Check if a key is in the buffer."""
         async with self._lock:
-            return key_value in self._buffer.get(table, {})
+            return key_value in self._buffer.get(
+                table, {}
+            ) or key_value in self._flushing.get(table, {})
 
     # ==================== Flush Logic ====================
 
     async def _flush_loop(self) -> None:
-        """Background task that periodically flushes the buffer."""
+        """Background task that flushes every interval or when a flush is requested."""
         while self._running:
             try:
-                await asyncio.sleep(self._config.flush_interval)
+                try:
+                    await asyncio.wait_for(
+                        self._flush_requested.wait(),
+                        timeout=self._config.flush_interval,
+                    )
+                except TimeoutError:
+                    pass
                 await self._flush_all()
             except asyncio.CancelledError:
                 break
@@ -372,143 +435,205 @@ class WriteBufferCache:
                 logger.exception("Error in write buffer flush loop: %s", e)
                 self._flush_errors += 1
 
+    # Hey future me - the flush no longer holds self._lock while talking to the DB!
+    # 1. Under the lock: swap self._buffer for an empty dict (O(1)) and remember the
+    #    old one as self._flushing (read-through still sees it)
+    # 2. Outside the lock: write it table by table, chunk by chunk (batch_size rows,
+    #    one transaction per chunk → SQLite write lock is held for short bursts)
+    # 3. Failed chunks (and the rest of that table) go back into the live buffer,
+    #    unless a newer write for the same key arrived meanwhile (newer wins)
+    # _flush_lock makes sure snapshots are written in order, one at a time.
     async def _flush_all(self) -> None:
         """Flush all buffered writes to the database."""
-        async with self._lock:
-            if not any(self._buffer.values()):
-                return  # Nothing to flush
-
-            # Sort tables by priority (critical tables first)
-            tables = sorted(
-                self._buffer.keys(),
-                key=lambda t: self._config.table_priorities.get(t, 99),
-            )
+        async with self._flush_lock:
+            async with self._lock:
+                self._flush_requested.clear()
+                if self._pending_count == 0:
+                    return  # Nothing to flush
+                snapshot = self._buffer
+                self._buffer = defaultdict(dict)
+                self._pending_count = 0
+                self._flushing = snapshot
 
-            for table in tables:
-                writes = list(self._buffer[table].values())
-                if not writes:
-                    continue
-
-                # Group by operation type
-                upserts = [
-                    w for w in writes if w.operation == WriteOperation.UPSERT
-                ]
-                updates = [
-                    w for w in writes if w.operation == WriteOperation.UPDATE
-                ]
-                deletes = [
-                    w for w in writes if w.operation == WriteOperation.DELETE
-                ]
+            try:
+                # Sort tables by priority (critical tables first)
+                tables = sorted(
+                    snapshot.keys(),
+                    key=lambda t: self._config.table_priorities.get(t, 99),
+                )
+                for table in tables:
+                    writes = list(snapshot[table].values())
+                    if writes:
+                        await self._flush_table(table, writes)
+            finally:
+                async with self._lock:
+                    self._flushing = {}
 
-                try:
-                    async with self._session_factory() as session:
-                        # Order: DELETEs first (referential integrity),
-                        # then UPSERTs, then UPDATEs
-                        if deletes:
-                            await self._bulk_delete(session, table, deletes)
-                        if upserts:
-                            await self._bulk_upsert(session, table, upserts)
-                        if updates:
-                            await self._bulk_update(session, table, updates)
-
-                        await session.commit()
-
-                    # Success: clear buffer for this table
-                    self._writes_flushed += len(writes)
-                    self._buffer[table].clear()
-
-                    if len(writes) > 10:
-                        logger.debug(
-                            "Flushed %d writes to %s", len(writes), table
-                        )
+        self._flush_count += 1
 
-                except Exception as e:
-                    logger.error(
-                        "Failed to flush %d writes to %s: %s",
-                        len(writes),
+    async def _flush_table(self, table: str, writes: list[PendingWrite]) -> None:
+        """Write one table's snapshot in batch_size chunks, requeue what failed."""
+        # Order: DELETEs first (referential integrity), then UPSERTs, then UPDATEs
+        ordered = (
+            [w for w in writes if w.operation == WriteOperation.DELETE]
+            + [w for w in writes if w.operation == WriteOperation.UPSERT]
+            + [w for w in writes if w.operation == WriteOperation.UPDATE]
+        )
+        batch_size = max(1, self._config.batch_size)
+        done = 0
+        try:
+            while done < len(ordered):
+                chunk = ordered[done : done + batch_size]
+                async with self._session_factory() as session:
+                    await self._bulk_delete(
+                        session,
                         table,
-                        e,
+                        [w for w in chunk if w.operation == WriteOperation.DELETE],
                     )
-                    self._flush_errors += 1
-                    # Buffer is preserved for next flush attempt
+                    await self._bulk_upsert(
+                        session,
+                        table,
+                        [w for w in chunk if w.operation == WriteOperation.UPSERT],
+                    )
+                    await self._bulk_update(
+                        session,
+                        table,
+                        [w for w in chunk if w.operation == WriteOperation.UPDATE],
+                    )
+                    await session.commit()
+                done += len(chunk)
+                self._writes_flushed += len(chunk)
+        except Exception as e:
+            logger.error(
+                "Failed to flush %d of %d writes to %s: %s",
+                len(ordered) - done,
+                len(ordered),
+                table,
+                e,
+            )
+            self._flush_errors += 1
+            await self._requeue(ordered[done:])
+            return
+        except BaseException:
+            # Cancelled mid-flush (shutdown) → keep the rest for stop()'s final flush
+            await self._requeue(ordered[done:])
+            raise
 
-        self._flush_count += 1
+        if len(ordered) > 10:
+            logger.debug("Flushed %d writes to %s", len(ordered), table)
+
+    async def _requeue(self, writes: list[PendingWrite]) -> None:
+        """Put unflushed writes back into the live buffer for the next flush.
+
+        A newer write for the same key wins. Exception: a newer UPDATE on top of
+        a failed UPSERT is merged into the UPSERT (same as buffer_update() does).
+        """
+        async with self._lock:
+            for w in writes:
+                live = self._buffer[w.table]
+                newer = live.get(w.key_value)
+                if newer is None:
+                    live[w.key_value] = w
+                    self._pending_count += 1
+                elif (
+                    newer.operation == WriteOperation.UPDATE
+                    and w.operation == WriteOperation.UPSERT
+                ):
+                    w.data.update(newer.data)
+                    w.timestamp = newer.timestamp
+                    live[w.key_value] = w
 
     async def _bulk_upsert(
         self,
         session: AsyncSession,
         table: str,
-        writes: List[PendingWrite],
+        writes: list[PendingWrite],
     ) -> None:
-        """Execute bulk UPSERT via SQLite ON CONFLICT."""
+        """Execute bulk UPSERT via multi-row INSERT ... ON CONFLICT.
+
+        Writes are grouped by their column set: a write that only carries
+        {"title"} must not NULL out the other columns of an existing row, which
+        a single union-of-columns statement would do.
+        """
         if not writes:
             return
 
-        # Collect all columns from all writes
-        all_columns: Set[str] = set()
+        groups: dict[tuple[str, ...], list[PendingWrite]] = defaultdict(list)
         for w in writes:
-            all_columns.update(w.data.keys())
-            all_columns.add(w.key_column)
-
-        columns = sorted(all_columns)
-        key_col = writes[0].key_column
-
-        # Build SQL
-        col_list = ", ".join(f'"{c}"' for c in columns)
-        placeholders = ", ".join(f":{c}" for c in columns)
-        update_clause = ", ".join(
-            f'"{c}" = excluded."{c}"' for c in columns if c != key_col
-        )
-
-        sql = f"""
-            INSERT INTO "{table}" ({col_list})
-            VALUES ({placeholders})
-            ON CONFLICT("{key_col}") DO UPDATE SET {update_clause}
-        """
-
-        # Execute in batches
-        batch_size = self._config.batch_size
-        for i in range(0, len(writes), batch_size):
-            batch = writes[i : i + batch_size]
-            params = []
-
-            for w in batch:
-                row = {c: w.data.get(c) for c in columns}
-                row[w.key_column] = w.key_value
-                params.append(row)
+            columns = tuple(sorted(set(w.data.keys()) | {w.key_column}))
+            groups[columns].append(w)
+
+        for columns, group in groups.items():
+            key_col = group[0].key_column
+            col_list = ", ".join(f'"{c}"' for c in columns)
+            update_cols = [c for c in columns if c != key_col]
+            if update_cols:
+                conflict = "DO UPDATE SET " + ", ".join(
+                    f'"{c}" = excluded."{c}"' for c in update_cols
+                )
+            else:
+                conflict = "DO NOTHING"
+
+            # Stay under SQLite's 999 bound parameters per statement
+            rows_per_stmt = max(1, min(len(group), _MAX_SQL_PARAMS // len(columns)))
+            for i in range(0, len(group), rows_per_stmt):
+                rows = group[i : i + rows_per_stmt]
+                values = []
+                params: dict[str, Any] = {}
+                for r, w in enumerate(rows):
+                    placeholders = []
+                    for c_idx, c in enumerate(columns):
+                        name = f"p{r}_{c_idx}"
+                        placeholders.append(f":{name}")
+                        params[name] = (
+                            w.key_value if c == w.key_column else w.data.get(c)
+                        )
+                    values.append(f"({', '.join(placeholders)})")
 
-            await session.execute(text(sql), params)
+                sql = f"""
+                    INSERT INTO "{table}" ({col_list})
+                    VALUES {", ".join(values)}
+                    ON CONFLICT("{key_col}") {conflict}
+                """
+                await session.execute(text(sql), params)
 
     async def _bulk_update(
         self,
         session: AsyncSession,
         table: str,
-        writes: List[PendingWrite],
+        writes: list[PendingWrite],
     ) -> None:
-        """Execute bulk UPDATE operations."""
+        """Execute bulk UPDATE operations (one executemany per column set)."""
         if not writes:
             return
 
-        key_col = writes[0].key_column
-
-        # Simple approach: individual UPDATEs (SQLite is fast for this)
-        # For large batches, consider CASE WHEN pattern
+        groups: dict[tuple[str, ...], list[PendingWrite]] = defaultdict(list)
         for w in writes:
-            for col, val in w.data.items():
-                sql = f"""
-                    UPDATE "{table}" 
-                    SET "{col}" = :val 
-                    WHERE "{key_col}" = :key
-                """
-                await session.execute(
-                    text(sql), {"val": val, "key": w.key_value}
-                )
+            if w.data:
+                groups[tuple(sorted(w.data.keys()))].append(w)
+
+        for columns, group in groups.items():
+            key_col = group[0].key_column
+            set_clause = ", ".join(f'"{c}" = :v{i}' for i, c in enumerate(columns))
+            sql = f"""
+                UPDATE "{table}"
+                SET {set_clause}
+                WHERE "{key_col}" = :_key
+            """
+            params = [
+                {
+                    "_key": w.key_value,
+                    **{f"v{i}": w.data[c] for i, c in enumerate(columns)},
+                }
+                for w in group
+            ]
+            await session.execute(text(sql), params)
 
     async def _bulk_delete(
         self,
         session: AsyncSession,
         table: str,
-        writes: List[PendingWrite],
+        writes: list[PendingWrite],
     ) -> None:
         """Execute bulk DELETE via IN clause."""
         if not writes:
@@ -518,7 +643,7 @@ class WriteBufferCache:
         key_values = [w.key_value for w in writes]
 
         # Chunk to stay under SQLite's 999 parameter limit
-        chunk_size = 500
+        chunk_size = _MAX_SQL_PARAMS
         for i in range(0, len(key_values), chunk_size):
             batch = key_values[i : i + chunk_size]
             placeholders = ", ".join(f":k{j}" for j in range(len(batch)))
@@ -541,16 +666,19 @@ class WriteBufferCache:
         """
         await self._flush_all()
 
-    def get_stats(self) -> Dict[str, Any]:
+    def get_stats(self) -> dict[str, Any]:
         """
         Get buffer statistics for monitoring.
 
         Returns:
             Dictionary with buffer metrics
         """
-        total_pending = sum(len(t) for t in self._buffer.values())
+        in_flight = sum(len(t) for t in self._flushing.values())
         return {
-            "pending_writes": total_pending,
+            "pending_writes": self._pending_count + in_flight,
+            "in_flight_writes": in_flight,
+            "flush_in_progress": self._flush_lock.locked(),
+            "flush_requests": self._flush_requests,
             "writes_buffered": self._writes_buffered,
             "writes_flushed": self._writes_flushed,
             "flush_count": self._flush_count,
@@ -570,5 +698,7 @@ class WriteBufferCache:
         """Get count of pending writes, optionally filtered by table."""
         async with self._lock:
             if table:
-                return len(self._buffer.get(table, {}))
-            return sum(len(t) for t in self._buffer.values())
+                return len(self._buffer.get(table, {})) + len(
+                    self._flushing.get(table, {})
+                )
+            return self._pending_count + sum(len(t) for t in self._flushing.values())
@@ -12,7 +12,6 @@ from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from soulspot.api.exception_handlers import register_exception_handlers
@@ -20,7 +19,10 @@ from soulspot.api.health_checks import register_health_endpoints
 from soulspot.api.routers import api_router, ui
 from soulspot.config import Settings, get_settings
 from soulspot.infrastructure.lifecycle import lifespan
-from soulspot.infrastructure.observability.middleware import RequestLoggingMiddleware
+from soulspot.infrastructure.observability.middleware import (
+    RequestLoggingMiddleware,
+    SelectiveGZipMiddleware,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -85,7 +87,10 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     )
 
     # Response compression middleware (must be first)
-    app.add_middleware(GZipMiddleware, minimum_size=settings.api.gzip_minimum_size)
+    # Hey future me - skips images/fonts/audio, they're compressed already!
+    app.add_middleware(
+        SelectiveGZipMiddleware, minimum_size=settings.api.gzip_minimum_size
+    )
 
     # Request logging middleware
     app.add_middleware(RequestLoggingMiddleware)
@@ -89,6 +89,22 @@ class SSEClient {
             this.emit('downloads_update', data);
         });
 
+        // Single download changed (delta - merge into the list by id)
+        this.eventSource.addEventListener('download_delta', (event) => {
+            this.log('Download delta received');
+            const data = this.parseData(event.data);
+            this.resetHeartbeatMonitor();
+            this.emit('download_delta', data);
+        });
+
+        // Job state/progress changed
+        this.eventSource.addEventListener('job_update', (event) => {
+            this.log('Job update received');
+            const data = this.parseData(event.data);
+            this.resetHeartbeatMonitor();
+            this.emit('job_update', data);
+        });
+
         // Heartbeat event
         this.eventSource.addEventListener('heartbeat', (event) => {
             this.log('Heartbeat received');